@@ -4,6 +4,7 @@ from .core import (
     BuildContext,
     ContainerEngine,
     ContainerError,
+    ContainerEvent,
     ContainerInfo,
     ContainerManager,
     ContainerNotFoundError,
@@ -35,11 +36,20 @@ from .core import (
 )
 from .factory import ContainerEngineFactory
 from .implementations import (
+    BUILD_DIGEST_LABEL,
+    APIContainerManager,
+    APIEngine,
+    APIImageManager,
+    APINetworkManager,
+    APIVolumeManager,
     DockerContainerManager,
     DockerEngine,
     DockerImageManager,
     DockerNetworkManager,
     DockerVolumeManager,
+    EngineAPIClient,
+    EngineAPIError,
+    build_context_digest,
 )
 
 __all__ = [
@@ -65,6 +75,7 @@ __all__ = [
     "PortMapping",
     "ImageInfo",
     "ContainerInfo",
+    "ContainerEvent",
     "VolumeInfo",
     "NetworkInfo",
     # Exceptions
@@ -86,4 +97,14 @@ __all__ = [
     "DockerContainerManager",
     "DockerVolumeManager",
     "DockerNetworkManager",
+    "APIEngine",
+    "APIImageManager",
+    "APIContainerManager",
+    "APIVolumeManager",
+    "APINetworkManager",
+    "EngineAPIClient",
+    "EngineAPIError",
+    # Build cache
+    "BUILD_DIGEST_LABEL",
+    "build_context_digest",
 ]
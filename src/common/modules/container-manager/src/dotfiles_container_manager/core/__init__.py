@@ -31,6 +31,7 @@ from .managers import (
 )
 from .types import (
     BuildContext,
+    ContainerEvent,
     ContainerInfo,
     ImageInfo,
     NetworkInfo,
@@ -62,6 +63,7 @@ __all__ = [
     "PortMapping",
     "ImageInfo",
     "ContainerInfo",
+    "ContainerEvent",
     "VolumeInfo",
     "NetworkInfo",
     # Exceptions
@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 
-from ..types import ContainerInfo, RunConfig
+from ..types import ContainerEvent, ContainerInfo, RunConfig
 
 
 class ContainerManager(ABC):
@@ -118,6 +119,51 @@ class ContainerManager(ABC):
         """
         pass
 
+    @abstractmethod
+    def wait(self, container: str, timeout: float | None = None) -> int:
+        """
+        Block until a container stops.
+
+        Args:
+            container: Container ID or name
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            Exit code of the container
+
+        Raises:
+            ContainerNotFoundError: If container doesn't exist
+            ContainerRuntimeError: If waiting fails or times out
+        """
+        pass
+
+    @abstractmethod
+    def events(
+        self,
+        filters: dict[str, str] | None = None,
+        since: str | None = None,
+        until: str | None = None,
+    ) -> Iterator[ContainerEvent]:
+        """
+        Stream container events as they happen.
+
+        The stream stays open until ``until`` is reached or the iterator
+        is closed.
+
+        Args:
+            filters: Optional filters (e.g., {'container': 'my-app',
+                'event': 'die'})
+            since: Show events created since this timestamp
+            until: Stream events until this timestamp
+
+        Yields:
+            ContainerEvent for each container event
+
+        Raises:
+            ContainerRuntimeError: If the event stream fails
+        """
+        pass
+
     @abstractmethod
     def list(
         self,
@@ -50,6 +50,16 @@ class BuildContext:
     files: dict[str, bytes] = field(default_factory=dict)
     """Additional files to include in build context (path -> content)"""
 
+    paths: dict[str, str | Path] = field(default_factory=dict)
+    """Host files or directories streamed into the context
+    (context path -> host path)"""
+
+    ignore: list[str] = field(default_factory=list)
+    """Glob patterns excluded from ``paths`` (like .dockerignore)"""
+
+    compress: bool = False
+    """Gzip the build context while streaming it"""
+
     build_args: dict[str, str] = field(default_factory=dict)
     """Build arguments"""
 
@@ -192,6 +202,23 @@ class ContainerInfo:
     """Exit code (if container has exited)"""
 
 
+@dataclass
+class ContainerEvent:
+    """A container lifecycle event reported by the runtime."""
+
+    container_id: str
+    """ID of the container the event refers to"""
+
+    action: str
+    """Event action (e.g., 'start', 'die', 'destroy')"""
+
+    time: int | None = None
+    """Event time (Unix timestamp)"""
+
+    attributes: dict[str, str] = field(default_factory=dict)
+    """Event attributes (container name, image, exit code, labels)"""
+
+
 @dataclass
 class VolumeInfo:
     """Information about a volume."""
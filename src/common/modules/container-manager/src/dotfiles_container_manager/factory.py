@@ -1,7 +1,7 @@
 """Factory for creating container engines."""
 
 from .core import ContainerEngine, ContainerRuntime, RuntimeNotAvailableError
-from .implementations import DockerEngine
+from .implementations import APIEngine, DockerEngine
 
 
 class ContainerEngineFactory:
@@ -11,6 +11,8 @@ class ContainerEngineFactory:
     def create(
         runtime: ContainerRuntime,
         command: str | None = None,
+        use_api: bool = False,
+        socket_path: str | None = None,
     ) -> ContainerEngine:
         """
         Create a container engine instance.
@@ -18,6 +20,10 @@ class ContainerEngineFactory:
         Args:
             runtime: Container runtime to use
             command: Optional custom command (defaults to runtime value)
+            use_api: Talk to the Engine API socket instead of running the
+                CLI for every operation
+            socket_path: API socket path (runtime default if None; only
+                used with use_api)
 
         Returns:
             ContainerEngine instance
@@ -33,12 +39,21 @@ class ContainerEngineFactory:
             >>> engine = ContainerEngineFactory.create(
             ...     ContainerRuntime.DOCKER, command="podman"
             ... )
+            >>> engine = ContainerEngineFactory.create(
+            ...     ContainerRuntime.PODMAN, use_api=True
+            ... )
         """
         # Determine command
         if command is None:
             command = runtime.value
 
         # Create engine based on runtime
+        if use_api:
+            api_engine = APIEngine(socket_path, runtime=runtime)
+            if not api_engine.is_available():
+                raise RuntimeNotAvailableError(api_engine.socket_path)
+            return api_engine
+
         if runtime == ContainerRuntime.DOCKER:
             engine = DockerEngine(command)
         elif runtime == ContainerRuntime.PODMAN:
@@ -98,3 +113,32 @@ class ContainerEngineFactory:
         engine = DockerEngine(command)
         engine.ensure_available()
         return engine
+
+    @staticmethod
+    def create_api(
+        runtime: ContainerRuntime = ContainerRuntime.DOCKER,
+        socket_path: str | None = None,
+    ) -> APIEngine:
+        """
+        Create an engine that speaks the Engine API over a Unix socket.
+
+        Args:
+            runtime: Runtime serving the socket (selects the default
+                socket path)
+            socket_path: API socket path (runtime default if None)
+
+        Returns:
+            APIEngine instance
+
+        Raises:
+            RuntimeNotAvailableError: If the socket is not reachable
+
+        Examples:
+            >>> engine = ContainerEngineFactory.create_api()
+            >>> engine = ContainerEngineFactory.create_api(
+            ...     socket_path="/run/user/1000/podman/podman.sock"
+            ... )
+        """
+        engine = APIEngine(socket_path, runtime=runtime)
+        engine.ensure_available()
+        return engine
@@ -1,11 +1,22 @@
 """Container manager implementations."""
 
+from .api import (
+    APIContainerManager,
+    APIEngine,
+    APIImageManager,
+    APINetworkManager,
+    APIVolumeManager,
+    EngineAPIClient,
+    EngineAPIError,
+)
 from .docker import (
+    BUILD_DIGEST_LABEL,
     DockerContainerManager,
     DockerEngine,
     DockerImageManager,
     DockerNetworkManager,
     DockerVolumeManager,
+    build_context_digest,
 )
 
 __all__ = [
@@ -14,4 +25,13 @@ __all__ = [
     "DockerContainerManager",
     "DockerVolumeManager",
     "DockerNetworkManager",
+    "APIEngine",
+    "APIImageManager",
+    "APIContainerManager",
+    "APIVolumeManager",
+    "APINetworkManager",
+    "EngineAPIClient",
+    "EngineAPIError",
+    "BUILD_DIGEST_LABEL",
+    "build_context_digest",
 ]
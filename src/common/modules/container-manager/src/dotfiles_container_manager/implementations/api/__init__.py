@@ -0,0 +1,25 @@
+"""Engine API implementation of container management."""
+
+from .client import (
+    NO_TIMEOUT,
+    EngineAPIClient,
+    EngineAPIError,
+    default_socket_path,
+)
+from .container import APIContainerManager
+from .engine import APIEngine
+from .image import APIImageManager
+from .network import APINetworkManager
+from .volume import APIVolumeManager
+
+__all__ = [
+    "APIEngine",
+    "APIImageManager",
+    "APIContainerManager",
+    "APIVolumeManager",
+    "APINetworkManager",
+    "EngineAPIClient",
+    "EngineAPIError",
+    "default_socket_path",
+    "NO_TIMEOUT",
+]
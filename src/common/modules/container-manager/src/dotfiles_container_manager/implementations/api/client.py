@@ -0,0 +1,431 @@
+"""HTTP client for the Docker/Podman Engine API over a Unix socket."""
+
+from __future__ import annotations
+
+import contextlib
+import http.client
+import json
+import os
+import queue
+import socket
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+from typing import Any, Final
+from urllib.parse import urlencode
+
+from ...core.enums import ContainerRuntime
+from ...core.exceptions import ContainerError
+
+DEFAULT_DOCKER_SOCKET = "/var/run/docker.sock"
+DEFAULT_PODMAN_SOCKET = "/run/podman/podman.sock"
+
+
+class _NoTimeout(Enum):
+    """Type of the NO_TIMEOUT sentinel."""
+
+    NO_TIMEOUT = "no-timeout"
+
+
+NO_TIMEOUT: Final = _NoTimeout.NO_TIMEOUT
+"""Request timeout that blocks indefinitely (None means the default)"""
+
+# Request timeout: seconds, NO_TIMEOUT, or None for the client default
+Timeout = float | _NoTimeout | None
+
+
+class EngineAPIError(ContainerError):
+    """Raised when the Engine API returns an error response."""
+
+    def __init__(self, status: int, message: str, method: str, path: str):
+        """
+        Initialize Engine API error.
+
+        Args:
+            status: HTTP status code
+            message: Error message returned by the daemon
+            method: Request method
+            path: Request path
+        """
+        self.status = status
+        super().__init__(
+            message=message, command=[method, path], exit_code=status
+        )
+
+
+@dataclass
+class APIResponse:
+    """Response from the Engine API."""
+
+    status: int
+    """HTTP status code"""
+
+    body: bytes = b""
+    """Response body"""
+
+    headers: dict[str, str] = field(default_factory=dict)
+    """Response headers (lower-case names)"""
+
+    def json(self) -> Any:
+        """Decode the body as JSON (None if empty)."""
+        return json.loads(self.body) if self.body else None
+
+
+class UnixSocketConnection(http.client.HTTPConnection):
+    """HTTP connection over a Unix domain socket."""
+
+    def __init__(self, socket_path: str, timeout: float | None = None):
+        """
+        Initialize connection.
+
+        Args:
+            socket_path: Path to the Unix socket
+            timeout: Socket timeout in seconds (None blocks indefinitely)
+        """
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self) -> None:
+        """Connect to the Unix socket."""
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(self.socket_path)
+        except OSError:
+            sock.close()
+            raise
+        self.sock = sock
+
+
+def default_socket_path(
+    runtime: ContainerRuntime = ContainerRuntime.DOCKER,
+) -> str:
+    """
+    Get the default Engine API socket for a runtime.
+
+    Honours ``DOCKER_HOST`` (``unix://`` URLs) and, for Podman, the
+    rootless socket under ``XDG_RUNTIME_DIR``.
+
+    Args:
+        runtime: Container runtime
+
+    Returns:
+        Path to the Unix socket
+    """
+    docker_host = os.environ.get("DOCKER_HOST", "")
+    if docker_host.startswith("unix://"):
+        return docker_host[len("unix://") :]
+
+    if runtime == ContainerRuntime.PODMAN:
+        runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+        if runtime_dir:
+            rootless = Path(runtime_dir) / "podman" / "podman.sock"
+            if rootless.exists():
+                return str(rootless)
+        return DEFAULT_PODMAN_SOCKET
+
+    return DEFAULT_DOCKER_SOCKET
+
+
+class EngineAPIClient:
+    """
+    Minimal Engine API client with pooled keep-alive connections.
+
+    Each request borrows a connection from the pool and returns it once
+    the response has been read, so consecutive calls reuse the same
+    socket instead of reconnecting. Streaming requests use a dedicated
+    connection that is closed when the stream ends.
+    """
+
+    def __init__(
+        self,
+        socket_path: str | None = None,
+        api_version: str | None = None,
+        timeout: float | None = 60.0,
+        pool_size: int = 4,
+    ):
+        """
+        Initialize client.
+
+        Args:
+            socket_path: Path to the Engine API socket (default for Docker
+                if None)
+            api_version: API version prefix (e.g., '1.43'); unversioned
+                paths are used if None
+            timeout: Default socket timeout in seconds (None blocks
+                indefinitely)
+            pool_size: Maximum number of idle connections kept open
+        """
+        self.socket_path = socket_path or default_socket_path()
+        self.api_version = api_version
+        self.timeout = timeout
+        self._pool: queue.LifoQueue[UnixSocketConnection] = queue.LifoQueue(
+            maxsize=pool_size
+        )
+
+    def url(self, path: str, params: dict[str, Any] | None = None) -> str:
+        """
+        Build a request URL.
+
+        Args:
+            path: API path (e.g., '/containers/json')
+            params: Query parameters; None values are skipped, booleans
+                are sent as 1/0 and dicts/lists as JSON
+
+        Returns:
+            Request URL
+        """
+        prefix = f"/v{self.api_version}" if self.api_version else ""
+        url = prefix + path
+        if params:
+            query = {}
+            for key, value in params.items():
+                if value is None:
+                    continue
+                if isinstance(value, bool):
+                    value = int(value)
+                elif isinstance(value, dict | list):
+                    value = json.dumps(value)
+                query[key] = value
+            if query:
+                url += "?" + urlencode(query)
+        return url
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, Any] | None = None,
+        body: Any = None,
+        data: bytes | Iterator[bytes] | None = None,
+        headers: dict[str, str] | None = None,
+        timeout: Timeout = None,
+    ) -> APIResponse:
+        """
+        Send a request and read the whole response.
+
+        Args:
+            method: HTTP method
+            path: API path
+            params: Query parameters
+            body: JSON-serialisable request body
+            data: Raw request body (bytes or chunk iterator)
+            headers: Extra request headers
+            timeout: Socket timeout for this request (client default if
+                None, NO_TIMEOUT to block indefinitely)
+
+        Returns:
+            APIResponse
+
+        Raises:
+            EngineAPIError: If the daemon returns an error status
+            ContainerError: If the socket cannot be reached
+        """
+        # A pooled connection may have been closed by the daemon while
+        # idle; retry once on a fresh one unless the body was a stream
+        retries = 0 if data is not None and not isinstance(data, bytes) else 1
+        while True:
+            conn = self._acquire(timeout)
+            reused = conn.sock is not None
+            sent = False
+            try:
+                self._send(conn, method, path, params, body, data, headers)
+                sent = True
+                response = conn.getresponse()
+                payload = response.read()
+                break
+            except (OSError, http.client.HTTPException) as e:
+                conn.close()
+                if reused and retries > 0 and self._is_stale(e, sent):
+                    retries -= 1
+                    continue
+                raise ContainerError(
+                    message=f"Engine API request failed: {method} {path}: {e}",
+                    command=[self.socket_path],
+                ) from e
+
+        if response.will_close:
+            conn.close()
+        else:
+            self._release(conn)
+
+        result = APIResponse(
+            status=response.status,
+            body=payload,
+            headers={k.lower(): v for k, v in response.getheaders()},
+        )
+        self._raise_for_status(result, method, path)
+        return result
+
+    def stream(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, Any] | None = None,
+        body: Any = None,
+        data: bytes | Iterator[bytes] | None = None,
+        headers: dict[str, str] | None = None,
+        timeout: Timeout = None,
+        chunk_size: int | None = None,
+    ) -> Iterator[bytes]:
+        """
+        Send a request and yield the response body as it arrives.
+
+        Args:
+            method: HTTP method
+            path: API path
+            params: Query parameters
+            body: JSON-serialisable request body
+            data: Raw request body (bytes or chunk iterator)
+            headers: Extra request headers
+            timeout: Socket timeout (client default if None, NO_TIMEOUT
+                to block indefinitely)
+            chunk_size: Yield raw chunks of up to this many bytes instead
+                of lines
+
+        Yields:
+            Response lines (including the trailing newline) or chunks
+
+        Raises:
+            EngineAPIError: If the daemon returns an error status
+            ContainerError: If the socket cannot be reached
+        """
+        conn = UnixSocketConnection(
+            self.socket_path, timeout=self._socket_timeout(timeout)
+        )
+        try:
+            try:
+                self._send(conn, method, path, params, body, data, headers)
+                response = conn.getresponse()
+            except (OSError, http.client.HTTPException) as e:
+                raise ContainerError(
+                    message=f"Engine API request failed: {method} {path}: {e}",
+                    command=[self.socket_path],
+                ) from e
+
+            if response.status >= 400:
+                self._raise_for_status(
+                    APIResponse(status=response.status, body=response.read()),
+                    method,
+                    path,
+                )
+
+            if chunk_size is None:
+                yield from response
+            else:
+                while chunk := response.read1(chunk_size):
+                    yield chunk
+        finally:
+            conn.close()
+
+    def get(self, path: str, **kwargs: Any) -> Any:
+        """Send a GET request and decode the JSON response."""
+        return self.request("GET", path, **kwargs).json()
+
+    def post(self, path: str, **kwargs: Any) -> Any:
+        """Send a POST request and decode the JSON response."""
+        return self.request("POST", path, **kwargs).json()
+
+    def delete(self, path: str, **kwargs: Any) -> Any:
+        """Send a DELETE request and decode the JSON response."""
+        return self.request("DELETE", path, **kwargs).json()
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                break
+
+    def _socket_timeout(self, timeout: Timeout) -> float | None:
+        """Resolve a request timeout to a socket timeout."""
+        if timeout is NO_TIMEOUT:
+            return None
+        if timeout is None:
+            return self.timeout
+        return timeout
+
+    def _acquire(self, timeout: Timeout) -> UnixSocketConnection:
+        """Borrow a pooled connection (or open a new one)."""
+        try:
+            conn = self._pool.get_nowait()
+        except queue.Empty:
+            conn = UnixSocketConnection(self.socket_path, timeout=self.timeout)
+
+        effective = self._socket_timeout(timeout)
+        conn.timeout = effective
+        if conn.sock is not None:
+            conn.sock.settimeout(effective)
+        return conn
+
+    def _release(self, conn: UnixSocketConnection) -> None:
+        """Return a connection to the pool."""
+        try:
+            self._pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    def _send(
+        self,
+        conn: UnixSocketConnection,
+        method: str,
+        path: str,
+        params: dict[str, Any] | None,
+        body: Any,
+        data: bytes | Iterator[bytes] | None,
+        headers: dict[str, str] | None,
+    ) -> None:
+        """Write a request to a connection."""
+        request_headers = {"Host": "docker"}
+        if body is not None:
+            data = json.dumps(body).encode("utf-8")
+            request_headers["Content-Type"] = "application/json"
+        if headers:
+            request_headers.update(headers)
+
+        encode_chunked = data is not None and not isinstance(data, bytes)
+        if encode_chunked:
+            request_headers["Transfer-Encoding"] = "chunked"
+
+        conn.request(
+            method,
+            self.url(path, params),
+            body=data,
+            headers=request_headers,
+            encode_chunked=encode_chunked,
+        )
+
+    @staticmethod
+    def _is_stale(error: Exception, sent: bool) -> bool:
+        """
+        Check whether a failed request can safely be sent again.
+
+        True only when a reused connection turned out to be closed: it
+        failed while the request was being written, or the daemon hung
+        up before sending any response byte. A timeout never qualifies,
+        since the daemon may still be handling the request.
+
+        Args:
+            error: Error raised by the request
+            sent: Whether the request had been written completely
+        """
+        if isinstance(error, TimeoutError):
+            return False
+        if not sent:
+            return True
+        return isinstance(error, ConnectionResetError | BrokenPipeError)
+
+    @staticmethod
+    def _raise_for_status(
+        response: APIResponse, method: str, path: str
+    ) -> None:
+        """Raise EngineAPIError for error responses."""
+        if response.status < 400:
+            return
+
+        message = response.body.decode("utf-8", errors="replace").strip()
+        with contextlib.suppress(json.JSONDecodeError, AttributeError):
+            message = json.loads(message).get("message", message)
+        raise EngineAPIError(response.status, message, method, path)
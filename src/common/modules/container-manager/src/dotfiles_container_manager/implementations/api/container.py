@@ -0,0 +1,370 @@
+"""Engine API container manager implementation."""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import sys
+from collections.abc import Iterator
+
+from ...core.exceptions import (
+    ContainerError,
+    ContainerNotFoundError,
+    ContainerRuntimeError,
+    ImageNotFoundError,
+)
+from ...core.managers import ContainerManager
+from ...core.types import ContainerEvent, ContainerInfo, RunConfig
+from ..docker.utils import parse_container_event, parse_container_inspect
+from .client import NO_TIMEOUT, EngineAPIClient, EngineAPIError
+from .utils import (
+    STDERR,
+    build_container_config,
+    demux_stream,
+    format_filters,
+    format_timestamp,
+    iter_frames,
+    quote_name,
+)
+
+# Read size for streamed container output
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+
+class APIContainerManager(ContainerManager):
+    """Engine API implementation of ContainerManager."""
+
+    def __init__(self, client: EngineAPIClient):
+        """
+        Initialize Engine API container manager.
+
+        Args:
+            client: Engine API client
+        """
+        self.client = client
+
+    def run(self, config: RunConfig) -> str:
+        """
+        Run a container.
+
+        Args:
+            config: Container run configuration
+
+        Returns:
+            - If config.detach=True: Container ID (12-character short ID)
+            - If config.detach=False: Container output as string (empty
+              if config.stream_output=True)
+        """
+        try:
+            created = self.client.post(
+                "/containers/create",
+                params={"name": config.name},
+                body=build_container_config(config),
+            )
+        except ContainerError as e:
+            if isinstance(e, EngineAPIError) and e.status == 404:
+                raise ImageNotFoundError(config.image) from e
+            raise ContainerRuntimeError(
+                message=(
+                    f"Failed to run container from image '{config.image}': "
+                    f"{e.message}"
+                ),
+                command=e.command,
+            ) from e
+
+        container_id = created["Id"]
+        self.start(container_id)
+
+        if config.detach:
+            return container_id[:12]
+
+        try:
+            if config.stream_output:
+                self._stream_output(container_id)
+            exit_code = self.wait(container_id)
+            output = "" if config.stream_output else self.logs(container_id)
+        finally:
+            if config.remove:
+                with contextlib.suppress(ContainerError):
+                    self.remove(container_id, force=True)
+
+        if exit_code != 0:
+            raise ContainerRuntimeError(
+                message=f"Container from image '{config.image}' failed",
+                command=["POST", f"/containers/{container_id}/wait"],
+                exit_code=exit_code,
+                stderr=output or None,
+            )
+        return output
+
+    def start(self, container: str) -> None:
+        """Start a stopped container."""
+        try:
+            self.client.request(
+                "POST", f"/containers/{quote_name(container)}/start"
+            )
+        except ContainerError as e:
+            raise self._error(e, container, "start") from e
+
+    def stop(self, container: str, timeout: int = 10) -> None:
+        """Stop a running container."""
+        try:
+            self.client.request(
+                "POST",
+                f"/containers/{quote_name(container)}/stop",
+                params={"t": timeout},
+                timeout=self._grace_timeout(timeout),
+            )
+        except ContainerError as e:
+            raise self._error(e, container, "stop") from e
+
+    def restart(self, container: str, timeout: int = 10) -> None:
+        """Restart a container."""
+        try:
+            self.client.request(
+                "POST",
+                f"/containers/{quote_name(container)}/restart",
+                params={"t": timeout},
+                timeout=self._grace_timeout(timeout),
+            )
+        except ContainerError as e:
+            raise self._error(e, container, "restart") from e
+
+    def remove(
+        self, container: str, force: bool = False, volumes: bool = False
+    ) -> None:
+        """Remove a container."""
+        try:
+            self.client.request(
+                "DELETE",
+                f"/containers/{quote_name(container)}",
+                params={"force": force, "v": volumes},
+            )
+        except ContainerError as e:
+            raise self._error(e, container, "remove") from e
+
+    def exists(self, container: str) -> bool:
+        """Check if a container exists."""
+        try:
+            self.client.request(
+                "GET", f"/containers/{quote_name(container)}/json"
+            )
+            return True
+        except ContainerError:
+            return False
+
+    def inspect(self, container: str) -> ContainerInfo:
+        """Get detailed information about a container."""
+        try:
+            data = self.client.get(
+                f"/containers/{quote_name(container)}/json"
+            )
+        except ContainerError as e:
+            raise self._error(e, container, "inspect") from e
+        return parse_container_inspect(data)
+
+    def wait(self, container: str, timeout: float | None = None) -> int:
+        """Block until a container stops and return its exit code."""
+        try:
+            result = self.client.post(
+                f"/containers/{quote_name(container)}/wait",
+                timeout=NO_TIMEOUT if timeout is None else timeout,
+            )
+        except ContainerError as e:
+            raise self._error(e, container, "wait for") from e
+
+        if result.get("Error"):
+            raise ContainerRuntimeError(
+                message=(
+                    f"Failed to wait for container '{container}': "
+                    f"{result['Error'].get('Message', '')}"
+                ),
+            )
+        return int(result.get("StatusCode", 0))
+
+    def events(
+        self,
+        filters: dict[str, str] | None = None,
+        since: str | None = None,
+        until: str | None = None,
+    ) -> Iterator[ContainerEvent]:
+        """Stream container events."""
+        params = {
+            "filters": format_filters(filters, type="container"),
+            "since": since,
+            "until": until,
+        }
+
+        try:
+            for line in self.client.stream(
+                "GET", "/events", params=params, timeout=NO_TIMEOUT
+            ):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    data = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                yield parse_container_event(data)
+        except ContainerError as e:
+            raise ContainerRuntimeError(
+                message=f"Failed to stream container events: {e.message}",
+                command=e.command,
+            ) from e
+
+    def list(
+        self,
+        all: bool = False,
+        filters: dict[str, str] | None = None,
+    ) -> list[ContainerInfo]:
+        """List containers."""
+        try:
+            data = self.client.get(
+                "/containers/json",
+                params={"all": all, "filters": format_filters(filters)},
+            )
+        except ContainerError as e:
+            raise ContainerRuntimeError(
+                message=f"Failed to list containers: {e.message}",
+                command=e.command,
+            ) from e
+
+        return [
+            ContainerInfo(
+                id=item.get("Id", "")[:12],
+                name=(item.get("Names") or [""])[0].lstrip("/"),
+                image=item.get("Image", ""),
+                state=item.get("State", ""),
+                status=item.get("Status", ""),
+                created=format_timestamp(item.get("Created")),
+                labels=item.get("Labels") or {},
+            )
+            for item in data or []
+        ]
+
+    def logs(
+        self,
+        container: str,
+        follow: bool = False,
+        tail: int | None = None,
+    ) -> str:
+        """Get container logs (stdout and stderr interleaved)."""
+        path = f"/containers/{quote_name(container)}/logs"
+        params = {
+            "stdout": True,
+            "stderr": True,
+            "follow": follow,
+            "tail": tail,
+        }
+
+        try:
+            if follow:
+                chunks = self.client.stream(
+                    "GET",
+                    path,
+                    params=params,
+                    timeout=NO_TIMEOUT,
+                    chunk_size=_STREAM_CHUNK_SIZE,
+                )
+                data = b"".join(
+                    payload for _, payload in iter_frames(chunks)
+                )
+            else:
+                raw = self.client.request("GET", path, params=params).body
+                data = b"".join(payload for _, payload in iter_frames([raw]))
+        except ContainerError as e:
+            raise self._error(e, container, "get logs for") from e
+
+        return data.decode("utf-8", errors="replace")
+
+    def exec(
+        self,
+        container: str,
+        command: list[str],
+        detach: bool = False,
+        user: str | None = None,
+    ) -> tuple[int, str]:
+        """Execute a command in a running container."""
+        body = {
+            "Cmd": command,
+            "AttachStdout": not detach,
+            "AttachStderr": not detach,
+        }
+        if user:
+            body["User"] = user
+
+        try:
+            created = self.client.post(
+                f"/containers/{quote_name(container)}/exec", body=body
+            )
+            exec_id = created["Id"]
+            raw = self.client.request(
+                "POST",
+                f"/exec/{exec_id}/start",
+                body={"Detach": detach, "Tty": False},
+                timeout=NO_TIMEOUT,
+            ).body
+            if detach:
+                return (0, "")
+            result = self.client.get(f"/exec/{exec_id}/json")
+        except EngineAPIError as e:
+            if e.status == 404:
+                raise ContainerNotFoundError(container) from e
+            return (e.status, e.message)
+        except ContainerError as e:
+            return (1, e.message)
+
+        stdout, stderr = demux_stream(raw)
+        exit_code = result.get("ExitCode") or 0
+        if exit_code != 0:
+            return (exit_code, (stderr or stdout).decode("utf-8", "replace"))
+        return (0, stdout.decode("utf-8", errors="replace"))
+
+    def prune(self) -> dict[str, int]:
+        """Remove stopped containers."""
+        try:
+            result = self.client.post("/containers/prune") or {}
+        except ContainerError as e:
+            raise ContainerRuntimeError(
+                message=f"Failed to prune containers: {e.message}",
+                command=e.command,
+            ) from e
+
+        return {
+            "deleted": len(result.get("ContainersDeleted") or []),
+            "space_reclaimed": result.get("SpaceReclaimed", 0),
+        }
+
+    def _stream_output(self, container_id: str) -> None:
+        """Copy a running container's output to stdout/stderr."""
+        chunks = self.client.stream(
+            "GET",
+            f"/containers/{container_id}/logs",
+            params={"stdout": True, "stderr": True, "follow": True},
+            timeout=NO_TIMEOUT,
+            chunk_size=_STREAM_CHUNK_SIZE,
+        )
+        for stream_type, payload in iter_frames(chunks):
+            target = sys.stderr if stream_type == STDERR else sys.stdout
+            target.buffer.write(payload)
+            target.flush()
+
+    def _grace_timeout(self, timeout: int) -> float | None:
+        """Socket timeout for calls that wait up to timeout seconds."""
+        if self.client.timeout is None:
+            return None
+        return self.client.timeout + timeout
+
+    @staticmethod
+    def _error(
+        error: ContainerError, container: str, action: str
+    ) -> ContainerError:
+        """Map an API error to the matching container exception."""
+        if isinstance(error, EngineAPIError) and error.status == 404:
+            return ContainerNotFoundError(container)
+        return ContainerRuntimeError(
+            message=f"Failed to {action} container '{container}': "
+            f"{error.message}",
+            command=error.command,
+        )
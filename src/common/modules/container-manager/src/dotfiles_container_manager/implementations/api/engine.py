@@ -0,0 +1,132 @@
+"""Engine API implementation of the container engine."""
+
+from typing import Any
+
+from ...core.base import ContainerEngine
+from ...core.enums import ContainerRuntime
+from ...core.exceptions import ContainerError, RuntimeNotAvailableError
+from .client import EngineAPIClient, default_socket_path
+from .container import APIContainerManager
+from .image import APIImageManager
+from .network import APINetworkManager
+from .volume import APIVolumeManager
+
+
+class APIEngine(ContainerEngine):
+    """
+    Container engine that talks to the Engine HTTP API directly.
+
+    Works with the Docker daemon socket and with Podman's
+    Docker-compatible API socket. Every operation is a request on a
+    pooled keep-alive connection rather than a CLI process.
+    """
+
+    def __init__(
+        self,
+        socket_path: str | None = None,
+        runtime: ContainerRuntime = ContainerRuntime.DOCKER,
+        api_version: str | None = None,
+        timeout: float | None = 60.0,
+    ):
+        """
+        Initialize Engine API engine.
+
+        Args:
+            socket_path: Path to the API socket (runtime default if None)
+            runtime: Runtime serving the socket
+            api_version: API version prefix (e.g., '1.43')
+            timeout: Default request timeout in seconds
+        """
+        self._runtime_hint = runtime
+        self.socket_path = socket_path or default_socket_path(runtime)
+        super().__init__(runtime.value)
+
+        self.client = EngineAPIClient(
+            self.socket_path, api_version=api_version, timeout=timeout
+        )
+
+        # Initialize managers
+        self._images_manager = APIImageManager(self.client)
+        self._containers_manager = APIContainerManager(self.client)
+        self._volumes_manager = APIVolumeManager(self.client)
+        self._networks_manager = APINetworkManager(self.client)
+
+    @property
+    def images(self) -> APIImageManager:
+        """Get the image manager."""
+        return self._images_manager
+
+    @property
+    def containers(self) -> APIContainerManager:
+        """Get the container manager."""
+        return self._containers_manager
+
+    @property
+    def volumes(self) -> APIVolumeManager:
+        """Get the volume manager."""
+        return self._volumes_manager
+
+    @property
+    def networks(self) -> APINetworkManager:
+        """Get the network manager."""
+        return self._networks_manager
+
+    def _detect_runtime(self) -> ContainerRuntime:
+        """Detect the container runtime type."""
+        return self._runtime_hint
+
+    def is_available(self) -> bool:
+        """Check if the API socket is reachable."""
+        return self.ping()
+
+    def version(self) -> str:
+        """Get the runtime version."""
+        try:
+            data = self.client.get("/version")
+        except ContainerError as e:
+            raise ContainerError(
+                message=f"Failed to get {self.command} version: {e.message}",
+                command=e.command,
+            ) from e
+
+        return (
+            f"{self.command} version {data.get('Version', 'unknown')} "
+            f"(API {data.get('ApiVersion', 'unknown')})"
+        )
+
+    def info(self) -> dict[str, Any]:
+        """Get runtime system information."""
+        try:
+            return self.client.get("/info")
+        except ContainerError as e:
+            raise ContainerError(
+                message=f"Failed to get {self.command} info: {e.message}",
+                command=e.command,
+            ) from e
+
+    def ping(self) -> bool:
+        """
+        Ping the daemon to check if it's responsive.
+
+        Returns:
+            True if daemon is responsive, False otherwise
+        """
+        try:
+            self.client.request("GET", "/_ping", timeout=5.0)
+            return True
+        except ContainerError:
+            return False
+
+    def ensure_available(self) -> None:
+        """
+        Ensure the API socket is reachable and raise error if not.
+
+        Raises:
+            RuntimeNotAvailableError: If the daemon is not reachable
+        """
+        if not self.is_available():
+            raise RuntimeNotAvailableError(self.socket_path)
+
+    def close(self) -> None:
+        """Close pooled API connections."""
+        self.client.close()
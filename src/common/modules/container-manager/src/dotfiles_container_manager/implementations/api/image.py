@@ -0,0 +1,280 @@
+"""Engine API image manager implementation."""
+
+from __future__ import annotations
+
+import base64
+import json
+from typing import Any
+
+from ...core.exceptions import (
+    ContainerError,
+    ImageBuildError,
+    ImageError,
+    ImageNotFoundError,
+)
+from ...core.managers import ImageManager
+from ...core.types import BuildContext, ImageInfo
+from ..docker.utils import iter_build_context
+from .client import EngineAPIClient, EngineAPIError
+from .utils import format_filters, format_timestamp, quote_name
+
+# Registry credentials are resolved by the daemon; send an empty auth config
+_EMPTY_REGISTRY_AUTH = base64.urlsafe_b64encode(b"{}").decode("ascii")
+
+
+def _parse_progress(body: bytes) -> list[dict[str, Any]]:
+    """Decode a JSON-lines progress stream (build, pull, push)."""
+    messages = []
+    for line in body.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            messages.append(json.loads(line))
+        except json.JSONDecodeError:
+            continue
+    return messages
+
+
+def _progress_error(messages: list[dict[str, Any]]) -> str | None:
+    """Return the first error reported in a progress stream, if any."""
+    for message in messages:
+        if message.get("error"):
+            return str(message["error"])
+        detail = message.get("errorDetail")
+        if detail:
+            return str(detail.get("message", detail))
+    return None
+
+
+def _split_reference(reference: str) -> tuple[str, str | None]:
+    """Split 'repo:tag' into repo and tag (tag is None if absent)."""
+    name, _, tag = reference.rpartition(":")
+    if not name or "/" in tag:
+        return reference, None
+    return name, tag
+
+
+class APIImageManager(ImageManager):
+    """Engine API implementation of ImageManager."""
+
+    def __init__(self, client: EngineAPIClient):
+        """
+        Initialize Engine API image manager.
+
+        Args:
+            client: Engine API client
+        """
+        self.client = client
+
+    def build(
+        self,
+        context: BuildContext,
+        image_name: str,
+        timeout: int = 600,
+    ) -> str:
+        """Build an image."""
+        params = {
+            "t": image_name,
+            "buildargs": context.build_args or None,
+            "labels": context.labels or None,
+            "target": context.target,
+            "networkmode": context.network,
+            "nocache": context.no_cache,
+            "pull": context.pull,
+            "rm": context.rm,
+        }
+
+        try:
+            response = self.client.request(
+                "POST",
+                "/build",
+                params=params,
+                data=iter_build_context(context),
+                headers={"Content-Type": "application/x-tar"},
+                timeout=timeout,
+            )
+        except ContainerError as e:
+            raise ImageBuildError(
+                message=f"Failed to build image '{image_name}': {e.message}",
+                command=e.command,
+            ) from e
+
+        messages = _parse_progress(response.body)
+        error = _progress_error(messages)
+        if error:
+            raise ImageBuildError(
+                message=f"Failed to build image '{image_name}': {error}",
+                command=["POST", "/build"],
+            )
+
+        for message in reversed(messages):
+            image_id = (message.get("aux") or {}).get("ID")
+            if image_id:
+                return image_id.replace("sha256:", "")[:12]
+
+        # Fallback: inspect the image we just built
+        return self._get_image_id(image_name)
+
+    def tag(self, image: str, tag: str) -> None:
+        """Tag an image."""
+        repo, tag_name = _split_reference(tag)
+
+        try:
+            self.client.request(
+                "POST",
+                f"/images/{quote_name(image)}/tag",
+                params={"repo": repo, "tag": tag_name},
+            )
+        except ContainerError as e:
+            raise ImageError(
+                message=f"Failed to tag image '{image}' as '{tag}': "
+                f"{e.message}",
+                command=e.command,
+            ) from e
+
+    def push(self, image: str, timeout: int = 300) -> None:
+        """Push an image to registry."""
+        repo, tag_name = _split_reference(image)
+
+        try:
+            response = self.client.request(
+                "POST",
+                f"/images/{quote_name(repo)}/push",
+                params={"tag": tag_name},
+                headers={"X-Registry-Auth": _EMPTY_REGISTRY_AUTH},
+                timeout=timeout,
+            )
+        except ContainerError as e:
+            raise ImageError(
+                message=f"Failed to push image '{image}': {e.message}",
+                command=e.command,
+            ) from e
+
+        error = _progress_error(_parse_progress(response.body))
+        if error:
+            raise ImageError(
+                message=f"Failed to push image '{image}': {error}",
+                command=["POST", f"/images/{repo}/push"],
+            )
+
+    def pull(self, image: str, timeout: int = 300) -> str:
+        """Pull an image from registry."""
+        repo, tag_name = _split_reference(image)
+
+        try:
+            response = self.client.request(
+                "POST",
+                "/images/create",
+                params={"fromImage": repo, "tag": tag_name or "latest"},
+                timeout=timeout,
+            )
+        except ContainerError as e:
+            raise ImageError(
+                message=f"Failed to pull image '{image}': {e.message}",
+                command=e.command,
+            ) from e
+
+        error = _progress_error(_parse_progress(response.body))
+        if error:
+            raise ImageError(
+                message=f"Failed to pull image '{image}': {error}",
+                command=["POST", "/images/create"],
+            )
+        return self._get_image_id(image)
+
+    def remove(self, image: str, force: bool = False) -> None:
+        """Remove an image."""
+        try:
+            self.client.request(
+                "DELETE",
+                f"/images/{quote_name(image)}",
+                params={"force": force},
+            )
+        except ContainerError as e:
+            if isinstance(e, EngineAPIError) and e.status == 404:
+                raise ImageNotFoundError(image) from e
+            raise ImageError(
+                message=f"Failed to remove image '{image}': {e.message}",
+                command=e.command,
+            ) from e
+
+    def exists(self, image: str) -> bool:
+        """Check if an image exists."""
+        try:
+            self.client.request("GET", f"/images/{quote_name(image)}/json")
+            return True
+        except ContainerError:
+            return False
+
+    def inspect(self, image: str) -> ImageInfo:
+        """Get detailed information about an image."""
+        try:
+            data = self.client.get(f"/images/{quote_name(image)}/json")
+        except ContainerError as e:
+            if isinstance(e, EngineAPIError) and e.status == 404:
+                raise ImageNotFoundError(image) from e
+            raise ImageError(
+                message=f"Failed to inspect image '{image}': {e.message}",
+                command=e.command,
+            ) from e
+
+        return ImageInfo(
+            id=data.get("Id", "").replace("sha256:", "")[:12],
+            tags=data.get("RepoTags") or [],
+            size=data.get("Size", 0),
+            created=data.get("Created"),
+            labels=(data.get("Config") or {}).get("Labels") or {},
+        )
+
+    def list(self, filters: dict[str, str] | None = None) -> list[ImageInfo]:
+        """List images."""
+        try:
+            data = self.client.get(
+                "/images/json", params={"filters": format_filters(filters)}
+            )
+        except ContainerError as e:
+            raise ImageError(
+                message=f"Failed to list images: {e.message}",
+                command=e.command,
+            ) from e
+
+        return [
+            ImageInfo(
+                id=item.get("Id", "").replace("sha256:", "")[:12],
+                tags=item.get("RepoTags") or [],
+                size=item.get("Size", 0),
+                created=format_timestamp(item.get("Created")),
+                labels=item.get("Labels") or {},
+            )
+            for item in data or []
+        ]
+
+    def prune(self, all: bool = False) -> dict[str, int]:
+        """Remove unused images."""
+        # dangling=false also removes unused tagged images
+        filters = {"dangling": "false"} if all else None
+
+        try:
+            result = self.client.post(
+                "/images/prune", params={"filters": format_filters(filters)}
+            )
+        except ContainerError as e:
+            raise ImageError(
+                message=f"Failed to prune images: {e.message}",
+                command=e.command,
+            ) from e
+
+        result = result or {}
+        return {
+            "deleted": len(result.get("ImagesDeleted") or []),
+            "space_reclaimed": result.get("SpaceReclaimed", 0),
+        }
+
+    def _get_image_id(self, image: str) -> str:
+        """Get image ID by name."""
+        try:
+            data = self.client.get(f"/images/{quote_name(image)}/json")
+            return data.get("Id", "").replace("sha256:", "")[:12]
+        except ContainerError:
+            return ""
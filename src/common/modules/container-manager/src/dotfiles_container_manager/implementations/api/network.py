@@ -0,0 +1,147 @@
+"""Engine API network manager implementation."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from ...core.exceptions import (
+    ContainerError,
+    NetworkError,
+    NetworkNotFoundError,
+)
+from ...core.managers import NetworkManager
+from ...core.types import NetworkInfo
+from .client import EngineAPIClient, EngineAPIError
+from .utils import format_filters, quote_name
+
+
+def _network_info(data: dict[str, Any]) -> NetworkInfo:
+    """Convert an API network document to NetworkInfo."""
+    return NetworkInfo(
+        id=data.get("Id", "")[:12],
+        name=data.get("Name", ""),
+        driver=data.get("Driver", ""),
+        scope=data.get("Scope", ""),
+        labels=data.get("Labels") or {},
+    )
+
+
+class APINetworkManager(NetworkManager):
+    """Engine API implementation of NetworkManager."""
+
+    def __init__(self, client: EngineAPIClient):
+        """
+        Initialize Engine API network manager.
+
+        Args:
+            client: Engine API client
+        """
+        self.client = client
+
+    def create(
+        self,
+        name: str,
+        driver: str = "bridge",
+        labels: dict[str, str] | None = None,
+    ) -> str:
+        """Create a network."""
+        body = {"Name": name, "Driver": driver, "Labels": labels or {}}
+
+        try:
+            result = self.client.post("/networks/create", body=body)
+        except ContainerError as e:
+            raise NetworkError(
+                message=f"Failed to create network '{name}': {e.message}",
+                command=e.command,
+            ) from e
+        return result.get("Id", "")
+
+    def remove(self, name: str) -> None:
+        """Remove a network."""
+        try:
+            self.client.request("DELETE", f"/networks/{quote_name(name)}")
+        except ContainerError as e:
+            raise self._error(e, name, f"remove network '{name}'") from e
+
+    def connect(self, network: str, container: str) -> None:
+        """Connect a container to a network."""
+        try:
+            self.client.request(
+                "POST",
+                f"/networks/{quote_name(network)}/connect",
+                body={"Container": container},
+            )
+        except ContainerError as e:
+            raise self._error(
+                e,
+                network,
+                f"connect container '{container}' to network '{network}'",
+            ) from e
+
+    def disconnect(
+        self, network: str, container: str, force: bool = False
+    ) -> None:
+        """Disconnect a container from a network."""
+        try:
+            self.client.request(
+                "POST",
+                f"/networks/{quote_name(network)}/disconnect",
+                body={"Container": container, "Force": force},
+            )
+        except ContainerError as e:
+            raise self._error(
+                e,
+                network,
+                f"disconnect container '{container}' "
+                f"from network '{network}'",
+            ) from e
+
+    def exists(self, name: str) -> bool:
+        """Check if a network exists."""
+        try:
+            self.client.request("GET", f"/networks/{quote_name(name)}")
+            return True
+        except ContainerError:
+            return False
+
+    def inspect(self, name: str) -> NetworkInfo:
+        """Get detailed information about a network."""
+        try:
+            data = self.client.get(f"/networks/{quote_name(name)}")
+        except ContainerError as e:
+            raise self._error(e, name, f"inspect network '{name}'") from e
+        return _network_info(data)
+
+    def list(self, filters: dict[str, str] | None = None) -> list[NetworkInfo]:
+        """List networks."""
+        try:
+            data = self.client.get(
+                "/networks", params={"filters": format_filters(filters)}
+            )
+        except ContainerError as e:
+            raise NetworkError(
+                message=f"Failed to list networks: {e.message}",
+                command=e.command,
+            ) from e
+        return [_network_info(item) for item in data or []]
+
+    def prune(self) -> dict[str, int]:
+        """Remove unused networks."""
+        try:
+            result = self.client.post("/networks/prune") or {}
+        except ContainerError as e:
+            raise NetworkError(
+                message=f"Failed to prune networks: {e.message}",
+                command=e.command,
+            ) from e
+        return {"deleted": len(result.get("NetworksDeleted") or [])}
+
+    @staticmethod
+    def _error(error: ContainerError, name: str, action: str) -> NetworkError:
+        """Map an API error to the matching network exception."""
+        if isinstance(error, EngineAPIError) and error.status == 404:
+            return NetworkNotFoundError(name)
+        return NetworkError(
+            message=f"Failed to {action}: {error.message}",
+            command=error.command,
+        )
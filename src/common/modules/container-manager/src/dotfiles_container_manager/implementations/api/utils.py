@@ -0,0 +1,240 @@
+"""Utility functions for Engine API operations."""
+
+import re
+import struct
+from collections.abc import Iterable, Iterator
+from datetime import UTC, datetime
+from typing import Any
+from urllib.parse import quote
+
+from ...core.types import RunConfig
+
+# Multiplexed stream frame header: stream type (1 byte), padding (3 bytes),
+# payload size (4 bytes, big endian)
+_FRAME_HEADER = struct.Struct(">BxxxL")
+
+STDOUT = 1
+STDERR = 2
+
+_MEMORY_UNITS = {
+    "": 1,
+    "b": 1,
+    "k": 1024,
+    "m": 1024**2,
+    "g": 1024**3,
+    "t": 1024**4,
+}
+
+
+def quote_name(name: str) -> str:
+    """
+    Quote a container, image, volume or network name for an API path.
+
+    Args:
+        name: Resource name or ID
+
+    Returns:
+        URL-quoted name
+    """
+    return quote(name, safe="")
+
+
+def format_filters(
+    filters: dict[str, str] | None, **extra: str
+) -> dict[str, list[str]] | None:
+    """
+    Convert CLI-style filters to the Engine API filter document.
+
+    Args:
+        filters: Filters (e.g., {'status': 'running'})
+        **extra: Additional filters
+
+    Returns:
+        Filter mapping of name -> values, or None if empty
+    """
+    merged = {**extra, **(filters or {})}
+    if not merged:
+        return None
+    return {key: [value] for key, value in merged.items()}
+
+
+def format_timestamp(value: Any) -> str | None:
+    """
+    Convert a Unix timestamp from list endpoints to ISO 8601.
+
+    Args:
+        value: Timestamp (int) or already formatted string
+
+    Returns:
+        ISO 8601 string, or None if missing
+    """
+    if value is None or isinstance(value, str):
+        return value
+    return datetime.fromtimestamp(value, tz=UTC).isoformat()
+
+
+def parse_memory_limit(limit: str) -> int:
+    """
+    Parse a memory limit such as '512m' or '2g' to bytes.
+
+    Args:
+        limit: Memory limit
+
+    Returns:
+        Limit in bytes
+
+    Raises:
+        ValueError: If the limit cannot be parsed
+    """
+    match = re.fullmatch(r"\s*([\d.]+)\s*([bkmgt]?)b?\s*", limit.lower())
+    if not match:
+        raise ValueError(f"Invalid memory limit: {limit}")
+    return int(float(match.group(1)) * _MEMORY_UNITS[match.group(2)])
+
+
+def iter_frames(chunks: Iterable[bytes]) -> Iterator[tuple[int, bytes]]:
+    """
+    Split a multiplexed attach/logs stream into frames.
+
+    Containers without a TTY send frames prefixed by an 8-byte header;
+    streams that do not start with a valid header (TTY containers) are
+    passed through as stdout.
+
+    Args:
+        chunks: Raw stream chunks
+
+    Yields:
+        Tuples of (stream type, payload)
+    """
+    buffer = bytearray()
+    multiplexed: bool | None = None
+
+    for chunk in chunks:
+        if multiplexed is False:
+            yield STDOUT, chunk
+            continue
+
+        buffer += chunk
+        if multiplexed is None:
+            if len(buffer) < _FRAME_HEADER.size:
+                continue
+            multiplexed = buffer[0] in (0, 1, 2) and buffer[1:4] == bytes(3)
+            if not multiplexed:
+                yield STDOUT, bytes(buffer)
+                buffer.clear()
+                continue
+
+        while len(buffer) >= _FRAME_HEADER.size:
+            stream_type, size = _FRAME_HEADER.unpack_from(buffer)
+            end = _FRAME_HEADER.size + size
+            if len(buffer) < end:
+                break
+            yield stream_type, bytes(buffer[_FRAME_HEADER.size : end])
+            del buffer[:end]
+
+    if buffer:
+        yield STDOUT, bytes(buffer)
+
+
+def demux_stream(data: bytes) -> tuple[bytes, bytes]:
+    """
+    Split a multiplexed attach/logs payload into stdout and stderr.
+
+    Args:
+        data: Raw stream data
+
+    Returns:
+        Tuple of (stdout, stderr)
+    """
+    stdout = bytearray()
+    stderr = bytearray()
+    for stream_type, payload in iter_frames([data]):
+        if stream_type == STDERR:
+            stderr += payload
+        else:
+            stdout += payload
+    return bytes(stdout), bytes(stderr)
+
+
+def build_container_config(config: RunConfig) -> dict[str, Any]:
+    """
+    Build the ``/containers/create`` body for a run configuration.
+
+    Mirrors the flags the CLI implementation passes to ``docker run``.
+
+    Args:
+        config: Container run configuration
+
+    Returns:
+        Container create request body
+    """
+    host_config: dict[str, Any] = {
+        "AutoRemove": config.remove and config.detach,
+        "Privileged": config.privileged,
+        "ReadonlyRootfs": config.read_only,
+        "RestartPolicy": {"Name": config.restart_policy.value},
+        "LogConfig": {"Type": config.log_driver.value, "Config": {}},
+    }
+    body: dict[str, Any] = {
+        "Image": config.image,
+        "Env": [f"{key}={value}" for key, value in config.environment.items()],
+        "Labels": dict(config.labels),
+        "HostConfig": host_config,
+    }
+
+    # Entrypoint/command, with the same split as the CLI implementation
+    if config.entrypoint:
+        body["Entrypoint"] = config.entrypoint[:1]
+    if config.command:
+        body["Cmd"] = list(config.command)
+    elif config.entrypoint and len(config.entrypoint) > 1:
+        body["Cmd"] = config.entrypoint[1:]
+
+    if config.user:
+        body["User"] = config.user
+    if config.working_dir:
+        body["WorkingDir"] = config.working_dir
+    if config.hostname:
+        body["Hostname"] = config.hostname
+
+    # Volumes
+    if config.volumes:
+        binds = []
+        for volume in config.volumes:
+            bind = f"{volume.source}:{volume.target}"
+            if volume.read_only:
+                bind += ":ro"
+            binds.append(bind)
+        host_config["Binds"] = binds
+
+    # Ports
+    if config.ports:
+        exposed: dict[str, dict] = {}
+        bindings: dict[str, list[dict[str, str]]] = {}
+        for port in config.ports:
+            key = f"{port.container_port}/{port.protocol}"
+            exposed[key] = {}
+            bindings.setdefault(key, []).append(
+                {
+                    "HostIp": port.host_ip if port.host_port else "",
+                    "HostPort": str(port.host_port or ""),
+                }
+            )
+        body["ExposedPorts"] = exposed
+        host_config["PortBindings"] = bindings
+
+    # Network
+    if config.network:
+        host_config["NetworkMode"] = (
+            config.network.value
+            if hasattr(config.network, "value")
+            else config.network
+        )
+
+    # Resource limits
+    if config.memory_limit:
+        host_config["Memory"] = parse_memory_limit(config.memory_limit)
+    if config.cpu_limit:
+        host_config["NanoCpus"] = int(float(config.cpu_limit) * 1e9)
+
+    return body
@@ -0,0 +1,122 @@
+"""Engine API volume manager implementation."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from ...core.exceptions import (
+    ContainerError,
+    VolumeError,
+    VolumeNotFoundError,
+)
+from ...core.managers import VolumeManager
+from ...core.types import VolumeInfo
+from .client import EngineAPIClient, EngineAPIError
+from .utils import format_filters, quote_name
+
+
+def _volume_info(data: dict[str, Any]) -> VolumeInfo:
+    """Convert an API volume document to VolumeInfo."""
+    return VolumeInfo(
+        name=data.get("Name", ""),
+        driver=data.get("Driver", ""),
+        mountpoint=data.get("Mountpoint"),
+        labels=data.get("Labels") or {},
+    )
+
+
+class APIVolumeManager(VolumeManager):
+    """Engine API implementation of VolumeManager."""
+
+    def __init__(self, client: EngineAPIClient):
+        """
+        Initialize Engine API volume manager.
+
+        Args:
+            client: Engine API client
+        """
+        self.client = client
+
+    def create(
+        self,
+        name: str,
+        driver: str = "local",
+        labels: dict[str, str] | None = None,
+    ) -> str:
+        """Create a volume."""
+        body = {"Name": name, "Driver": driver, "Labels": labels or {}}
+
+        try:
+            result = self.client.post("/volumes/create", body=body)
+        except ContainerError as e:
+            raise VolumeError(
+                message=f"Failed to create volume '{name}': {e.message}",
+                command=e.command,
+            ) from e
+        return result.get("Name", name)
+
+    def remove(self, name: str, force: bool = False) -> None:
+        """Remove a volume."""
+        try:
+            self.client.request(
+                "DELETE",
+                f"/volumes/{quote_name(name)}",
+                params={"force": force},
+            )
+        except ContainerError as e:
+            if isinstance(e, EngineAPIError) and e.status == 404:
+                raise VolumeNotFoundError(name) from e
+            raise VolumeError(
+                message=f"Failed to remove volume '{name}': {e.message}",
+                command=e.command,
+            ) from e
+
+    def exists(self, name: str) -> bool:
+        """Check if a volume exists."""
+        try:
+            self.client.request("GET", f"/volumes/{quote_name(name)}")
+            return True
+        except ContainerError:
+            return False
+
+    def inspect(self, name: str) -> VolumeInfo:
+        """Get detailed information about a volume."""
+        try:
+            data = self.client.get(f"/volumes/{quote_name(name)}")
+        except ContainerError as e:
+            if isinstance(e, EngineAPIError) and e.status == 404:
+                raise VolumeNotFoundError(name) from e
+            raise VolumeError(
+                message=f"Failed to inspect volume '{name}': {e.message}",
+                command=e.command,
+            ) from e
+        return _volume_info(data)
+
+    def list(self, filters: dict[str, str] | None = None) -> list[VolumeInfo]:
+        """List volumes."""
+        try:
+            data = self.client.get(
+                "/volumes", params={"filters": format_filters(filters)}
+            )
+        except ContainerError as e:
+            raise VolumeError(
+                message=f"Failed to list volumes: {e.message}",
+                command=e.command,
+            ) from e
+        volumes = (data or {}).get("Volumes") or []
+        return [_volume_info(item) for item in volumes]
+
+    def prune(self) -> dict[str, int]:
+        """Remove unused volumes."""
+        try:
+            result = self.client.post("/volumes/prune") or {}
+        except ContainerError as e:
+            raise VolumeError(
+                message=f"Failed to prune volumes: {e.message}",
+                command=e.command,
+            ) from e
+
+        return {
+            "deleted": len(result.get("VolumesDeleted") or []),
+            "space_reclaimed": result.get("SpaceReclaimed", 0),
+        }
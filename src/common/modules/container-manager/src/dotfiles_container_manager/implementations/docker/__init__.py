@@ -4,6 +4,7 @@ from .container import DockerContainerManager
 from .engine import DockerEngine
 from .image import DockerImageManager
 from .network import DockerNetworkManager
+from .utils import BUILD_DIGEST_LABEL, build_context_digest
 from .volume import DockerVolumeManager
 
 __all__ = [
@@ -12,4 +13,6 @@ __all__ = [
     "DockerContainerManager",
     "DockerVolumeManager",
     "DockerNetworkManager",
+    "BUILD_DIGEST_LABEL",
+    "build_context_digest",
 ]
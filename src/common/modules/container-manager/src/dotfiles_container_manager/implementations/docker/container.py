@@ -3,15 +3,19 @@
 from __future__ import annotations
 
 import json
+import subprocess
+from collections.abc import Iterator
 
 from ...core.exceptions import ContainerNotFoundError, ContainerRuntimeError
 from ...core.managers import ContainerManager
-from ...core.types import ContainerInfo, PortMapping, RunConfig
+from ...core.types import ContainerEvent, ContainerInfo, RunConfig
 from .utils import (
     format_env_vars,
     format_labels,
     format_port_mappings,
     format_volume_mounts,
+    parse_container_event,
+    parse_container_inspect,
     run_docker_command,
 )
 
@@ -41,7 +45,7 @@ class DockerContainerManager(ContainerManager):
 
         Note:
             For long-running containers or when you need to inspect/wait for
-            completion, use detach=True and poll with inspect().
+            completion, use detach=True and block on wait().
         """
         cmd = [self.command, "run"]
 
@@ -234,37 +238,7 @@ class DockerContainerManager(ContainerManager):
             if not data:
                 raise ContainerNotFoundError(container)
 
-            cont_data = data[0]
-
-            # Parse port mappings
-            ports = []
-            port_bindings = cont_data.get("NetworkSettings", {}).get(
-                "Ports", {}
-            )
-            for container_port, bindings in port_bindings.items():
-                if bindings:
-                    for binding in bindings:
-                        port, protocol = container_port.split("/")
-                        ports.append(
-                            PortMapping(
-                                container_port=int(port),
-                                host_port=int(binding.get("HostPort", 0)),
-                                protocol=protocol,
-                                host_ip=binding.get("HostIp", "0.0.0.0"),
-                            )
-                        )
-
-            return ContainerInfo(
-                id=cont_data.get("Id", "")[:12],
-                name=cont_data.get("Name", "").lstrip("/"),
-                image=cont_data.get("Config", {}).get("Image", ""),
-                state=cont_data.get("State", {}).get("Status", ""),
-                status=cont_data.get("State", {}).get("Status", ""),
-                created=cont_data.get("Created"),
-                ports=ports,
-                labels=cont_data.get("Config", {}).get("Labels") or {},
-                exit_code=cont_data.get("State", {}).get("ExitCode"),
-            )
+            return parse_container_inspect(data[0])
 
         except json.JSONDecodeError as e:
             raise ContainerRuntimeError(
@@ -281,6 +255,94 @@ class DockerContainerManager(ContainerManager):
                 command=cmd,
             ) from e
 
+    def wait(self, container: str, timeout: float | None = None) -> int:
+        """Block until a Docker container stops and return its exit code."""
+        cmd = [self.command, "wait", container]
+
+        try:
+            result = run_docker_command(cmd, timeout=timeout)
+            output = result.stdout.decode("utf-8").strip()
+            return int(output.splitlines()[-1]) if output else 0
+        except ValueError as e:
+            raise ContainerRuntimeError(
+                message=f"Unexpected wait output for '{container}': {e}",
+                command=cmd,
+            ) from e
+        except Exception as e:
+            if "No such container" in str(e):
+                raise ContainerNotFoundError(container) from e
+            raise ContainerRuntimeError(
+                message=f"Failed to wait for container '{container}': {e}",
+                command=cmd,
+            ) from e
+
+    def events(
+        self,
+        filters: dict[str, str] | None = None,
+        since: str | None = None,
+        until: str | None = None,
+    ) -> Iterator[ContainerEvent]:
+        """Stream Docker container events."""
+        cmd = [
+            self.command,
+            "events",
+            "--format",
+            "{{json .}}",
+            "--filter",
+            "type=container",
+        ]
+
+        if filters:
+            for key, value in filters.items():
+                cmd.extend(["--filter", f"{key}={value}"])
+        if since:
+            cmd.extend(["--since", since])
+        if until:
+            cmd.extend(["--until", until])
+
+        try:
+            process = subprocess.Popen(
+                cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+            )
+        except FileNotFoundError as e:
+            raise ContainerRuntimeError(
+                message="Docker command not found. Is Docker installed?",
+                command=cmd,
+            ) from e
+
+        try:
+            assert process.stdout is not None
+            for line in process.stdout:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    data = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                yield parse_container_event(data)
+
+            if process.wait() != 0:
+                stderr = (
+                    process.stderr.read().decode("utf-8", errors="replace")
+                    if process.stderr
+                    else ""
+                )
+                raise ContainerRuntimeError(
+                    message="Failed to stream container events",
+                    command=cmd,
+                    exit_code=process.returncode,
+                    stderr=stderr,
+                )
+        finally:
+            # Closing the iterator stops the event stream
+            if process.poll() is None:
+                process.terminate()
+                process.wait()
+            for stream in (process.stdout, process.stderr):
+                if stream is not None:
+                    stream.close()
+
     def list(
         self,
         all: bool = False,
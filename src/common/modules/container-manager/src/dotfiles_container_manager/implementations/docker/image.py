@@ -8,10 +8,10 @@ from ...core.exceptions import ImageBuildError, ImageError, ImageNotFoundError
 from ...core.managers import ImageManager
 from ...core.types import BuildContext, ImageInfo
 from .utils import (
-    create_build_context_tar,
     extract_image_id,
     format_build_args,
     format_labels,
+    iter_build_context,
     run_docker_command,
 )
 
@@ -35,11 +35,8 @@ class DockerImageManager(ImageManager):
         timeout: int = 600,
     ) -> str:
         """Build a Docker image."""
-        # Create tar archive with Dockerfile and files
-        tar_data = create_build_context_tar(
-            context.dockerfile,
-            context.files,
-        )
+        # Stream the tar archive with Dockerfile and files into stdin
+        tar_stream = iter_build_context(context)
 
         # Build command
         cmd = [self.command, "build", "-t", image_name]
@@ -73,7 +70,7 @@ class DockerImageManager(ImageManager):
 
         try:
             result = run_docker_command(
-                cmd, timeout=timeout, input_data=tar_data
+                cmd, timeout=timeout, input_data=tar_stream
             )
             output = result.stdout.decode("utf-8")
 
@@ -1,19 +1,107 @@
 """Utility functions for Docker operations."""
 
-import io
+import contextlib
+import fnmatch
+import hashlib
 import json
+import os
 import re
 import subprocess
 import tarfile
+import threading
+import time
+import zlib
+from collections.abc import Iterable, Iterator
+from pathlib import Path, PurePosixPath
 from typing import Any
 
 from ...core.exceptions import ContainerError
+from ...core.types import (
+    BuildContext,
+    ContainerEvent,
+    ContainerInfo,
+    PortMapping,
+)
+
+# Read size used when streaming host files into a build context
+BUILD_CONTEXT_CHUNK_SIZE = 256 * 1024
+
+# Image label holding the digest of the build context an image came from
+BUILD_DIGEST_LABEL = "dotfiles.build.digest"
+
+
+def _run_with_streamed_input(
+    command: list[str],
+    chunks: Iterable[bytes],
+    timeout: float | None,
+    stream: bool,
+) -> subprocess.CompletedProcess:
+    """Run a command, writing stdin chunk by chunk as they are produced."""
+    pipe = None if stream else subprocess.PIPE
+    process = subprocess.Popen(
+        command, stdin=subprocess.PIPE, stdout=pipe, stderr=pipe
+    )
+    deadline = None if timeout is None else time.monotonic() + timeout
+
+    # Drain output concurrently so a chatty process never blocks on a
+    # full pipe while we are still writing its input
+    outputs: dict[str, bytes] = {}
+
+    def drain(name: str, stream_pipe: Any) -> None:
+        outputs[name] = stream_pipe.read()
+
+    readers = [
+        threading.Thread(target=drain, args=(name, stream_pipe), daemon=True)
+        for name, stream_pipe in (
+            ("stdout", process.stdout),
+            ("stderr", process.stderr),
+        )
+        if stream_pipe is not None
+    ]
+    for reader in readers:
+        reader.start()
+
+    assert process.stdin is not None
+    try:
+        for chunk in chunks:
+            process.stdin.write(chunk)
+    except BrokenPipeError:
+        # The process exited early; its exit status reports why
+        pass
+    except Exception as e:
+        process.kill()
+        process.wait()
+        raise ContainerError(
+            message=f"Failed to stream command input: {e}",
+            command=command,
+        ) from e
+    finally:
+        with contextlib.suppress(BrokenPipeError):
+            process.stdin.close()
+
+    try:
+        remaining = None if deadline is None else deadline - time.monotonic()
+        process.wait(timeout=None if remaining is None else max(remaining, 0))
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+        raise
+
+    for reader in readers:
+        reader.join()
+
+    return subprocess.CompletedProcess(
+        command,
+        process.returncode,
+        outputs.get("stdout"),
+        outputs.get("stderr"),
+    )
 
 
 def run_docker_command(
     command: list[str],
-    timeout: int | None = None,
-    input_data: bytes | None = None,
+    timeout: float | None = None,
+    input_data: bytes | Iterable[bytes] | None = None,
     stream: bool = False,
 ) -> subprocess.CompletedProcess:
     """
@@ -22,7 +110,8 @@ def run_docker_command(
     Args:
         command: Command to run
         timeout: Timeout in seconds
-        input_data: Data to pipe to stdin
+        input_data: Data to pipe to stdin (bytes, or an iterable of
+            chunks written as they are produced)
         stream: Stream output to terminal (preserves ANSI codes)
 
     Returns:
@@ -32,7 +121,11 @@ def run_docker_command(
         ContainerError: If command fails
     """
     try:
-        if stream:
+        if input_data is not None and not isinstance(input_data, bytes):
+            result = _run_with_streamed_input(
+                command, input_data, timeout, stream
+            )
+        elif stream:
             # Stream output directly to terminal without capturing
             result = subprocess.run(
                 command,
@@ -80,6 +173,150 @@ def run_docker_command(
         ) from e
 
 
+def is_ignored(path: str, patterns: list[str]) -> bool:
+    """
+    Check whether a context path matches an ignore pattern.
+
+    A pattern matches the full relative path, any leading directory of
+    it, or any single path component, so ``__pycache__``, ``*.pyc`` and
+    ``docs/build`` all behave as expected.
+
+    Args:
+        path: Relative path inside the context (``/`` separated)
+        patterns: Glob patterns
+
+    Returns:
+        True if the path should be excluded
+    """
+    parts = PurePosixPath(path).parts
+    prefixes = ["/".join(parts[:i]) for i in range(1, len(parts) + 1)]
+    for pattern in patterns:
+        pattern = pattern.strip().rstrip("/")
+        if not pattern:
+            continue
+        if any(fnmatch.fnmatchcase(prefix, pattern) for prefix in prefixes):
+            return True
+        if any(fnmatch.fnmatchcase(part, pattern) for part in parts):
+            return True
+    return False
+
+
+def _tar_header(name: str, size: int, mode: int = 0o644) -> bytes:
+    """Build a tar header block for a regular file."""
+    info = tarfile.TarInfo(name=name)
+    info.size = size
+    info.mode = mode
+    # Fixed mtime keeps the context byte-identical across runs
+    info.mtime = 0
+    return info.tobuf(tarfile.DEFAULT_FORMAT, "utf-8", "surrogateescape")
+
+
+def _tar_padding(size: int) -> bytes:
+    """Padding that fills a member's data up to the next tar block."""
+    remainder = size % tarfile.BLOCKSIZE
+    return b"\0" * (tarfile.BLOCKSIZE - remainder) if remainder else b""
+
+
+def _iter_tar_file(
+    name: str, host_path: Path, chunk_size: int
+) -> Iterator[bytes]:
+    """Yield a tar member for a host file, reading it in chunks."""
+    stat = host_path.stat()
+    size = stat.st_size
+    yield _tar_header(name, size, stat.st_mode & 0o7777)
+
+    remaining = size
+    with host_path.open("rb") as f:
+        while remaining > 0:
+            chunk = f.read(min(chunk_size, remaining))
+            if not chunk:
+                # File shrank while streaming; keep the archive valid
+                chunk = b"\0" * remaining
+            remaining -= len(chunk)
+            yield chunk
+    yield _tar_padding(size)
+
+
+def _iter_host_files(
+    host_dir: Path, patterns: list[str]
+) -> Iterator[tuple[str, Path]]:
+    """Walk a directory in sorted order, skipping ignored entries."""
+    for root, dirnames, filenames in os.walk(host_dir):
+        root_path = Path(root)
+        rel_root = root_path.relative_to(host_dir).as_posix()
+        rel_root = "" if rel_root == "." else f"{rel_root}/"
+
+        # Prune ignored directories so they are never walked
+        dirnames[:] = sorted(
+            d for d in dirnames if not is_ignored(rel_root + d, patterns)
+        )
+        for filename in sorted(filenames):
+            rel_path = rel_root + filename
+            if not is_ignored(rel_path, patterns):
+                yield rel_path, root_path / filename
+
+
+def _iter_tar_blocks(
+    context: BuildContext, chunk_size: int
+) -> Iterator[bytes]:
+    """Yield the uncompressed tar stream for a build context."""
+    members: list[tuple[str, bytes]] = [
+        ("Dockerfile", context.dockerfile.encode("utf-8")),
+        *context.files.items(),
+    ]
+    for name, content in members:
+        yield _tar_header(name, len(content)) + content
+        yield _tar_padding(len(content))
+
+    for context_path, host in context.paths.items():
+        host_path = Path(host)
+        prefix = context_path.strip("/")
+        if host_path.is_dir():
+            for rel_path, file_path in _iter_host_files(
+                host_path, context.ignore
+            ):
+                name = f"{prefix}/{rel_path}" if prefix else rel_path
+                yield from _iter_tar_file(name, file_path, chunk_size)
+        else:
+            yield from _iter_tar_file(prefix, host_path, chunk_size)
+
+    # End-of-archive marker: two empty blocks
+    yield b"\0" * (tarfile.BLOCKSIZE * 2)
+
+
+def iter_build_context(
+    context: BuildContext,
+    chunk_size: int = BUILD_CONTEXT_CHUNK_SIZE,
+) -> Iterator[bytes]:
+    """
+    Stream a build context as a tar archive.
+
+    Members are produced lazily: in-memory ``files`` first, then every
+    host file under ``paths`` (minus ``ignore`` matches) read in chunks,
+    so large contexts never have to be held in memory.
+
+    Args:
+        context: Build context
+        chunk_size: Read size for host files
+
+    Yields:
+        Chunks of the (optionally gzip-compressed) tar archive
+    """
+    blocks = _iter_tar_blocks(context, chunk_size)
+    if not context.compress:
+        for block in blocks:
+            if block:
+                yield block
+        return
+
+    compressor = zlib.compressobj(wbits=16 + zlib.MAX_WBITS)
+    for block in blocks:
+        data = compressor.compress(block)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
 def create_build_context_tar(
     dockerfile_content: str,
     files: dict[str, bytes] | None = None,
@@ -94,23 +331,48 @@ def create_build_context_tar(
     Returns:
         Tar archive as bytes
     """
-    tar_buffer = io.BytesIO()
+    context = BuildContext(dockerfile=dockerfile_content, files=files or {})
+    return b"".join(iter_build_context(context))
+
+
+def build_context_digest(context: BuildContext) -> str:
+    """
+    Compute a content digest of a build context.
 
-    with tarfile.open(fileobj=tar_buffer, mode="w") as tar:
-        # Add Dockerfile
-        dockerfile_bytes = dockerfile_content.encode("utf-8")
-        dockerfile_info = tarfile.TarInfo(name="Dockerfile")
-        dockerfile_info.size = len(dockerfile_bytes)
-        tar.addfile(dockerfile_info, io.BytesIO(dockerfile_bytes))
+    Hashes the (uncompressed, deterministic) context archive together
+    with the build arguments, target and labels, so two contexts share a
+    digest exactly when they would produce the same image. Store it in
+    the image under ``BUILD_DIGEST_LABEL`` to detect stale images
+    without rebuilding.
 
-        # Add additional files
-        if files:
-            for file_path, file_content in files.items():
-                file_info = tarfile.TarInfo(name=file_path)
-                file_info.size = len(file_content)
-                tar.addfile(file_info, io.BytesIO(file_content))
+    Args:
+        context: Build context
 
-    return tar_buffer.getvalue()
+    Returns:
+        Digest as ``sha256:<hex>``
+    """
+    digest = hashlib.sha256()
+    archive = BuildContext(
+        dockerfile=context.dockerfile,
+        files=context.files,
+        paths=context.paths,
+        ignore=context.ignore,
+    )
+    for chunk in iter_build_context(archive):
+        digest.update(chunk)
+
+    labels = {
+        key: value
+        for key, value in context.labels.items()
+        if key != BUILD_DIGEST_LABEL
+    }
+    options = {
+        "build_args": context.build_args,
+        "labels": labels,
+        "target": context.target,
+    }
+    digest.update(json.dumps(options, sort_keys=True).encode())
+    return f"sha256:{digest.hexdigest()}"
 
 
 def parse_docker_output(output: str) -> dict[str, Any]:
@@ -129,6 +391,82 @@ def parse_docker_output(output: str) -> dict[str, Any]:
         return {"raw": output}
 
 
+def parse_container_inspect(data: dict[str, Any]) -> ContainerInfo:
+    """
+    Parse container details from inspect output.
+
+    ``container inspect`` and the Engine API's ``/containers/{id}/json``
+    return the same document.
+
+    Args:
+        data: Decoded inspect document for one container
+
+    Returns:
+        ContainerInfo
+    """
+    # Parse port mappings
+    ports = []
+    port_bindings = (data.get("NetworkSettings") or {}).get("Ports") or {}
+    for container_port, bindings in port_bindings.items():
+        if bindings:
+            for binding in bindings:
+                port, protocol = container_port.split("/")
+                ports.append(
+                    PortMapping(
+                        container_port=int(port),
+                        host_port=int(binding.get("HostPort", 0)),
+                        protocol=protocol,
+                        host_ip=binding.get("HostIp", "0.0.0.0"),
+                    )
+                )
+
+    state = data.get("State", {})
+    config = data.get("Config", {})
+    return ContainerInfo(
+        id=data.get("Id", "")[:12],
+        name=data.get("Name", "").lstrip("/"),
+        image=config.get("Image", ""),
+        state=state.get("Status", ""),
+        status=state.get("Status", ""),
+        created=data.get("Created"),
+        ports=ports,
+        labels=config.get("Labels") or {},
+        exit_code=state.get("ExitCode"),
+    )
+
+
+def parse_container_event(data: dict[str, Any]) -> ContainerEvent:
+    """
+    Parse a container event from ``events --format '{{json .}}'``.
+
+    Handles both the Docker layout (Action/Actor) and the flat layout
+    used by Podman (Status/ID/Name).
+
+    Args:
+        data: Decoded JSON event
+
+    Returns:
+        ContainerEvent
+    """
+    actor = data.get("Actor") or {}
+    attributes = dict(actor.get("Attributes") or data.get("Attributes") or {})
+    for key, attribute in (("Name", "name"), ("Image", "image")):
+        if key in data and attribute not in attributes:
+            attributes[attribute] = data[key]
+    if data.get("ContainerExitCode") is not None:
+        attributes.setdefault("exitCode", str(data["ContainerExitCode"]))
+
+    container_id = actor.get("ID") or data.get("id") or data.get("ID", "")
+    action = data.get("Action") or data.get("status") or data.get("Status")
+
+    return ContainerEvent(
+        container_id=container_id,
+        action=action or "",
+        time=data.get("time") or data.get("Time"),
+        attributes={key: str(value) for key, value in attributes.items()},
+    )
+
+
 def extract_image_id(output: str) -> str:
     """
     Extract image ID from Docker build output.
@@ -0,0 +1,507 @@
+"""Tests for the Engine API implementation against a local stand-in."""
+
+import json
+import os
+import shutil
+import socketserver
+import struct
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler
+from urllib.parse import parse_qs, unquote, urlparse
+
+import pytest
+
+from dotfiles_container_manager import ContainerEngineFactory
+from dotfiles_container_manager.core import (
+    BuildContext,
+    ContainerError,
+    ContainerNotFoundError,
+    ContainerRuntime,
+    ImageBuildError,
+    PortMapping,
+    RunConfig,
+    VolumeMount,
+)
+from dotfiles_container_manager.implementations.api import (
+    NO_TIMEOUT,
+    APIEngine,
+    EngineAPIClient,
+    EngineAPIError,
+)
+from dotfiles_container_manager.implementations.api.utils import (
+    build_container_config,
+    demux_stream,
+    iter_frames,
+    parse_memory_limit,
+)
+
+
+def _frame(stream_type: int, payload: bytes) -> bytes:
+    """Build a multiplexed stream frame."""
+    return struct.pack(">BxxxL", stream_type, len(payload)) + payload
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Request handler that dispatches to the server's routes."""
+
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def log_message(self, format, *args):
+        pass
+
+    def _handle(self):
+        url = urlparse(self.path)
+        if self.headers.get("Transfer-Encoding") == "chunked":
+            body = b""
+            while True:
+                size = int(self.rfile.readline().strip(), 16)
+                chunk = self.rfile.read(size)
+                self.rfile.readline()
+                if size == 0:
+                    break
+                body += chunk
+        else:
+            body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+        request = {
+            "method": self.command,
+            "path": unquote(url.path),
+            "query": {k: v[0] for k, v in parse_qs(url.query).items()},
+            "body": body,
+            "headers": dict(self.headers),
+        }
+        self.server.requests.append(request)
+
+        route = self.server.routes.get((self.command, unquote(url.path)))
+        if route is None:
+            status, payload = 404, {"message": f"No such route: {url.path}"}
+        else:
+            status, payload = route(request)
+
+        if not isinstance(payload, bytes):
+            payload = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+        # Drop the connection despite keep-alive, like an idle timeout
+        if self.server.hang_up:
+            self.close_connection = True
+
+    def do_GET(self):
+        self._handle()
+
+    def do_POST(self):
+        self._handle()
+
+    def do_DELETE(self):
+        self._handle()
+
+
+class _FakeDaemon(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Stand-in Engine API daemon on a Unix socket."""
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: str):
+        super().__init__(socket_path, _Handler)
+        self.routes = {}
+        self.requests = []
+        self.connections = 0
+        self.hang_up = False
+
+
+@pytest.fixture
+def daemon():
+    """Run a stand-in daemon on a short Unix socket path."""
+    directory = tempfile.mkdtemp(prefix="cm-")
+    server = _FakeDaemon(os.path.join(directory, "api.sock"))
+    thread = threading.Thread(
+        target=server.serve_forever, args=(0.01,), daemon=True
+    )
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+@pytest.fixture
+def engine(daemon):
+    """APIEngine connected to the stand-in daemon."""
+    engine = APIEngine(daemon.server_address, timeout=5.0)
+    yield engine
+    engine.close()
+
+
+class TestEngineAPIClient:
+    """Tests for EngineAPIClient."""
+
+    def test_keep_alive_reuses_connection(self, daemon):
+        """Test consecutive requests share one pooled connection."""
+        daemon.routes[("GET", "/_ping")] = lambda r: (200, b"OK")
+        client = EngineAPIClient(daemon.server_address, timeout=5.0)
+
+        for _ in range(5):
+            assert client.request("GET", "/_ping").body == b"OK"
+
+        assert daemon.connections == 1
+        client.close()
+
+    def test_error_status_raises(self, daemon):
+        """Test error responses raise EngineAPIError with the message."""
+        client = EngineAPIClient(daemon.server_address, timeout=5.0)
+
+        with pytest.raises(EngineAPIError) as exc_info:
+            client.get("/containers/missing/json")
+
+        assert exc_info.value.status == 404
+        assert "No such route" in exc_info.value.message
+        client.close()
+
+    def test_query_params_and_version_prefix(self, daemon):
+        """Test params are encoded and the API version is prefixed."""
+        daemon.routes[("GET", "/v1.43/containers/json")] = lambda r: (200, [])
+        client = EngineAPIClient(
+            daemon.server_address, api_version="1.43", timeout=5.0
+        )
+
+        client.get(
+            "/containers/json",
+            params={"all": True, "filters": {"status": ["exited"]}, "x": None},
+        )
+
+        query = daemon.requests[0]["query"]
+        assert query == {"all": "1", "filters": '{"status": ["exited"]}'}
+        client.close()
+
+    def test_chunked_request_body(self, daemon):
+        """Test iterator bodies are sent with chunked encoding."""
+        daemon.routes[("POST", "/build")] = lambda r: (200, b"")
+        client = EngineAPIClient(daemon.server_address, timeout=5.0)
+
+        client.request("POST", "/build", data=iter([b"abc", b"def"]))
+
+        assert daemon.requests[0]["body"] == b"abcdef"
+        client.close()
+
+    def test_stale_connection_is_retried(self, daemon):
+        """Test a request on a connection closed while idle is resent."""
+        daemon.routes[("POST", "/containers/create")] = lambda r: (
+            201,
+            {"Id": "abc"},
+        )
+        daemon.hang_up = True
+        client = EngineAPIClient(daemon.server_address, timeout=5.0)
+
+        for _ in range(3):
+            assert client.post("/containers/create") == {"Id": "abc"}
+
+        assert len(daemon.requests) == 3
+        assert daemon.connections == 3
+        client.close()
+
+    def test_timeout_is_not_retried(self, daemon):
+        """Test a request that timed out after being sent isn't resent."""
+
+        def slow(request):
+            time.sleep(0.5)
+            return 200, {"StatusCode": 0}
+
+        daemon.routes[("GET", "/_ping")] = lambda r: (200, b"OK")
+        daemon.routes[("POST", "/containers/job/wait")] = slow
+        client = EngineAPIClient(daemon.server_address, timeout=5.0)
+        client.request("GET", "/_ping")
+
+        with pytest.raises(ContainerError):
+            client.post("/containers/job/wait", timeout=0.1)
+        time.sleep(0.6)
+
+        methods = [r["method"] for r in daemon.requests]
+        assert methods == ["GET", "POST"]
+        client.close()
+
+    def test_no_timeout_outlasts_default(self, daemon):
+        """Test NO_TIMEOUT requests may run past the default timeout."""
+
+        def slow(request):
+            time.sleep(0.3)
+            return 200, {"StatusCode": 0}
+
+        daemon.routes[("POST", "/containers/job/wait")] = slow
+        client = EngineAPIClient(daemon.server_address, timeout=0.1)
+
+        assert client.post("/containers/job/wait", timeout=NO_TIMEOUT) == {
+            "StatusCode": 0
+        }
+        client.close()
+
+    def test_unreachable_socket(self, tmp_path):
+        """Test missing sockets are reported as container errors."""
+        engine = APIEngine(str(tmp_path / "missing.sock"))
+        assert engine.is_available() is False
+
+
+class TestAPIUtils:
+    """Tests for Engine API helpers."""
+
+    def test_iter_frames_across_chunks(self):
+        """Test frames split across reads are reassembled."""
+        data = _frame(1, b"hello ") + _frame(2, b"oops") + _frame(1, b"bye")
+        chunks = [data[:5], data[5:13], data[13:]]
+
+        frames = list(iter_frames(chunks))
+
+        assert frames == [(1, b"hello "), (2, b"oops"), (1, b"bye")]
+
+    def test_demux_tty_passthrough(self):
+        """Test TTY output without frame headers is returned as stdout."""
+        assert demux_stream(b"plain output\n") == (b"plain output\n", b"")
+
+    def test_parse_memory_limit(self):
+        """Test memory limits are converted to bytes."""
+        assert parse_memory_limit("512m") == 512 * 1024**2
+        assert parse_memory_limit("2g") == 2 * 1024**3
+        assert parse_memory_limit("1024") == 1024
+        with pytest.raises(ValueError):
+            parse_memory_limit("lots")
+
+    def test_build_container_config(self):
+        """Test RunConfig maps to the create request body."""
+        config = RunConfig(
+            image="alpine:latest",
+            entrypoint=["/bin/sh", "-c", "echo hi"],
+            environment={"A": "1"},
+            volumes=[
+                VolumeMount(source="/host", target="/data", read_only=True)
+            ],
+            ports=[PortMapping(container_port=80, host_port=8080)],
+            memory_limit="256m",
+            cpu_limit="0.5",
+            remove=True,
+        )
+
+        body = build_container_config(config)
+
+        assert body["Image"] == "alpine:latest"
+        assert body["Entrypoint"] == ["/bin/sh"]
+        assert body["Cmd"] == ["-c", "echo hi"]
+        assert body["Env"] == ["A=1"]
+        assert body["ExposedPorts"] == {"80/tcp": {}}
+        host = body["HostConfig"]
+        assert host["Binds"] == ["/host:/data:ro"]
+        assert host["PortBindings"]["80/tcp"][0]["HostPort"] == "8080"
+        assert host["Memory"] == 256 * 1024**2
+        assert host["NanoCpus"] == 500_000_000
+        assert host["AutoRemove"] is True
+        assert host["NetworkMode"] == "bridge"
+
+
+class TestAPIContainerManager:
+    """Tests for APIContainerManager."""
+
+    def test_run_detached(self, daemon, engine):
+        """Test run creates and starts the container."""
+        daemon.routes[("POST", "/containers/create")] = lambda r: (
+            201,
+            {"Id": "abcdef1234567890", "Warnings": []},
+        )
+        daemon.routes[("POST", "/containers/abcdef1234567890/start")] = (
+            lambda r: (204, b"")
+        )
+
+        container_id = engine.containers.run(
+            RunConfig(image="alpine", name="job", environment={"X": "y"})
+        )
+
+        assert container_id == "abcdef123456"
+        create = daemon.requests[0]
+        assert create["query"] == {"name": "job"}
+        assert json.loads(create["body"])["Env"] == ["X=y"]
+        assert daemon.requests[1]["path"].endswith("/start")
+
+    def test_inspect(self, daemon, engine):
+        """Test inspect parses the container document."""
+        daemon.routes[("GET", "/containers/job/json")] = lambda r: (
+            200,
+            {
+                "Id": "abcdef1234567890",
+                "Name": "/job",
+                "Config": {"Image": "alpine", "Labels": {"a": "b"}},
+                "State": {"Status": "exited", "ExitCode": 3},
+            },
+        )
+
+        info = engine.containers.inspect("job")
+
+        assert info.id == "abcdef123456"
+        assert info.name == "job"
+        assert info.state == "exited"
+        assert info.exit_code == 3
+        assert info.labels == {"a": "b"}
+
+    def test_inspect_not_found(self, engine):
+        """Test missing containers raise ContainerNotFoundError."""
+        with pytest.raises(ContainerNotFoundError):
+            engine.containers.inspect("missing")
+        assert engine.containers.exists("missing") is False
+
+    def test_wait(self, daemon, engine):
+        """Test wait returns the container exit code."""
+        daemon.routes[("POST", "/containers/job/wait")] = lambda r: (
+            200,
+            {"StatusCode": 2},
+        )
+
+        assert engine.containers.wait("job") == 2
+
+    def test_wait_outlasts_client_timeout(self, daemon):
+        """Test wait without a timeout isn't cut off by the client's."""
+
+        def slow(request):
+            time.sleep(0.3)
+            return 200, {"StatusCode": 0}
+
+        daemon.routes[("POST", "/containers/job/wait")] = slow
+        engine = APIEngine(daemon.server_address, timeout=0.1)
+
+        assert engine.containers.wait("job") == 0
+        assert len(daemon.requests) == 1
+        engine.close()
+
+    def test_logs_demultiplexed(self, daemon, engine):
+        """Test logs strip stream frame headers."""
+        daemon.routes[("GET", "/containers/job/logs")] = lambda r: (
+            200,
+            _frame(1, b"out\n") + _frame(2, b"err\n"),
+        )
+
+        assert engine.containers.logs("job", tail=5) == "out\nerr\n"
+        assert daemon.requests[0]["query"]["tail"] == "5"
+
+    def test_events(self, daemon, engine):
+        """Test events are streamed and parsed."""
+        events = [
+            {"Action": "start", "Actor": {"ID": "a1", "Attributes": {}}},
+            {"Action": "die", "Actor": {"ID": "a1", "Attributes": {}}},
+        ]
+        daemon.routes[("GET", "/events")] = lambda r: (
+            200,
+            b"".join(json.dumps(e).encode() + b"\n" for e in events),
+        )
+
+        received = list(engine.containers.events(filters={"container": "a1"}))
+
+        assert [e.action for e in received] == ["start", "die"]
+        filters = json.loads(daemon.requests[0]["query"]["filters"])
+        assert filters == {"type": ["container"], "container": ["a1"]}
+
+    def test_list(self, daemon, engine):
+        """Test list converts the summary documents."""
+        daemon.routes[("GET", "/containers/json")] = lambda r: (
+            200,
+            [
+                {
+                    "Id": "abcdef1234567890",
+                    "Names": ["/job"],
+                    "Image": "alpine",
+                    "State": "running",
+                    "Status": "Up 1 second",
+                    "Created": 0,
+                }
+            ],
+        )
+
+        containers = engine.containers.list(all=True)
+
+        assert containers[0].name == "job"
+        assert containers[0].created == "1970-01-01T00:00:00+00:00"
+        assert daemon.requests[0]["query"]["all"] == "1"
+
+
+class TestAPIImageManager:
+    """Tests for APIImageManager."""
+
+    def test_build(self, daemon, engine):
+        """Test build uploads the context and returns the image ID."""
+        daemon.routes[("POST", "/build")] = lambda r: (
+            200,
+            b'{"stream": "Step 1/1"}\n'
+            b'{"aux": {"ID": "sha256:0123456789abcdef"}}\n',
+        )
+
+        image_id = engine.images.build(
+            BuildContext(
+                dockerfile="FROM alpine", build_args={"V": "1"}, no_cache=True
+            ),
+            "test:latest",
+        )
+
+        assert image_id == "0123456789ab"
+        request = daemon.requests[0]
+        assert request["headers"]["Content-Type"] == "application/x-tar"
+        assert request["query"]["t"] == "test:latest"
+        assert json.loads(request["query"]["buildargs"]) == {"V": "1"}
+        assert request["query"]["nocache"] == "1"
+
+    def test_build_error(self, daemon, engine):
+        """Test build errors in the progress stream raise ImageBuildError."""
+        daemon.routes[("POST", "/build")] = lambda r: (
+            200,
+            b'{"errorDetail": {"message": "boom"}, "error": "boom"}\n',
+        )
+
+        with pytest.raises(ImageBuildError, match="boom"):
+            engine.images.build(BuildContext(dockerfile="FROM x"), "t")
+
+    def test_inspect_labels(self, daemon, engine):
+        """Test image inspect returns labels."""
+        daemon.routes[("GET", "/images/test:latest/json")] = lambda r: (
+            200,
+            {
+                "Id": "sha256:0123456789abcdef",
+                "RepoTags": ["test:latest"],
+                "Size": 10,
+                "Config": {"Labels": {"digest": "x"}},
+            },
+        )
+
+        info = engine.images.inspect("test:latest")
+
+        assert info.id == "0123456789ab"
+        assert info.labels == {"digest": "x"}
+
+
+class TestAPIEngine:
+    """Tests for APIEngine and factory selection."""
+
+    def test_version(self, daemon, engine):
+        """Test version reports the daemon and API version."""
+        daemon.routes[("GET", "/version")] = lambda r: (
+            200,
+            {"Version": "24.0.5", "ApiVersion": "1.43"},
+        )
+
+        assert engine.version() == "docker version 24.0.5 (API 1.43)"
+
+    def test_factory_create_api(self, daemon):
+        """Test the factory selects the API engine."""
+        daemon.routes[("GET", "/_ping")] = lambda r: (200, b"OK")
+
+        engine = ContainerEngineFactory.create(
+            ContainerRuntime.PODMAN,
+            use_api=True,
+            socket_path=daemon.server_address,
+        )
+
+        assert isinstance(engine, APIEngine)
+        assert engine.runtime == ContainerRuntime.PODMAN
+        engine.close()
@@ -1,5 +1,6 @@
 """Tests for DockerContainerManager."""
 
+import io
 import json
 from unittest.mock import MagicMock, patch
 
@@ -581,6 +582,110 @@ class TestDockerContainerManager:
             with pytest.raises(ContainerNotFoundError):
                 manager.logs("test-container")
 
+    def test_wait_returns_exit_code(self, mock_docker_command):
+        """Test waiting for a container returns its exit code."""
+        with patch(
+            "dotfiles_container_manager.implementations.docker.container.run_docker_command"
+        ) as mock_run:
+            mock_run.return_value = mock_docker_command(stdout=b"3\n")
+
+            manager = DockerContainerManager()
+            exit_code = manager.wait("test-container", timeout=30)
+
+            assert exit_code == 3
+            assert mock_run.call_args[0][0] == [
+                "docker",
+                "wait",
+                "test-container",
+            ]
+            assert mock_run.call_args[1]["timeout"] == 30
+
+    def test_wait_not_found(self):
+        """Test wait on a missing container raises ContainerNotFoundError."""
+        with patch(
+            "dotfiles_container_manager.implementations.docker.container.run_docker_command",
+            side_effect=Exception("No such container: test-container"),
+        ):
+            manager = DockerContainerManager()
+            with pytest.raises(ContainerNotFoundError):
+                manager.wait("test-container")
+
+    def test_wait_timeout(self):
+        """Test wait timeout raises ContainerRuntimeError."""
+        with patch(
+            "dotfiles_container_manager.implementations.docker.container.run_docker_command",
+            side_effect=Exception("Docker command timed out after 1 seconds"),
+        ):
+            manager = DockerContainerManager()
+            with pytest.raises(ContainerRuntimeError):
+                manager.wait("test-container", timeout=1)
+
+    def test_events_stream(self):
+        """Test events are parsed from the JSON event stream."""
+        docker_event = {
+            "Type": "container",
+            "Action": "die",
+            "Actor": {
+                "ID": "abc123",
+                "Attributes": {"name": "web", "exitCode": "0"},
+            },
+            "time": 1700000000,
+        }
+        podman_event = {
+            "ID": "def456",
+            "Name": "worker",
+            "Status": "start",
+            "Type": "container",
+        }
+        process = MagicMock()
+        process.stdout = io.BytesIO(
+            json.dumps(docker_event).encode()
+            + b"\n\n"
+            + json.dumps(podman_event).encode()
+            + b"\n"
+        )
+        process.wait.return_value = 0
+        process.poll.return_value = 0
+
+        with patch(
+            "dotfiles_container_manager.implementations.docker.container.subprocess.Popen",
+            return_value=process,
+        ) as mock_popen:
+            manager = DockerContainerManager()
+            events = list(manager.events(filters={"event": "die"}))
+
+        cmd = mock_popen.call_args[0][0]
+        assert cmd[:2] == ["docker", "events"]
+        assert "type=container" in cmd
+        assert "event=die" in cmd
+        assert len(events) == 2
+        assert events[0].container_id == "abc123"
+        assert events[0].action == "die"
+        assert events[0].time == 1700000000
+        assert events[0].attributes["exitCode"] == "0"
+        assert events[1].container_id == "def456"
+        assert events[1].action == "start"
+        assert events[1].attributes["name"] == "worker"
+
+    def test_events_close_terminates_process(self):
+        """Test closing the event iterator stops the events command."""
+        process = MagicMock()
+        process.stdout = io.BytesIO(
+            b'{"Action": "start", "Actor": {"ID": "abc123"}}\n' * 5
+        )
+        process.poll.return_value = None
+
+        with patch(
+            "dotfiles_container_manager.implementations.docker.container.subprocess.Popen",
+            return_value=process,
+        ):
+            manager = DockerContainerManager()
+            events = manager.events()
+            assert next(events).action == "start"
+            events.close()
+
+        process.terminate.assert_called_once()
+
     def test_exec_success(self, mock_docker_command):
         """Test executing command in container."""
         with patch(
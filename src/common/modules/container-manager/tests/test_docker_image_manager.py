@@ -1,6 +1,9 @@
 """Tests for DockerImageManager."""
 
+import gzip
+import io
 import json
+import tarfile
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -15,6 +18,14 @@ from dotfiles_container_manager.core import (
 from dotfiles_container_manager.implementations.docker import (
     DockerImageManager,
 )
+from dotfiles_container_manager.implementations.docker.utils import (
+    BUILD_DIGEST_LABEL,
+    build_context_digest,
+    create_build_context_tar,
+    is_ignored,
+    iter_build_context,
+    run_docker_command,
+)
 
 
 class TestDockerImageManager:
@@ -640,3 +651,149 @@ class TestDockerImageManager:
                 manager.list()
 
             assert "Failed to list images" in str(exc_info.value)
+
+
+class TestBuildContextStreaming:
+    """Tests for the streaming build context."""
+
+    @staticmethod
+    def _read_tar(data: bytes) -> dict[str, bytes]:
+        with tarfile.open(fileobj=io.BytesIO(data)) as tar:
+            return {
+                member.name: tar.extractfile(member).read()
+                for member in tar.getmembers()
+            }
+
+    def test_streams_paths_with_ignore(self, tmp_path):
+        """Test host directories are added lazily, minus ignored entries."""
+        module = tmp_path / "module"
+        (module / "pkg" / "__pycache__").mkdir(parents=True)
+        (module / "pkg" / "core.py").write_text("x = 1")
+        (module / "pkg" / "__pycache__" / "core.cpython-312.pyc").write_bytes(
+            b"cache"
+        )
+        (module / "stale.pyc").write_bytes(b"stale")
+        single = tmp_path / "entrypoint.py"
+        single.write_text("print('hi')")
+
+        context = BuildContext(
+            dockerfile="FROM alpine",
+            files={"extra.txt": b"extra"},
+            paths={"module": module, "entrypoint.py": single},
+            ignore=["__pycache__", "*.pyc"],
+        )
+
+        chunks = list(iter_build_context(context, chunk_size=4))
+        members = self._read_tar(b"".join(chunks))
+
+        assert members == {
+            "Dockerfile": b"FROM alpine",
+            "extra.txt": b"extra",
+            "module/pkg/core.py": b"x = 1",
+            "entrypoint.py": b"print('hi')",
+        }
+        assert len(chunks) > 4
+
+    def test_gzip(self, tmp_path):
+        """Test compressed contexts decompress to the same archive."""
+        context = BuildContext(dockerfile="FROM alpine", files={"a": b"1"})
+        plain = b"".join(iter_build_context(context))
+
+        context.compress = True
+        compressed = b"".join(iter_build_context(context))
+
+        assert gzip.decompress(compressed) == plain
+
+    def test_create_build_context_tar_is_deterministic(self):
+        """Test the in-memory helper still returns a complete archive."""
+        first = create_build_context_tar("FROM alpine", {"a": b"1"})
+        second = create_build_context_tar("FROM alpine", {"a": b"1"})
+
+        assert first == second
+        assert self._read_tar(first) == {
+            "Dockerfile": b"FROM alpine",
+            "a": b"1",
+        }
+
+    def test_is_ignored(self):
+        """Test ignore patterns match paths, prefixes and components."""
+        assert is_ignored("a/__pycache__/b.pyc", ["__pycache__"])
+        assert is_ignored("a/b.pyc", ["*.pyc"])
+        assert is_ignored("docs/build/index.html", ["docs/build"])
+        assert not is_ignored("src/docs.py", ["docs"])
+
+    def test_run_docker_command_streams_input(self):
+        """Test iterable input is written to the process incrementally."""
+        result = run_docker_command(
+            ["cat"], input_data=iter([b"abc", b"def"] * 1000)
+        )
+        assert result.stdout == b"abcdef" * 1000
+
+    def test_build_streams_context(self, mock_docker_command):
+        """Test build passes the context as a chunk iterator."""
+        with patch(
+            "dotfiles_container_manager.implementations.docker.image.run_docker_command"
+        ) as mock_run:
+            mock_run.return_value = mock_docker_command(
+                stdout=b"Successfully built abc123"
+            )
+
+            DockerImageManager().build(
+                BuildContext(dockerfile="FROM alpine"), "test:latest"
+            )
+
+            input_data = mock_run.call_args[1]["input_data"]
+            assert not isinstance(input_data, bytes)
+            assert "Dockerfile" in self._read_tar(b"".join(input_data))
+
+
+class TestBuildContextDigest:
+    """Tests for build context digests."""
+
+    def test_stable_across_calls(self, tmp_path):
+        """Test identical contexts share a digest."""
+        (tmp_path / "a.py").write_text("a")
+        context = BuildContext(dockerfile="FROM alpine", paths={"m": tmp_path})
+
+        digest = build_context_digest(context)
+
+        assert digest.startswith("sha256:")
+        assert build_context_digest(context) == digest
+
+    def test_changes_with_sources(self, tmp_path):
+        """Test editing a streamed host file changes the digest."""
+        source = tmp_path / "a.py"
+        source.write_text("a")
+        context = BuildContext(dockerfile="FROM alpine", paths={"m": tmp_path})
+        before = build_context_digest(context)
+
+        source.write_text("b")
+
+        assert build_context_digest(context) != before
+
+    def test_ignored_files_do_not_count(self, tmp_path):
+        """Test files excluded from the context don't affect the digest."""
+        (tmp_path / "a.py").write_text("a")
+        context = BuildContext(
+            dockerfile="FROM alpine",
+            paths={"m": tmp_path},
+            ignore=["*.pyc"],
+        )
+        before = build_context_digest(context)
+
+        (tmp_path / "a.pyc").write_bytes(b"cache")
+
+        assert build_context_digest(context) == before
+
+    def test_options(self):
+        """Test build args count but cache settings and the label don't."""
+        context = BuildContext(dockerfile="FROM alpine")
+        before = build_context_digest(context)
+
+        context.no_cache = True
+        context.compress = True
+        context.labels[BUILD_DIGEST_LABEL] = before
+        assert build_context_digest(context) == before
+
+        context.build_args["VERSION"] = "2"
+        assert build_context_digest(context) != before
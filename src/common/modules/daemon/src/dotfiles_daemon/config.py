@@ -39,6 +39,30 @@ class DaemonConfig(BaseModel):
         description="Connection timeout in seconds",
     )
 
+    coalesce_window_ms: float = Field(
+        default=0.0,
+        ge=0.0,
+        description=(
+            "Batch events of one type published within this many "
+            "milliseconds into one message (0 disables)"
+        ),
+    )
+
+    client_queue_size: int = Field(
+        default=256,
+        ge=1,
+        description="Events queued per event client before it is dropped",
+    )
+
+    client_max_lag: float = Field(
+        default=5.0,
+        gt=0.0,
+        description=(
+            "Seconds an event may wait for a client before the client "
+            "is dropped as too slow"
+        ),
+    )
+
     def get_command_socket_path(self) -> Path:
         """Get the full path to the command socket."""
         return self.socket_dir / self.command_socket_name
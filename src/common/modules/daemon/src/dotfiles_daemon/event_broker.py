@@ -1,12 +1,33 @@
 """Event broker for managing dynamic event sockets."""
 
 import asyncio
+import contextlib
+import time
 from typing import Any
 
-from dotfiles_event_protocol import Message
+from dotfiles_event_protocol import Message, MessageType
 
 from .config import DaemonConfig
 from .logger import Logger
+from .metrics import LatencyHistogram
+
+
+class _EventClient:
+    """An event socket subscriber and the events queued for it."""
+
+    def __init__(self, writer: asyncio.StreamWriter, queue_size: int) -> None:
+        """Initialize the client.
+
+        Args:
+            writer: Stream writer of the connection
+            queue_size: Most events queued before the client is dropped
+        """
+        self.writer = writer
+        # Encoded frames and the monotonic time they were broadcast
+        self.queue: asyncio.Queue[tuple[bytes, float]] = asyncio.Queue(
+            maxsize=queue_size
+        )
+        self.task: asyncio.Task[None] | None = None
 
 
 class EventBroker:
@@ -16,6 +37,16 @@ class EventBroker:
     1. Creates event sockets on-demand based on event_type
     2. Maintains a registry of active event sockets
     3. Broadcasts events to the appropriate socket
+
+    With config.coalesce_window_ms set, events of one type are held
+    for the window and sent as a single "batch" message whose payload
+    lists them. Progress updates of an operation that is still waiting
+    are replaced by the newer one.
+
+    Every client gets its own bounded queue and send task, so a slow
+    monitor doesn't hold up the others. A client whose queue fills up
+    or that falls more than config.client_max_lag seconds behind is
+    disconnected. Delivery latencies are recorded per event type.
     """
 
     def __init__(
@@ -34,6 +65,14 @@ class EventBroker:
         self._event_servers: dict[str, Any] = {}
         self._running = False
 
+        # Coalescing: messages waiting per event type, and the tasks
+        # sending them when their window closes
+        self._pending: dict[str, list[Message]] = {}
+        self._flush_tasks: dict[str, asyncio.Task[None]] = {}
+
+        # Broadcast-to-write latencies per event type
+        self._latency: dict[str, LatencyHistogram] = {}
+
     async def start(self) -> None:
         """Start the event broker."""
         if self._running:
@@ -49,6 +88,13 @@ class EventBroker:
 
         self.logger.info("Stopping event broker")
 
+        # Send events still waiting for their window to close
+        for task in self._flush_tasks.values():
+            task.cancel()
+        self._flush_tasks.clear()
+        for event_type in list(self._pending):
+            await self._flush(event_type)
+
         # Stop all event servers
         for event_type, server in self._event_servers.items():
             self.logger.info(f"Stopping event server for: {event_type}")
@@ -57,6 +103,14 @@ class EventBroker:
         self._event_servers.clear()
         self._running = False
 
+    def get_delivery_latency(self) -> dict[str, LatencyHistogram]:
+        """Get the delivery latency histograms.
+
+        Returns:
+            Histogram of broadcast-to-write latency per event type
+        """
+        return dict(self._latency)
+
     async def broadcast(self, message: Message) -> None:
         """Broadcast a message to the appropriate event socket.
 
@@ -71,10 +125,78 @@ class EventBroker:
         if event_type not in self._event_servers:
             await self._create_event_server(event_type)
 
+        if self.config.coalesce_window_ms > 0:
+            self._coalesce(message)
+            return
+
         # Broadcast to event server
         server = self._event_servers[event_type]
         await self._send_to_server(server, message)
 
+    def _coalesce(self, message: Message) -> None:
+        """Hold a message until its event type's window closes.
+
+        Args:
+            message: Message to broadcast
+        """
+        event_type = message.event_type
+        pending = self._pending.setdefault(event_type, [])
+
+        operation_id = self._progress_operation(message)
+        if operation_id is not None:
+            # The newer progress supersedes the waiting one
+            pending[:] = [
+                m
+                for m in pending
+                if self._progress_operation(m) != operation_id
+            ]
+        pending.append(message)
+
+        if event_type not in self._flush_tasks:
+            self._flush_tasks[event_type] = asyncio.create_task(
+                self._flush_later(event_type)
+            )
+
+    @staticmethod
+    def _progress_operation(message: Message) -> str | None:
+        """Operation ID of a progress message, None for other messages."""
+        if message.payload.get("type") != MessageType.OPERATION_PROGRESS:
+            return None
+        return message.payload.get("operation_id")
+
+    async def _flush_later(self, event_type: str) -> None:
+        """Send an event type's waiting messages when the window closes.
+
+        Args:
+            event_type: Type of event
+        """
+        await asyncio.sleep(self.config.coalesce_window_ms / 1000)
+        self._flush_tasks.pop(event_type, None)
+        await self._flush(event_type)
+
+    async def _flush(self, event_type: str) -> None:
+        """Send an event type's waiting messages as one message.
+
+        Args:
+            event_type: Type of event
+        """
+        messages = self._pending.pop(event_type, [])
+        server = self._event_servers.get(event_type)
+        if not messages or server is None:
+            return
+
+        if len(messages) == 1:
+            message = messages[0]
+        else:
+            message = Message(
+                event_type=event_type,
+                payload={
+                    "type": MessageType.BATCH,
+                    "messages": [m.model_dump() for m in messages],
+                },
+            )
+        await self._send_to_server(server, message)
+
     async def _create_event_server(self, event_type: str) -> None:
         """Create a new event server for the given event type.
 
@@ -120,49 +242,106 @@ class EventBroker:
         addr = writer.get_extra_info("peername")
         self.logger.info(f"New event client connected to {event_type}: {addr}")
 
-        # Add client to list
-        if event_type in self._event_servers:
-            self._event_servers[event_type]["clients"].append(writer)
+        server_info = self._event_servers.get(event_type)
+        if server_info is None:
+            writer.close()
+            return
+
+        # Add client to list and start its send task
+        client = _EventClient(writer, self.config.client_queue_size)
+        server_info["clients"].append(client)
+        client.task = asyncio.create_task(
+            self._send_to_client(event_type, client)
+        )
 
         try:
-            # Keep connection alive (clients only receive, don't send)
-            while True:
-                await asyncio.sleep(1)
+            # Clients only receive; reading just notices when they leave
+            while await reader.read(4096):
+                pass
         except (ConnectionResetError, BrokenPipeError):
-            self.logger.info(f"Event client disconnected from {event_type}")
+            pass
         finally:
-            # Remove client from list
-            if event_type in self._event_servers:
+            self.logger.info(f"Event client disconnected from {event_type}")
+            self._drop_client(server_info, client)
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    def _drop_client(
+        self, server_info: dict[str, Any] | None, client: _EventClient
+    ) -> None:
+        """Remove a client and close its connection.
+
+        Args:
+            server_info: Server information dictionary (None if the
+                server is already gone)
+            client: Client to drop
+        """
+        if server_info is not None and client in server_info["clients"]:
+            server_info["clients"].remove(client)
+        if (
+            client.task is not None
+            and client.task is not asyncio.current_task()
+        ):
+            client.task.cancel()
+        if not client.writer.is_closing():
+            client.writer.close()
+
+    async def _send_to_client(
+        self, event_type: str, client: _EventClient
+    ) -> None:
+        """Write queued events to a client until it is dropped.
+
+        Args:
+            event_type: Type of event
+            client: Client to write to
+        """
+        latency = self._latency.setdefault(event_type, LatencyHistogram())
+        try:
+            while True:
+                data, enqueued_at = await client.queue.get()
                 try:
-                    self._event_servers[event_type]["clients"].remove(writer)
-                except ValueError:
-                    pass
-            writer.close()
-            await writer.wait_closed()
+                    client.writer.write(data)
+                    # Whatever is left of the lag allowance
+                    remaining = self.config.client_max_lag - (
+                        time.monotonic() - enqueued_at
+                    )
+                    await asyncio.wait_for(client.writer.drain(), remaining)
+                finally:
+                    client.queue.task_done()
+                latency.observe(time.monotonic() - enqueued_at)
+        except TimeoutError:
+            self.logger.warning(
+                f"Dropping event client of {event_type}: more than "
+                f"{self.config.client_max_lag}s behind"
+            )
+        except ConnectionError as e:
+            self.logger.info(f"Failed to send to client: {e}")
+        finally:
+            self._drop_client(self._event_servers.get(event_type), client)
 
     async def _send_to_server(
         self, server_info: dict[str, Any], message: Message
     ) -> None:
-        """Send message to all clients of an event server.
+        """Queue a message for all clients of an event server.
 
         Args:
             server_info: Server information dictionary
             message: Message to send
         """
-        # Serialize message
+        # Encode once; every client's queue shares the same frame
         data = message.model_dump_json().encode("utf-8")
+        frame = len(data).to_bytes(4, "big") + data  # Length prefix
+        enqueued_at = time.monotonic()
 
-        # Send to all connected clients
-        clients = server_info["clients"]
-        for writer in clients:
+        for client in list(server_info["clients"]):
             try:
-                writer.write(
-                    len(data).to_bytes(4, "big")
-                )  # Message length prefix
-                writer.write(data)
-                await writer.drain()
-            except Exception as e:
-                self.logger.error(f"Failed to send to client: {e}")
+                client.queue.put_nowait((frame, enqueued_at))
+            except asyncio.QueueFull:
+                self.logger.warning(
+                    f"Dropping event client of {message.event_type}: "
+                    f"{client.queue.maxsize} events queued"
+                )
+                self._drop_client(server_info, client)
 
     async def _stop_event_server(self, server_info: dict[str, Any]) -> None:
         """Stop an event server.
@@ -173,6 +352,16 @@ class EventBroker:
         server = server_info["server"]
         socket_path = server_info["socket_path"]
 
+        # Let clients receive what is already queued, then disconnect
+        clients = list(server_info["clients"])
+        with contextlib.suppress(TimeoutError):
+            await asyncio.wait_for(
+                asyncio.gather(*(client.queue.join() for client in clients)),
+                self.config.client_max_lag,
+            )
+        for client in clients:
+            self._drop_client(server_info, client)
+
         # Close server
         server.close()
         await server.wait_closed()
@@ -0,0 +1,82 @@
+"""Delivery latency metrics."""
+
+import bisect
+from dataclasses import dataclass, field
+
+# Upper bounds of the latency buckets in seconds; slower deliveries
+# are counted in a final overflow bucket
+LATENCY_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+)
+
+
+@dataclass
+class LatencyHistogram:
+    """Histogram of event delivery latencies.
+
+    Attributes:
+        bounds: Upper bounds of the buckets in seconds
+        counts: Deliveries per bucket, plus one for slower deliveries
+        total: Number of deliveries recorded
+        total_seconds: Sum of all recorded latencies
+        max_seconds: Slowest recorded latency
+    """
+
+    bounds: tuple[float, ...] = LATENCY_BUCKETS
+    counts: list[int] = field(default_factory=list)
+    total: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    def __post_init__(self) -> None:
+        """Create the bucket counters."""
+        if not self.counts:
+            self.counts = [0] * (len(self.bounds) + 1)
+
+    def observe(self, seconds: float) -> None:
+        """Record one delivery.
+
+        Args:
+            seconds: Time from broadcast until written to the client
+        """
+        self.counts[bisect.bisect_left(self.bounds, seconds)] += 1
+        self.total += 1
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+
+    @property
+    def mean_seconds(self) -> float:
+        """Average latency, 0 if nothing was recorded."""
+        return self.total_seconds / self.total if self.total else 0.0
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-th quantile.
+
+        Args:
+            q: Quantile between 0 and 1 (e.g. 0.99)
+
+        Returns:
+            Bucket bound in seconds (max_seconds for the overflow
+            bucket), 0 if nothing was recorded
+        """
+        if not self.total:
+            return 0.0
+        rank = q * self.total
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank and count:
+                if index == len(self.bounds):
+                    return self.max_seconds
+                return self.bounds[index]
+        return self.max_seconds
@@ -1,10 +1,13 @@
 """Tests for event broker."""
 
+import asyncio
+
 import pytest
+from dotfiles_event_protocol import Message
+
 from dotfiles_daemon.config import DaemonConfig
 from dotfiles_daemon.event_broker import EventBroker
 from dotfiles_daemon.logger import Logger
-from dotfiles_event_protocol import Message
 
 
 @pytest.mark.asyncio
@@ -116,3 +119,101 @@ async def test_event_broker_cleanup_on_stop(tmp_path):
 
     # Socket should be removed
     assert not socket_path.exists()
+
+
+def _progress(operation_id: str, progress: float) -> Message:
+    """Create a progress message for an operation."""
+    return Message(
+        event_type="wallpaper",
+        payload={
+            "type": "operation_progress",
+            "operation_id": operation_id,
+            "step": "apply",
+            "progress": progress,
+        },
+    )
+
+
+@pytest.mark.asyncio
+async def test_event_broker_coalesces_progress(tmp_path):
+    """Test a burst is sent as one batch keeping the last progress."""
+    config = DaemonConfig(socket_dir=tmp_path, coalesce_window_ms=50)
+    config.ensure_socket_dir()
+    broker = EventBroker(config=config, logger=Logger("test-broker"))
+    await broker.start()
+
+    # Create the event socket and subscribe
+    await broker.broadcast(_progress("op-1", 0.0))
+    await asyncio.sleep(0.1)
+    reader, writer = await asyncio.open_unix_connection(
+        str(config.get_event_socket_path("wallpaper"))
+    )
+    await asyncio.sleep(0.05)
+
+    started = Message(
+        event_type="wallpaper",
+        payload={"type": "operation_started", "operation_id": "op-1"},
+    )
+    await broker.broadcast(started)
+    for progress in range(1, 11):
+        await broker.broadcast(_progress("op-1", progress * 10.0))
+
+    header = await asyncio.wait_for(reader.readexactly(4), timeout=5)
+    data = await reader.readexactly(int.from_bytes(header, "big"))
+    batch = Message.model_validate_json(data)
+
+    assert batch.payload["type"] == "batch"
+    messages = [Message(**m) for m in batch.payload["messages"]]
+    assert [m.payload["type"] for m in messages] == [
+        "operation_started",
+        "operation_progress",
+    ]
+    assert messages[1].payload["progress"] == 100.0
+
+    writer.close()
+    await broker.stop()
+
+
+async def _read_message(reader: asyncio.StreamReader) -> Message:
+    """Read one length-prefixed message from an event socket."""
+    header = await asyncio.wait_for(reader.readexactly(4), timeout=5)
+    data = await reader.readexactly(int.from_bytes(header, "big"))
+    return Message.model_validate_json(data)
+
+
+@pytest.mark.asyncio
+async def test_event_broker_drops_slow_client(tmp_path):
+    """Test a client that stops reading is dropped without stalling others."""
+    config = DaemonConfig(
+        socket_dir=tmp_path, client_queue_size=4, client_max_lag=0.5
+    )
+    config.ensure_socket_dir()
+    broker = EventBroker(config=config, logger=Logger("test-broker"))
+    await broker.start()
+
+    await broker.broadcast(Message(event_type="test", payload={"n": -1}))
+    socket_path = str(config.get_event_socket_path("test"))
+    _, slow_writer = await asyncio.open_unix_connection(socket_path)
+    reader, writer = await asyncio.open_unix_connection(socket_path)
+    await asyncio.sleep(0.05)
+    assert len(broker._event_servers["test"]["clients"]) == 2
+
+    # Large events fill the slow client's socket buffer
+    blob = "x" * 256 * 1024
+    for n in range(20):
+        await broker.broadcast(
+            Message(event_type="test", payload={"n": n, "blob": blob})
+        )
+        message = await _read_message(reader)
+        assert message.payload["n"] == n
+
+    await asyncio.sleep(0.6)
+    assert len(broker._event_servers["test"]["clients"]) == 1
+
+    latency = broker.get_delivery_latency()["test"]
+    assert latency.total >= 20
+    assert latency.max_seconds < config.client_max_lag
+
+    slow_writer.close()
+    writer.close()
+    await broker.stop()
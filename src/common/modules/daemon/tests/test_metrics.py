@@ -0,0 +1,32 @@
+"""Tests for delivery latency metrics."""
+
+from dotfiles_daemon.metrics import LatencyHistogram
+
+
+def test_latency_histogram_observe():
+    """Test latencies are counted in their buckets."""
+    histogram = LatencyHistogram(bounds=(0.01, 0.1))
+
+    histogram.observe(0.005)
+    histogram.observe(0.05)
+    histogram.observe(0.05)
+    histogram.observe(2.0)
+
+    assert histogram.counts == [1, 2, 1]
+    assert histogram.total == 4
+    assert histogram.max_seconds == 2.0
+    assert histogram.mean_seconds == (0.005 + 0.05 + 0.05 + 2.0) / 4
+
+
+def test_latency_histogram_quantile():
+    """Test quantiles report the bound of their bucket."""
+    histogram = LatencyHistogram(bounds=(0.01, 0.1))
+    assert histogram.quantile(0.5) == 0.0
+
+    for _ in range(9):
+        histogram.observe(0.005)
+    histogram.observe(1.5)
+
+    assert histogram.quantile(0.5) == 0.01
+    assert histogram.quantile(0.9) == 0.01
+    assert histogram.quantile(0.99) == 1.5
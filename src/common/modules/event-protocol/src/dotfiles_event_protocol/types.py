@@ -13,6 +13,7 @@ class MessageType(str, Enum):
     STATE_UPDATE = "state_update"
     QUERY_REQUEST = "query_request"
     QUERY_RESPONSE = "query_response"
+    BATCH = "batch"
 
 
 class QueryType(str, Enum):
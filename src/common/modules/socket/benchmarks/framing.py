@@ -0,0 +1,128 @@
+"""Micro-benchmark of message framing and broadcast.
+
+Compares the previous framing (serialize per recipient and per replayed
+message, concatenate header and payload, grow received bytes chunk by
+chunk) with the current one (encode a Frame once, sendmsg() header and
+payload together, recv_into() a preallocated buffer).
+
+Usage:
+    python benchmarks/framing.py [--clients N] [--size BYTES]
+"""
+
+import argparse
+import socket
+import threading
+import time
+from collections.abc import Callable
+
+import msgpack
+
+from dotfiles_socket.core import MessageType, SocketMessage, create_message
+from dotfiles_socket.core.framing import (
+    encode_frame,
+    recv_frame,
+    send_frame,
+)
+
+
+def _legacy_send(sock: socket.socket, message: SocketMessage) -> None:
+    """Previous send path: pack, then copy header and payload together."""
+    data = msgpack.packb(message.to_dict())
+    sock.sendall(len(data).to_bytes(4, "big") + data)
+
+
+def _legacy_recv_exact(sock: socket.socket, num_bytes: int) -> bytes:
+    """Previous read path: append each chunk to a bytes object."""
+    data = b""
+    while len(data) < num_bytes:
+        chunk = sock.recv(num_bytes - len(data))
+        if not chunk:
+            return b""
+        data += chunk
+    return data
+
+
+def _legacy_recv(sock: socket.socket) -> bytes:
+    """Read one frame the previous way."""
+    length = int.from_bytes(_legacy_recv_exact(sock, 4), "big")
+    return _legacy_recv_exact(sock, length)
+
+
+def _broadcast(
+    clients: int,
+    messages: list[SocketMessage],
+    send: Callable[[list[socket.socket], SocketMessage], None],
+    recv: Callable[[socket.socket], bytes | bytearray],
+) -> float:
+    """Time sending every message to every client and reading it back."""
+    pairs = [socket.socketpair() for _ in range(clients)]
+    readers = [
+        threading.Thread(
+            target=lambda sock=reader: [recv(sock) for _ in messages]
+        )
+        for _, reader in pairs
+    ]
+    for thread in readers:
+        thread.start()
+
+    start = time.perf_counter()
+    writers = [writer for writer, _ in pairs]
+    for message in messages:
+        send(writers, message)
+    for thread in readers:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    for writer, reader in pairs:
+        writer.close()
+        reader.close()
+    return elapsed
+
+
+def _legacy_broadcast(
+    writers: list[socket.socket], message: SocketMessage
+) -> None:
+    """Serialize the message again for every recipient."""
+    for writer in writers:
+        _legacy_send(writer, message)
+
+
+def _frame_broadcast(
+    writers: list[socket.socket], message: SocketMessage
+) -> None:
+    """Encode the message once and share the frame."""
+    frame = encode_frame(message)
+    for writer in writers:
+        send_frame(writer, frame)
+
+
+def main() -> None:
+    """Run the benchmark and print the timings."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--messages", type=int, default=200)
+    parser.add_argument("--size", type=int, default=64 * 1024)
+    args = parser.parse_args()
+
+    messages = [
+        create_message(
+            "bench", MessageType.DATA, {"i": i, "blob": "x" * args.size}
+        )
+        for i in range(args.messages)
+    ]
+
+    before = _broadcast(
+        args.clients, messages, _legacy_broadcast, _legacy_recv
+    )
+    after = _broadcast(args.clients, messages, _frame_broadcast, recv_frame)
+
+    print(
+        f"{args.messages} messages of {args.size} bytes "
+        f"to {args.clients} clients"
+    )
+    print(f"  before: {before * 1000:8.1f} ms")
+    print(f"  after:  {after * 1000:8.1f} ms ({before / after:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -46,31 +46,44 @@ from dotfiles_socket.config import (
 # Exceptions
 from dotfiles_socket.core import (
     ClientInfo,
+    ClientSendStats,
     ConnectionError,
     MaxConnectionsError,
+    MessageCoalescer,
     MessageError,
     MessageType,
+    OverflowPolicy,
+    SelectorSocketServer,
     SocketClient,
     SocketError,
     SocketMessage,
     SocketServer,
     TimeoutError,
     ValidationError,
+    create_batch,
     create_message,
+    expand_batch,
     get_timestamp_iso,
     get_timestamp_ms,
     validate_event_name,
 )
 
 # Factory functions
-from dotfiles_socket.factory import SocketType, create_client, create_server
+from dotfiles_socket.factory import (
+    ServerBackend,
+    SocketType,
+    create_client,
+    create_server,
+)
 
 # Implementations (for direct use if needed)
 from dotfiles_socket.implementations.tcp import (
+    TcpSelectorSocketServer,
     TcpSocketClient,
     TcpSocketServer,
 )
 from dotfiles_socket.implementations.unix import (
+    UnixSelectorSocketServer,
     UnixSocketClient,
     UnixSocketServer,
 )
@@ -79,14 +92,21 @@ __all__ = [
     # Core types
     "SocketServer",
     "SocketClient",
+    "SelectorSocketServer",
     "SocketMessage",
     "MessageType",
     "ClientInfo",
+    "ClientSendStats",
+    "OverflowPolicy",
     # Core utilities
     "create_message",
     "validate_event_name",
     "get_timestamp_ms",
     "get_timestamp_iso",
+    # Batching
+    "MessageCoalescer",
+    "create_batch",
+    "expand_batch",
     # Exceptions
     "SocketError",
     "ConnectionError",
@@ -107,12 +127,15 @@ __all__ = [
     "get_tcp_socket_config",
     # Factory
     "SocketType",
+    "ServerBackend",
     "create_server",
     "create_client",
     # Unix implementations
     "UnixSocketServer",
+    "UnixSelectorSocketServer",
     "UnixSocketClient",
     # TCP implementations
     "TcpSocketServer",
+    "TcpSelectorSocketServer",
     "TcpSocketClient",
 ]
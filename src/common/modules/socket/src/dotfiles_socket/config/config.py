@@ -1,6 +1,7 @@
 """Configuration models for socket module."""
 
 from pathlib import Path
+from typing import Literal
 
 from pydantic import BaseModel, Field, field_validator
 
@@ -36,8 +37,43 @@ class SocketConfig(BaseModel):
         default=True,
         description="Allow clients to send messages back to server",
     )
-
-    @field_validator("default_timeout", "buffer_size", "message_queue_size")
+    server_backend: Literal["threaded", "selector"] = Field(
+        default="threaded",
+        description=(
+            "Server implementation created by the factory "
+            "(threaded=thread per client, selector=single event loop)"
+        ),
+    )
+    send_queue_size: int = Field(
+        default=1000,
+        description=(
+            "Max messages waiting to be written to one client "
+            "(selector servers)"
+        ),
+    )
+    send_queue_overflow: Literal[
+        "drop_oldest", "drop_newest", "disconnect"
+    ] = Field(
+        default="drop_oldest",
+        description=(
+            "What to do when a client's send queue is full (selector servers)"
+        ),
+    )
+    coalesce_window_ms: float = Field(
+        default=0,
+        ge=0,
+        description=(
+            "Batch broadcasts sent within this many milliseconds into "
+            "one message, 0 disables (selector servers)"
+        ),
+    )
+
+    @field_validator(
+        "default_timeout",
+        "buffer_size",
+        "message_queue_size",
+        "send_queue_size",
+    )
     @classmethod
     def validate_positive(cls, v: int) -> int:
         """Validate that value is positive."""
@@ -1,6 +1,7 @@
 """Core abstractions for socket module."""
 
 from .client import SocketClient
+from .coalescing import MessageCoalescer, create_batch, expand_batch
 from .exceptions import (
     ConnectionError,
     MaxConnectionsError,
@@ -9,10 +10,13 @@ from .exceptions import (
     TimeoutError,
     ValidationError,
 )
+from .selector_server import SelectorSocketServer
 from .server import SocketServer
 from .types import (
     ClientInfo,
+    ClientSendStats,
     MessageType,
+    OverflowPolicy,
     SocketMessage,
     create_message,
     get_timestamp_iso,
@@ -24,10 +28,13 @@ __all__ = [
     # Abstract base classes
     "SocketServer",
     "SocketClient",
+    "SelectorSocketServer",
     # Types
     "SocketMessage",
     "MessageType",
     "ClientInfo",
+    "ClientSendStats",
+    "OverflowPolicy",
     # Exceptions
     "SocketError",
     "ConnectionError",
@@ -40,4 +47,8 @@ __all__ = [
     "get_timestamp_ms",
     "get_timestamp_iso",
     "create_message",
+    # Batching
+    "MessageCoalescer",
+    "create_batch",
+    "expand_batch",
 ]
@@ -0,0 +1,95 @@
+"""Batching of broadcast messages sent in quick succession."""
+
+import threading
+import time
+from collections.abc import Callable, Hashable
+
+from .types import MessageType, SocketMessage, create_message
+
+# Returns the key of a message that later messages with the same key
+# replace while both are waiting (e.g. progress of one operation), or
+# None for messages that must all be delivered
+CoalesceKey = Callable[[SocketMessage], Hashable | None]
+
+
+class MessageCoalescer:
+    """Collects messages for a time window before they are sent.
+
+    The first message added opens a window; everything added until it
+    closes is sent together as one batch message. A message whose key
+    matches a waiting one replaces it, so only the newest of a stream
+    of superseded updates goes out. Thread-safe.
+    """
+
+    def __init__(
+        self, window_seconds: float, key: CoalesceKey | None = None
+    ) -> None:
+        """Initialize the coalescer.
+
+        Args:
+            window_seconds: How long the first message of a batch waits
+            key: Key of messages that supersede each other (None = keep
+                every message)
+        """
+        self.window_seconds = window_seconds
+        self._key = key
+        self._lock = threading.Lock()
+        self._messages: list[SocketMessage] = []
+        self._keys: list[Hashable | None] = []
+        self._deadline: float | None = None
+
+    @property
+    def deadline(self) -> float | None:
+        """Monotonic time the open window closes, None if empty."""
+        return self._deadline
+
+    def add(self, message: SocketMessage) -> bool:
+        """Add a message to the open window.
+
+        Returns:
+            True if the message opened a new window
+        """
+        key = self._key(message) if self._key is not None else None
+        with self._lock:
+            if key is not None and key in self._keys:
+                # Drop the superseded message; the new one goes last so
+                # the order of the remaining messages is kept
+                index = self._keys.index(key)
+                del self._messages[index]
+                del self._keys[index]
+            self._messages.append(message)
+            self._keys.append(key)
+
+            if self._deadline is not None:
+                return False
+            self._deadline = time.monotonic() + self.window_seconds
+            return True
+
+    def drain(self) -> list[SocketMessage]:
+        """Take the waiting messages and close the window."""
+        with self._lock:
+            messages = self._messages
+            self._messages = []
+            self._keys = []
+            self._deadline = None
+            return messages
+
+
+def create_batch(messages: list[SocketMessage]) -> SocketMessage:
+    """Wrap messages into one BATCH message.
+
+    Args:
+        messages: Messages to send together, all for the same event
+    """
+    return create_message(
+        messages[0].event_name,
+        MessageType.BATCH,
+        {"messages": [message.to_dict() for message in messages]},
+    )
+
+
+def expand_batch(message: SocketMessage) -> list[SocketMessage]:
+    """Messages carried by a message (itself, unless it's a batch)."""
+    if message.message_type != MessageType.BATCH:
+        return [message]
+    return [SocketMessage.from_dict(data) for data in message.data["messages"]]
@@ -0,0 +1,156 @@
+"""Wire framing for socket messages.
+
+Every message is sent as a 4 byte big-endian payload length followed by
+the msgpack encoded message dictionary. A message is encoded into a
+Frame once and the same buffers are written to every recipient:
+header and payload go out in one sendmsg() call instead of being
+concatenated, and reads fill preallocated buffers with recv_into().
+"""
+
+import socket
+from collections.abc import Iterable
+
+import msgpack
+
+from .exceptions import MessageError
+from .types import SocketMessage
+
+# Frame header: payload length as a 4 byte big-endian integer
+HEADER_SIZE = 4
+
+# Most buffers handed to a single sendmsg() call (kept well below the
+# usual IOV_MAX of 1024)
+MAX_SEND_BUFFERS = 64
+
+# Platforms without sendmsg() fall back to one sendall() per buffer
+HAS_SENDMSG = hasattr(socket.socket, "sendmsg")
+
+
+class Frame:
+    """A message encoded once for the wire.
+
+    Attributes:
+        header: Length prefix of the payload
+        payload: msgpack encoded message
+    """
+
+    __slots__ = ("header", "payload")
+
+    def __init__(self, payload: bytes | memoryview) -> None:
+        """Initialize the frame.
+
+        Args:
+            payload: msgpack encoded message
+        """
+        self.payload = memoryview(payload)
+        self.header = len(self.payload).to_bytes(HEADER_SIZE, "big")
+
+    def __len__(self) -> int:
+        """Number of bytes on the wire."""
+        return HEADER_SIZE + len(self.payload)
+
+    def __bytes__(self) -> bytes:
+        """The frame as one bytes object (copies the payload)."""
+        return self.header + self.payload.tobytes()
+
+    def buffers(self, offset: int = 0) -> list[memoryview]:
+        """Buffers still to be written after offset bytes were sent."""
+        if offset < HEADER_SIZE:
+            return [memoryview(self.header)[offset:], self.payload]
+        return [self.payload[offset - HEADER_SIZE :]]
+
+
+def encode_frame(message: SocketMessage) -> Frame:
+    """Serialize a message into a frame.
+
+    The payload is a view of the packer's own buffer, so nothing is
+    copied after encoding.
+
+    Raises:
+        MessageError: If the message cannot be serialized
+    """
+    packer = msgpack.Packer(autoreset=False)
+    try:
+        packer.pack(message.to_dict())
+    except Exception as e:
+        raise MessageError(f"Failed to serialize message: {e}") from e
+    return Frame(packer.getbuffer())
+
+
+def decode_payload(payload: bytes | bytearray | memoryview) -> SocketMessage:
+    """Deserialize a frame payload into a message."""
+    return SocketMessage.from_dict(msgpack.unpackb(payload, raw=False))
+
+
+def gather_buffers(
+    frames: Iterable[Frame], offset: int = 0
+) -> list[memoryview]:
+    """Buffers of consecutive frames, for one sendmsg() call.
+
+    Args:
+        frames: Frames to write, in order
+        offset: Bytes of the first frame already written
+    """
+    buffers: list[memoryview] = []
+    for frame in frames:
+        buffers.extend(frame.buffers(offset))
+        offset = 0
+        if len(buffers) >= MAX_SEND_BUFFERS:
+            break
+    return buffers
+
+
+def send_buffers(sock: socket.socket, buffers: list[memoryview]) -> int:
+    """Write buffers with one system call where possible.
+
+    Returns:
+        Number of bytes written (may be fewer than requested)
+
+    Raises:
+        BlockingIOError: If a non-blocking socket can't take any data
+    """
+    if HAS_SENDMSG:
+        return sock.sendmsg(buffers)
+    return sock.send(buffers[0])
+
+
+def send_frame(sock: socket.socket, frame: Frame) -> None:
+    """Write a whole frame to a blocking socket."""
+    if not HAS_SENDMSG:
+        sock.sendall(frame.header)
+        sock.sendall(frame.payload)
+        return
+
+    sent = 0
+    total = len(frame)
+    while sent < total:
+        sent += sock.sendmsg(frame.buffers(sent))
+
+
+def recv_exact(sock: socket.socket, num_bytes: int) -> bytearray:
+    """Read exactly num_bytes from a blocking socket.
+
+    Returns:
+        The bytes read, or an empty bytearray if the peer closed
+    """
+    data = bytearray(num_bytes)
+    view = memoryview(data)
+    received = 0
+    while received < num_bytes:
+        count = sock.recv_into(view[received:])
+        if not count:
+            return bytearray()
+        received += count
+    return data
+
+
+def recv_frame(sock: socket.socket) -> bytearray:
+    """Read the payload of the next frame from a blocking socket.
+
+    Returns:
+        The payload, or an empty bytearray if the peer closed
+    """
+    header = recv_exact(sock, HEADER_SIZE)
+    if not header:
+        return header
+    return recv_exact(sock, int.from_bytes(header, "big"))
@@ -0,0 +1,725 @@
+"""Event-loop socket server core built on selectors."""
+
+import contextlib
+import itertools
+import logging
+import selectors
+import socket
+import threading
+import time
+from abc import abstractmethod
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any
+
+from dotfiles_socket.config import get_generic_socket_config
+
+from .coalescing import CoalesceKey, MessageCoalescer, create_batch
+from .exceptions import ConnectionError as SocketConnectionError
+from .exceptions import SocketError
+from .framing import (
+    HEADER_SIZE,
+    Frame,
+    decode_payload,
+    encode_frame,
+    gather_buffers,
+    send_buffers,
+)
+from .server import SocketServer
+from .types import (
+    ClientInfo,
+    ClientSendStats,
+    OverflowPolicy,
+    SocketMessage,
+    get_timestamp_ms,
+    validate_event_name,
+)
+
+
+@dataclass(eq=False)
+class _Connection:
+    """State of one connected client.
+
+    The send queue is filled by send() callers and drained by the loop
+    thread, both holding lock; everything else belongs to the loop.
+
+    Attributes:
+        sock: Client socket (non-blocking)
+        info: Client information reported to hooks
+        lock: Guards the send queue and its counters
+        frames: Framed messages waiting to be written, with the
+            monotonic time they were queued
+        offset: Bytes of the first frame already written
+        queued_bytes: Bytes waiting to be written
+        sent: Frames fully written
+        dropped: Frames discarded by the overflow policy
+        max_queued: Highest number of queued frames seen
+        overflowed: Set when the DISCONNECT policy triggered
+        inbox: Bytes received but not yet parsed into frames
+        writing: Whether the socket is registered for EVENT_WRITE
+    """
+
+    sock: socket.socket
+    info: ClientInfo
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    frames: deque[tuple[Frame, float]] = field(default_factory=deque)
+    offset: int = 0
+    queued_bytes: int = 0
+    sent: int = 0
+    dropped: int = 0
+    max_queued: int = 0
+    overflowed: bool = False
+    inbox: bytearray = field(default_factory=bytearray)
+    writing: bool = False
+
+
+class SelectorSocketServer(SocketServer):
+    """Socket server multiplexing all clients on one event loop.
+
+    A single thread accepts connections, reads client messages and
+    writes outgoing frames for every client through a selector, so the
+    thread count stays constant however many clients connect, and new
+    connections are accepted as soon as they arrive. send() may be
+    called from any thread: it serializes the message once, appends the
+    frame to each recipient's bounded send queue and wakes the loop,
+    which writes as much as each socket accepts without blocking. A
+    slow client only fills its own queue; once full, the overflow
+    policy drops its oldest or newest frames, or disconnects it.
+
+    With a coalescing window, broadcasts are held for the window and
+    sent as one BATCH message, and messages sharing a coalesce key
+    replace the earlier ones still waiting (e.g. progress updates of
+    the same operation). Unicasts are never held.
+
+    Subclasses provide the listening socket for their transport.
+    """
+
+    def __init__(
+        self,
+        event_name: str,
+        max_connections: int,
+        blocking_mode: bool | None = None,
+        allow_client_send: bool | None = None,
+        message_queue_size: int | None = None,
+        send_queue_size: int | None = None,
+        send_queue_overflow: OverflowPolicy | str | None = None,
+        coalesce_window_ms: float | None = None,
+        coalesce_key: CoalesceKey | None = None,
+    ) -> None:
+        """Initialize the server.
+
+        Args:
+            event_name: Event identifier for this server
+            max_connections: Max concurrent clients
+            blocking_mode: Run in blocking mode (default from config)
+            allow_client_send: Allow clients to send (default from config)
+            message_queue_size: Max queued messages (default from config)
+            send_queue_size: Max messages waiting to be written to one
+                client (default from config)
+            send_queue_overflow: Policy when a client's send queue is
+                full (default from config)
+            coalesce_window_ms: Batch broadcasts sent within this many
+                milliseconds, 0 to disable (default from config)
+            coalesce_key: Key of broadcasts that supersede each other
+                within a batch (None = keep every message)
+
+        Raises:
+            ValidationError: If event_name is invalid
+        """
+        validate_event_name(event_name)
+        self._event_name = event_name
+        self._logger = logging.getLogger(__name__)
+
+        generic_config = get_generic_socket_config()
+
+        self._max_connections = max_connections
+        self._blocking_mode = (
+            blocking_mode
+            if blocking_mode is not None
+            else generic_config.blocking_mode
+        )
+        self._allow_client_send = (
+            allow_client_send
+            if allow_client_send is not None
+            else generic_config.allow_client_send
+        )
+        self._message_queue_size = (
+            message_queue_size
+            if message_queue_size is not None
+            else generic_config.message_queue_size
+        )
+        self._send_queue_size = (
+            send_queue_size
+            if send_queue_size is not None
+            else generic_config.send_queue_size
+        )
+        self._send_queue_overflow = OverflowPolicy(
+            send_queue_overflow
+            if send_queue_overflow is not None
+            else generic_config.send_queue_overflow
+        )
+        window_ms = (
+            coalesce_window_ms
+            if coalesce_window_ms is not None
+            else generic_config.coalesce_window_ms
+        )
+        self._coalescer = (
+            MessageCoalescer(window_ms / 1000, key=coalesce_key)
+            if window_ms > 0
+            else None
+        )
+        self._buffer_size = generic_config.buffer_size
+        # Reused by the loop thread for every recv_into()
+        self._read_buffer = bytearray(self._buffer_size)
+
+        # Server state
+        self._server_socket: socket.socket | None = None
+        self._selector: selectors.BaseSelector | None = None
+        self._running = False
+        self._loop_thread: threading.Thread | None = None
+        self._client_ids = itertools.count(1)
+
+        # Wakes the loop when another thread queued output or stopped it
+        self._wakeup_recv: socket.socket | None = None
+        self._wakeup_send: socket.socket | None = None
+
+        # Client management
+        self._clients: dict[str, _Connection] = {}
+        self._clients_lock = threading.Lock()
+        self._pending_writes: set[str] = set()
+
+        # Message queue (for when no clients connected), kept encoded
+        self._message_queue: deque[Frame] = deque(
+            maxlen=self._message_queue_size
+        )
+        self._queue_lock = threading.Lock()
+
+    @property
+    def event_name(self) -> str:
+        """Get the event name for this server."""
+        return self._event_name
+
+    # === Transport hooks ===
+
+    @abstractmethod
+    def _create_listener(self) -> socket.socket:
+        """Create the bound and listening server socket.
+
+        Raises:
+            SocketError: If the socket cannot be created
+        """
+        pass
+
+    def _close_listener(self) -> None:
+        """Release transport resources after the listener is closed."""
+        pass
+
+    @property
+    @abstractmethod
+    def _address(self) -> str:
+        """Address of the server, reported in ClientInfo and logs."""
+        pass
+
+    def _client_address(self, address: Any) -> str:  # noqa: ARG002
+        """Address reported in the ClientInfo of an accepted client.
+
+        Args:
+            address: Peer address returned by accept()
+        """
+        return self._address
+
+    # === Lifecycle ===
+
+    def start(self) -> None:
+        """Start the socket server."""
+        if self._running:
+            self._logger.warning(
+                f"Server for '{self._event_name}' already running"
+            )
+            return
+
+        try:
+            self._server_socket = self._create_listener()
+            self._server_socket.setblocking(False)
+
+            self._wakeup_recv, self._wakeup_send = socket.socketpair()
+            self._wakeup_recv.setblocking(False)
+            self._wakeup_send.setblocking(False)
+
+            self._selector = selectors.DefaultSelector()
+            self._selector.register(
+                self._server_socket, selectors.EVENT_READ, self._accept
+            )
+            self._selector.register(
+                self._wakeup_recv, selectors.EVENT_READ, self._drain_wakeup
+            )
+            self._running = True
+
+            self._logger.info(
+                f"Selector socket server started: {self._address}"
+            )
+
+            if self._blocking_mode:
+                # Blocking mode - run in current thread
+                self._run_loop()
+            else:
+                # Non-blocking mode - run in separate thread
+                self._loop_thread = threading.Thread(
+                    target=self._run_loop,
+                    name=f"socket-loop-{self._event_name}",
+                    daemon=True,
+                )
+                self._loop_thread.start()
+
+        except Exception as e:
+            self._running = False
+            self._close_all()
+            raise SocketError(f"Failed to start server: {e}") from e
+
+    def stop(self) -> None:
+        """Stop the socket server."""
+        if not self._running:
+            return
+
+        self._running = False
+        self._logger.info(f"Stopping selector socket server: {self._address}")
+        self._wake()
+
+        if (
+            self._loop_thread is not None
+            and self._loop_thread is not threading.current_thread()
+        ):
+            self._loop_thread.join(timeout=1.0)
+            self._loop_thread = None
+
+        self._logger.info("Selector socket server stopped")
+
+    def _close_all(self) -> None:
+        """Close the clients, the listener and the loop's resources."""
+        with self._clients_lock:
+            connections = list(self._clients.values())
+            self._clients.clear()
+            self._pending_writes.clear()
+
+        for connection in connections:
+            with contextlib.suppress(Exception):
+                connection.sock.close()
+
+        if self._selector is not None:
+            self._selector.close()
+            self._selector = None
+
+        for sock in (
+            self._server_socket,
+            self._wakeup_recv,
+            self._wakeup_send,
+        ):
+            if sock is not None:
+                with contextlib.suppress(Exception):
+                    sock.close()
+        self._server_socket = None
+        self._wakeup_recv = self._wakeup_send = None
+
+        try:
+            self._close_listener()
+        except Exception as e:
+            self._logger.error(f"Error cleaning up listener: {e}")
+
+    # === Sending ===
+
+    def send(
+        self, message: SocketMessage, client_id: str | None = None
+    ) -> None:
+        """Send a message to client(s).
+
+        The message is framed once and queued for each recipient; the
+        loop thread writes it out. Never blocks on a client's socket.
+        """
+        if not self._running:
+            raise SocketError("Server is not running")
+
+        if client_id is None and self._coalescer is not None:
+            # The loop sends the batch when the window closes
+            if self._coalescer.add(message):
+                self._wake()
+            return
+
+        self._send_frame(encode_frame(message), client_id)
+
+    def _send_frame(self, frame: Frame, client_id: str | None) -> None:
+        """Queue a frame for client(s), or for later if none connected."""
+        with self._clients_lock:
+            if not self._clients:
+                # No clients connected - queue message
+                with self._queue_lock:
+                    self._message_queue.append(frame)
+                    self._logger.debug(
+                        f"Queued message (no clients): "
+                        f"{len(self._message_queue)}/{self._message_queue_size}"
+                    )
+                return
+
+            if client_id is not None:
+                # Unicast to specific client
+                if client_id not in self._clients:
+                    raise SocketConnectionError(
+                        f"Client not connected: {client_id}"
+                    )
+                recipients = [self._clients[client_id]]
+            else:
+                recipients = list(self._clients.values())
+
+            for connection in recipients:
+                self._enqueue(connection, frame)
+                self._pending_writes.add(connection.info.client_id)
+
+        self._wake()
+
+    def _enqueue(self, connection: _Connection, frame: Frame) -> None:
+        """Add a frame to a client's send queue, applying the policy."""
+        with connection.lock:
+            if connection.overflowed:
+                return
+
+            frames = connection.frames
+            if len(frames) >= self._send_queue_size:
+                policy = self._send_queue_overflow
+                if policy == OverflowPolicy.DISCONNECT:
+                    connection.overflowed = True
+                    return
+
+                # A partly written frame must be finished to keep the
+                # stream framed, so the oldest droppable one is next
+                index = 1 if connection.offset else 0
+                if policy == OverflowPolicy.DROP_NEWEST or index >= len(
+                    frames
+                ):
+                    connection.dropped += 1
+                    return
+                dropped, _ = frames[index]
+                del frames[index]
+                connection.queued_bytes -= len(dropped)
+                connection.dropped += 1
+
+            frames.append((frame, time.monotonic()))
+            connection.queued_bytes += len(frame)
+            connection.max_queued = max(connection.max_queued, len(frames))
+
+    def _wake(self) -> None:
+        """Interrupt the loop's select() call."""
+        if self._wakeup_send is None:
+            return
+        with contextlib.suppress(BlockingIOError, OSError):
+            self._wakeup_send.send(b"\0")
+
+    # === Event loop ===
+
+    def _run_loop(self) -> None:
+        """Dispatch socket events until the server stops."""
+        try:
+            while self._running and self._selector is not None:
+                self._register_pending_writes()
+                for key, mask in self._selector.select(self._select_timeout()):
+                    if isinstance(key.data, _Connection):
+                        self._on_client_event(key.data, mask)
+                    else:
+                        key.data()
+                    if not self._running:
+                        break
+                self._flush_batch()
+        except Exception as e:
+            if self._running:
+                self._logger.error(f"Socket event loop failed: {e}")
+        finally:
+            self._running = False
+            with self._clients_lock:
+                client_ids = list(self._clients)
+            self._close_all()
+            for client_id in client_ids:
+                self.on_client_disconnected(client_id)
+
+    def _select_timeout(self) -> float | None:
+        """Time until the coalescing window closes, None to wait."""
+        if self._coalescer is None or self._coalescer.deadline is None:
+            return None
+        return max(0.0, self._coalescer.deadline - time.monotonic())
+
+    def _flush_batch(self) -> None:
+        """Broadcast the coalesced messages once their window closed."""
+        coalescer = self._coalescer
+        if (
+            coalescer is None
+            or coalescer.deadline is None
+            or coalescer.deadline > time.monotonic()
+        ):
+            return
+
+        messages = coalescer.drain()
+        if not messages:
+            return
+        message = messages[0] if len(messages) == 1 else create_batch(messages)
+        try:
+            self._send_frame(encode_frame(message), None)
+        except Exception as e:
+            self._logger.error(f"Failed to send batch: {e}")
+        self._register_pending_writes()
+
+    def _drain_wakeup(self) -> None:
+        """Consume wakeup bytes."""
+        assert self._wakeup_recv is not None
+        with contextlib.suppress(BlockingIOError):
+            while self._wakeup_recv.recv(4096):
+                pass
+
+    def _register_pending_writes(self) -> None:
+        """Watch for writability of clients with buffered output."""
+        with self._clients_lock:
+            client_ids = list(self._pending_writes)
+            self._pending_writes.clear()
+            connections = [
+                self._clients[cid]
+                for cid in client_ids
+                if cid in self._clients
+            ]
+
+        for connection in connections:
+            if connection.overflowed:
+                self._logger.warning(
+                    f"Send queue of client {connection.info.client_id} "
+                    f"overflowed ({self._send_queue_size} messages), "
+                    f"disconnecting"
+                )
+                self._disconnect(connection)
+            elif not connection.writing:
+                self._set_writing(connection, True)
+
+    def _set_writing(self, connection: _Connection, writing: bool) -> None:
+        """Add or remove EVENT_WRITE from a client's registration."""
+        assert self._selector is not None
+        events = selectors.EVENT_READ
+        if writing:
+            events |= selectors.EVENT_WRITE
+        self._selector.modify(connection.sock, events, connection)
+        connection.writing = writing
+
+    def _accept(self) -> None:
+        """Accept every pending connection."""
+        assert self._server_socket is not None and self._selector is not None
+        while True:
+            try:
+                client_socket, address = self._server_socket.accept()
+            except (BlockingIOError, InterruptedError):
+                return
+
+            with self._clients_lock:
+                if len(self._clients) >= self._max_connections:
+                    self._logger.warning(
+                        f"Max connections reached "
+                        f"({self._max_connections}), "
+                        f"rejecting client"
+                    )
+                    client_socket.close()
+                    continue
+
+                client_socket.setblocking(False)
+                client_id = (
+                    f"client_{get_timestamp_ms()}_{next(self._client_ids)}"
+                )
+                connection = _Connection(
+                    sock=client_socket,
+                    info=ClientInfo(
+                        client_id=client_id,
+                        connected_at=get_timestamp_ms(),
+                        address=self._client_address(address),
+                    ),
+                )
+                self._clients[client_id] = connection
+
+                # Send queued messages to the new client first
+                with self._queue_lock:
+                    for frame in self._message_queue:
+                        self._enqueue(connection, frame)
+
+            self._selector.register(
+                client_socket, selectors.EVENT_READ, connection
+            )
+            if connection.frames:
+                self._set_writing(connection, True)
+
+            self.on_client_connected(connection.info)
+
+    def _on_client_event(self, connection: _Connection, mask: int) -> None:
+        """Handle readiness of a client socket."""
+        if mask & selectors.EVENT_READ and not self._read(connection):
+            return
+        if mask & selectors.EVENT_WRITE:
+            self._write(connection)
+
+    def _read(self, connection: _Connection) -> bool:
+        """Read available bytes and handle complete frames.
+
+        Returns:
+            False if the client disconnected
+        """
+        try:
+            count = connection.sock.recv_into(self._read_buffer)
+        except (BlockingIOError, InterruptedError):
+            return True
+        except OSError as e:
+            self._logger.error(
+                f"Error handling client {connection.info.client_id}: {e}"
+            )
+            self._disconnect(connection)
+            return False
+
+        if not count:
+            self._disconnect(connection)
+            return False
+
+        inbox = connection.inbox
+        inbox += memoryview(self._read_buffer)[:count]
+
+        # Handle every complete frame, then drop them in one go
+        start = 0
+        with memoryview(inbox) as view:
+            while len(view) - start >= HEADER_SIZE:
+                length = int.from_bytes(
+                    view[start : start + HEADER_SIZE], "big"
+                )
+                end = start + HEADER_SIZE + length
+                if len(view) < end:
+                    break
+                self._handle_frame(connection, view[start + HEADER_SIZE : end])
+                start = end
+        del inbox[:start]
+        return True
+
+    def _handle_frame(
+        self, connection: _Connection, payload: memoryview
+    ) -> None:
+        """Deserialize a client message and pass it to the hook."""
+        if not self._allow_client_send:
+            return
+        try:
+            message = decode_payload(payload)
+        except Exception as e:
+            self._logger.error(f"Failed to deserialize message: {e}")
+            return
+        self.on_message_received(connection.info.client_id, message)
+
+    def _write(self, connection: _Connection) -> None:
+        """Write queued frames until the socket would block."""
+        error: OSError | None = None
+        with connection.lock:
+            frames = connection.frames
+            while frames:
+                # Headers and payloads of several frames in one call
+                buffers = gather_buffers(
+                    (frame for frame, _ in frames), connection.offset
+                )
+                try:
+                    sent = send_buffers(connection.sock, buffers)
+                except (BlockingIOError, InterruptedError):
+                    break
+                except OSError as e:
+                    error = e
+                    break
+
+                connection.queued_bytes -= sent
+                written = connection.offset + sent
+                while frames and written >= len(frames[0][0]):
+                    written -= len(frames.popleft()[0])
+                    connection.sent += 1
+                connection.offset = written
+                if sent < sum(len(buffer) for buffer in buffers):
+                    break
+            drained = not frames
+
+        if error is not None:
+            self._logger.error(
+                f"Failed to send to client {connection.info.client_id}: "
+                f"{error}"
+            )
+            self._disconnect(connection)
+            return
+
+        if drained and connection.writing:
+            self._set_writing(connection, False)
+
+    def _disconnect(self, connection: _Connection) -> None:
+        """Close a client connection and call the hook."""
+        client_id = connection.info.client_id
+        with self._clients_lock:
+            if self._clients.get(client_id) is not connection:
+                return
+            del self._clients[client_id]
+            self._pending_writes.discard(client_id)
+
+        if self._selector is not None:
+            with contextlib.suppress(KeyError, ValueError):
+                self._selector.unregister(connection.sock)
+        with contextlib.suppress(Exception):
+            connection.sock.close()
+
+        self.on_client_disconnected(client_id)
+
+    # === Queries and hooks ===
+
+    def is_running(self) -> bool:
+        """Check if server is currently running."""
+        return self._running
+
+    def get_connected_clients(self) -> list[ClientInfo]:
+        """Get list of currently connected clients."""
+        with self._clients_lock:
+            return [connection.info for connection in self._clients.values()]
+
+    def get_client_stats(self) -> list[ClientSendStats]:
+        """Get send queue metrics of the connected clients."""
+        now = time.monotonic()
+        with self._clients_lock:
+            connections = list(self._clients.values())
+
+        stats = []
+        for connection in connections:
+            with connection.lock:
+                frames = connection.frames
+                stats.append(
+                    ClientSendStats(
+                        client_id=connection.info.client_id,
+                        queued_messages=len(frames),
+                        queued_bytes=connection.queued_bytes,
+                        sent_messages=connection.sent,
+                        dropped_messages=connection.dropped,
+                        max_queued_messages=connection.max_queued,
+                        lag_seconds=now - frames[0][1] if frames else 0.0,
+                    )
+                )
+        return stats
+
+    def on_client_connected(self, client_info: ClientInfo) -> None:
+        """Hook called when a client connects."""
+        self._logger.info(f"Client connected: {client_info.client_id}")
+
+    def on_client_disconnected(self, client_id: str) -> None:
+        """Hook called when a client disconnects."""
+        self._logger.info(f"Client disconnected: {client_id}")
+
+    def on_message_received(
+        self, client_id: str, message: SocketMessage
+    ) -> None:
+        """Hook called when a message is received from a client."""
+        self._logger.debug(
+            f"Message from {client_id}: {message.message_type.value}"
+        )
+
+    def get_queue_size(self) -> int:
+        """Get current size of the message queue."""
+        with self._queue_lock:
+            return len(self._message_queue)
+
+    def clear_queue(self) -> None:
+        """Clear all queued messages."""
+        with self._queue_lock:
+            self._message_queue.clear()
+            self._logger.debug("Message queue cleared")
@@ -13,6 +13,20 @@ class MessageType(Enum):
     DATA = "data"
     ERROR = "error"
     CONTROL = "control"
+    BATCH = "batch"  # Several messages sent together (data["messages"])
+
+
+class OverflowPolicy(Enum):
+    """What a server does when a client's send queue is full.
+
+    DROP_OLDEST discards the oldest frame not yet being written,
+    DROP_NEWEST discards the frame being queued, and DISCONNECT closes
+    the client's connection.
+    """
+
+    DROP_OLDEST = "drop_oldest"
+    DROP_NEWEST = "drop_newest"
+    DISCONNECT = "disconnect"
 
 
 @dataclass
@@ -81,6 +95,29 @@ class ClientInfo:
     address: str
 
 
+@dataclass
+class ClientSendStats:
+    """Send queue metrics of a connected client.
+
+    Attributes:
+        client_id: Unique identifier for the client
+        queued_messages: Messages waiting to be written
+        queued_bytes: Bytes waiting to be written
+        sent_messages: Messages fully written to the socket
+        dropped_messages: Messages discarded by the overflow policy
+        max_queued_messages: Highest number of queued messages seen
+        lag_seconds: Time the oldest queued message has been waiting
+    """
+
+    client_id: str
+    queued_messages: int
+    queued_bytes: int
+    sent_messages: int
+    dropped_messages: int
+    max_queued_messages: int
+    lag_seconds: float
+
+
 # Event name validation
 EVENT_NAME_PATTERN = re.compile(r"^[a-zA-Z0-9_-]+$")
 EVENT_NAME_MAX_LENGTH = 64
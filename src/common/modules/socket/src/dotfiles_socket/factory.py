@@ -3,6 +3,7 @@
 from enum import Enum
 from typing import Any
 
+from dotfiles_socket.config import get_generic_socket_config
 from dotfiles_socket.core import SocketClient, SocketServer
 
 
@@ -13,9 +14,21 @@ class SocketType(Enum):
     TCP = "tcp"
 
 
+class ServerBackend(Enum):
+    """Server implementation enumeration.
+
+    THREADED runs an accept thread plus one thread per client;
+    SELECTOR serves every client from a single event loop thread.
+    """
+
+    THREADED = "threaded"
+    SELECTOR = "selector"
+
+
 def create_server(
     socket_type: SocketType | str,
     event_name: str,
+    server_backend: ServerBackend | str | None = None,
     **kwargs: Any,
 ) -> SocketServer:
     """Create a socket server instance.
@@ -23,13 +36,15 @@ def create_server(
     Args:
         socket_type: Type of socket (SocketType.UNIX or SocketType.TCP)
         event_name: Event identifier for this server
+        server_backend: Server implementation (default from config)
         **kwargs: Additional arguments passed to the server constructor
 
     Returns:
-        SocketServer instance (UnixSocketServer or TcpSocketServer)
+        SocketServer instance (UnixSocketServer, TcpSocketServer,
+        UnixSelectorSocketServer or TcpSelectorSocketServer)
 
     Raises:
-        ValueError: If socket_type is invalid
+        ValueError: If socket_type or server_backend is invalid
 
     Examples:
         # Create Unix socket server
@@ -47,6 +62,13 @@ def create_server(
             host="127.0.0.1",
             port=9000,
         )
+
+        # Serve all clients from one event loop
+        server = create_server(
+            SocketType.UNIX,
+            "my_event",
+            server_backend=ServerBackend.SELECTOR,
+        )
     """
     # Convert string to enum if needed
     if isinstance(socket_type, str):
@@ -57,6 +79,33 @@ def create_server(
                 f"Invalid socket_type: {socket_type}. Must be 'unix' or 'tcp'"
             ) from e
 
+    if server_backend is None:
+        server_backend = get_generic_socket_config().server_backend
+    if isinstance(server_backend, str):
+        try:
+            server_backend = ServerBackend(server_backend.lower())
+        except ValueError as e:
+            raise ValueError(
+                f"Invalid server_backend: {server_backend}. "
+                f"Must be 'threaded' or 'selector'"
+            ) from e
+
+    if server_backend == ServerBackend.SELECTOR:
+        if socket_type == SocketType.UNIX:
+            from dotfiles_socket.implementations.unix import (
+                UnixSelectorSocketServer,
+            )
+
+            return UnixSelectorSocketServer(event_name=event_name, **kwargs)
+        elif socket_type == SocketType.TCP:
+            from dotfiles_socket.implementations.tcp import (
+                TcpSelectorSocketServer,
+            )
+
+            return TcpSelectorSocketServer(event_name=event_name, **kwargs)
+        else:
+            raise ValueError(f"Unsupported socket type: {socket_type}")
+
     if socket_type == SocketType.UNIX:
         from dotfiles_socket.implementations.unix import UnixSocketServer
 
@@ -1,6 +1,9 @@
 """TCP socket implementation."""
 
 from dotfiles_socket.implementations.tcp.client import TcpSocketClient
+from dotfiles_socket.implementations.tcp.selector_server import (
+    TcpSelectorSocketServer,
+)
 from dotfiles_socket.implementations.tcp.server import TcpSocketServer
 
-__all__ = ["TcpSocketServer", "TcpSocketClient"]
+__all__ = ["TcpSocketServer", "TcpSelectorSocketServer", "TcpSocketClient"]
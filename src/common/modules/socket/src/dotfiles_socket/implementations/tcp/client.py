@@ -8,8 +8,6 @@ import time
 from collections import deque
 from collections.abc import Iterator
 
-import msgpack
-
 from dotfiles_socket.config import get_generic_socket_config
 from dotfiles_socket.core import ConnectionError as SocketConnectionError
 from dotfiles_socket.core import (
@@ -19,6 +17,12 @@ from dotfiles_socket.core import (
     TimeoutError,
     validate_event_name,
 )
+from dotfiles_socket.core.coalescing import expand_batch
+from dotfiles_socket.core.framing import (
+    decode_payload,
+    encode_frame,
+    send_frame,
+)
 
 
 class TcpSocketClient(SocketClient):
@@ -147,13 +151,7 @@ class TcpSocketClient(SocketClient):
             raise SocketConnectionError("Not connected to server")
 
         try:
-            # Serialize message
-            msg_dict = message.to_dict()
-            packed_data = msgpack.packb(msg_dict)
-
-            # Send length prefix (4 bytes) + data
-            length = len(packed_data)
-            self._socket.sendall(length.to_bytes(4, "big") + packed_data)
+            send_frame(self._socket, encode_frame(message))
 
         except Exception as e:
             raise MessageError(f"Failed to send message: {e}") from e
@@ -236,12 +234,11 @@ class TcpSocketClient(SocketClient):
 
                 # Deserialize message
                 try:
-                    msg_dict = msgpack.unpackb(msg_data, raw=False)
-                    message = SocketMessage.from_dict(msg_dict)
+                    message = decode_payload(msg_data)
 
-                    # Add to buffer
+                    # Add to buffer, unpacking batches
                     with self._buffer_condition:
-                        self._message_buffer.append(message)
+                        self._message_buffer.extend(expand_batch(message))
                         self._buffer_condition.notify_all()
 
                 except Exception as e:
@@ -254,22 +251,24 @@ class TcpSocketClient(SocketClient):
                         self._reconnect()
                 break
 
-    def _recv_exact(self, num_bytes: int) -> bytes:
+    def _recv_exact(self, num_bytes: int) -> bytearray:
         """Receive exactly num_bytes from socket."""
         if not self._socket:
-            return b""
+            return bytearray()
 
-        data = b""
-        while len(data) < num_bytes:
+        data = bytearray(num_bytes)
+        view = memoryview(data)
+        received = 0
+        while received < num_bytes:
             try:
-                chunk = self._socket.recv(num_bytes - len(data))
-                if not chunk:
-                    return b""
-                data += chunk
+                count = self._socket.recv_into(view[received:])
+                if not count:
+                    return bytearray()
+                received += count
             except builtins.TimeoutError:
                 continue
             except Exception:
-                return b""
+                return bytearray()
         return data
 
     def _reconnect(self) -> None:
@@ -0,0 +1,133 @@
+"""TCP socket server running on a selector event loop."""
+
+import socket
+from typing import Any
+
+from dotfiles_socket.config import get_tcp_socket_config
+from dotfiles_socket.core import OverflowPolicy, SocketError
+from dotfiles_socket.core.coalescing import CoalesceKey
+from dotfiles_socket.core.selector_server import SelectorSocketServer
+
+
+class TcpSelectorSocketServer(SelectorSocketServer):
+    """TCP socket server serving all clients from one thread."""
+
+    def __init__(
+        self,
+        event_name: str,
+        host: str | None = None,
+        port: int | None = None,
+        port_range_start: int | None = None,
+        port_range_end: int | None = None,
+        blocking_mode: bool | None = None,
+        allow_client_send: bool | None = None,
+        max_connections: int | None = None,
+        message_queue_size: int | None = None,
+        send_queue_size: int | None = None,
+        send_queue_overflow: OverflowPolicy | str | None = None,
+        coalesce_window_ms: float | None = None,
+        coalesce_key: CoalesceKey | None = None,
+    ) -> None:
+        """Initialize TCP socket server.
+
+        Args:
+            event_name: Event identifier for this server
+            host: Host to bind to (default from config)
+            port: Specific port to use (overrides port range)
+            port_range_start: Start of port range (default from config)
+            port_range_end: End of port range (default from config)
+            blocking_mode: Run in blocking mode (default from config)
+            allow_client_send: Allow clients to send (default from config)
+            max_connections: Max concurrent clients (default from config)
+            message_queue_size: Max queued messages (default from config)
+            send_queue_size: Max messages waiting to be written to one
+                client (default from config)
+            send_queue_overflow: Policy when a client's send queue is
+                full (default from config)
+            coalesce_window_ms: Batch broadcasts sent within this many
+                milliseconds, 0 to disable (default from config)
+            coalesce_key: Key of broadcasts that supersede each other
+                within a batch (None = keep every message)
+
+        Raises:
+            ValidationError: If event_name is invalid
+        """
+        # Load config
+        tcp_config = get_tcp_socket_config()
+
+        super().__init__(
+            event_name,
+            max_connections=(
+                max_connections
+                if max_connections is not None
+                else tcp_config.max_connections
+            ),
+            blocking_mode=blocking_mode,
+            allow_client_send=allow_client_send,
+            message_queue_size=message_queue_size,
+            send_queue_size=send_queue_size,
+            send_queue_overflow=send_queue_overflow,
+            coalesce_window_ms=coalesce_window_ms,
+            coalesce_key=coalesce_key,
+        )
+
+        self._host = host or tcp_config.host
+        self._port = port
+        self._port_range_start = (
+            port_range_start
+            if port_range_start is not None
+            else tcp_config.port_range_start
+        )
+        self._port_range_end = (
+            port_range_end
+            if port_range_end is not None
+            else tcp_config.port_range_end
+        )
+        self._actual_port: int | None = None
+
+    @property
+    def port(self) -> int | None:
+        """Get the actual port the server is bound to."""
+        return self._actual_port
+
+    @property
+    def _address(self) -> str:
+        """Address of the server, reported in ClientInfo and logs."""
+        return f"{self._host}:{self._actual_port}"
+
+    def _client_address(self, address: Any) -> str:
+        """Report the peer host and port of an accepted client."""
+        return f"{address[0]}:{address[1]}"
+
+    def _create_listener(self) -> socket.socket:
+        """Bind to the configured port, or the first free one in range."""
+        server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+
+            if self._port is not None:
+                # Use specific port
+                server_socket.bind((self._host, self._port))
+                self._actual_port = self._port
+            else:
+                # Try port range
+                for port in range(
+                    self._port_range_start, self._port_range_end + 1
+                ):
+                    try:
+                        server_socket.bind((self._host, port))
+                    except OSError:
+                        continue
+                    self._actual_port = port
+                    break
+                else:
+                    raise SocketError(
+                        f"No available port in range "
+                        f"{self._port_range_start}-{self._port_range_end}"
+                    )
+
+            server_socket.listen(self._max_connections)
+        except Exception:
+            server_socket.close()
+            raise
+        return server_socket
@@ -1,6 +1,9 @@
 """Unix domain socket implementation."""
 
 from dotfiles_socket.implementations.unix.client import UnixSocketClient
+from dotfiles_socket.implementations.unix.selector_server import (
+    UnixSelectorSocketServer,
+)
 from dotfiles_socket.implementations.unix.server import UnixSocketServer
 
-__all__ = ["UnixSocketServer", "UnixSocketClient"]
+__all__ = ["UnixSocketServer", "UnixSelectorSocketServer", "UnixSocketClient"]
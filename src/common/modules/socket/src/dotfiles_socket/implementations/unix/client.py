@@ -8,8 +8,6 @@ from collections import deque
 from collections.abc import Iterator
 from pathlib import Path
 
-import msgpack
-
 from dotfiles_socket.config import get_generic_socket_config
 from dotfiles_socket.core import ConnectionError as SocketConnectionError
 from dotfiles_socket.core import (
@@ -19,6 +17,13 @@ from dotfiles_socket.core import (
     validate_event_name,
 )
 from dotfiles_socket.core import TimeoutError as SocketTimeoutError
+from dotfiles_socket.core.coalescing import expand_batch
+from dotfiles_socket.core.framing import (
+    decode_payload,
+    encode_frame,
+    recv_exact,
+    send_frame,
+)
 
 
 class UnixSocketClient(SocketClient):
@@ -140,15 +145,7 @@ class UnixSocketClient(SocketClient):
             raise SocketConnectionError("Not connected to server")
 
         try:
-            # Serialize message
-            msg_dict = message.to_dict()
-            packed_data = msgpack.packb(msg_dict)
-
-            # Send length prefix (4 bytes) + data
-            length = len(packed_data)
-            self._client_socket.sendall(
-                length.to_bytes(4, "big") + packed_data
-            )
+            send_frame(self._client_socket, encode_frame(message))
 
         except Exception as e:
             raise MessageError(f"Failed to send message: {e}") from e
@@ -240,12 +237,11 @@ class UnixSocketClient(SocketClient):
 
                 # Deserialize message
                 try:
-                    msg_dict = msgpack.unpackb(msg_data, raw=False)
-                    message = SocketMessage.from_dict(msg_dict)
+                    message = decode_payload(msg_data)
 
-                    # Add to buffer
+                    # Add to buffer, unpacking batches
                     with self._buffer_condition:
-                        self._message_buffer.append(message)
+                        self._message_buffer.extend(expand_batch(message))
                         self._buffer_condition.notify_all()
 
                 except Exception as e:
@@ -262,18 +258,11 @@ class UnixSocketClient(SocketClient):
                     else:
                         break
 
-    def _recv_exact(self, num_bytes: int) -> bytes:
+    def _recv_exact(self, num_bytes: int) -> bytearray:
         """Receive exact number of bytes from socket."""
         if not self._client_socket:
-            return b""
-
-        data = b""
-        while len(data) < num_bytes:
-            chunk = self._client_socket.recv(num_bytes - len(data))
-            if not chunk:
-                return b""
-            data += chunk
-        return data
+            return bytearray()
+        return recv_exact(self._client_socket, num_bytes)
 
     def _attempt_reconnect(self) -> None:
         """Attempt to reconnect to the server."""
@@ -0,0 +1,117 @@
+"""Unix domain socket server running on a selector event loop."""
+
+import socket
+from pathlib import Path
+
+from dotfiles_socket.config import (
+    get_generic_socket_config,
+    get_unix_socket_config,
+)
+from dotfiles_socket.core import OverflowPolicy
+from dotfiles_socket.core.coalescing import CoalesceKey
+from dotfiles_socket.core.selector_server import SelectorSocketServer
+
+
+class UnixSelectorSocketServer(SelectorSocketServer):
+    """Unix domain socket server serving all clients from one thread."""
+
+    def __init__(
+        self,
+        event_name: str,
+        socket_dir: Path | None = None,
+        blocking_mode: bool | None = None,
+        allow_client_send: bool | None = None,
+        max_connections: int | None = None,
+        socket_permissions: str | None = None,
+        auto_remove_socket: bool | None = None,
+        message_queue_size: int | None = None,
+        send_queue_size: int | None = None,
+        send_queue_overflow: OverflowPolicy | str | None = None,
+        coalesce_window_ms: float | None = None,
+        coalesce_key: CoalesceKey | None = None,
+    ) -> None:
+        """Initialize Unix socket server.
+
+        Args:
+            event_name: Event identifier for this server
+            socket_dir: Directory for socket file (default from config)
+            blocking_mode: Run in blocking mode (default from config)
+            allow_client_send: Allow clients to send (default from config)
+            max_connections: Max concurrent clients (default from config)
+            socket_permissions: Socket file permissions (default from config)
+            auto_remove_socket: Remove socket on stop (default from config)
+            message_queue_size: Max queued messages (default from config)
+            send_queue_size: Max messages waiting to be written to one
+                client (default from config)
+            send_queue_overflow: Policy when a client's send queue is
+                full (default from config)
+            coalesce_window_ms: Batch broadcasts sent within this many
+                milliseconds, 0 to disable (default from config)
+            coalesce_key: Key of broadcasts that supersede each other
+                within a batch (None = keep every message)
+
+        Raises:
+            ValidationError: If event_name is invalid
+        """
+        # Load config
+        generic_config = get_generic_socket_config()
+        unix_config = get_unix_socket_config()
+
+        super().__init__(
+            event_name,
+            max_connections=(
+                max_connections
+                if max_connections is not None
+                else unix_config.max_connections
+            ),
+            blocking_mode=blocking_mode,
+            allow_client_send=allow_client_send,
+            message_queue_size=message_queue_size,
+            send_queue_size=send_queue_size,
+            send_queue_overflow=send_queue_overflow,
+            coalesce_window_ms=coalesce_window_ms,
+            coalesce_key=coalesce_key,
+        )
+
+        self._socket_dir = (
+            Path(socket_dir) if socket_dir else generic_config.socket_dir
+        )
+        self._socket_permissions = (
+            socket_permissions or unix_config.socket_permissions
+        )
+        self._auto_remove_socket = (
+            auto_remove_socket
+            if auto_remove_socket is not None
+            else unix_config.auto_remove_socket
+        )
+        self._socket_path = self._socket_dir / f"{self._event_name}.sock"
+
+    @property
+    def _address(self) -> str:
+        """Address of the server, reported in ClientInfo and logs."""
+        return str(self._socket_path)
+
+    def _create_listener(self) -> socket.socket:
+        """Create the socket file and listen on it."""
+        # Create socket directory if needed
+        self._socket_dir.mkdir(parents=True, exist_ok=True)
+
+        # Remove existing socket file if present
+        if self._socket_path.exists():
+            self._socket_path.unlink()
+
+        server_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            server_socket.bind(str(self._socket_path))
+            self._socket_path.chmod(int(self._socket_permissions, 8))
+            server_socket.listen(self._max_connections)
+        except Exception:
+            server_socket.close()
+            raise
+        return server_socket
+
+    def _close_listener(self) -> None:
+        """Remove the socket file if configured."""
+        if self._auto_remove_socket and self._socket_path.exists():
+            self._socket_path.unlink()
+            self._logger.debug(f"Removed socket file: {self._socket_path}")
@@ -7,15 +7,12 @@ import threading
 from collections import deque
 from pathlib import Path
 
-import msgpack
-
 from dotfiles_socket.config import (
     get_generic_socket_config,
     get_unix_socket_config,
 )
 from dotfiles_socket.core import (
     ClientInfo,
-    MessageError,
     SocketError,
     SocketMessage,
     SocketServer,
@@ -23,6 +20,13 @@ from dotfiles_socket.core import (
     validate_event_name,
 )
 from dotfiles_socket.core import ConnectionError as SocketConnectionError
+from dotfiles_socket.core.framing import (
+    Frame,
+    decode_payload,
+    encode_frame,
+    recv_frame,
+    send_frame,
+)
 
 
 class UnixSocketServer(SocketServer):
@@ -107,8 +111,8 @@ class UnixSocketServer(SocketServer):
         self._clients_lock = threading.Lock()
         self._client_threads: list[threading.Thread] = []
 
-        # Message queue (for when no clients connected)
-        self._message_queue: deque[SocketMessage] = deque(
+        # Message queue (for when no clients connected), kept encoded
+        self._message_queue: deque[Frame] = deque(
             maxlen=self._message_queue_size
         )
         self._queue_lock = threading.Lock()
@@ -215,18 +219,14 @@ class UnixSocketServer(SocketServer):
         if not self._running:
             raise SocketError("Server is not running")
 
-        # Serialize message
-        try:
-            msg_dict = message.to_dict()
-            packed_data = msgpack.packb(msg_dict)
-        except Exception as e:
-            raise MessageError(f"Failed to serialize message: {e}") from e
+        # Serialize message once for every recipient
+        frame = encode_frame(message)
 
         with self._clients_lock:
             if not self._clients:
                 # No clients connected - queue message
                 with self._queue_lock:
-                    self._message_queue.append(message)
+                    self._message_queue.append(frame)
                     self._logger.debug(
                         f"Queued message (no clients): "
                         f"{len(self._message_queue)}/{self._message_queue_size}"
@@ -240,21 +240,19 @@ class UnixSocketServer(SocketServer):
                         f"Client not connected: {client_id}"
                     )
                 self._send_to_client(
-                    self._clients[client_id], packed_data, client_id
+                    self._clients[client_id], frame, client_id
                 )
             else:
                 # Broadcast to all clients
                 for cid, client_socket in list(self._clients.items()):
-                    self._send_to_client(client_socket, packed_data, cid)
+                    self._send_to_client(client_socket, frame, cid)
 
     def _send_to_client(
-        self, client_socket: socket.socket, data: bytes, client_id: str
+        self, client_socket: socket.socket, frame: Frame, client_id: str
     ) -> None:
-        """Send data to a specific client socket."""
+        """Send a frame to a specific client socket."""
         try:
-            # Send length prefix (4 bytes) + data
-            length = len(data)
-            client_socket.sendall(length.to_bytes(4, "big") + data)
+            send_frame(client_socket, frame)
         except Exception as e:
             self._logger.error(f"Failed to send to client {client_id}: {e}")
             # Remove failed client
@@ -371,14 +369,9 @@ class UnixSocketServer(SocketServer):
                 f"queued messages to {client_id}"
             )
 
-            for message in self._message_queue:
+            for frame in self._message_queue:
                 try:
-                    msg_dict = message.to_dict()
-                    packed_data = msgpack.packb(msg_dict)
-                    length = len(packed_data)
-                    client_socket.sendall(
-                        length.to_bytes(4, "big") + packed_data
-                    )
+                    send_frame(client_socket, frame)
                 except Exception as e:
                     self._logger.error(f"Failed to send queued message: {e}")
 
@@ -388,22 +381,14 @@ class UnixSocketServer(SocketServer):
         """Handle communication with a connected client."""
         try:
             while self._running:
-                # Receive length prefix (4 bytes)
-                length_data = self._recv_exact(client_socket, 4)
-                if not length_data:
-                    break
-
-                length = int.from_bytes(length_data, "big")
-
-                # Receive message data
-                msg_data = self._recv_exact(client_socket, length)
+                # Receive next frame
+                msg_data = recv_frame(client_socket)
                 if not msg_data:
                     break
 
                 # Deserialize message
                 try:
-                    msg_dict = msgpack.unpackb(msg_data, raw=False)
-                    message = SocketMessage.from_dict(msg_dict)
+                    message = decode_payload(msg_data)
 
                     # Call message received hook
                     self.on_message_received(client_id, message)
@@ -423,15 +408,3 @@ class UnixSocketServer(SocketServer):
                 client_socket.close()
 
             self.on_client_disconnected(client_id)
-
-    def _recv_exact(
-        self, client_socket: socket.socket, num_bytes: int
-    ) -> bytes:
-        """Receive exact number of bytes from socket."""
-        data = b""
-        while len(data) < num_bytes:
-            chunk = client_socket.recv(num_bytes - len(data))
-            if not chunk:
-                return b""
-            data += chunk
-        return data
@@ -0,0 +1,153 @@
+"""Tests for broadcast batching."""
+
+import time
+from pathlib import Path
+
+import pytest
+
+from dotfiles_socket.core import (
+    MessageCoalescer,
+    MessageType,
+    SocketMessage,
+    TimeoutError,
+    create_batch,
+    create_message,
+    expand_batch,
+)
+from dotfiles_socket.implementations.unix import (
+    UnixSelectorSocketServer,
+    UnixSocketClient,
+)
+
+
+def _progress(operation_id: str, progress: float) -> SocketMessage:
+    """Create a progress update."""
+    return create_message(
+        "test_event",
+        MessageType.DATA,
+        {
+            "type": "operation_progress",
+            "operation_id": operation_id,
+            "progress": progress,
+        },
+    )
+
+
+def _operation_key(message: SocketMessage) -> str | None:
+    """Coalesce progress updates of the same operation."""
+    if message.data.get("type") != "operation_progress":
+        return None
+    return message.data["operation_id"]
+
+
+class TestMessageCoalescer:
+    """Tests for MessageCoalescer."""
+
+    def test_window(self) -> None:
+        """Test the first message opens the window and drain closes it."""
+        coalescer = MessageCoalescer(0.016)
+        assert coalescer.deadline is None
+
+        assert coalescer.add(_progress("a", 1))
+        assert not coalescer.add(_progress("a", 2))
+        assert coalescer.deadline is not None
+
+        assert len(coalescer.drain()) == 2
+        assert coalescer.deadline is None
+        assert coalescer.drain() == []
+
+    def test_superseded_messages_collapse(self) -> None:
+        """Test a keyed message replaces the waiting one and goes last."""
+        coalescer = MessageCoalescer(0.016, key=_operation_key)
+        started = create_message(
+            "test_event", MessageType.DATA, {"type": "operation_started"}
+        )
+
+        coalescer.add(_progress("a", 10))
+        coalescer.add(started)
+        coalescer.add(_progress("b", 10))
+        coalescer.add(_progress("a", 20))
+
+        assert [m.data.get("progress") for m in coalescer.drain()] == [
+            None,
+            10,
+            20,
+        ]
+
+    def test_batch_roundtrip(self) -> None:
+        """Test a batch expands into its messages."""
+        messages = [_progress("a", 1), _progress("b", 2)]
+        batch = create_batch(messages)
+
+        assert batch.message_type == MessageType.BATCH
+        assert expand_batch(batch) == messages
+        assert expand_batch(messages[0]) == [messages[0]]
+
+
+class TestCoalescingServer:
+    """Tests for coalescing on the selector server."""
+
+    def test_progress_stream(
+        self, temp_socket_dir: Path, event_name: str
+    ) -> None:
+        """Test a burst of updates arrives as one collapsed batch."""
+        server = UnixSelectorSocketServer(
+            event_name=event_name,
+            socket_dir=temp_socket_dir,
+            blocking_mode=False,
+            coalesce_window_ms=100,
+            coalesce_key=_operation_key,
+        )
+        server.start()
+        client = UnixSocketClient(
+            event_name=event_name,
+            socket_dir=temp_socket_dir,
+            auto_reconnect=False,
+        )
+        client.connect()
+        time.sleep(0.2)
+
+        server.send(
+            create_message(
+                event_name, MessageType.DATA, {"type": "operation_started"}
+            )
+        )
+        for progress in range(0, 101, 10):
+            server.send(_progress("op", progress))
+
+        assert client.receive(timeout=2.0).data["type"] == "operation_started"
+        assert client.receive(timeout=2.0).data["progress"] == 100
+        with pytest.raises(TimeoutError):
+            client.receive(timeout=0.3)
+        (stats,) = server.get_client_stats()
+        assert stats.sent_messages == 1
+
+        client.disconnect()
+        server.stop()
+
+    def test_unicast_is_not_held(
+        self, temp_socket_dir: Path, event_name: str
+    ) -> None:
+        """Test messages to one client bypass the window."""
+        server = UnixSelectorSocketServer(
+            event_name=event_name,
+            socket_dir=temp_socket_dir,
+            blocking_mode=False,
+            coalesce_window_ms=10_000,
+        )
+        server.start()
+        client = UnixSocketClient(
+            event_name=event_name,
+            socket_dir=temp_socket_dir,
+            auto_reconnect=False,
+        )
+        client.connect()
+        time.sleep(0.2)
+
+        (client_info,) = server.get_connected_clients()
+        server.send(_progress("op", 1), client_id=client_info.client_id)
+
+        assert client.receive(timeout=2.0).data["progress"] == 1
+
+        client.disconnect()
+        server.stop()
@@ -7,9 +7,12 @@ import pytest
 
 from dotfiles_socket import (
     MessageType,
+    ServerBackend,
     SocketType,
+    TcpSelectorSocketServer,
     TcpSocketClient,
     TcpSocketServer,
+    UnixSelectorSocketServer,
     UnixSocketClient,
     UnixSocketServer,
     create_client,
@@ -90,6 +93,38 @@ class TestCreateServer:
         with pytest.raises(ValueError, match="Invalid socket_type"):
             create_server("invalid", event_name)
 
+    def test_create_selector_servers(
+        self, temp_socket_dir: Path, event_name: str, tcp_host: str
+    ) -> None:
+        """Test server_backend selects the event loop servers."""
+        unix_server = create_server(
+            SocketType.UNIX,
+            event_name,
+            server_backend=ServerBackend.SELECTOR,
+            socket_dir=temp_socket_dir,
+        )
+        tcp_server = create_server(
+            "tcp", event_name, server_backend="selector", host=tcp_host
+        )
+
+        assert isinstance(unix_server, UnixSelectorSocketServer)
+        assert isinstance(tcp_server, TcpSelectorSocketServer)
+
+    def test_default_server_backend(
+        self, temp_socket_dir: Path, event_name: str
+    ) -> None:
+        """Test the configured default backend is the threaded server."""
+        server = create_server(
+            SocketType.UNIX, event_name, socket_dir=temp_socket_dir
+        )
+
+        assert isinstance(server, UnixSocketServer)
+
+    def test_invalid_server_backend(self, event_name: str) -> None:
+        """Test creating server with invalid server backend."""
+        with pytest.raises(ValueError, match="Invalid server_backend"):
+            create_server("unix", event_name, server_backend="invalid")
+
 
 class TestCreateClient:
     """Tests for create_client factory function."""
@@ -0,0 +1,83 @@
+"""Tests for wire framing."""
+
+import socket
+import threading
+
+from dotfiles_socket.core import MessageType, create_message
+from dotfiles_socket.core.framing import (
+    HEADER_SIZE,
+    MAX_SEND_BUFFERS,
+    Frame,
+    decode_payload,
+    encode_frame,
+    gather_buffers,
+    recv_exact,
+    recv_frame,
+    send_frame,
+)
+
+
+class TestFrame:
+    """Tests for Frame."""
+
+    def test_encode_decode_roundtrip(self, event_name: str) -> None:
+        """Test a message survives encoding and decoding."""
+        message = create_message(event_name, MessageType.DATA, {"a": [1, 2]})
+        frame = encode_frame(message)
+
+        assert len(frame) == HEADER_SIZE + len(frame.payload)
+        assert int.from_bytes(frame.header, "big") == len(frame.payload)
+        assert decode_payload(frame.payload) == message
+
+    def test_buffers_after_offset(self) -> None:
+        """Test buffers skip the bytes already written."""
+        frame = Frame(b"payload")
+        wire = bytes(frame)
+
+        for offset in range(len(frame)):
+            assert b"".join(frame.buffers(offset)) == wire[offset:]
+
+    def test_gather_buffers(self) -> None:
+        """Test several frames are gathered, up to the buffer limit."""
+        frames = [Frame(bytes([i])) for i in range(MAX_SEND_BUFFERS)]
+
+        buffers = gather_buffers(frames[:2], offset=1)
+        assert b"".join(buffers) == (bytes(frames[0]) + bytes(frames[1]))[1:]
+        assert len(gather_buffers(frames)) == MAX_SEND_BUFFERS
+
+
+class TestSocketIO:
+    """Tests for sending and receiving frames."""
+
+    def test_send_and_receive(self, event_name: str) -> None:
+        """Test frames larger than the socket buffers arrive whole."""
+        left, right = socket.socketpair()
+        messages = [
+            create_message(
+                event_name, MessageType.DATA, {"i": i, "x": "x" * n}
+            )
+            for i, n in enumerate((0, 10, 3_000_000))
+        ]
+
+        sender = threading.Thread(
+            target=lambda: [
+                send_frame(left, encode_frame(message)) for message in messages
+            ]
+        )
+        sender.start()
+        received = [decode_payload(recv_frame(right)) for _ in messages]
+        sender.join()
+
+        assert received == messages
+        left.close()
+        assert recv_frame(right) == bytearray()
+        right.close()
+
+    def test_recv_exact_on_close(self) -> None:
+        """Test a peer closing mid-read returns no data."""
+        left, right = socket.socketpair()
+        left.sendall(b"abc")
+        left.close()
+
+        assert recv_exact(right, 5) == bytearray()
+        right.close()
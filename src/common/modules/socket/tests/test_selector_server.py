@@ -0,0 +1,380 @@
+"""Tests for the selector based socket servers."""
+
+import socket
+import threading
+import time
+from pathlib import Path
+
+import msgpack
+import pytest
+
+from dotfiles_socket.core import (
+    ClientInfo,
+    MessageType,
+    OverflowPolicy,
+    create_message,
+)
+from dotfiles_socket.implementations.tcp import (
+    TcpSelectorSocketServer,
+    TcpSocketClient,
+)
+from dotfiles_socket.implementations.unix import (
+    UnixSelectorSocketServer,
+    UnixSocketClient,
+)
+
+
+def _unix_client(temp_socket_dir: Path, event_name: str) -> UnixSocketClient:
+    """Create and connect a Unix client."""
+    client = UnixSocketClient(
+        event_name=event_name,
+        socket_dir=temp_socket_dir,
+        auto_reconnect=False,
+    )
+    client.connect()
+    return client
+
+
+def _read_frames(sock: socket.socket) -> list[dict]:
+    """Read messages from a raw socket until the server closes it."""
+    data = bytearray()
+    while chunk := sock.recv(65536):
+        data += chunk
+
+    messages = []
+    while data:
+        length = int.from_bytes(data[:4], "big")
+        messages.append(msgpack.unpackb(bytes(data[4 : 4 + length])))
+        del data[: 4 + length]
+    return messages
+
+
+class TestUnixSelectorSocketServer:
+    """Tests for UnixSelectorSocketServer."""
+
+    def test_server_start_stop(
+        self, temp_socket_dir: Path, event_name: str
+    ) -> None:
+        """Test the loop thread starts and the socket file is removed."""
+        server = UnixSelectorSocketServer(
+            event_name=event_name,
+            socket_dir=temp_socket_dir,
+            blocking_mode=False,
+        )
+        socket_path = temp_socket_dir / f"{event_name}.sock"
+
+        server.start()
+        assert server.is_running()
+        assert socket_path.exists()
+
+        server.stop()
+        assert not server.is_running()
+        assert not socket_path.exists()
+
+    def test_message_send_receive(
+        self, temp_socket_dir: Path, event_name: str
+    ) -> None:
+        """Test a message reaches a connected client."""
+        server = UnixSelectorSocketServer(
+            event_name=event_name,
+            socket_dir=temp_socket_dir,
+            blocking_mode=False,
+        )
+        server.start()
+        client = _unix_client(temp_socket_dir, event_name)
+        time.sleep(0.2)
+
+        server.send(
+            create_message(event_name, MessageType.DATA, {"test": "hello"})
+        )
+
+        received = client.receive(timeout=2.0)
+        assert received.data["test"] == "hello"
+
+        client.disconnect()
+        server.stop()
+
+    def test_broadcast_uses_one_thread(
+        self, temp_socket_dir: Path, event_name: str
+    ) -> None:
+        """Test many clients are served without a thread per client."""
+        server = UnixSelectorSocketServer(
+            event_name=event_name,
+            socket_dir=temp_socket_dir,
+            blocking_mode=False,
+            max_connections=20,
+        )
+        server.start()
+        threads_before = threading.active_count()
+
+        clients = [
+            _unix_client(temp_socket_dir, event_name) for _ in range(10)
+        ]
+        time.sleep(0.2)
+        assert len(server.get_connected_clients()) == 10
+        client_ids = {c.client_id for c in server.get_connected_clients()}
+        assert len(client_ids) == 10
+        # Each client runs its own receive thread; the server adds none
+        assert threading.active_count() == threads_before + len(clients)
+
+        server.send(create_message(event_name, MessageType.DATA, {"n": 1}))
+
+        for client in clients:
+            assert client.receive(timeout=2.0).data["n"] == 1
+            client.disconnect()
+        server.stop()
+
+    def test_large_message(
+        self, temp_socket_dir: Path, event_name: str
+    ) -> None:
+        """Test messages larger than the socket buffer are written fully."""
+        server = UnixSelectorSocketServer(
+            event_name=event_name,
+            socket_dir=temp_socket_dir,
+            blocking_mode=False,
+        )
+        server.start()
+        client = _unix_client(temp_socket_dir, event_name)
+        time.sleep(0.2)
+
+        payload = "x" * 2_000_000
+        for i in range(3):
+            server.send(
+                create_message(
+                    event_name, MessageType.DATA, {"i": i, "payload": payload}
+                )
+            )
+
+        for i in range(3):
+            received = client.receive(timeout=5.0)
+            assert received.data["i"] == i
+            assert received.data["payload"] == payload
+
+        client.disconnect()
+        server.stop()
+
+    def test_queued_messages_replayed(
+        self, temp_socket_dir: Path, event_name: str
+    ) -> None:
+        """Test messages sent without clients reach the first client."""
+        server = UnixSelectorSocketServer(
+            event_name=event_name,
+            socket_dir=temp_socket_dir,
+            blocking_mode=False,
+        )
+        server.start()
+
+        for i in range(3):
+            server.send(create_message(event_name, MessageType.DATA, {"i": i}))
+        assert server.get_queue_size() == 3
+
+        client = _unix_client(temp_socket_dir, event_name)
+        for i in range(3):
+            assert client.receive(timeout=2.0).data["i"] == i
+
+        client.disconnect()
+        server.stop()
+
+    def test_hooks(self, temp_socket_dir: Path, event_name: str) -> None:
+        """Test connect, message and disconnect hooks are called."""
+        events: list[tuple[str, str]] = []
+        done = threading.Event()
+
+        class RecordingServer(UnixSelectorSocketServer):
+            def on_client_connected(self, client_info: ClientInfo) -> None:
+                events.append(("connected", client_info.client_id))
+
+            def on_message_received(self, client_id, message) -> None:
+                events.append(("message", message.data["text"]))
+
+            def on_client_disconnected(self, client_id: str) -> None:
+                events.append(("disconnected", client_id))
+                done.set()
+
+        server = RecordingServer(
+            event_name=event_name,
+            socket_dir=temp_socket_dir,
+            blocking_mode=False,
+        )
+        server.start()
+        client = _unix_client(temp_socket_dir, event_name)
+        client.send(
+            create_message(event_name, MessageType.DATA, {"text": "hi"})
+        )
+        time.sleep(0.2)
+        client.disconnect()
+
+        assert done.wait(timeout=2.0)
+        client_id = events[0][1]
+        assert events == [
+            ("connected", client_id),
+            ("message", "hi"),
+            ("disconnected", client_id),
+        ]
+        server.stop()
+
+    def test_max_connections(
+        self, temp_socket_dir: Path, event_name: str
+    ) -> None:
+        """Test clients beyond max_connections are rejected."""
+        server = UnixSelectorSocketServer(
+            event_name=event_name,
+            socket_dir=temp_socket_dir,
+            blocking_mode=False,
+            max_connections=1,
+        )
+        server.start()
+
+        first = _unix_client(temp_socket_dir, event_name)
+        time.sleep(0.1)
+        second = _unix_client(temp_socket_dir, event_name)
+        time.sleep(0.2)
+
+        assert len(server.get_connected_clients()) == 1
+
+        first.disconnect()
+        second.disconnect()
+        server.stop()
+
+
+class TestSendQueues:
+    """Tests for the bounded per-client send queues."""
+
+    # Large enough that a few messages fill the socket buffers
+    PAYLOAD = "x" * 500_000
+
+    def _flood(
+        self,
+        temp_socket_dir: Path,
+        event_name: str,
+        policy: OverflowPolicy,
+    ) -> tuple[UnixSelectorSocketServer, socket.socket]:
+        """Send messages to a client that doesn't read them."""
+        server = UnixSelectorSocketServer(
+            event_name=event_name,
+            socket_dir=temp_socket_dir,
+            blocking_mode=False,
+            send_queue_size=3,
+            send_queue_overflow=policy,
+        )
+        server.start()
+        stalled = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stalled.connect(str(temp_socket_dir / f"{event_name}.sock"))
+        time.sleep(0.2)
+
+        for i in range(20):
+            server.send(
+                create_message(
+                    event_name,
+                    MessageType.DATA,
+                    {"i": i, "payload": self.PAYLOAD},
+                )
+            )
+            time.sleep(0.01)
+        time.sleep(0.2)
+        return server, stalled
+
+    @pytest.mark.parametrize(
+        "policy", [OverflowPolicy.DROP_OLDEST, OverflowPolicy.DROP_NEWEST]
+    )
+    def test_drop_policies(
+        self,
+        temp_socket_dir: Path,
+        event_name: str,
+        policy: OverflowPolicy,
+    ) -> None:
+        """Test a full queue drops frames and reports the lag."""
+        server, stalled = self._flood(temp_socket_dir, event_name, policy)
+
+        (stats,) = server.get_client_stats()
+        assert stats.queued_messages == 3
+        assert stats.max_queued_messages == 3
+        assert stats.dropped_messages > 0
+        assert stats.queued_bytes > 2 * len(self.PAYLOAD)
+        assert stats.lag_seconds > 0
+
+        # The server closes the client on stop, ending the stream
+        threading.Timer(0.5, server.stop).start()
+        received = [message["data"]["i"] for message in _read_frames(stalled)]
+        stalled.close()
+
+        assert received == sorted(received)
+        if policy == OverflowPolicy.DROP_OLDEST:
+            assert received[-1] == 19
+        else:
+            assert received[-1] < 19
+
+    def test_disconnect_policy(
+        self, temp_socket_dir: Path, event_name: str
+    ) -> None:
+        """Test a client whose queue overflows is disconnected."""
+        server, stalled = self._flood(
+            temp_socket_dir, event_name, OverflowPolicy.DISCONNECT
+        )
+
+        assert server.get_connected_clients() == []
+        stalled.close()
+        server.stop()
+
+    def test_sent_messages(
+        self, temp_socket_dir: Path, event_name: str
+    ) -> None:
+        """Test written messages are counted and nothing stays queued."""
+        server = UnixSelectorSocketServer(
+            event_name=event_name,
+            socket_dir=temp_socket_dir,
+            blocking_mode=False,
+        )
+        server.start()
+        client = _unix_client(temp_socket_dir, event_name)
+        time.sleep(0.2)
+
+        for i in range(5):
+            server.send(create_message(event_name, MessageType.DATA, {"i": i}))
+        for _ in range(5):
+            client.receive(timeout=2.0)
+
+        (stats,) = server.get_client_stats()
+        assert stats.sent_messages == 5
+        assert stats.queued_messages == 0
+        assert stats.lag_seconds == 0.0
+
+        client.disconnect()
+        server.stop()
+
+
+class TestTcpSelectorSocketServer:
+    """Tests for TcpSelectorSocketServer."""
+
+    def test_message_send_receive(
+        self, event_name: str, tcp_host: str
+    ) -> None:
+        """Test a unicast message reaches the addressed client."""
+        server = TcpSelectorSocketServer(
+            event_name=event_name,
+            host=tcp_host,
+            blocking_mode=False,
+        )
+        server.start()
+        assert server.port is not None
+
+        client = TcpSocketClient(
+            event_name=event_name,
+            host=tcp_host,
+            port=server.port,
+            auto_reconnect=False,
+        )
+        client.connect()
+        time.sleep(0.2)
+
+        (client_info,) = server.get_connected_clients()
+        assert client_info.address.startswith(f"{tcp_host}:")
+        server.send(
+            create_message(event_name, MessageType.DATA, {"value": 42}),
+            client_id=client_info.client_id,
+        )
+
+        assert client.receive(timeout=2.0).data["value"] == 42
+
+        client.disconnect()
+        server.stop()
@@ -1,6 +1,7 @@
 """Dotfiles State Manager - Generic state persistence layer.
 
-Provides a Redis-like API backed by SQLite or Redis for persistent state management.
+Provides a Redis-like API backed by SQLite, Redis or memory for
+persistent state management.
 
 Usage:
     from dotfiles_state_manager import StateManager
@@ -33,24 +34,55 @@ Usage:
     # Context manager
     with StateManager() as state:
         state.set("key", "value")
+
+    # Change notifications
+    state.subscribe("wallpaper:*", lambda change: print(change.key))
+
+    # asyncio
+    async with AsyncStateManager() as state:
+        await state.set("key", "value")
 """
 
 # Main interface
+from dotfiles_state_manager.async_manager import AsyncStateManager
 from dotfiles_state_manager.manager import StateManager
+from dotfiles_state_manager.notifications import KeyChange, Subscription
+from dotfiles_state_manager.sweeper import ExpirySweeper, SweepStats
 
 # Backends (for advanced usage)
 from dotfiles_state_manager.backends import (
+    AsyncRedisBackend,
+    AsyncStateBackend,
+    CachedBackend,
+    CacheStats,
+    ExecutorBackend,
+    MemoryBackend,
     RedisBackend,
     SQLiteBackend,
     StateBackend,
 )
 
+# Value codecs
+from dotfiles_state_manager.codecs import (
+    Codec,
+    JsonCodec,
+    MsgpackCodec,
+    OrjsonCodec,
+    RawCodec,
+    Serializer,
+    get_codec,
+)
+
 # Configuration
 from dotfiles_state_manager.config import (
     AppConfig,
+    CacheConfig,
+    CodecConfig,
+    MemoryConfig,
     RedisConfig,
     SQLiteConfig,
     StateManagerConfig,
+    SweeperConfig,
     get_default_config,
     get_state_manager_config,
 )
@@ -58,15 +90,38 @@ from dotfiles_state_manager.config import (
 __all__ = [
     # Main interface
     "StateManager",
+    "AsyncStateManager",
+    "ExpirySweeper",
+    "SweepStats",
+    "KeyChange",
+    "Subscription",
     # Backends
     "StateBackend",
     "SQLiteBackend",
     "RedisBackend",
+    "MemoryBackend",
+    "CachedBackend",
+    "CacheStats",
+    "AsyncStateBackend",
+    "ExecutorBackend",
+    "AsyncRedisBackend",
+    # Value codecs
+    "Codec",
+    "JsonCodec",
+    "OrjsonCodec",
+    "MsgpackCodec",
+    "RawCodec",
+    "Serializer",
+    "get_codec",
     # Configuration
     "AppConfig",
     "StateManagerConfig",
     "SQLiteConfig",
     "RedisConfig",
+    "MemoryConfig",
+    "CacheConfig",
+    "CodecConfig",
+    "SweeperConfig",
     "get_default_config",
     "get_state_manager_config",
 ]
@@ -0,0 +1,320 @@
+"""Asyncio StateManager facade."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import AbstractAsyncContextManager
+from typing import Any
+
+from dotfiles_state_manager.backends import (
+    AsyncRedisBackend,
+    AsyncStateBackend,
+    CachedBackend,
+    CacheStats,
+    ExecutorBackend,
+    StateBackend,
+)
+from dotfiles_state_manager.config import (
+    CacheConfig,
+    StateManagerConfig,
+    SweeperConfig,
+    get_state_manager_config,
+)
+from dotfiles_state_manager.manager import create_backend, create_serializer
+from dotfiles_state_manager.sweeper import ExpirySweeper, SweepStats
+
+
+class AsyncStateManager:
+    """Asyncio state manager facade.
+
+    Same API as StateManager with every operation awaitable, for use
+    from an event loop. SQLite (and any other blocking backend) runs on
+    a dedicated thread; Redis is accessed with redis.asyncio.
+
+    Usage:
+        async with AsyncStateManager() as state:
+            await state.set("key", "value")
+            value = await state.get("key")
+
+            async with state.transaction():
+                await state.hset("user:1", "name", "John")
+                await state.set("last_user", "user:1")
+    """
+
+    def __init__(
+        self,
+        config: StateManagerConfig | None = None,
+        backend: AsyncStateBackend | StateBackend | None = None,
+        cache: CacheConfig | None = None,
+        sweeper: SweeperConfig | None = None,
+    ) -> None:
+        """Initialize state manager.
+
+        Args:
+            config: Configuration for state manager. If None, loads from
+                settings files.
+            backend: Specific backend instance to use. If provided, config
+                is ignored. Blocking backends are run on a dedicated thread.
+            cache: Read cache configuration for blocking backends. If
+                None, uses config.cache (no cache when a backend is given).
+            sweeper: Expired key sweeper configuration for blocking
+                backends. If None, uses config.sweeper (no sweeper when a
+                backend is given).
+        """
+        if backend is None:
+            if config is None:
+                config = get_state_manager_config()
+
+            backend = self._create_backend(config)
+            if cache is None:
+                cache = config.cache
+            if sweeper is None:
+                sweeper = config.sweeper
+
+        self._sweeper: ExpirySweeper | None = None
+        if isinstance(backend, StateBackend):
+            if cache is not None and cache.enabled:
+                backend = CachedBackend(
+                    backend,
+                    max_bytes=cache.max_bytes,
+                    ttl=cache.ttl_seconds or None,
+                    version_check_interval=cache.version_check_seconds,
+                )
+            if sweeper is not None and sweeper.enabled:
+                self._sweeper = ExpirySweeper(
+                    backend,
+                    interval=sweeper.interval_seconds,
+                    batch_size=sweeper.batch_size,
+                    max_rows=sweeper.max_rows_per_sweep,
+                )
+                self._sweeper.start()
+            backend = ExecutorBackend(backend)
+
+        self._backend: AsyncStateBackend = backend
+
+    @property
+    def cache_stats(self) -> CacheStats | None:
+        """Hit/miss counters of the read cache, or None if disabled."""
+        backend = self._backend
+        if isinstance(backend, ExecutorBackend) and isinstance(
+            backend.backend, CachedBackend
+        ):
+            return backend.backend.stats
+        return None
+
+    @property
+    def sweep_stats(self) -> SweepStats | None:
+        """Counters of the expired key sweeper, or None if disabled."""
+        if self._sweeper is not None:
+            return self._sweeper.stats
+        return None
+
+    def _create_backend(
+        self, config: StateManagerConfig
+    ) -> AsyncStateBackend | StateBackend:
+        """Create backend from configuration.
+
+        Args:
+            config: State manager configuration
+
+        Returns:
+            AsyncRedisBackend for Redis, a blocking backend otherwise
+
+        Raises:
+            ValueError: If backend or codec type is not supported
+        """
+        if config.backend != "redis":
+            return create_backend(config)
+
+        return AsyncRedisBackend(
+            host=config.redis.host,
+            port=config.redis.port,
+            db=config.redis.db,
+            password=config.redis.password if config.redis.password else None,
+            key_prefix=config.redis.key_prefix,
+            max_connections=config.redis.max_connections,
+            socket_timeout=config.redis.socket_timeout,
+            socket_connect_timeout=config.redis.socket_connect_timeout,
+            serializer=create_serializer(config),
+        )
+
+    # === Key-Value Operations ===
+
+    async def set(self, key: str, value: Any) -> None:
+        """Store a value for the given key."""
+        await self._backend.set(key, value)
+
+    async def get(self, key: str, default: Any = None) -> Any:
+        """Retrieve a value for the given key."""
+        return await self._backend.get(key, default)
+
+    async def mset(self, mapping: dict[str, Any]) -> None:
+        """Store several key-value pairs in one operation."""
+        await self._backend.mset(mapping)
+
+    async def mget(self, keys: list[str], default: Any = None) -> list[Any]:
+        """Retrieve the values of several keys in one operation."""
+        return await self._backend.mget(keys, default)
+
+    async def delete(self, key: str) -> bool:
+        """Delete a key."""
+        return await self._backend.delete(key)
+
+    async def exists(self, key: str) -> bool:
+        """Check if a key exists."""
+        return await self._backend.exists(key)
+
+    async def keys(self, pattern: str | None = None) -> list[str]:
+        """List all keys, optionally matching a pattern."""
+        return await self._backend.keys(pattern)
+
+    def scan(
+        self,
+        pattern: str | None = None,
+        type: str | None = None,
+        count: int = 100,
+    ) -> AsyncIterator[str]:
+        """Iterate over keys of any data type, a page at a time."""
+        return self._backend.scan(pattern, type, count)
+
+    # === Hash Operations ===
+
+    async def hset(self, hash_key: str, field: str, value: Any) -> None:
+        """Set a field in a hash."""
+        await self._backend.hset(hash_key, field, value)
+
+    async def hmset(self, hash_key: str, mapping: dict[str, Any]) -> None:
+        """Set several fields in a hash in one operation."""
+        await self._backend.hmset(hash_key, mapping)
+
+    async def hget(
+        self, hash_key: str, field: str, default: Any = None
+    ) -> Any:
+        """Get a field from a hash."""
+        return await self._backend.hget(hash_key, field, default)
+
+    async def hgetall(self, hash_key: str) -> dict[str, Any]:
+        """Get all fields from a hash."""
+        return await self._backend.hgetall(hash_key)
+
+    async def hdel(self, hash_key: str, field: str) -> bool:
+        """Delete a field from a hash."""
+        return await self._backend.hdel(hash_key, field)
+
+    async def hexists(self, hash_key: str, field: str) -> bool:
+        """Check if a field exists in a hash."""
+        return await self._backend.hexists(hash_key, field)
+
+    # === List Operations ===
+
+    async def lpush(
+        self, list_key: str, value: Any, max_length: int | None = None
+    ) -> None:
+        """Prepend a value to a list, optionally capping its length."""
+        await self._backend.lpush(list_key, value, max_length)
+
+    async def rpush(
+        self, list_key: str, value: Any, max_length: int | None = None
+    ) -> None:
+        """Append a value to a list, optionally capping its length."""
+        await self._backend.rpush(list_key, value, max_length)
+
+    async def lrange(
+        self, list_key: str, start: int = 0, end: int = -1
+    ) -> list[Any]:
+        """Get a range of elements from a list."""
+        return await self._backend.lrange(list_key, start, end)
+
+    async def llen(self, list_key: str) -> int:
+        """Get the length of a list."""
+        return await self._backend.llen(list_key)
+
+    async def ltrim(self, list_key: str, start: int, end: int) -> None:
+        """Trim a list to the elements between start and end."""
+        await self._backend.ltrim(list_key, start, end)
+
+    async def lpop(self, list_key: str) -> Any | None:
+        """Remove and return the first element of a list."""
+        return await self._backend.lpop(list_key)
+
+    async def rpop(self, list_key: str) -> Any | None:
+        """Remove and return the last element of a list."""
+        return await self._backend.rpop(list_key)
+
+    # === Set Operations ===
+
+    async def sadd(self, set_key: str, *values: Any) -> int:
+        """Add one or more values to a set."""
+        return await self._backend.sadd(set_key, *values)
+
+    async def smembers(self, set_key: str) -> set[Any]:
+        """Get all members of a set."""
+        return await self._backend.smembers(set_key)
+
+    async def sismember(self, set_key: str, value: Any) -> bool:
+        """Check if a value is a member of a set."""
+        return await self._backend.sismember(set_key, value)
+
+    async def srem(self, set_key: str, *values: Any) -> int:
+        """Remove one or more values from a set."""
+        return await self._backend.srem(set_key, *values)
+
+    async def scard(self, set_key: str) -> int:
+        """Get the number of members in a set."""
+        return await self._backend.scard(set_key)
+
+    # === TTL/Expiration Operations ===
+
+    async def expire(self, key: str, seconds: int) -> bool:
+        """Set an expiration time on a key."""
+        return await self._backend.expire(key, seconds)
+
+    async def ttl(self, key: str) -> int | None:
+        """Get the remaining time to live for a key."""
+        return await self._backend.ttl(key)
+
+    async def persist(self, key: str) -> bool:
+        """Remove expiration from a key."""
+        return await self._backend.persist(key)
+
+    # === Transactions ===
+
+    def transaction(self) -> AbstractAsyncContextManager[None]:
+        """Group operations so they are committed together.
+
+        Usage:
+            async with state.transaction():
+                await state.hset("user:1", "name", "John")
+                await state.set("last_user", "user:1")
+        """
+        return self._backend.transaction()
+
+    # === Maintenance Operations ===
+
+    async def cleanup_expired(self, limit: int | None = None) -> int:
+        """Remove expired keys, at most limit rows if given."""
+        return await self._backend.cleanup_expired(limit)
+
+    async def clear_all(self) -> None:
+        """Clear all data (dangerous!)."""
+        await self._backend.clear_all()
+
+    async def close(self) -> None:
+        """Close the backend connection and cleanup resources."""
+        if self._sweeper is not None:
+            # Waits for the current batch, off the event loop
+            await asyncio.to_thread(self._sweeper.stop)
+        await self._backend.close()
+
+    # === Context Manager Support ===
+
+    async def __aenter__(self) -> AsyncStateManager:
+        """Enter async context manager."""
+        return self
+
+    async def __aexit__(
+        self, exc_type: Any, exc_val: Any, exc_tb: Any
+    ) -> None:
+        """Exit async context manager."""
+        await self.close()
@@ -1,12 +1,29 @@
 """State backend implementations."""
 
-from dotfiles_state_manager.backends.base import StateBackend
+from dotfiles_state_manager.backends.async_base import AsyncStateBackend
+from dotfiles_state_manager.backends.async_redis_backend import (
+    AsyncRedisBackend,
+)
+from dotfiles_state_manager.backends.base import KEY_TYPES, StateBackend
+from dotfiles_state_manager.backends.cached_backend import (
+    CachedBackend,
+    CacheStats,
+)
+from dotfiles_state_manager.backends.executor_backend import ExecutorBackend
+from dotfiles_state_manager.backends.memory_backend import MemoryBackend
 from dotfiles_state_manager.backends.redis_backend import RedisBackend
 from dotfiles_state_manager.backends.sqlite_backend import SQLiteBackend
 
 __all__ = [
+    "KEY_TYPES",
     "StateBackend",
     "SQLiteBackend",
     "RedisBackend",
+    "MemoryBackend",
+    "CachedBackend",
+    "CacheStats",
+    "AsyncStateBackend",
+    "ExecutorBackend",
+    "AsyncRedisBackend",
 ]
 
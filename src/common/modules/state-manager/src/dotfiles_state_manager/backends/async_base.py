@@ -0,0 +1,223 @@
+"""Abstract base class for asyncio state backends."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from contextlib import AbstractAsyncContextManager
+from typing import Any
+
+
+class AsyncStateBackend(ABC):
+    """Abstract interface for asyncio state backends.
+
+    Mirrors StateBackend with awaitable operations, so state can be used
+    from an event loop without blocking it. See StateBackend for the
+    semantics of each operation.
+    """
+
+    # === Key-Value Operations ===
+
+    @abstractmethod
+    async def set(self, key: str, value: Any) -> None:
+        """Store a value for the given key."""
+        pass
+
+    @abstractmethod
+    async def get(self, key: str, default: Any = None) -> Any:
+        """Retrieve a value for the given key."""
+        pass
+
+    @abstractmethod
+    async def delete(self, key: str) -> bool:
+        """Delete a key."""
+        pass
+
+    @abstractmethod
+    async def exists(self, key: str) -> bool:
+        """Check if a key exists."""
+        pass
+
+    @abstractmethod
+    async def keys(self, pattern: str | None = None) -> list[str]:
+        """List all keys, optionally matching a pattern."""
+        pass
+
+    @abstractmethod
+    def scan(
+        self,
+        pattern: str | None = None,
+        type: str | None = None,
+        count: int = 100,
+    ) -> AsyncIterator[str]:
+        """Iterate over keys of any data type, a page at a time.
+
+        Usage:
+            async for key in backend.scan("wallpaper:*"):
+                ...
+        """
+        pass
+
+    @abstractmethod
+    async def mset(self, mapping: dict[str, Any]) -> None:
+        """Store several key-value pairs in one operation."""
+        pass
+
+    @abstractmethod
+    async def mget(self, keys: list[str], default: Any = None) -> list[Any]:
+        """Retrieve the values of several keys in one operation."""
+        pass
+
+    # === Hash Operations ===
+
+    @abstractmethod
+    async def hset(self, hash_key: str, field: str, value: Any) -> None:
+        """Set a field in a hash."""
+        pass
+
+    @abstractmethod
+    async def hmset(self, hash_key: str, mapping: dict[str, Any]) -> None:
+        """Set several fields in a hash in one operation."""
+        pass
+
+    @abstractmethod
+    async def hget(
+        self, hash_key: str, field: str, default: Any = None
+    ) -> Any:
+        """Get a field from a hash."""
+        pass
+
+    @abstractmethod
+    async def hgetall(self, hash_key: str) -> dict[str, Any]:
+        """Get all fields from a hash."""
+        pass
+
+    @abstractmethod
+    async def hdel(self, hash_key: str, field: str) -> bool:
+        """Delete a field from a hash."""
+        pass
+
+    @abstractmethod
+    async def hexists(self, hash_key: str, field: str) -> bool:
+        """Check if a field exists in a hash."""
+        pass
+
+    # === List Operations ===
+
+    @abstractmethod
+    async def lpush(
+        self, list_key: str, value: Any, max_length: int | None = None
+    ) -> None:
+        """Prepend a value to a list, optionally capping its length."""
+        pass
+
+    @abstractmethod
+    async def rpush(
+        self, list_key: str, value: Any, max_length: int | None = None
+    ) -> None:
+        """Append a value to a list, optionally capping its length."""
+        pass
+
+    @abstractmethod
+    async def lrange(
+        self, list_key: str, start: int = 0, end: int = -1
+    ) -> list[Any]:
+        """Get a range of elements from a list."""
+        pass
+
+    @abstractmethod
+    async def llen(self, list_key: str) -> int:
+        """Get the length of a list."""
+        pass
+
+    @abstractmethod
+    async def ltrim(self, list_key: str, start: int, end: int) -> None:
+        """Trim a list to the elements between start and end."""
+        pass
+
+    @abstractmethod
+    async def lpop(self, list_key: str) -> Any | None:
+        """Remove and return the first element of a list."""
+        pass
+
+    @abstractmethod
+    async def rpop(self, list_key: str) -> Any | None:
+        """Remove and return the last element of a list."""
+        pass
+
+    # === Set Operations ===
+
+    @abstractmethod
+    async def sadd(self, set_key: str, *values: Any) -> int:
+        """Add one or more values to a set."""
+        pass
+
+    @abstractmethod
+    async def smembers(self, set_key: str) -> set[Any]:
+        """Get all members of a set."""
+        pass
+
+    @abstractmethod
+    async def sismember(self, set_key: str, value: Any) -> bool:
+        """Check if a value is a member of a set."""
+        pass
+
+    @abstractmethod
+    async def srem(self, set_key: str, *values: Any) -> int:
+        """Remove one or more values from a set."""
+        pass
+
+    @abstractmethod
+    async def scard(self, set_key: str) -> int:
+        """Get the number of members in a set."""
+        pass
+
+    # === TTL/Expiration Operations ===
+
+    @abstractmethod
+    async def expire(self, key: str, seconds: int) -> bool:
+        """Set an expiration time on a key."""
+        pass
+
+    @abstractmethod
+    async def ttl(self, key: str) -> int | None:
+        """Get the remaining time to live for a key."""
+        pass
+
+    @abstractmethod
+    async def persist(self, key: str) -> bool:
+        """Remove expiration from a key."""
+        pass
+
+    # === Transactions ===
+
+    @abstractmethod
+    def transaction(self) -> AbstractAsyncContextManager[None]:
+        """Group operations so they are committed together.
+
+        Usage:
+            async with backend.transaction():
+                await backend.hset("user:1", "name", "John")
+                await backend.set("last_user", "user:1")
+
+        Only operations awaited by the task that opened the transaction
+        belong to it.
+        """
+        pass
+
+    # === Maintenance Operations ===
+
+    @abstractmethod
+    async def cleanup_expired(self, limit: int | None = None) -> int:
+        """Remove expired keys, at most limit rows if given."""
+        pass
+
+    @abstractmethod
+    async def clear_all(self) -> None:
+        """Clear all data (dangerous!)."""
+        pass
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Close the backend connection and cleanup resources."""
+        pass
@@ -0,0 +1,431 @@
+"""Asyncio Redis backend implementation for state management."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from fnmatch import fnmatch
+from typing import Any
+
+try:
+    import redis.asyncio as aioredis
+
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+    aioredis = None  # type: ignore
+
+from dotfiles_state_manager.backends.async_base import AsyncStateBackend
+from dotfiles_state_manager.backends.base import KEY_TYPES
+from dotfiles_state_manager.codecs import Serializer
+
+
+class AsyncRedisBackend(AsyncStateBackend):
+    """Redis-based state backend for asyncio, using redis.asyncio.
+
+    Stores keys exactly like RedisBackend, so both can share a server.
+    The connection is opened by the first command, which raises
+    redis.ConnectionError if the server can't be reached.
+
+    Requires redis package to be installed:
+        uv add dotfiles-state-manager[redis]
+    """
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 6379,
+        db: int = 0,
+        password: str | None = None,
+        key_prefix: str = "dotfiles:",
+        max_connections: int = 10,
+        socket_timeout: int = 5,
+        socket_connect_timeout: int = 5,
+        serializer: Serializer | None = None,
+    ) -> None:
+        """Initialize asyncio Redis backend.
+
+        Args:
+            host: Redis server host
+            port: Redis server port
+            db: Redis database number
+            password: Redis password (if required)
+            key_prefix: Prefix for all keys
+            max_connections: Maximum connections in pool
+            socket_timeout: Socket timeout in seconds
+            socket_connect_timeout: Socket connect timeout in seconds
+            serializer: Value encoding (JSON text if None)
+
+        Raises:
+            ImportError: If redis package is not installed
+        """
+        if not REDIS_AVAILABLE:
+            raise ImportError(
+                "Redis backend requires redis package. "
+                "Install with: uv add dotfiles-state-manager[redis]"
+            )
+
+        self.key_prefix = key_prefix
+        self.serializer = serializer or Serializer()
+        # Transaction pipeline of the current task
+        self._pipeline: ContextVar[Any] = ContextVar(
+            f"redis_pipeline_{id(self)}", default=None
+        )
+        connection_options = {
+            "host": host,
+            "port": port,
+            "db": db,
+            "password": password if password else None,
+            "max_connections": max_connections,
+            "socket_timeout": socket_timeout,
+            "socket_connect_timeout": socket_connect_timeout,
+        }
+        self.client: aioredis.Redis = aioredis.Redis(  # type: ignore
+            **connection_options, decode_responses=True
+        )
+
+        # Binary values must be read without decoding them as UTF-8
+        self._value_client: aioredis.Redis = self.client  # type: ignore
+        if self.serializer.binary:
+            self._value_client = aioredis.Redis(  # type: ignore
+                **connection_options, decode_responses=False
+            )
+
+    def _make_key(self, key: str) -> str:
+        """Add prefix to key."""
+        return f"{self.key_prefix}{key}"
+
+    async def _write(self, command: str, *args: Any, **kwargs: Any) -> None:
+        """Send a write command, or queue it in the open transaction."""
+        pipeline = self._pipeline.get()
+        if pipeline is not None:
+            # Pipelines buffer commands without awaiting
+            getattr(pipeline, command)(*args, **kwargs)
+        else:
+            await getattr(self.client, command)(*args, **kwargs)
+
+    def _serialize(self, value: Any) -> str | bytes:
+        """Encode a value for storage."""
+        return self.serializer.encode(value)
+
+    def _deserialize(self, value: str | bytes) -> Any:
+        """Decode a stored value."""
+        return self.serializer.decode(value)
+
+    # === Key-Value Operations ===
+
+    async def set(self, key: str, value: Any) -> None:
+        """Store a value for the given key."""
+        await self._write("set", self._make_key(key), self._serialize(value))
+
+    async def get(self, key: str, default: Any = None) -> Any:
+        """Retrieve a value for the given key."""
+        value = await self._value_client.get(self._make_key(key))
+
+        if value is None:
+            return default
+
+        return self._deserialize(value)
+
+    async def mset(self, mapping: dict[str, Any]) -> None:
+        """Store several key-value pairs with a single MSET."""
+        if not mapping:
+            return
+        await self._write(
+            "mset",
+            {
+                self._make_key(key): self._serialize(value)
+                for key, value in mapping.items()
+            },
+        )
+
+    async def mget(self, keys: list[str], default: Any = None) -> list[Any]:
+        """Retrieve the values of several keys with a single MGET."""
+        if not keys:
+            return []
+        values = await self._value_client.mget(
+            [self._make_key(key) for key in keys]
+        )
+        return [
+            default if value is None else self._deserialize(value)
+            for value in values
+        ]
+
+    async def delete(self, key: str) -> bool:
+        """Delete a key."""
+        result = await self.client.delete(self._make_key(key))
+        return result > 0
+
+    async def exists(self, key: str) -> bool:
+        """Check if a key exists."""
+        return bool(await self.client.exists(self._make_key(key)))
+
+    async def keys(self, pattern: str | None = None) -> list[str]:
+        """List all keys, optionally matching a pattern.
+
+        Uses incremental SCAN rather than the blocking KEYS command.
+        """
+        # SCAN may report a key more than once
+        return list(dict.fromkeys([key async for key in self.scan(pattern)]))
+
+    async def scan(
+        self,
+        pattern: str | None = None,
+        type: str | None = None,
+        count: int = 100,
+    ) -> AsyncIterator[str]:
+        """Iterate over keys with SCAN (keys may repeat)."""
+        if type is not None and type not in KEY_TYPES:
+            raise ValueError(f"Unsupported key type: {type}")
+
+        search_pattern = f"{self.key_prefix}{pattern or '*'}"
+        prefix_len = len(self.key_prefix)
+
+        async for raw_key in self.client.scan_iter(
+            match=search_pattern, count=count, _type=type
+        ):
+            key = raw_key[prefix_len:]
+            # Filter with fnmatch for consistent glob semantics
+            if pattern is None or fnmatch(key, pattern):
+                yield key
+
+    # === Hash Operations ===
+
+    async def hset(self, hash_key: str, field: str, value: Any) -> None:
+        """Set a field in a hash."""
+        await self._write(
+            "hset", self._make_key(hash_key), field, self._serialize(value)
+        )
+
+    async def hmset(self, hash_key: str, mapping: dict[str, Any]) -> None:
+        """Set several fields in a hash with a single HSET."""
+        if not mapping:
+            return
+        await self._write(
+            "hset",
+            self._make_key(hash_key),
+            mapping={
+                field: self._serialize(value)
+                for field, value in mapping.items()
+            },
+        )
+
+    async def hget(
+        self, hash_key: str, field: str, default: Any = None
+    ) -> Any:
+        """Get a field from a hash."""
+        value = await self._value_client.hget(self._make_key(hash_key), field)
+
+        if value is None:
+            return default
+
+        return self._deserialize(value)
+
+    async def hgetall(self, hash_key: str) -> dict[str, Any]:
+        """Get all fields from a hash."""
+        raw_hash = await self._value_client.hgetall(self._make_key(hash_key))
+
+        return {
+            (
+                field.decode() if isinstance(field, bytes) else field
+            ): self._deserialize(value)
+            for field, value in raw_hash.items()
+        }
+
+    async def hdel(self, hash_key: str, field: str) -> bool:
+        """Delete a field from a hash."""
+        result = await self.client.hdel(self._make_key(hash_key), field)
+        return result > 0
+
+    async def hexists(self, hash_key: str, field: str) -> bool:
+        """Check if a field exists in a hash."""
+        return bool(
+            await self.client.hexists(self._make_key(hash_key), field)
+        )
+
+    # === List Operations ===
+
+    async def lpush(
+        self, list_key: str, value: Any, max_length: int | None = None
+    ) -> None:
+        """Prepend a value to a list."""
+        prefixed_key = self._make_key(list_key)
+        serialized = self._serialize(value)
+        if max_length is None:
+            await self._write("lpush", prefixed_key, serialized)
+            return
+
+        async with self.transaction():
+            await self._write("lpush", prefixed_key, serialized)
+            await self._write("ltrim", prefixed_key, 0, max_length - 1)
+
+    async def rpush(
+        self, list_key: str, value: Any, max_length: int | None = None
+    ) -> None:
+        """Append a value to a list."""
+        prefixed_key = self._make_key(list_key)
+        serialized = self._serialize(value)
+        if max_length is None:
+            await self._write("rpush", prefixed_key, serialized)
+            return
+
+        async with self.transaction():
+            await self._write("rpush", prefixed_key, serialized)
+            await self._write("ltrim", prefixed_key, -max_length, -1)
+
+    async def lrange(
+        self, list_key: str, start: int = 0, end: int = -1
+    ) -> list[Any]:
+        """Get a range of elements from a list."""
+        values = await self._value_client.lrange(
+            self._make_key(list_key), start, end
+        )
+        return [self._deserialize(v) for v in values]
+
+    async def llen(self, list_key: str) -> int:
+        """Get the length of a list."""
+        return int(await self.client.llen(self._make_key(list_key)))
+
+    async def ltrim(self, list_key: str, start: int, end: int) -> None:
+        """Trim a list to the elements between start and end."""
+        await self._write("ltrim", self._make_key(list_key), start, end)
+
+    async def lpop(self, list_key: str) -> Any | None:
+        """Remove and return the first element of a list."""
+        value = await self._value_client.lpop(self._make_key(list_key))
+
+        if value is None:
+            return None
+
+        return self._deserialize(value)
+
+    async def rpop(self, list_key: str) -> Any | None:
+        """Remove and return the last element of a list."""
+        value = await self._value_client.rpop(self._make_key(list_key))
+
+        if value is None:
+            return None
+
+        return self._deserialize(value)
+
+    # === Set Operations ===
+
+    async def sadd(self, set_key: str, *values: Any) -> int:
+        """Add one or more values to a set."""
+        serialized_values = [self._serialize(v) for v in values]
+        result = await self.client.sadd(
+            self._make_key(set_key), *serialized_values
+        )
+        return int(result)
+
+    async def smembers(self, set_key: str) -> set[Any]:
+        """Get all members of a set."""
+        raw_members = await self._value_client.smembers(
+            self._make_key(set_key)
+        )
+        return {self._deserialize(m) for m in raw_members}
+
+    async def sismember(self, set_key: str, value: Any) -> bool:
+        """Check if a value is a member of a set."""
+        return bool(
+            await self.client.sismember(
+                self._make_key(set_key), self._serialize(value)
+            )
+        )
+
+    async def srem(self, set_key: str, *values: Any) -> int:
+        """Remove one or more values from a set."""
+        serialized_values = [self._serialize(v) for v in values]
+        result = await self.client.srem(
+            self._make_key(set_key), *serialized_values
+        )
+        return int(result)
+
+    async def scard(self, set_key: str) -> int:
+        """Get the number of members in a set."""
+        return int(await self.client.scard(self._make_key(set_key)))
+
+    # === TTL/Expiration Operations ===
+
+    async def expire(self, key: str, seconds: int) -> bool:
+        """Set an expiration time on a key."""
+        return bool(await self.client.expire(self._make_key(key), seconds))
+
+    async def ttl(self, key: str) -> int | None:
+        """Get the remaining time to live for a key."""
+        result = await self.client.ttl(self._make_key(key))
+
+        if result == -1:
+            # Key exists but has no expiration
+            return None
+        elif result == -2:
+            # Key doesn't exist
+            return -2
+        else:
+            # Return remaining seconds
+            return int(result)
+
+    async def persist(self, key: str) -> bool:
+        """Remove expiration from a key."""
+        return bool(await self.client.persist(self._make_key(key)))
+
+    # === Transactions ===
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[None]:
+        """Queue the enclosed writes in a MULTI/EXEC pipeline.
+
+        set, mset, hset, hmset, lpush, rpush and ltrim awaited by the
+        current task are buffered and sent in one round-trip on exit.
+        Commands that return a result (reads, deletes, pops, ...) still
+        run immediately against the server.
+        """
+        if self._pipeline.get() is not None:
+            # Nested: the outermost transaction executes
+            yield
+            return
+
+        pipeline = self.client.pipeline(transaction=True)
+        token = self._pipeline.set(pipeline)
+        try:
+            yield
+        except BaseException:
+            await pipeline.reset()
+            raise
+        else:
+            await pipeline.execute()
+        finally:
+            self._pipeline.reset(token)
+
+    # === Maintenance Operations ===
+
+    async def cleanup_expired(
+        self,
+        limit: int | None = None,  # noqa: ARG002
+    ) -> int:
+        """Remove expired keys.
+
+        Note: Redis automatically removes expired keys, so this is a no-op.
+        Returns 0 as we can't determine how many keys were expired.
+        ``limit`` is accepted for interface compatibility only: there is
+        no backlog to bound, since Redis expires keys itself.
+        """
+        return 0
+
+    async def clear_all(self) -> None:
+        """Clear all data (dangerous!)."""
+        # Only delete keys with our prefix
+        pattern = f"{self.key_prefix}*"
+        keys_to_delete = [
+            key async for key in self.client.scan_iter(match=pattern)
+        ]
+
+        if keys_to_delete:
+            await self.client.delete(*keys_to_delete)
+
+    async def close(self) -> None:
+        """Close the backend connections."""
+        await self.client.aclose()
+        if self._value_client is not self.client:
+            await self._value_client.aclose()
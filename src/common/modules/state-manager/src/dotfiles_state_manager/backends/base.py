@@ -3,8 +3,15 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from contextlib import AbstractContextManager
 from typing import Any
 
+from dotfiles_state_manager.notifications import ChangeCallback, Subscription
+
+# Data structure names accepted by StateBackend.scan (as in Redis TYPE)
+KEY_TYPES = ("string", "hash", "list", "set")
+
 
 class StateBackend(ABC):
     """Abstract interface for state persistence backends.
@@ -74,6 +81,86 @@ class StateBackend(ABC):
         """
         pass
 
+    @abstractmethod
+    def scan(
+        self,
+        pattern: str | None = None,
+        type: str | None = None,
+        count: int = 100,
+    ) -> Iterator[str]:
+        """Iterate over keys of any data type, a page at a time.
+
+        Unlike keys(), this covers hashes, lists and sets too, and never
+        loads or blocks on the whole keyspace at once.
+
+        Args:
+            pattern: Optional glob-style pattern (e.g., "wallpaper:*")
+            type: Only yield keys of this type ("string", "hash",
+                "list" or "set")
+            count: Number of keys fetched per round-trip
+
+        Yields:
+            Matching keys
+        """
+        pass
+
+    @abstractmethod
+    def mset(self, mapping: dict[str, Any]) -> None:
+        """Store several key-value pairs in one operation.
+
+        Args:
+            mapping: Keys and JSON-serializable values to store
+        """
+        pass
+
+    @abstractmethod
+    def mget(self, keys: list[str], default: Any = None) -> list[Any]:
+        """Retrieve the values of several keys in one operation.
+
+        Args:
+            keys: The keys to retrieve
+            default: Value returned for keys that don't exist
+
+        Returns:
+            Values in the same order as keys
+        """
+        pass
+
+    def get_with_ttl(
+        self, key: str, default: Any = None
+    ) -> tuple[Any, int | None]:
+        """Retrieve a value together with the remaining TTL of its key.
+
+        Backends able to read both at once override this; the default
+        makes separate get and ttl calls.
+
+        Args:
+            key: The key to retrieve
+            default: Default value if key doesn't exist
+
+        Returns:
+            The value (or default) and the TTL as returned by ttl()
+        """
+        return self.get(key, default), self.ttl(key)
+
+    def mget_with_ttl(
+        self, keys: list[str], default: Any = None
+    ) -> list[tuple[Any, int | None]]:
+        """Retrieve several values together with the TTLs of their keys.
+
+        Args:
+            keys: The keys to retrieve
+            default: Value returned for keys that don't exist
+
+        Returns:
+            (value, TTL) pairs in the same order as keys
+        """
+        values = self.mget(keys, default)
+        return [
+            (value, self.ttl(key))
+            for key, value in zip(keys, values, strict=True)
+        ]
+
     # === Hash Operations ===
 
     @abstractmethod
@@ -87,6 +174,16 @@ class StateBackend(ABC):
         """
         pass
 
+    @abstractmethod
+    def hmset(self, hash_key: str, mapping: dict[str, Any]) -> None:
+        """Set several fields in a hash in one operation.
+
+        Args:
+            hash_key: The hash key
+            mapping: Field names and JSON-serializable values
+        """
+        pass
+
     @abstractmethod
     def hget(self, hash_key: str, field: str, default: Any = None) -> Any:
         """Get a field from a hash.
@@ -113,6 +210,35 @@ class StateBackend(ABC):
         """
         pass
 
+    def hget_with_ttl(
+        self, hash_key: str, field: str, default: Any = None
+    ) -> tuple[Any, int | None]:
+        """Get a field from a hash together with the hash's TTL.
+
+        Args:
+            hash_key: The hash key
+            field: The field name within the hash
+            default: Default value if field doesn't exist
+
+        Returns:
+            The field value (or default) and the TTL as returned by ttl()
+        """
+        return self.hget(hash_key, field, default), self.ttl(hash_key)
+
+    def hgetall_with_ttl(
+        self, hash_key: str
+    ) -> tuple[dict[str, Any], int | None]:
+        """Get all fields from a hash together with the hash's TTL.
+
+        Args:
+            hash_key: The hash key
+
+        Returns:
+            Dictionary of all field-value pairs and the TTL as returned
+            by ttl()
+        """
+        return self.hgetall(hash_key), self.ttl(hash_key)
+
     @abstractmethod
     def hdel(self, hash_key: str, field: str) -> bool:
         """Delete a field from a hash.
@@ -142,22 +268,30 @@ class StateBackend(ABC):
     # === List Operations ===
 
     @abstractmethod
-    def lpush(self, list_key: str, value: Any) -> None:
+    def lpush(
+        self, list_key: str, value: Any, max_length: int | None = None
+    ) -> None:
         """Prepend a value to a list.
 
         Args:
             list_key: The list key
             value: Any JSON-serializable value
+            max_length: If set, trim the list to its first max_length
+                elements afterwards (a capped list, newest first)
         """
         pass
 
     @abstractmethod
-    def rpush(self, list_key: str, value: Any) -> None:
+    def rpush(
+        self, list_key: str, value: Any, max_length: int | None = None
+    ) -> None:
         """Append a value to a list.
 
         Args:
             list_key: The list key
             value: Any JSON-serializable value
+            max_length: If set, trim the list to its last max_length
+                elements afterwards (a capped list, newest last)
         """
         pass
 
@@ -189,6 +323,18 @@ class StateBackend(ABC):
         """
         pass
 
+    @abstractmethod
+    def ltrim(self, list_key: str, start: int, end: int) -> None:
+        """Trim a list to the elements between start and end.
+
+        Args:
+            list_key: The list key
+            start: Start index (0-based, inclusive; negative counts from
+                the end)
+            end: End index (inclusive; -1 means end of list)
+        """
+        pass
+
     @abstractmethod
     def lpop(self, list_key: str) -> Any | None:
         """Remove and return the first element of a list.
@@ -319,14 +465,38 @@ class StateBackend(ABC):
         """
         pass
 
+    # === Transactions ===
+
+    @abstractmethod
+    def transaction(self) -> AbstractContextManager[None]:
+        """Group operations so they are committed together.
+
+        Usage:
+            with backend.transaction():
+                backend.hset("user:1", "name", "John")
+                backend.set("last_user", "user:1")
+
+        Writes made inside the block are applied atomically when it
+        exits and discarded if it raises. Transactions may be nested;
+        only the outermost one commits.
+
+        Returns:
+            Context manager delimiting the transaction
+        """
+        pass
+
     # === Maintenance Operations ===
 
     @abstractmethod
-    def cleanup_expired(self) -> int:
-        """Remove all expired keys.
+    def cleanup_expired(self, limit: int | None = None) -> int:
+        """Remove expired keys.
+
+        Args:
+            limit: Maximum number of stored rows to remove, so large
+                backlogs can be reclaimed in short batches (None = all)
 
         Returns:
-            Number of keys removed
+            Number of rows removed
         """
         pass
 
@@ -338,6 +508,44 @@ class StateBackend(ABC):
         """
         pass
 
+    def data_version(self) -> int | None:
+        """Get a counter that changes when another client modifies the store.
+
+        Used by caching layers to detect writes they did not make
+        themselves. Writes made through this backend instance need not
+        change it.
+
+        Returns:
+            Opaque version number, or None if the backend can't tell
+        """
+        return None
+
+    # === Change Notifications ===
+
+    def subscribe(
+        self, pattern: str, callback: ChangeCallback
+    ) -> Subscription:
+        """Call back whenever a key matching a pattern changes.
+
+        Changes made by other clients of the same store are reported
+        too. Callbacks run on a background thread of the backend (or,
+        for in-process stores, in the thread that made the change), so
+        they should return quickly and must not assume the thread.
+
+        Args:
+            pattern: Glob-style pattern of the keys to watch
+            callback: Called with a KeyChange for every matching change
+
+        Returns:
+            Subscription whose cancel() stops the notifications
+
+        Raises:
+            NotImplementedError: If the backend can't report changes
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support change notifications"
+        )
+
     @abstractmethod
     def close(self) -> None:
         """Close the backend connection and cleanup resources."""
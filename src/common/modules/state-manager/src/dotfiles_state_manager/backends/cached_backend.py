@@ -0,0 +1,569 @@
+"""In-process read-through cache wrapping another state backend."""
+
+from __future__ import annotations
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, NamedTuple
+
+from dotfiles_state_manager.backends.base import StateBackend
+from dotfiles_state_manager.codecs import Codec, JsonCodec
+from dotfiles_state_manager.notifications import ChangeCallback, Subscription
+
+# Returned by the inner backend for keys that don't exist, so misses
+# can be cached without confusing them with stored None values
+_MISSING: Any = object()
+
+# Rough per-entry bookkeeping overhead in bytes (key tuple, entry,
+# OrderedDict node), added to the encoded value size
+ENTRY_OVERHEAD = 200
+
+# Cache slots: (kind, key, hash field)
+_Slot = tuple[str, str, str | None]
+
+# Values cached as they are; anything else is cached as a copy (encoded
+# where possible), so callers can't modify the cached value
+_IMMUTABLE = (str, bytes, int, float, bool, type(None))
+
+
+class _Entry(NamedTuple):
+    """A cached read result."""
+
+    value: Any
+    restore: Callable[[Any], Any] | None  # turns value into a fresh copy
+    size: int
+    expires_at: float | None  # time.monotonic() deadline
+
+
+@dataclass
+class CacheStats:
+    """Counters of a CachedBackend.
+
+    Attributes:
+        hits: Reads answered from memory
+        misses: Reads forwarded to the inner backend
+        evictions: Entries dropped to stay within max_bytes
+        invalidations: Entries dropped because their key changed
+        entries: Entries currently cached
+        size_bytes: Estimated memory used by the cached entries
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+    entries: int = 0
+    size_bytes: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of reads answered from memory."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class CachedBackend(StateBackend):
+    """Write-through LRU cache in front of another backend.
+
+    Caches the results of get, mget, hget and hgetall, bounded by an
+    estimate of their size in bytes. All writes go straight to the
+    inner backend and drop the cached entries of the keys they touch.
+    Entries never outlive the TTL of their key, nor ``ttl`` seconds if
+    given. When the inner backend reports a data_version, a change of
+    it (a write by another process) drops the whole cache; it is
+    checked at most once per ``version_check_interval`` seconds, so
+    cache hits don't each query the backend.
+
+    List and set reads, scans and TTL queries are not cached.
+
+    Usage:
+        backend = CachedBackend(SQLiteBackend(db_path), max_bytes=1 << 20)
+        backend.get("key")  # miss, read from SQLite
+        backend.get("key")  # hit
+        print(backend.stats.hit_rate)
+    """
+
+    def __init__(
+        self,
+        backend: StateBackend,
+        max_bytes: int = 16 * 1024 * 1024,
+        ttl: float | None = None,
+        version_check_interval: float = 0.05,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            backend: Backend to read from and write through to
+            max_bytes: Upper bound on the estimated size of cached values
+            ttl: Maximum age of a cached entry in seconds (None = until
+                invalidated). Set it when other clients write to a
+                backend without a data_version, such as Redis.
+            version_check_interval: Minimum seconds between checks of
+                the backend's data_version (how long writes by other
+                processes may go unnoticed)
+        """
+        self.backend = backend
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.version_check_interval = version_check_interval
+
+        # Containers are cached in the inner backend's own format, so a
+        # hit returns what a miss would (tuples as lists with JSON, int
+        # keys and bytes with msgpack, ...)
+        serializer = getattr(backend, "serializer", None)
+        self._codec: Codec = (
+            serializer.codec if serializer is not None else JsonCodec()
+        )
+
+        self._lock = threading.RLock()
+        self._entries: OrderedDict[_Slot, _Entry] = OrderedDict()
+        self._slots_by_key: dict[str, set[_Slot]] = {}
+        self._size = 0
+        self._generation = 0  # bumped by every invalidation
+        self._stats = CacheStats()
+        self._data_version = backend.data_version()
+        self._next_version_check = 0.0
+        self._local = threading.local()
+
+    @property
+    def stats(self) -> CacheStats:
+        """Snapshot of the cache counters."""
+        with self._lock:
+            return CacheStats(
+                hits=self._stats.hits,
+                misses=self._stats.misses,
+                evictions=self._stats.evictions,
+                invalidations=self._stats.invalidations,
+                entries=len(self._entries),
+                size_bytes=self._size,
+            )
+
+    # === Cache bookkeeping ===
+
+    @property
+    def _written_keys(self) -> set[str] | None:
+        """Keys written by the current thread's open transaction."""
+        return getattr(self._local, "written_keys", None)
+
+    def _sync_data_version(self) -> None:
+        """Drop everything if another process modified the store."""
+        now = time.monotonic()
+        if now < self._next_version_check:
+            return
+        self._next_version_check = now + self.version_check_interval
+
+        version = self.backend.data_version()
+        with self._lock:
+            if version != self._data_version:
+                self._data_version = version
+                self._clear()
+
+    def _lookup(self, slot: _Slot) -> _Entry | None:
+        """Get a live entry and mark it as recently used."""
+        entry = self._entries.get(slot)
+        if entry is None:
+            return None
+        if entry.expires_at is not None and entry.expires_at <= (
+            time.monotonic()
+        ):
+            self._discard(slot)
+            return None
+        self._entries.move_to_end(slot)
+        return entry
+
+    def _expiry(self, remaining: int | None) -> float | None | bool:
+        """Get the monotonic deadline for an entry.
+
+        Args:
+            remaining: TTL of the entry's key, as reported by ttl()
+
+        Returns:
+            Deadline, None for no deadline, or False if the entry
+            shouldn't be cached at all
+        """
+        now = time.monotonic()
+        deadline = None if self.ttl is None else now + self.ttl
+
+        if remaining is not None and remaining >= 0:
+            # TTLs have a one second resolution; err on the early side
+            if remaining <= 1:
+                return False
+            key_deadline = now + remaining - 1
+            if deadline is None or key_deadline < deadline:
+                deadline = key_deadline
+        return deadline
+
+    def _store(
+        self,
+        slot: _Slot,
+        value: Any,
+        remaining: int | None,
+        generation: int,
+    ) -> None:
+        """Cache a value read from the inner backend.
+
+        The backend is read without holding the cache lock, so the value
+        is dropped if any key was invalidated since the read started.
+        """
+        if self._written_keys is not None:
+            # Reads inside a transaction may see uncommitted writes
+            return
+
+        expires_at = self._expiry(remaining)
+        if expires_at is False:
+            return
+
+        restore = None
+        if value is not _MISSING and not isinstance(value, _IMMUTABLE):
+            try:
+                value = self._codec.dumps(value)
+                restore = self._codec.loads
+            except (TypeError, ValueError):
+                # e.g. a hash of bytes values with the raw codec
+                value = copy.deepcopy(value)
+                restore = copy.deepcopy
+        size = ENTRY_OVERHEAD + len(slot[1])
+        if isinstance(value, (str, bytes)):
+            size += len(value)
+        elif restore is copy.deepcopy:
+            size += len(repr(value))
+        if size > self.max_bytes:
+            return
+
+        entry = _Entry(value, restore, size, expires_at)
+        with self._lock:
+            if generation == self._generation:
+                self._insert(slot, entry)
+
+    def _insert(self, slot: _Slot, entry: _Entry) -> None:
+        """Add an entry, evicting the least recently used ones."""
+        self._discard(slot)
+        self._entries[slot] = entry
+        self._slots_by_key.setdefault(slot[1], set()).add(slot)
+        self._size += entry.size
+
+        while self._size > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._discard(oldest)
+            self._stats.evictions += 1
+
+    def _discard(self, slot: _Slot) -> None:
+        """Remove one entry."""
+        entry = self._entries.pop(slot, None)
+        if entry is None:
+            return
+        self._size -= entry.size
+        slots = self._slots_by_key[slot[1]]
+        slots.discard(slot)
+        if not slots:
+            del self._slots_by_key[slot[1]]
+
+    def _invalidate(self, key: str) -> None:
+        """Drop every entry of a key."""
+        with self._lock:
+            self._generation += 1
+            for slot in list(self._slots_by_key.get(key, ())):
+                self._discard(slot)
+                self._stats.invalidations += 1
+
+    def _clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._generation += 1
+            self._stats.invalidations += len(self._entries)
+            self._entries.clear()
+            self._slots_by_key.clear()
+            self._size = 0
+
+    @contextmanager
+    def _writing(self, *keys: str) -> Iterator[None]:
+        """Invalidate keys once the enclosed write to them is done.
+
+        Invalidating after the write (rather than before) guarantees a
+        concurrent read can't cache the value being replaced.
+        """
+        try:
+            yield
+        finally:
+            if self._written_keys is not None:
+                self._written_keys.update(keys)
+            for key in keys:
+                self._invalidate(key)
+
+    def _value(self, entry: _Entry) -> Any:
+        """Get a cached value, giving callers their own container copy."""
+        if entry.restore is None:
+            return entry.value
+        return entry.restore(entry.value)
+
+    def _read(
+        self, slot: _Slot, load: Callable[[], tuple[Any, int | None]]
+    ) -> Any:
+        """Answer a read from memory or load and cache it."""
+        self._sync_data_version()
+        with self._lock:
+            entry = self._lookup(slot)
+            if entry is not None:
+                self._stats.hits += 1
+                return self._value(entry)
+            self._stats.misses += 1
+            generation = self._generation
+
+        value, remaining = load()
+        self._store(slot, value, remaining, generation)
+        return value
+
+    # === Key-Value Operations ===
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a value for the given key."""
+        with self._writing(key):
+            self.backend.set(key, value)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Retrieve a value for the given key."""
+        value = self._read(
+            ("get", key, None),
+            lambda: self.backend.get_with_ttl(key, _MISSING),
+        )
+        return default if value is _MISSING else value
+
+    def mset(self, mapping: dict[str, Any]) -> None:
+        """Store several key-value pairs in one operation."""
+        with self._writing(*mapping):
+            self.backend.mset(mapping)
+
+    def mget(self, keys: list[str], default: Any = None) -> list[Any]:
+        """Retrieve several values, fetching only the uncached ones."""
+        self._sync_data_version()
+        values: list[Any] = []
+        missing: list[int] = []
+        with self._lock:
+            for key in keys:
+                entry = self._lookup(("get", key, None))
+                if entry is None:
+                    missing.append(len(values))
+                    values.append(_MISSING)
+                else:
+                    self._stats.hits += 1
+                    values.append(self._value(entry))
+            self._stats.misses += len(missing)
+            generation = self._generation
+
+        if missing:
+            loaded = self.backend.mget_with_ttl(
+                [keys[index] for index in missing], _MISSING
+            )
+            for index, (value, remaining) in zip(
+                missing, loaded, strict=True
+            ):
+                self._store(
+                    ("get", keys[index], None), value, remaining, generation
+                )
+                values[index] = value
+
+        return [default if value is _MISSING else value for value in values]
+
+    def delete(self, key: str) -> bool:
+        """Delete a key."""
+        with self._writing(key):
+            return self.backend.delete(key)
+
+    def exists(self, key: str) -> bool:
+        """Check if a key exists."""
+        return self.backend.exists(key)
+
+    def keys(self, pattern: str | None = None) -> list[str]:
+        """List all keys, optionally matching a pattern."""
+        return self.backend.keys(pattern)
+
+    def scan(
+        self,
+        pattern: str | None = None,
+        type: str | None = None,
+        count: int = 100,
+    ) -> Iterator[str]:
+        """Iterate over keys of any data type, a page at a time."""
+        return self.backend.scan(pattern, type, count)
+
+    # === Hash Operations ===
+
+    def hset(self, hash_key: str, field: str, value: Any) -> None:
+        """Set a field in a hash."""
+        with self._writing(hash_key):
+            self.backend.hset(hash_key, field, value)
+
+    def hmset(self, hash_key: str, mapping: dict[str, Any]) -> None:
+        """Set several fields in a hash in one operation."""
+        with self._writing(hash_key):
+            self.backend.hmset(hash_key, mapping)
+
+    def hget(self, hash_key: str, field: str, default: Any = None) -> Any:
+        """Get a field from a hash."""
+        value = self._read(
+            ("hget", hash_key, field),
+            lambda: self.backend.hget_with_ttl(hash_key, field, _MISSING),
+        )
+        return default if value is _MISSING else value
+
+    def hgetall(self, hash_key: str) -> dict[str, Any]:
+        """Get all fields from a hash."""
+        return self._read(
+            ("hgetall", hash_key, None),
+            lambda: self.backend.hgetall_with_ttl(hash_key),
+        )
+
+    def hdel(self, hash_key: str, field: str) -> bool:
+        """Delete a field from a hash."""
+        with self._writing(hash_key):
+            return self.backend.hdel(hash_key, field)
+
+    def hexists(self, hash_key: str, field: str) -> bool:
+        """Check if a field exists in a hash."""
+        return self.backend.hexists(hash_key, field)
+
+    # === List Operations ===
+
+    def lpush(
+        self, list_key: str, value: Any, max_length: int | None = None
+    ) -> None:
+        """Prepend a value to a list, optionally capping its length."""
+        with self._writing(list_key):
+            self.backend.lpush(list_key, value, max_length)
+
+    def rpush(
+        self, list_key: str, value: Any, max_length: int | None = None
+    ) -> None:
+        """Append a value to a list, optionally capping its length."""
+        with self._writing(list_key):
+            self.backend.rpush(list_key, value, max_length)
+
+    def lrange(
+        self, list_key: str, start: int = 0, end: int = -1
+    ) -> list[Any]:
+        """Get a range of elements from a list."""
+        return self.backend.lrange(list_key, start, end)
+
+    def llen(self, list_key: str) -> int:
+        """Get the length of a list."""
+        return self.backend.llen(list_key)
+
+    def ltrim(self, list_key: str, start: int, end: int) -> None:
+        """Trim a list to the elements between start and end."""
+        with self._writing(list_key):
+            self.backend.ltrim(list_key, start, end)
+
+    def lpop(self, list_key: str) -> Any | None:
+        """Remove and return the first element of a list."""
+        with self._writing(list_key):
+            return self.backend.lpop(list_key)
+
+    def rpop(self, list_key: str) -> Any | None:
+        """Remove and return the last element of a list."""
+        with self._writing(list_key):
+            return self.backend.rpop(list_key)
+
+    # === Set Operations ===
+
+    def sadd(self, set_key: str, *values: Any) -> int:
+        """Add one or more values to a set."""
+        with self._writing(set_key):
+            return self.backend.sadd(set_key, *values)
+
+    def smembers(self, set_key: str) -> set[Any]:
+        """Get all members of a set."""
+        return self.backend.smembers(set_key)
+
+    def sismember(self, set_key: str, value: Any) -> bool:
+        """Check if a value is a member of a set."""
+        return self.backend.sismember(set_key, value)
+
+    def srem(self, set_key: str, *values: Any) -> int:
+        """Remove one or more values from a set."""
+        with self._writing(set_key):
+            return self.backend.srem(set_key, *values)
+
+    def scard(self, set_key: str) -> int:
+        """Get the number of members in a set."""
+        return self.backend.scard(set_key)
+
+    # === TTL/Expiration Operations ===
+
+    def expire(self, key: str, seconds: int) -> bool:
+        """Set an expiration time on a key."""
+        with self._writing(key):
+            return self.backend.expire(key, seconds)
+
+    def ttl(self, key: str) -> int | None:
+        """Get the remaining time to live for a key."""
+        return self.backend.ttl(key)
+
+    def persist(self, key: str) -> bool:
+        """Remove expiration from a key."""
+        with self._writing(key):
+            return self.backend.persist(key)
+
+    # === Transactions ===
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Run the inner backend's transaction, keeping the cache coherent.
+
+        Reads inside the block are not cached. Keys written in it are
+        invalidated again once it ends, and a rolled back transaction
+        drops the whole cache.
+        """
+        if self._written_keys is not None:
+            with self.backend.transaction():
+                yield
+            return
+
+        written_keys: set[str] = set()
+        self._local.written_keys = written_keys
+        try:
+            with self.backend.transaction():
+                yield
+        except BaseException:
+            self._clear()
+            raise
+        finally:
+            self._local.written_keys = None
+            for key in written_keys:
+                self._invalidate(key)
+
+    # === Maintenance Operations ===
+
+    def cleanup_expired(self, limit: int | None = None) -> int:
+        """Remove expired keys.
+
+        Cached entries never outlive their key's TTL, so none of them
+        can refer to the rows removed here.
+        """
+        return self.backend.cleanup_expired(limit)
+
+    def clear_all(self) -> None:
+        """Clear all data (dangerous!)."""
+        try:
+            self.backend.clear_all()
+        finally:
+            self._clear()
+
+    def subscribe(
+        self, pattern: str, callback: ChangeCallback
+    ) -> Subscription:
+        """Subscribe to changes through the inner backend."""
+        return self.backend.subscribe(pattern, callback)
+
+    def data_version(self) -> int | None:
+        """Get the inner backend's data version."""
+        return self.backend.data_version()
+
+    def close(self) -> None:
+        """Drop the cache and close the inner backend."""
+        self._clear()
+        self.backend.close()
@@ -0,0 +1,255 @@
+"""Asyncio adapter running a blocking backend on a dedicated thread."""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import itertools
+from collections.abc import AsyncIterator, Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Any, TypeVar
+
+from dotfiles_state_manager.backends.async_base import AsyncStateBackend
+from dotfiles_state_manager.backends.base import StateBackend
+
+T = TypeVar("T")
+
+
+def _next_page(keys: Iterator[str], count: int) -> list[str]:
+    """Take up to count keys from a scan iterator."""
+    return list(itertools.islice(keys, count))
+
+
+class ExecutorBackend(AsyncStateBackend):
+    """Runs a blocking StateBackend on its own thread.
+
+    Every operation is handed to a single worker thread, so the event
+    loop never waits on disk I/O or SQLite locks, and the wrapped backend
+    only ever sees one thread (its per-thread transaction state keeps
+    working unchanged).
+
+    While a task has a transaction open, operations awaited by other
+    tasks wait until it ends instead of slipping into it.
+
+    Usage:
+        backend = ExecutorBackend(SQLiteBackend(db_path=path))
+        await backend.set("key", "value")
+    """
+
+    def __init__(self, backend: StateBackend) -> None:
+        """Initialize the adapter.
+
+        Args:
+            backend: Blocking backend to run (owned by the adapter and
+                closed with it)
+        """
+        self.backend = backend
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="state-backend"
+        )
+        self._lock = asyncio.Lock()  # Held for the length of a transaction
+        self._owner: asyncio.Task[Any] | None = None
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        """Run a function on the backend thread."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(func, *args)
+        )
+
+    async def _call(self, func: Callable[..., T], *args: Any) -> T:
+        """Run a backend operation, waiting for other tasks' transactions."""
+        if self._owner is not None and self._owner is asyncio.current_task():
+            return await self._run(func, *args)
+        async with self._lock:
+            return await self._run(func, *args)
+
+    # === Key-Value Operations ===
+
+    async def set(self, key: str, value: Any) -> None:
+        """Store a value for the given key."""
+        await self._call(self.backend.set, key, value)
+
+    async def get(self, key: str, default: Any = None) -> Any:
+        """Retrieve a value for the given key."""
+        return await self._call(self.backend.get, key, default)
+
+    async def delete(self, key: str) -> bool:
+        """Delete a key."""
+        return await self._call(self.backend.delete, key)
+
+    async def exists(self, key: str) -> bool:
+        """Check if a key exists."""
+        return await self._call(self.backend.exists, key)
+
+    async def keys(self, pattern: str | None = None) -> list[str]:
+        """List all keys, optionally matching a pattern."""
+        return await self._call(self.backend.keys, pattern)
+
+    async def scan(
+        self,
+        pattern: str | None = None,
+        type: str | None = None,
+        count: int = 100,
+    ) -> AsyncIterator[str]:
+        """Iterate over keys, fetching count keys per thread hop."""
+        keys = self.backend.scan(pattern, type, count)
+        while True:
+            page = await self._call(_next_page, keys, count)
+            for key in page:
+                yield key
+            if len(page) < count:
+                return
+
+    async def mset(self, mapping: dict[str, Any]) -> None:
+        """Store several key-value pairs in one operation."""
+        await self._call(self.backend.mset, mapping)
+
+    async def mget(self, keys: list[str], default: Any = None) -> list[Any]:
+        """Retrieve the values of several keys in one operation."""
+        return await self._call(self.backend.mget, keys, default)
+
+    # === Hash Operations ===
+
+    async def hset(self, hash_key: str, field: str, value: Any) -> None:
+        """Set a field in a hash."""
+        await self._call(self.backend.hset, hash_key, field, value)
+
+    async def hmset(self, hash_key: str, mapping: dict[str, Any]) -> None:
+        """Set several fields in a hash in one operation."""
+        await self._call(self.backend.hmset, hash_key, mapping)
+
+    async def hget(
+        self, hash_key: str, field: str, default: Any = None
+    ) -> Any:
+        """Get a field from a hash."""
+        return await self._call(self.backend.hget, hash_key, field, default)
+
+    async def hgetall(self, hash_key: str) -> dict[str, Any]:
+        """Get all fields from a hash."""
+        return await self._call(self.backend.hgetall, hash_key)
+
+    async def hdel(self, hash_key: str, field: str) -> bool:
+        """Delete a field from a hash."""
+        return await self._call(self.backend.hdel, hash_key, field)
+
+    async def hexists(self, hash_key: str, field: str) -> bool:
+        """Check if a field exists in a hash."""
+        return await self._call(self.backend.hexists, hash_key, field)
+
+    # === List Operations ===
+
+    async def lpush(
+        self, list_key: str, value: Any, max_length: int | None = None
+    ) -> None:
+        """Prepend a value to a list, optionally capping its length."""
+        await self._call(self.backend.lpush, list_key, value, max_length)
+
+    async def rpush(
+        self, list_key: str, value: Any, max_length: int | None = None
+    ) -> None:
+        """Append a value to a list, optionally capping its length."""
+        await self._call(self.backend.rpush, list_key, value, max_length)
+
+    async def lrange(
+        self, list_key: str, start: int = 0, end: int = -1
+    ) -> list[Any]:
+        """Get a range of elements from a list."""
+        return await self._call(self.backend.lrange, list_key, start, end)
+
+    async def llen(self, list_key: str) -> int:
+        """Get the length of a list."""
+        return await self._call(self.backend.llen, list_key)
+
+    async def ltrim(self, list_key: str, start: int, end: int) -> None:
+        """Trim a list to the elements between start and end."""
+        await self._call(self.backend.ltrim, list_key, start, end)
+
+    async def lpop(self, list_key: str) -> Any | None:
+        """Remove and return the first element of a list."""
+        return await self._call(self.backend.lpop, list_key)
+
+    async def rpop(self, list_key: str) -> Any | None:
+        """Remove and return the last element of a list."""
+        return await self._call(self.backend.rpop, list_key)
+
+    # === Set Operations ===
+
+    async def sadd(self, set_key: str, *values: Any) -> int:
+        """Add one or more values to a set."""
+        return await self._call(self.backend.sadd, set_key, *values)
+
+    async def smembers(self, set_key: str) -> set[Any]:
+        """Get all members of a set."""
+        return await self._call(self.backend.smembers, set_key)
+
+    async def sismember(self, set_key: str, value: Any) -> bool:
+        """Check if a value is a member of a set."""
+        return await self._call(self.backend.sismember, set_key, value)
+
+    async def srem(self, set_key: str, *values: Any) -> int:
+        """Remove one or more values from a set."""
+        return await self._call(self.backend.srem, set_key, *values)
+
+    async def scard(self, set_key: str) -> int:
+        """Get the number of members in a set."""
+        return await self._call(self.backend.scard, set_key)
+
+    # === TTL/Expiration Operations ===
+
+    async def expire(self, key: str, seconds: int) -> bool:
+        """Set an expiration time on a key."""
+        return await self._call(self.backend.expire, key, seconds)
+
+    async def ttl(self, key: str) -> int | None:
+        """Get the remaining time to live for a key."""
+        return await self._call(self.backend.ttl, key)
+
+    async def persist(self, key: str) -> bool:
+        """Remove expiration from a key."""
+        return await self._call(self.backend.persist, key)
+
+    # === Transactions ===
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[None]:
+        """Run the backend's transaction on the backend thread.
+
+        Other tasks' operations wait until the transaction ends.
+        """
+        task = asyncio.current_task()
+        if self._owner is not None and self._owner is task:
+            # Nested: the outermost transaction commits
+            yield
+            return
+
+        async with self._lock:
+            context = self.backend.transaction()
+            await self._run(context.__enter__)
+            self._owner = task
+            try:
+                yield
+            except BaseException as e:
+                self._owner = None
+                await self._run(
+                    context.__exit__, type(e), e, e.__traceback__
+                )
+                raise
+            self._owner = None
+            await self._run(context.__exit__, None, None, None)
+
+    # === Maintenance Operations ===
+
+    async def cleanup_expired(self, limit: int | None = None) -> int:
+        """Remove expired keys, at most limit rows if given."""
+        return await self._call(self.backend.cleanup_expired, limit)
+
+    async def clear_all(self) -> None:
+        """Clear all data (dangerous!)."""
+        await self._call(self.backend.clear_all)
+
+    async def close(self) -> None:
+        """Close the backend and stop its thread."""
+        await self._call(self.backend.close)
+        self._executor.shutdown(wait=False)
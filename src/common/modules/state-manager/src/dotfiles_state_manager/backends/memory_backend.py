@@ -0,0 +1,794 @@
+"""In-memory backend implementation for state management."""
+
+from __future__ import annotations
+
+import base64
+import json
+import logging
+import math
+import os
+import tempfile
+import threading
+import time
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from fnmatch import fnmatch
+from itertools import islice
+from pathlib import Path
+from typing import Any
+
+from dotfiles_state_manager.backends.base import KEY_TYPES, StateBackend
+from dotfiles_state_manager.codecs import Serializer
+from dotfiles_state_manager.notifications import (
+    ChangeCallback,
+    KeyChange,
+    SubscriberRegistry,
+    Subscription,
+)
+
+# Version of the snapshot file layout
+SNAPSHOT_VERSION = 1
+
+# Encoded value as kept in memory (str or bytes, see Serializer.encode)
+_Stored = str | bytes
+
+
+def _dump_stored(value: _Stored) -> Any:
+    """Convert an encoded value to JSON for a snapshot."""
+    if isinstance(value, bytes):
+        return {"b64": base64.b64encode(value).decode("ascii")}
+    return value
+
+
+def _load_stored(value: Any) -> _Stored:
+    """Convert a snapshot value back to its encoded form."""
+    if isinstance(value, dict):
+        return base64.b64decode(value["b64"])
+    return value
+
+
+class MemoryBackend(StateBackend):
+    """In-memory state backend.
+
+    Keeps every data structure in Python dicts, so there is no file to
+    open and no schema to create: a fast backend for tests, short-lived
+    processes and ephemeral caches. Values are held encoded by the
+    serializer, so callers can't mutate stored values through returned
+    ones and unhashable values can be set members, as with SQLite.
+
+    Key semantics follow SQLiteBackend: one name may hold several data
+    types at once, and the key-value operations (delete, exists, keys)
+    only concern string keys. Expired keys are hidden from reads and
+    removed when read or by cleanup_expired().
+
+    With a snapshot_path the data is loaded from that file when the
+    backend is created, and written back (atomically, only if changed)
+    by save(), every snapshot_interval seconds from a daemon thread,
+    and on close().
+
+    Usage:
+        backend = MemoryBackend()
+        backend.set("key", "value")
+
+        # Survives restarts
+        backend = MemoryBackend(
+            snapshot_path=Path("~/.cache/dotfiles/state.json"),
+            snapshot_interval=60,
+        )
+    """
+
+    def __init__(
+        self,
+        serializer: Serializer | None = None,
+        snapshot_path: Path | str | None = None,
+        snapshot_interval: float | None = None,
+    ) -> None:
+        """Initialize memory backend.
+
+        Args:
+            serializer: Value encoding (JSON text if None)
+            snapshot_path: File the data is loaded from and saved to
+                (None = data is lost when the process exits)
+            snapshot_interval: Seconds between background snapshots
+                (None = only save() and close() write the file)
+        """
+        self.serializer = serializer or Serializer()
+        self.snapshot_path = (
+            Path(snapshot_path).expanduser() if snapshot_path else None
+        )
+        self.snapshot_interval = snapshot_interval
+
+        self._logger = logging.getLogger(__name__)
+        self._lock = threading.RLock()
+        self._lock_depth = 0  # _locked() blocks entered by the holder
+
+        # Key type -> key -> data (see KEY_TYPES)
+        self._data: dict[str, dict[str, Any]] = {
+            key_type: {} for key_type in KEY_TYPES
+        }
+        # Key type -> key -> time.time() deadline
+        self._expires: dict[str, dict[str, float]] = {
+            key_type: {} for key_type in KEY_TYPES
+        }
+
+        # (type, key) -> state before the open transaction touched it
+        self._journal: dict[tuple[str, str], tuple[Any, float | None]] = {}
+        self._transaction_depth = 0
+
+        # Changes not yet delivered to subscribers
+        self._subscribers = SubscriberRegistry()
+        self._pending: list[KeyChange] = []
+
+        # Bumped by every write; compared to the last saved version
+        self._version = 0
+        self._saved_version = 0
+
+        if self.snapshot_path is not None and self.snapshot_path.exists():
+            self._load_snapshot(self.snapshot_path)
+
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        if self.snapshot_path is not None and snapshot_interval:
+            self._thread = threading.Thread(
+                target=self._run_snapshots,
+                name="state-memory-snapshot",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def _serialize(self, value: Any) -> _Stored:
+        """Encode a value for storage."""
+        return self.serializer.encode(value)
+
+    def _deserialize(self, value: _Stored) -> Any:
+        """Decode a stored value."""
+        return self.serializer.decode(value)
+
+    # === Storage Helpers ===
+
+    def _live(self, key_type: str, key: str) -> Any | None:
+        """Get the data of a key, dropping it if expired.
+
+        Must be called with the lock held.
+
+        Returns:
+            The stored data, or None if the key doesn't exist
+        """
+        data = self._data[key_type].get(key)
+        if data is None:
+            return None
+
+        expires_at = self._expires[key_type].get(key)
+        if expires_at is not None and expires_at <= time.time():
+            self._touch(key_type, key, "remove")
+            del self._data[key_type][key]
+            del self._expires[key_type][key]
+            return None
+
+        return data
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Hold the lock, then deliver the changes made while holding it.
+
+        Changes are delivered once the outermost block exits (outside
+        the lock), or when the open transaction commits.
+        """
+        with self._lock:
+            self._lock_depth += 1
+            try:
+                yield
+            finally:
+                self._lock_depth -= 1
+            if self._lock_depth or self._transaction_depth:
+                return
+            pending, self._pending = self._pending, []
+
+        if pending:
+            self._subscribers.dispatch(pending)
+
+    def _touch(self, key_type: str, key: str, event: str) -> None:
+        """Record that a key is about to change.
+
+        Must be called with the lock held, before the change. Inside a
+        transaction the key's previous state is journaled (once) so a
+        rollback can restore it.
+
+        Args:
+            key_type: Data type of the key
+            key: The key
+            event: Kind of change, as in KeyChange.event
+        """
+        self._version += 1
+        if self._subscribers:
+            self._pending.append(KeyChange(key, event))
+        if not self._transaction_depth:
+            return
+
+        slot = (key_type, key)
+        if slot in self._journal:
+            return
+
+        data = self._data[key_type].get(key)
+        if data is not None and key_type != "string":
+            data = data.copy()
+        self._journal[slot] = (data, self._expires[key_type].get(key))
+
+    def _drop(self, key_type: str, key: str) -> None:
+        """Remove a key of one type along with its expiry."""
+        self._data[key_type].pop(key, None)
+        self._expires[key_type].pop(key, None)
+
+    def _container(self, key_type: str, key: str, factory: type) -> Any:
+        """Get a hash, list or set for writing, creating it if missing.
+
+        Must be called with the lock held.
+        """
+        data = self._live(key_type, key)
+        self._touch(key_type, key, "write")
+        if data is None:
+            data = factory()
+            self._data[key_type][key] = data
+        return data
+
+    def _remove_if_empty(self, key_type: str, key: str) -> None:
+        """Remove a container left empty, as SQLite has no rows for it."""
+        if not self._data[key_type].get(key):
+            self._drop(key_type, key)
+
+    # === Key-Value Operations ===
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a value for the given key."""
+        serialized = self._serialize(value)
+        with self._locked():
+            self._touch("string", key, "write")
+            self._data["string"][key] = serialized
+            self._expires["string"].pop(key, None)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Retrieve a value for the given key."""
+        with self._locked():
+            value = self._live("string", key)
+        if value is None:
+            return default
+        return self._deserialize(value)
+
+    def mset(self, mapping: dict[str, Any]) -> None:
+        """Store several key-value pairs at once."""
+        rows = [
+            (key, self._serialize(value)) for key, value in mapping.items()
+        ]
+        with self._locked():
+            for key, serialized in rows:
+                self._touch("string", key, "write")
+                self._data["string"][key] = serialized
+                self._expires["string"].pop(key, None)
+
+    def mget(self, keys: list[str], default: Any = None) -> list[Any]:
+        """Retrieve the values of several keys at once."""
+        with self._locked():
+            found = [self._live("string", key) for key in keys]
+        return [
+            default if value is None else self._deserialize(value)
+            for value in found
+        ]
+
+    def delete(self, key: str) -> bool:
+        """Delete a key."""
+        with self._locked():
+            if self._live("string", key) is None:
+                return False
+            self._touch("string", key, "remove")
+            self._drop("string", key)
+            return True
+
+    def exists(self, key: str) -> bool:
+        """Check if a key exists."""
+        with self._locked():
+            return self._live("string", key) is not None
+
+    def keys(self, pattern: str | None = None) -> list[str]:
+        """List all keys, optionally matching a pattern."""
+        return list(self.scan(pattern, type="string"))
+
+    def scan(
+        self,
+        pattern: str | None = None,
+        type: str | None = None,
+        count: int = 100,  # noqa: ARG002
+    ) -> Iterator[str]:
+        """Iterate over keys of any data type, in key order.
+
+        The matching keys are collected when iteration starts, so the
+        data may be modified while iterating. count is accepted for
+        interface compatibility; there are no round-trips to batch.
+        """
+        if type is not None and type not in KEY_TYPES:
+            raise ValueError(f"Unsupported key type: {type}")
+
+        key_types = KEY_TYPES if type is None else (type,)
+        now = time.time()
+        matches: set[str] = set()
+
+        with self._locked():
+            for key_type in key_types:
+                expires = self._expires[key_type]
+                for key in self._data[key_type]:
+                    expires_at = expires.get(key)
+                    if expires_at is not None and expires_at <= now:
+                        continue
+                    if pattern is None or fnmatch(key, pattern):
+                        matches.add(key)
+
+        yield from sorted(matches)
+
+    # === Hash Operations ===
+
+    def hset(self, hash_key: str, field: str, value: Any) -> None:
+        """Set a field in a hash."""
+        serialized = self._serialize(value)
+        with self._locked():
+            self._container("hash", hash_key, dict)[field] = serialized
+
+    def hmset(self, hash_key: str, mapping: dict[str, Any]) -> None:
+        """Set several fields in a hash at once."""
+        fields = {
+            field: self._serialize(value) for field, value in mapping.items()
+        }
+        if not fields:
+            return
+        with self._locked():
+            self._container("hash", hash_key, dict).update(fields)
+
+    def hget(self, hash_key: str, field: str, default: Any = None) -> Any:
+        """Get a field from a hash."""
+        with self._locked():
+            fields = self._live("hash", hash_key)
+            value = None if fields is None else fields.get(field)
+        if value is None:
+            return default
+        return self._deserialize(value)
+
+    def hgetall(self, hash_key: str) -> dict[str, Any]:
+        """Get all fields from a hash."""
+        with self._locked():
+            fields = self._live("hash", hash_key)
+            items = [] if fields is None else list(fields.items())
+        return {field: self._deserialize(value) for field, value in items}
+
+    def hdel(self, hash_key: str, field: str) -> bool:
+        """Delete a field from a hash."""
+        with self._locked():
+            fields = self._live("hash", hash_key)
+            if fields is None or field not in fields:
+                return False
+            self._touch("hash", hash_key, "remove")
+            del fields[field]
+            self._remove_if_empty("hash", hash_key)
+            return True
+
+    def hexists(self, hash_key: str, field: str) -> bool:
+        """Check if a field exists in a hash."""
+        with self._locked():
+            fields = self._live("hash", hash_key)
+            return fields is not None and field in fields
+
+    # === List Operations ===
+
+    def lpush(
+        self, list_key: str, value: Any, max_length: int | None = None
+    ) -> None:
+        """Prepend a value to a list."""
+        serialized = self._serialize(value)
+        with self._locked():
+            items = self._container("list", list_key, deque)
+            items.appendleft(serialized)
+            if max_length is not None:
+                while len(items) > max(max_length, 0):
+                    items.pop()
+                self._remove_if_empty("list", list_key)
+
+    def rpush(
+        self, list_key: str, value: Any, max_length: int | None = None
+    ) -> None:
+        """Append a value to a list."""
+        serialized = self._serialize(value)
+        with self._locked():
+            items = self._container("list", list_key, deque)
+            items.append(serialized)
+            if max_length is not None:
+                while len(items) > max(max_length, 0):
+                    items.popleft()
+                self._remove_if_empty("list", list_key)
+
+    @staticmethod
+    def _resolve_range(
+        length: int, start: int, end: int
+    ) -> tuple[int, int] | None:
+        """Map a Redis-style inclusive index range onto list indices.
+
+        Returns:
+            (first, last) indices, or None if the range is empty
+        """
+        if start < 0:
+            start = length + start
+        if end < 0:
+            end = length + end
+
+        start = max(0, start)
+        end = min(length - 1, end)
+
+        if start > end:
+            return None
+        return start, end
+
+    def lrange(
+        self, list_key: str, start: int = 0, end: int = -1
+    ) -> list[Any]:
+        """Get a range of elements from a list."""
+        with self._locked():
+            items = self._live("list", list_key)
+            if items is None:
+                return []
+            indices = self._resolve_range(len(items), start, end)
+            if indices is None:
+                return []
+            first, last = indices
+            values = list(islice(items, first, last + 1))
+        return [self._deserialize(value) for value in values]
+
+    def llen(self, list_key: str) -> int:
+        """Get the length of a list."""
+        with self._locked():
+            items = self._live("list", list_key)
+            return 0 if items is None else len(items)
+
+    def ltrim(self, list_key: str, start: int, end: int) -> None:
+        """Trim a list to the elements between start and end."""
+        with self._locked():
+            items = self._live("list", list_key)
+            if items is None:
+                return
+            self._touch("list", list_key, "remove")
+
+            indices = self._resolve_range(len(items), start, end)
+            if indices is None:
+                self._drop("list", list_key)
+                return
+
+            first, last = indices
+            for _ in range(len(items) - last - 1):
+                items.pop()
+            for _ in range(first):
+                items.popleft()
+
+    def _pop(self, list_key: str, left: bool) -> Any | None:
+        """Remove and return the element at one end of a list."""
+        with self._locked():
+            items = self._live("list", list_key)
+            if items is None:
+                return None
+            self._touch("list", list_key, "remove")
+            value = items.popleft() if left else items.pop()
+            self._remove_if_empty("list", list_key)
+        return self._deserialize(value)
+
+    def lpop(self, list_key: str) -> Any | None:
+        """Remove and return the first element of a list."""
+        return self._pop(list_key, left=True)
+
+    def rpop(self, list_key: str) -> Any | None:
+        """Remove and return the last element of a list."""
+        return self._pop(list_key, left=False)
+
+    # === Set Operations ===
+
+    def sadd(self, set_key: str, *values: Any) -> int:
+        """Add one or more values to a set."""
+        serialized = {self._serialize(value) for value in values}
+        if not serialized:
+            return 0
+        with self._locked():
+            members = self._container("set", set_key, set)
+            before = len(members)
+            members.update(serialized)
+            return len(members) - before
+
+    def smembers(self, set_key: str) -> set[Any]:
+        """Get all members of a set."""
+        with self._locked():
+            members = self._live("set", set_key)
+            values = [] if members is None else list(members)
+        return {self._deserialize(value) for value in values}
+
+    def sismember(self, set_key: str, value: Any) -> bool:
+        """Check if a value is a member of a set."""
+        serialized = self._serialize(value)
+        with self._locked():
+            members = self._live("set", set_key)
+            return members is not None and serialized in members
+
+    def srem(self, set_key: str, *values: Any) -> int:
+        """Remove one or more values from a set."""
+        serialized = {self._serialize(value) for value in values}
+        with self._locked():
+            members = self._live("set", set_key)
+            if members is None:
+                return 0
+            self._touch("set", set_key, "remove")
+            before = len(members)
+            members.difference_update(serialized)
+            removed = before - len(members)
+            self._remove_if_empty("set", set_key)
+            return removed
+
+    def scard(self, set_key: str) -> int:
+        """Get the number of members in a set."""
+        with self._locked():
+            members = self._live("set", set_key)
+            return 0 if members is None else len(members)
+
+    # === TTL/Expiration Operations ===
+
+    def expire(self, key: str, seconds: int) -> bool:
+        """Set an expiration time on a key."""
+        expires_at = time.time() + seconds
+
+        # The first data structure holding the key gets the expiry
+        with self._locked():
+            for key_type in KEY_TYPES:
+                if self._live(key_type, key) is not None:
+                    self._touch(key_type, key, "expire")
+                    self._expires[key_type][key] = expires_at
+                    return True
+
+        return False
+
+    def ttl(self, key: str) -> int | None:
+        """Get the remaining time to live for a key."""
+        with self._locked():
+            for key_type in KEY_TYPES:
+                if self._live(key_type, key) is not None:
+                    expires_at = self._expires[key_type].get(key)
+                    if expires_at is None:
+                        return None
+                    return math.ceil(expires_at - time.time())
+
+        return -2  # Key doesn't exist
+
+    def persist(self, key: str) -> bool:
+        """Remove expiration from a key."""
+        updated = False
+
+        with self._locked():
+            for key_type in KEY_TYPES:
+                if (
+                    self._live(key_type, key) is not None
+                    and key in self._expires[key_type]
+                ):
+                    self._touch(key_type, key, "expire")
+                    del self._expires[key_type][key]
+                    updated = True
+
+        return updated
+
+    # === Transactions ===
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Apply the enclosed operations atomically.
+
+        The backend lock is held for the whole block, so other threads
+        wait until it ends. Keys are journaled the first time the block
+        changes them and restored from the journal if it raises.
+        """
+        with self._lock:
+            if self._transaction_depth:
+                # Nested: the outermost transaction commits
+                self._transaction_depth += 1
+                try:
+                    yield
+                finally:
+                    self._transaction_depth -= 1
+                return
+
+            self._transaction_depth = 1
+            try:
+                yield
+            except BaseException:
+                self._rollback()
+                self._pending.clear()
+                raise
+            finally:
+                self._transaction_depth = 0
+                self._journal.clear()
+            pending, self._pending = self._pending, []
+
+        if pending:
+            self._subscribers.dispatch(pending)
+
+    def _rollback(self) -> None:
+        """Restore the keys journaled by the open transaction."""
+        for (key_type, key), (data, expires_at) in self._journal.items():
+            self._drop(key_type, key)
+            if data is not None:
+                self._data[key_type][key] = data
+            if expires_at is not None:
+                self._expires[key_type][key] = expires_at
+        self._version += 1
+
+    # === Maintenance Operations ===
+
+    def cleanup_expired(self, limit: int | None = None) -> int:
+        """Remove expired keys.
+
+        Only keys with an expiry are examined, so the cost depends on
+        how many keys have a TTL rather than on the size of the store.
+        """
+        now = time.time()
+        removed = 0
+
+        with self._locked():
+            for key_type in KEY_TYPES:
+                expires = self._expires[key_type]
+                expired = [
+                    key
+                    for key, expires_at in expires.items()
+                    if expires_at <= now
+                ]
+                for key in expired:
+                    if limit is not None and removed >= limit:
+                        return removed
+                    self._touch(key_type, key, "remove")
+                    self._drop(key_type, key)
+                    removed += 1
+
+        return removed
+
+    def clear_all(self) -> None:
+        """Clear all data (dangerous!)."""
+        with self._locked():
+            for key_type in KEY_TYPES:
+                for key in list(self._data[key_type]):
+                    self._touch(key_type, key, "remove")
+                self._data[key_type].clear()
+                self._expires[key_type].clear()
+
+    # === Change Notifications ===
+
+    def subscribe(
+        self, pattern: str, callback: ChangeCallback
+    ) -> Subscription:
+        """Call back whenever a key matching a pattern changes.
+
+        Callbacks run synchronously in the thread that made the change,
+        after the operation (or its transaction) completes.
+        """
+        return self._subscribers.add(pattern, callback)
+
+    # === Snapshots ===
+
+    def save(self) -> bool:
+        """Write the data to the snapshot file if it changed.
+
+        The file is replaced atomically, so a crash while saving leaves
+        the previous snapshot intact. Expired keys are left out.
+
+        Returns:
+            True if a snapshot was written
+
+        Raises:
+            ValueError: If the backend has no snapshot_path
+        """
+        if self.snapshot_path is None:
+            raise ValueError("MemoryBackend has no snapshot_path")
+
+        with self._lock:
+            if self._version == self._saved_version:
+                return False
+            version = self._version
+            document = self._dump_snapshot()
+
+        self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(
+            dir=self.snapshot_path.parent,
+            prefix=f".{self.snapshot_path.name}.",
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(document, f, separators=(",", ":"))
+                f.flush()
+                os.fsync(f.fileno())
+            Path(tmp_name).replace(self.snapshot_path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+        with self._lock:
+            self._saved_version = max(self._saved_version, version)
+        return True
+
+    def _dump_snapshot(self) -> dict[str, Any]:
+        """Build the snapshot document. Must be called with the lock held."""
+        now = time.time()
+        keys: dict[str, dict[str, Any]] = {}
+
+        for key_type in KEY_TYPES:
+            expires = self._expires[key_type]
+            entries = {}
+            for key, data in self._data[key_type].items():
+                expires_at = expires.get(key)
+                if expires_at is not None and expires_at <= now:
+                    continue
+
+                if key_type == "hash":
+                    dumped: Any = {
+                        field: _dump_stored(value)
+                        for field, value in data.items()
+                    }
+                elif key_type in ("list", "set"):
+                    dumped = [_dump_stored(value) for value in data]
+                else:
+                    dumped = _dump_stored(data)
+                entries[key] = {"value": dumped, "expires_at": expires_at}
+            keys[key_type] = entries
+
+        return {"version": SNAPSHOT_VERSION, "saved_at": now, "keys": keys}
+
+    def _load_snapshot(self, path: Path) -> None:
+        """Load the data of a snapshot file, replacing the current data."""
+        with path.open(encoding="utf-8") as f:
+            document = json.load(f)
+
+        if document.get("version") != SNAPSHOT_VERSION:
+            raise ValueError(
+                f"Unsupported snapshot version in {path}: "
+                f"{document.get('version')}"
+            )
+
+        factories = {"hash": dict, "list": deque, "set": set}
+        with self._lock:
+            for key_type in KEY_TYPES:
+                data = self._data[key_type]
+                expires = self._expires[key_type]
+                data.clear()
+                expires.clear()
+
+                for key, entry in document["keys"].get(key_type, {}).items():
+                    value = entry["value"]
+                    if key_type == "hash":
+                        data[key] = {
+                            field: _load_stored(stored)
+                            for field, stored in value.items()
+                        }
+                    elif key_type in factories:
+                        data[key] = factories[key_type](
+                            _load_stored(stored) for stored in value
+                        )
+                    else:
+                        data[key] = _load_stored(value)
+                    if entry.get("expires_at") is not None:
+                        expires[key] = entry["expires_at"]
+
+            self._version = self._saved_version = 0
+
+    def _run_snapshots(self) -> None:
+        """Save a snapshot every snapshot_interval until closed."""
+        assert self.snapshot_interval is not None
+        while not self._stop_event.wait(self.snapshot_interval):
+            try:
+                self.save()
+            except Exception as e:
+                self._logger.warning(f"State snapshot failed: {e}")
+
+    def close(self) -> None:
+        """Stop background snapshots and write a final one."""
+        self._subscribers.clear()
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self.snapshot_path is not None:
+            self.save()
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
-import json
+import logging
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
 from fnmatch import fnmatch
 from typing import Any
 
@@ -15,7 +18,43 @@ except ImportError:
     REDIS_AVAILABLE = False
     Redis = None  # type: ignore
 
-from dotfiles_state_manager.backends.base import StateBackend
+from dotfiles_state_manager.backends.base import KEY_TYPES, StateBackend
+from dotfiles_state_manager.codecs import Serializer
+from dotfiles_state_manager.notifications import (
+    ChangeCallback,
+    KeyChange,
+    SubscriberRegistry,
+    Subscription,
+)
+
+# Keyspace notification classes needed by subscribe(): K (keyspace
+# channel), g (generic: del, expire, persist), $ l s h (per type) and
+# x (expired). "A" is an alias for all of them but K.
+KEYSPACE_EVENT_FLAGS = "Kg$lshx"
+
+# Keyspace events -> KeyChange.event (anything else is a write)
+KEYSPACE_EVENTS = {
+    "del": "remove",
+    "hdel": "remove",
+    "lpop": "remove",
+    "rpop": "remove",
+    "lrem": "remove",
+    "ltrim": "remove",
+    "srem": "remove",
+    "spop": "remove",
+    "expired": "remove",
+    "evicted": "remove",
+    "rename_from": "remove",
+    "expire": "expire",
+    "persist": "expire",
+}
+
+
+def _escape_glob(text: str) -> str:
+    """Escape Redis glob metacharacters in literal text."""
+    return "".join(
+        f"\\{char}" if char in "*?[]\\" else char for char in text
+    )
 
 
 class RedisBackend(StateBackend):
@@ -38,6 +77,7 @@ class RedisBackend(StateBackend):
         max_connections: int = 10,
         socket_timeout: int = 5,
         socket_connect_timeout: int = 5,
+        serializer: Serializer | None = None,
     ) -> None:
         """Initialize Redis backend.
 
@@ -50,6 +90,7 @@ class RedisBackend(StateBackend):
             max_connections: Maximum connections in pool
             socket_timeout: Socket timeout in seconds
             socket_connect_timeout: Socket connect timeout in seconds
+            serializer: Value encoding (JSON text if None)
 
         Raises:
             ImportError: If redis package is not installed
@@ -62,17 +103,35 @@ class RedisBackend(StateBackend):
             )
 
         self.key_prefix = key_prefix
+        self.db = db
+        self.serializer = serializer or Serializer()
+        self._logger = logging.getLogger(__name__)
+        self._subscribers = SubscriberRegistry(
+            on_empty=self._stop_listener
+        )
+        self._listener: Any = None  # redis PubSubWorkerThread
+        self._listener_lock = threading.Lock()
+        self._local = threading.local()  # Per-thread transaction pipeline
+        connection_options = {
+            "host": host,
+            "port": port,
+            "db": db,
+            "password": password if password else None,
+            "max_connections": max_connections,
+            "socket_timeout": socket_timeout,
+            "socket_connect_timeout": socket_connect_timeout,
+        }
         self.client: Redis = redis.Redis(  # type: ignore
-            host=host,
-            port=port,
-            db=db,
-            password=password if password else None,
-            max_connections=max_connections,
-            socket_timeout=socket_timeout,
-            socket_connect_timeout=socket_connect_timeout,
-            decode_responses=True,
+            **connection_options, decode_responses=True
         )
 
+        # Binary values must be read without decoding them as UTF-8
+        self._value_client: Redis = self.client
+        if self.serializer.binary:
+            self._value_client = redis.Redis(  # type: ignore
+                **connection_options, decode_responses=False
+            )
+
         # Test connection
         try:
             self.client.ping()
@@ -85,13 +144,27 @@ class RedisBackend(StateBackend):
         """Add prefix to key."""
         return f"{self.key_prefix}{key}"
 
-    def _serialize(self, value: Any) -> str:
-        """Serialize a value to JSON string."""
-        return json.dumps(value)
+    @property
+    def _writer(self) -> Any:
+        """Client for write commands (the open pipeline in a transaction)."""
+        pipeline = getattr(self._local, "pipeline", None)
+        return self.client if pipeline is None else pipeline
 
-    def _deserialize(self, value: str) -> Any:
-        """Deserialize a JSON string to value."""
-        return json.loads(value)
+    def _serialize(self, value: Any) -> str | bytes:
+        """Encode a value for storage."""
+        return self.serializer.encode(value)
+
+    def _deserialize(self, value: str | bytes) -> Any:
+        """Decode a stored value."""
+        return self.serializer.decode(value)
+
+    @staticmethod
+    def _remaining(result: int) -> int | None:
+        """Convert a Redis TTL reply to a TTL as ttl() reports it."""
+        if result == -1:
+            # Key exists but has no expiration
+            return None
+        return result
 
     # === Key-Value Operations ===
 
@@ -99,18 +172,74 @@ class RedisBackend(StateBackend):
         """Store a value for the given key."""
         prefixed_key = self._make_key(key)
         serialized = self._serialize(value)
-        self.client.set(prefixed_key, serialized)
+        self._writer.set(prefixed_key, serialized)
 
     def get(self, key: str, default: Any = None) -> Any:
         """Retrieve a value for the given key."""
         prefixed_key = self._make_key(key)
-        value = self.client.get(prefixed_key)
+        value = self._value_client.get(prefixed_key)
 
         if value is None:
             return default
 
         return self._deserialize(value)
 
+    def get_with_ttl(
+        self, key: str, default: Any = None
+    ) -> tuple[Any, int | None]:
+        """Retrieve a value and its TTL in a single round trip."""
+        prefixed_key = self._make_key(key)
+        pipeline = self._value_client.pipeline(transaction=False)
+        pipeline.get(prefixed_key)
+        pipeline.ttl(prefixed_key)
+        value, result = pipeline.execute()
+
+        if value is None:
+            return default, -2
+
+        return self._deserialize(value), self._remaining(result)
+
+    def mset(self, mapping: dict[str, Any]) -> None:
+        """Store several key-value pairs with a single MSET."""
+        if not mapping:
+            return
+        self._writer.mset(
+            {
+                self._make_key(key): self._serialize(value)
+                for key, value in mapping.items()
+            }
+        )
+
+    def mget(self, keys: list[str], default: Any = None) -> list[Any]:
+        """Retrieve the values of several keys with a single MGET."""
+        if not keys:
+            return []
+        values = self._value_client.mget([self._make_key(key) for key in keys])
+        return [
+            default if value is None else self._deserialize(value)
+            for value in values
+        ]
+
+    def mget_with_ttl(
+        self, keys: list[str], default: Any = None
+    ) -> list[tuple[Any, int | None]]:
+        """Retrieve several values and their TTLs in a single round trip."""
+        if not keys:
+            return []
+        prefixed_keys = [self._make_key(key) for key in keys]
+        pipeline = self._value_client.pipeline(transaction=False)
+        pipeline.mget(prefixed_keys)
+        for prefixed_key in prefixed_keys:
+            pipeline.ttl(prefixed_key)
+        values, *results = pipeline.execute()
+
+        return [
+            (default, -2)
+            if value is None
+            else (self._deserialize(value), self._remaining(result))
+            for value, result in zip(values, results, strict=True)
+        ]
+
     def delete(self, key: str) -> bool:
         """Delete a key."""
         prefixed_key = self._make_key(key)
@@ -123,24 +252,33 @@ class RedisBackend(StateBackend):
         return bool(self.client.exists(prefixed_key))
 
     def keys(self, pattern: str | None = None) -> list[str]:
-        """List all keys, optionally matching a pattern."""
-        if pattern is None:
-            search_pattern = f"{self.key_prefix}*"
-        else:
-            search_pattern = f"{self.key_prefix}{pattern}"
+        """List all keys, optionally matching a pattern.
 
-        # Get all matching keys
-        raw_keys = self.client.keys(search_pattern)
+        Uses incremental SCAN rather than the blocking KEYS command.
+        """
+        # SCAN may report a key more than once
+        return list(dict.fromkeys(self.scan(pattern)))
 
-        # Remove prefix from keys
+    def scan(
+        self,
+        pattern: str | None = None,
+        type: str | None = None,
+        count: int = 100,
+    ) -> Iterator[str]:
+        """Iterate over keys with SCAN (keys may repeat)."""
+        if type is not None and type not in KEY_TYPES:
+            raise ValueError(f"Unsupported key type: {type}")
+
+        search_pattern = f"{self.key_prefix}{pattern or '*'}"
         prefix_len = len(self.key_prefix)
-        keys_list = [k[prefix_len:] for k in raw_keys]
 
-        # If pattern was provided, filter with fnmatch
-        if pattern is not None:
-            keys_list = [k for k in keys_list if fnmatch(k, pattern)]
-
-        return keys_list
+        for raw_key in self.client.scan_iter(
+            match=search_pattern, count=count, _type=type
+        ):
+            key = raw_key[prefix_len:]
+            # Filter with fnmatch for consistent glob semantics
+            if pattern is None or fnmatch(key, pattern):
+                yield key
 
     # === Hash Operations ===
 
@@ -148,25 +286,69 @@ class RedisBackend(StateBackend):
         """Set a field in a hash."""
         prefixed_key = self._make_key(hash_key)
         serialized = self._serialize(value)
-        self.client.hset(prefixed_key, field, serialized)
+        self._writer.hset(prefixed_key, field, serialized)
+
+    def hmset(self, hash_key: str, mapping: dict[str, Any]) -> None:
+        """Set several fields in a hash with a single HSET."""
+        if not mapping:
+            return
+        prefixed_key = self._make_key(hash_key)
+        self._writer.hset(
+            prefixed_key,
+            mapping={
+                field: self._serialize(value)
+                for field, value in mapping.items()
+            },
+        )
 
     def hget(self, hash_key: str, field: str, default: Any = None) -> Any:
         """Get a field from a hash."""
         prefixed_key = self._make_key(hash_key)
-        value = self.client.hget(prefixed_key, field)
+        value = self._value_client.hget(prefixed_key, field)
 
         if value is None:
             return default
 
         return self._deserialize(value)
 
+    def hget_with_ttl(
+        self, hash_key: str, field: str, default: Any = None
+    ) -> tuple[Any, int | None]:
+        """Get a field and the hash's TTL in a single round trip."""
+        prefixed_key = self._make_key(hash_key)
+        pipeline = self._value_client.pipeline(transaction=False)
+        pipeline.hget(prefixed_key, field)
+        pipeline.ttl(prefixed_key)
+        value, result = pipeline.execute()
+
+        if value is None:
+            return default, -2
+
+        return self._deserialize(value), self._remaining(result)
+
     def hgetall(self, hash_key: str) -> dict[str, Any]:
         """Get all fields from a hash."""
         prefixed_key = self._make_key(hash_key)
-        raw_hash = self.client.hgetall(prefixed_key)
+        return self._decode_hash(self._value_client.hgetall(prefixed_key))
 
+    def hgetall_with_ttl(
+        self, hash_key: str
+    ) -> tuple[dict[str, Any], int | None]:
+        """Get all fields and the hash's TTL in a single round trip."""
+        prefixed_key = self._make_key(hash_key)
+        pipeline = self._value_client.pipeline(transaction=False)
+        pipeline.hgetall(prefixed_key)
+        pipeline.ttl(prefixed_key)
+        raw_hash, result = pipeline.execute()
+
+        return self._decode_hash(raw_hash), self._remaining(result)
+
+    def _decode_hash(self, raw_hash: dict[Any, Any]) -> dict[str, Any]:
+        """Decode the fields and values of an HGETALL reply."""
         return {
-            field: self._deserialize(value)
+            (
+                field.decode() if isinstance(field, bytes) else field
+            ): self._deserialize(value)
             for field, value in raw_hash.items()
         }
 
@@ -183,24 +365,40 @@ class RedisBackend(StateBackend):
 
     # === List Operations ===
 
-    def lpush(self, list_key: str, value: Any) -> None:
+    def lpush(
+        self, list_key: str, value: Any, max_length: int | None = None
+    ) -> None:
         """Prepend a value to a list."""
         prefixed_key = self._make_key(list_key)
         serialized = self._serialize(value)
-        self.client.lpush(prefixed_key, serialized)
+        if max_length is None:
+            self._writer.lpush(prefixed_key, serialized)
+            return
 
-    def rpush(self, list_key: str, value: Any) -> None:
+        with self.transaction():
+            self._writer.lpush(prefixed_key, serialized)
+            self._writer.ltrim(prefixed_key, 0, max_length - 1)
+
+    def rpush(
+        self, list_key: str, value: Any, max_length: int | None = None
+    ) -> None:
         """Append a value to a list."""
         prefixed_key = self._make_key(list_key)
         serialized = self._serialize(value)
-        self.client.rpush(prefixed_key, serialized)
+        if max_length is None:
+            self._writer.rpush(prefixed_key, serialized)
+            return
+
+        with self.transaction():
+            self._writer.rpush(prefixed_key, serialized)
+            self._writer.ltrim(prefixed_key, -max_length, -1)
 
     def lrange(
         self, list_key: str, start: int = 0, end: int = -1
     ) -> list[Any]:
         """Get a range of elements from a list."""
         prefixed_key = self._make_key(list_key)
-        values = self.client.lrange(prefixed_key, start, end)
+        values = self._value_client.lrange(prefixed_key, start, end)
         return [self._deserialize(v) for v in values]
 
     def llen(self, list_key: str) -> int:
@@ -208,10 +406,15 @@ class RedisBackend(StateBackend):
         prefixed_key = self._make_key(list_key)
         return int(self.client.llen(prefixed_key))
 
+    def ltrim(self, list_key: str, start: int, end: int) -> None:
+        """Trim a list to the elements between start and end."""
+        prefixed_key = self._make_key(list_key)
+        self._writer.ltrim(prefixed_key, start, end)
+
     def lpop(self, list_key: str) -> Any | None:
         """Remove and return the first element of a list."""
         prefixed_key = self._make_key(list_key)
-        value = self.client.lpop(prefixed_key)
+        value = self._value_client.lpop(prefixed_key)
 
         if value is None:
             return None
@@ -221,7 +424,7 @@ class RedisBackend(StateBackend):
     def rpop(self, list_key: str) -> Any | None:
         """Remove and return the last element of a list."""
         prefixed_key = self._make_key(list_key)
-        value = self.client.rpop(prefixed_key)
+        value = self._value_client.rpop(prefixed_key)
 
         if value is None:
             return None
@@ -240,7 +443,7 @@ class RedisBackend(StateBackend):
     def smembers(self, set_key: str) -> set[Any]:  # type: ignore
         """Get all members of a set."""
         prefixed_key = self._make_key(set_key)
-        raw_members = self.client.smembers(prefixed_key)
+        raw_members = self._value_client.smembers(prefixed_key)
         return {self._deserialize(m) for m in raw_members}
 
     def sismember(self, set_key: str, value: Any) -> bool:
@@ -272,17 +475,7 @@ class RedisBackend(StateBackend):
     def ttl(self, key: str) -> int | None:
         """Get the remaining time to live for a key."""
         prefixed_key = self._make_key(key)
-        result = self.client.ttl(prefixed_key)
-
-        if result == -1:
-            # Key exists but has no expiration
-            return None
-        elif result == -2:
-            # Key doesn't exist
-            return -2
-        else:
-            # Return remaining seconds
-            return result
+        return self._remaining(self.client.ttl(prefixed_key))
 
     def persist(self, key: str) -> bool:
         """Remove expiration from a key."""
@@ -290,13 +483,124 @@ class RedisBackend(StateBackend):
         result = self.client.persist(prefixed_key)
         return bool(result)
 
+    # === Transactions ===
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Queue the enclosed writes in a MULTI/EXEC pipeline.
+
+        set, mset, hset, hmset, lpush, rpush and ltrim issued by the
+        current thread are buffered and sent in one round-trip on exit.
+        Commands that return a result (reads, deletes, pops, ...) still
+        run immediately against the server.
+        """
+        if getattr(self._local, "pipeline", None) is not None:
+            # Nested: the outermost transaction executes
+            yield
+            return
+
+        pipeline = self.client.pipeline(transaction=True)
+        self._local.pipeline = pipeline
+        try:
+            yield
+        except BaseException:
+            pipeline.reset()
+            raise
+        else:
+            pipeline.execute()
+        finally:
+            self._local.pipeline = None
+
+    # === Change Notifications ===
+
+    def subscribe(
+        self, pattern: str, callback: ChangeCallback
+    ) -> Subscription:
+        """Call back whenever a key matching a pattern changes.
+
+        Listens to the server's keyspace notifications, so writes by
+        every client and expirations are reported. The required
+        notify-keyspace-events classes are enabled on the server if
+        missing. Callbacks run on the pub/sub listener thread.
+        """
+        with self._listener_lock:
+            if self._listener is None:
+                self._enable_keyspace_events()
+                pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+                channel = f"__keyspace@{self.db}__:"
+                pubsub.psubscribe(
+                    **{
+                        f"{channel}{_escape_glob(self.key_prefix)}*": (
+                            self._on_keyspace_event
+                        )
+                    }
+                )
+                self._listener = pubsub.run_in_thread(
+                    sleep_time=1.0, daemon=True
+                )
+
+            return self._subscribers.add(pattern, callback)
+
+    def _enable_keyspace_events(self) -> None:
+        """Enable the keyspace notifications subscribe() relies on."""
+        try:
+            current = self.client.config_get("notify-keyspace-events").get(
+                "notify-keyspace-events", ""
+            )
+            if "A" in current:
+                current = current.replace("A", "g$lshzxetd")
+            missing = "".join(
+                flag for flag in KEYSPACE_EVENT_FLAGS if flag not in current
+            )
+            if missing:
+                self.client.config_set(
+                    "notify-keyspace-events", current + missing
+                )
+        except redis.ResponseError as e:
+            # CONFIG may be disabled, e.g. on managed servers
+            self._logger.warning(
+                "Cannot enable Redis keyspace notifications "
+                f"(set notify-keyspace-events {KEYSPACE_EVENT_FLAGS}): {e}"
+            )
+
+    def _on_keyspace_event(self, message: dict[str, Any]) -> None:
+        """Turn a keyspace notification into a KeyChange."""
+        channel = message["channel"]
+        if isinstance(channel, bytes):
+            channel = channel.decode()
+        event = message["data"]
+        if isinstance(event, bytes):
+            event = event.decode()
+
+        prefixed_key = channel.split(":", 1)[1]
+        key = prefixed_key[len(self.key_prefix) :]
+        self._subscribers.dispatch(
+            [KeyChange(key, KEYSPACE_EVENTS.get(event, "write"))]
+        )
+
+    def _stop_listener(self) -> None:
+        """Stop the pub/sub listener once nothing is subscribed."""
+        with self._listener_lock:
+            if self._subscribers or self._listener is None:
+                return
+            listener, self._listener = self._listener, None
+
+        # The thread exits (and closes its pubsub connection) within
+        # sleep_time; no need to wait for it
+        listener.stop()
+
     # === Maintenance Operations ===
 
-    def cleanup_expired(self) -> int:
-        """Remove all expired keys.
+    def cleanup_expired(
+        self,
+        limit: int | None = None,  # noqa: ARG002
+    ) -> int:
+        """Remove expired keys.
 
         Note: Redis automatically removes expired keys, so this is a no-op.
         Returns 0 as we can't determine how many keys were expired.
+        ``limit`` is accepted for interface compatibility only: there is
+        no backlog to bound, since Redis expires keys itself.
         """
         return 0
 
@@ -304,11 +608,15 @@ class RedisBackend(StateBackend):
         """Clear all data (dangerous!)."""
         # Only delete keys with our prefix
         pattern = f"{self.key_prefix}*"
-        keys_to_delete = self.client.keys(pattern)
+        keys_to_delete = list(self.client.scan_iter(match=pattern))
 
         if keys_to_delete:
             self.client.delete(*keys_to_delete)
 
     def close(self) -> None:
         """Close the backend connection and cleanup resources."""
+        self._subscribers.clear()
+        self._stop_listener()
         self.client.close()
+        if self._value_client is not self.client:
+            self._value_client.close()
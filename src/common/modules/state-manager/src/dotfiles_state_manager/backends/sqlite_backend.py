@@ -2,15 +2,103 @@
 
 from __future__ import annotations
 
-import json
+import logging
+import os
 import sqlite3
 import threading
 import time
+import weakref
+from collections.abc import Iterator
+from contextlib import contextmanager
 from fnmatch import fnmatch
 from pathlib import Path
 from typing import Any
 
-from dotfiles_state_manager.backends.base import StateBackend
+from dotfiles_state_manager.backends.base import KEY_TYPES, StateBackend
+from dotfiles_state_manager.codecs import Serializer
+from dotfiles_state_manager.notifications import (
+    ChangeCallback,
+    KeyChange,
+    SubscriberRegistry,
+    Subscription,
+)
+
+# Key type -> (table, key column)
+TYPE_TABLES = {
+    "string": ("kv_store", "key"),
+    "hash": ("hash_store", "hash_key"),
+    "list": ("list_store", "list_key"),
+    "set": ("set_store", "set_key"),
+}
+
+# Keys per statement for batched lookups (SQLite's default limit on
+# host parameters in older versions is 999)
+MAX_BATCH_VARIABLES = 900
+
+# Entries kept in the change log; a subscriber that falls further behind
+# misses the oldest changes
+CHANGE_LOG_SIZE = 10_000
+
+# Name suffixes of the triggers filling the change log
+CHANGE_TRIGGERS = ("notify_insert", "notify_update", "notify_delete")
+
+
+def _process_alive(pid: int) -> bool:
+    """Check whether a process with the given ID is running."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class _ReaderHolder:
+    """Thread-local owner of a reader connection.
+
+    Dropped with the thread's locals when the thread exits, which
+    closes the connection (see SQLiteBackend._reader).
+    """
+
+    __slots__ = ("conn", "__weakref__")
+
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self.conn = conn
+
+
+def _release_reader(
+    conn: sqlite3.Connection,
+    readers: list[sqlite3.Connection],
+    readers_lock: threading.Lock,
+) -> None:
+    """Close a reader connection and forget it."""
+    with readers_lock:
+        if conn in readers:
+            readers.remove(conn)
+    conn.close()
+
+
+def _glob_prefix(pattern: str) -> str:
+    """Get the literal prefix of a glob pattern."""
+    for index, char in enumerate(pattern):
+        if char in "*?[":
+            return pattern[:index]
+    return pattern
+
+
+def _prefix_upper_bound(prefix: str) -> str | None:
+    """Get the smallest string greater than every string with prefix.
+
+    Returns:
+        Exclusive upper bound, or None if there is none (empty prefix)
+    """
+    while prefix:
+        last = ord(prefix[-1])
+        if last < 0x10FFFF:
+            return prefix[:-1] + chr(last + 1)
+        prefix = prefix[:-1]
+    return None
 
 
 class SQLiteBackend(StateBackend):
@@ -20,27 +108,146 @@ class SQLiteBackend(StateBackend):
     Uses separate tables for different data structures (key-value, hash, list, set).
     """
 
-    def __init__(self, db_path: Path | str, wal_mode: bool = True) -> None:
+    def __init__(
+        self,
+        db_path: Path | str,
+        wal_mode: bool = True,
+        serializer: Serializer | None = None,
+        connection_pool: bool = False,
+        busy_timeout: float = 5.0,
+        cache_size_kib: int = 8192,
+        mmap_size: int = 64 * 1024 * 1024,
+        notify_interval: float = 0.1,
+    ) -> None:
         """Initialize SQLite backend.
 
         Args:
             db_path: Path to SQLite database file
             wal_mode: Enable WAL mode for better concurrency
+            serializer: Value encoding (JSON text if None). Binary
+                encodings are stored as BLOBs.
+            connection_pool: Give every thread its own read-only
+                connection, so reads run concurrently (with WAL, even
+                alongside a write). Writes always go through one
+                connection, one at a time.
+            busy_timeout: Seconds to wait for a lock held by another
+                connection before failing
+            cache_size_kib: Page cache size per connection in KiB
+            mmap_size: Bytes of the database file to memory-map
+            notify_interval: Seconds between checks for changes while
+                there are subscriptions (see subscribe())
         """
         self.db_path = Path(db_path).expanduser()
+        self.serializer = serializer or Serializer()
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self._lock = threading.RLock()  # Reentrant lock for thread safety
+        self.wal_mode = wal_mode
+        self.connection_pool = connection_pool
+        self.busy_timeout = busy_timeout
+        self.cache_size_kib = cache_size_kib
+        self.mmap_size = mmap_size
+        self.notify_interval = notify_interval
+
+        self._lock = threading.RLock()  # Serializes use of self.conn
+        self._transaction_depth = 0
+        self._data_version: int | None = None
+        self._local = threading.local()  # Per-thread reader, txn flag
+        self._readers: list[sqlite3.Connection] = []
+        self._readers_lock = threading.Lock()
+
+        self._logger = logging.getLogger(__name__)
+        self._subscribers = SubscriberRegistry(
+            on_empty=self._stop_change_poller
+        )
+        self._poller: threading.Thread | None = None
+        self._poller_stop = threading.Event()
+        self._poller_lock = threading.Lock()
+        self._listener_id: int | None = None  # Row in change_listeners
 
-        self.conn = sqlite3.connect(
+        # Writer connection (and the only connection without a pool)
+        self.conn = self._connect()
+        if wal_mode:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+        self._configure(self.conn)
+
+        self._init_schema()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection to the database."""
+        return sqlite3.connect(
             str(self.db_path),
             check_same_thread=False,
             isolation_level=None,  # Autocommit mode
+            timeout=self.busy_timeout,
         )
 
-        if wal_mode:
-            self.conn.execute("PRAGMA journal_mode=WAL")
+    def _configure(self, conn: sqlite3.Connection) -> None:
+        """Apply per-connection performance pragmas."""
+        conn.execute(f"PRAGMA busy_timeout = {int(self.busy_timeout * 1000)}")
+        conn.execute(f"PRAGMA cache_size = {-self.cache_size_kib}")
+        conn.execute(f"PRAGMA mmap_size = {self.mmap_size}")
+        if self.wal_mode:
+            # Durable across application crashes; only a power loss can
+            # roll back the latest commits, and never corrupts the file
+            conn.execute("PRAGMA synchronous = NORMAL")
+
+    def _reader(self) -> sqlite3.Connection:
+        """Get the read-only connection of the current thread.
+
+        The connection is closed when the thread exits, so short-lived
+        threads don't leave connections behind.
+        """
+        holder = getattr(self._local, "reader", None)
+        if holder is None:
+            conn = self._connect()
+            self._configure(conn)
+            conn.execute("PRAGMA query_only = ON")
+            holder = _ReaderHolder(conn)
+            # Must not reference self, or the backend would be kept
+            # alive until every thread that read from it has exited
+            weakref.finalize(
+                holder,
+                _release_reader,
+                conn,
+                self._readers,
+                self._readers_lock,
+            )
+            self._local.reader = holder
+            with self._readers_lock:
+                self._readers.append(conn)
+        return holder.conn
+
+    @contextmanager
+    def _reading(self) -> Iterator[sqlite3.Connection]:
+        """Get a connection for reads.
+
+        With a connection pool this is the thread's own reader, used
+        without locking, unless the thread is inside a transaction: its
+        reads must then see its uncommitted writes.
+        """
+        if self.connection_pool and not getattr(
+            self._local, "in_transaction", False
+        ):
+            yield self._reader()
+        else:
+            with self._lock:
+                yield self.conn
+
+    @contextmanager
+    def _writing(self) -> Iterator[sqlite3.Connection]:
+        """Get the writer connection, holding the write lock."""
+        with self._lock:
+            yield self.conn
 
-        self._init_schema()
+    def _purge_expired(self, table: str, where: str, params: tuple) -> None:
+        """Delete rows found expired by a read.
+
+        Re-checks the expiry so a value written since the read survives.
+        """
+        with self._writing() as conn:
+            conn.execute(
+                f"DELETE FROM {table} WHERE {where} AND expires_at <= ?",
+                (*params, self._current_timestamp()),
+            )
 
     def _init_schema(self) -> None:
         """Initialize database schema."""
@@ -99,13 +306,66 @@ class SQLiteBackend(StateBackend):
             "CREATE INDEX IF NOT EXISTS idx_set_expires ON set_store(expires_at)"
         )
 
-    def _serialize(self, value: Any) -> str:
-        """Serialize a value to JSON string."""
-        return json.dumps(value)
+        self._init_key_registry()
 
-    def _deserialize(self, value: str) -> Any:
-        """Deserialize a JSON string to value."""
-        return json.loads(value)
+    def _init_key_registry(self) -> None:
+        """Create the key registry and the triggers maintaining it.
+
+        key_registry holds one row per (key, type) of every data
+        structure, so keys of all types can be scanned in key order
+        through a single index.
+        """
+        created = (
+            self.conn.execute(
+                """SELECT 1 FROM sqlite_master
+                   WHERE type = 'table' AND name = 'key_registry'"""
+            ).fetchone()
+            is None
+        )
+
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS key_registry (
+                key TEXT NOT NULL,
+                type TEXT NOT NULL,
+                PRIMARY KEY (key, type)
+            ) WITHOUT ROWID
+        """)
+
+        for key_type, (table, column) in TYPE_TABLES.items():
+            self.conn.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS {table}_register
+                AFTER INSERT ON {table}
+                BEGIN
+                    INSERT OR IGNORE INTO key_registry (key, type)
+                    VALUES (NEW.{column}, '{key_type}');
+                END
+            """)
+            self.conn.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS {table}_unregister
+                AFTER DELETE ON {table}
+                WHEN NOT EXISTS (
+                    SELECT 1 FROM {table} WHERE {column} = OLD.{column}
+                )
+                BEGIN
+                    DELETE FROM key_registry
+                    WHERE key = OLD.{column} AND type = '{key_type}';
+                END
+            """)
+
+            if created:
+                # Register keys written before the registry existed
+                self.conn.execute(f"""
+                    INSERT OR IGNORE INTO key_registry (key, type)
+                    SELECT DISTINCT {column}, '{key_type}' FROM {table}
+                """)
+
+    def _serialize(self, value: Any) -> str | bytes:
+        """Encode a value for storage."""
+        return self.serializer.encode(value)
+
+    def _deserialize(self, value: str | bytes) -> Any:
+        """Decode a stored value."""
+        return self.serializer.decode(value)
 
     def _current_timestamp(self) -> int:
         """Get current Unix timestamp."""
@@ -117,335 +377,520 @@ class SQLiteBackend(StateBackend):
             return False
         return expires_at <= self._current_timestamp()
 
+    def _remaining(self, expires_at: int | None) -> int | None:
+        """Convert a stored expiry timestamp to a TTL as ttl() reports it."""
+        if expires_at is None:
+            return None
+        remaining = expires_at - self._current_timestamp()
+        return remaining if remaining > 0 else -2
+
     # === Key-Value Operations ===
 
     def set(self, key: str, value: Any) -> None:
         """Store a value for the given key."""
-        with self._lock:
-            serialized = self._serialize(value)
-            self.conn.execute(
+        serialized = self._serialize(value)
+        with self._writing() as conn:
+            conn.execute(
                 "INSERT OR REPLACE INTO kv_store (key, value, expires_at) VALUES (?, ?, NULL)",
                 (key, serialized),
             )
 
     def get(self, key: str, default: Any = None) -> Any:
         """Retrieve a value for the given key."""
-        with self._lock:
-            cursor = self.conn.execute(
+        return self.get_with_ttl(key, default)[0]
+
+    def get_with_ttl(
+        self, key: str, default: Any = None
+    ) -> tuple[Any, int | None]:
+        """Retrieve a value and its TTL with a single query."""
+        with self._reading() as conn:
+            cursor = conn.execute(
                 "SELECT value, expires_at FROM kv_store WHERE key = ?",
                 (key,),
             )
             row = cursor.fetchone()
 
-            if row is None:
-                return default
+        if row is None:
+            return default, -2
 
-            value, expires_at = row
+        value, expires_at = row
 
-            if self._is_expired(expires_at):
-                self.delete(key)
-                return default
+        if self._is_expired(expires_at):
+            self._purge_expired("kv_store", "key = ?", (key,))
+            return default, -2
+
+        return self._deserialize(value), self._remaining(expires_at)
+
+    def mset(self, mapping: dict[str, Any]) -> None:
+        """Store several key-value pairs in one transaction."""
+        rows = [
+            (key, self._serialize(value)) for key, value in mapping.items()
+        ]
+        with self.transaction():
+            self.conn.executemany(
+                """INSERT OR REPLACE INTO kv_store (key, value, expires_at)
+                   VALUES (?, ?, NULL)""",
+                rows,
+            )
 
-            return self._deserialize(value)
+    def mget(self, keys: list[str], default: Any = None) -> list[Any]:
+        """Retrieve the values of several keys with batched queries."""
+        return [value for value, _ in self.mget_with_ttl(keys, default)]
+
+    def mget_with_ttl(
+        self, keys: list[str], default: Any = None
+    ) -> list[tuple[Any, int | None]]:
+        """Retrieve several values and their TTLs with batched queries."""
+        found: dict[str, tuple[str | bytes, int | None]] = {}
+        with self._reading() as conn:
+            for start in range(0, len(keys), MAX_BATCH_VARIABLES):
+                batch = keys[start : start + MAX_BATCH_VARIABLES]
+                placeholders = ", ".join("?" * len(batch))
+                cursor = conn.execute(
+                    f"""SELECT key, value, expires_at FROM kv_store
+                        WHERE key IN ({placeholders})""",
+                    batch,
+                )
+                for key, value, expires_at in cursor.fetchall():
+                    if not self._is_expired(expires_at):
+                        found[key] = (value, expires_at)
+
+        results: list[tuple[Any, int | None]] = []
+        for key in keys:
+            if key in found:
+                value, expires_at = found[key]
+                results.append(
+                    (self._deserialize(value), self._remaining(expires_at))
+                )
+            else:
+                results.append((default, -2))
+        return results
 
     def delete(self, key: str) -> bool:
         """Delete a key."""
-        cursor = self.conn.execute(
-            "DELETE FROM kv_store WHERE key = ?",
-            (key,),
-        )
+        with self._writing() as conn:
+            cursor = conn.execute(
+                "DELETE FROM kv_store WHERE key = ?",
+                (key,),
+            )
         return cursor.rowcount > 0
 
     def exists(self, key: str) -> bool:
         """Check if a key exists."""
-        cursor = self.conn.execute(
-            "SELECT expires_at FROM kv_store WHERE key = ?",
-            (key,),
-        )
-        row = cursor.fetchone()
+        with self._reading() as conn:
+            cursor = conn.execute(
+                "SELECT expires_at FROM kv_store WHERE key = ?",
+                (key,),
+            )
+            row = cursor.fetchone()
 
         if row is None:
             return False
 
         expires_at = row[0]
         if self._is_expired(expires_at):
-            self.delete(key)
+            self._purge_expired("kv_store", "key = ?", (key,))
             return False
 
         return True
 
     def keys(self, pattern: str | None = None) -> list[str]:
         """List all keys, optionally matching a pattern."""
-        cursor = self.conn.execute("SELECT key, expires_at FROM kv_store")
-        all_keys = []
-
-        for key, expires_at in cursor.fetchall():
-            if not self._is_expired(expires_at):
+        return list(self.scan(pattern, type="string"))
+
+    def scan(
+        self,
+        pattern: str | None = None,
+        type: str | None = None,
+        count: int = 100,
+    ) -> Iterator[str]:
+        """Iterate over keys of any data type, a page at a time.
+
+        The literal prefix of the pattern (up to the first wildcard)
+        becomes a range over the key registry index; pages are fetched
+        with keyset pagination, so each round-trip costs O(count).
+        """
+        if type is not None and type not in KEY_TYPES:
+            raise ValueError(f"Unsupported key type: {type}")
+
+        prefix = _glob_prefix(pattern) if pattern else ""
+        upper = _prefix_upper_bound(prefix)
+
+        conditions = ["(key, type) > (:after_key, :after_type)"]
+        if prefix:
+            conditions.append("key >= :prefix")
+        if upper is not None:
+            conditions.append("key < :upper")
+        if type is not None:
+            conditions.append("type = :type")
+
+        # Skip keys whose data has expired
+        live = " ".join(
+            f"""WHEN '{key_type}' THEN EXISTS (
+                    SELECT 1 FROM {table}
+                    WHERE {column} = key_registry.key
+                    AND (expires_at IS NULL OR expires_at > :now)
+                )"""
+            for key_type, (table, column) in TYPE_TABLES.items()
+        )
+        conditions.append(f"CASE type {live} END")
+
+        query = f"""SELECT key, type FROM key_registry
+                    WHERE {" AND ".join(conditions)}
+                    ORDER BY key, type LIMIT :count"""
+        params: dict[str, Any] = {
+            "after_key": "",
+            "after_type": "",
+            "prefix": prefix,
+            "upper": upper,
+            "type": type,
+            "count": count,
+        }
+
+        previous = None
+        while True:
+            params["now"] = self._current_timestamp()
+            with self._reading() as conn:
+                rows = conn.execute(query, params).fetchall()
+
+            for key, _ in rows:
+                # A key may exist as several types; report it once
+                if key == previous:
+                    continue
+                previous = key
                 if pattern is None or fnmatch(key, pattern):
-                    all_keys.append(key)
+                    yield key
+
+            if len(rows) < count:
+                return
 
-        return all_keys
+            params["after_key"], params["after_type"] = rows[-1]
 
     # === Hash Operations ===
 
     def hset(self, hash_key: str, field: str, value: Any) -> None:
         """Set a field in a hash."""
         serialized = self._serialize(value)
-        self.conn.execute(
-            """INSERT OR REPLACE INTO hash_store (hash_key, field, value, expires_at)
-               VALUES (?, ?, ?, NULL)""",
-            (hash_key, field, serialized),
-        )
+        with self._writing() as conn:
+            conn.execute(
+                """INSERT OR REPLACE INTO hash_store
+                   (hash_key, field, value, expires_at)
+                   VALUES (?, ?, ?, NULL)""",
+                (hash_key, field, serialized),
+            )
+
+    def hmset(self, hash_key: str, mapping: dict[str, Any]) -> None:
+        """Set several fields in a hash in one transaction."""
+        rows = [
+            (hash_key, field, self._serialize(value))
+            for field, value in mapping.items()
+        ]
+        with self.transaction():
+            self.conn.executemany(
+                """INSERT OR REPLACE INTO hash_store
+                   (hash_key, field, value, expires_at)
+                   VALUES (?, ?, ?, NULL)""",
+                rows,
+            )
 
     def hget(self, hash_key: str, field: str, default: Any = None) -> Any:
         """Get a field from a hash."""
-        cursor = self.conn.execute(
-            "SELECT value, expires_at FROM hash_store WHERE hash_key = ? AND field = ?",
-            (hash_key, field),
-        )
-        row = cursor.fetchone()
+        return self.hget_with_ttl(hash_key, field, default)[0]
+
+    def hget_with_ttl(
+        self, hash_key: str, field: str, default: Any = None
+    ) -> tuple[Any, int | None]:
+        """Get a field from a hash and the hash's TTL with a single query.
+
+        A missing field is reported with a TTL of -2 even if the hash
+        exists; its absence can't be undone by the hash expiring.
+        """
+        with self._reading() as conn:
+            cursor = conn.execute(
+                """SELECT value, expires_at FROM hash_store
+                   WHERE hash_key = ? AND field = ?""",
+                (hash_key, field),
+            )
+            row = cursor.fetchone()
 
         if row is None:
-            return default
+            return default, -2
 
         value, expires_at = row
 
         if self._is_expired(expires_at):
-            self.hdel(hash_key, field)
-            return default
+            self._purge_expired(
+                "hash_store", "hash_key = ? AND field = ?", (hash_key, field)
+            )
+            return default, -2
 
-        return self._deserialize(value)
+        return self._deserialize(value), self._remaining(expires_at)
 
     def hgetall(self, hash_key: str) -> dict[str, Any]:
         """Get all fields from a hash."""
-        cursor = self.conn.execute(
-            "SELECT field, value, expires_at FROM hash_store WHERE hash_key = ?",
-            (hash_key,),
-        )
+        return self.hgetall_with_ttl(hash_key)[0]
+
+    def hgetall_with_ttl(
+        self, hash_key: str
+    ) -> tuple[dict[str, Any], int | None]:
+        """Get all fields from a hash and its TTL with a single query."""
+        with self._reading() as conn:
+            rows = conn.execute(
+                """SELECT field, value, expires_at FROM hash_store
+                   WHERE hash_key = ?""",
+                (hash_key,),
+            ).fetchall()
 
         result = {}
-        for field, value, expires_at in cursor.fetchall():
+        remaining: int | None = -2
+        for field, value, expires_at in rows:
             if not self._is_expired(expires_at):
                 result[field] = self._deserialize(value)
+                remaining = self._remaining(expires_at)
 
-        return result
+        return result, remaining
 
     def hdel(self, hash_key: str, field: str) -> bool:
         """Delete a field from a hash."""
-        cursor = self.conn.execute(
-            "DELETE FROM hash_store WHERE hash_key = ? AND field = ?",
-            (hash_key, field),
-        )
+        with self._writing() as conn:
+            cursor = conn.execute(
+                "DELETE FROM hash_store WHERE hash_key = ? AND field = ?",
+                (hash_key, field),
+            )
         return cursor.rowcount > 0
 
     def hexists(self, hash_key: str, field: str) -> bool:
         """Check if a field exists in a hash."""
-        cursor = self.conn.execute(
-            "SELECT expires_at FROM hash_store WHERE hash_key = ? AND field = ?",
-            (hash_key, field),
-        )
-        row = cursor.fetchone()
+        with self._reading() as conn:
+            cursor = conn.execute(
+                """SELECT expires_at FROM hash_store
+                   WHERE hash_key = ? AND field = ?""",
+                (hash_key, field),
+            )
+            row = cursor.fetchone()
 
         if row is None:
             return False
 
         expires_at = row[0]
         if self._is_expired(expires_at):
-            self.hdel(hash_key, field)
+            self._purge_expired(
+                "hash_store", "hash_key = ? AND field = ?", (hash_key, field)
+            )
             return False
 
         return True
 
     # === List Operations ===
-
-    def lpush(self, list_key: str, value: Any) -> None:
-        """Prepend a value to a list."""
-        # Get all existing items
-        cursor = self.conn.execute(
-            """SELECT position, value, expires_at FROM list_store
-               WHERE list_key = ?
-               ORDER BY position""",
+    #
+    # List elements are stored at contiguous signed positions: lpush
+    # takes MIN(position) - 1 and rpush MAX(position) + 1, so both ends
+    # are reached through the primary key index and no element is ever
+    # renumbered. Pops and trims only delete rows at the ends.
+
+    def _list_bounds(
+        self, conn: sqlite3.Connection, list_key: str
+    ) -> tuple[int, int] | None:
+        """Get the head and tail positions of a list (None if empty)."""
+        cursor = conn.execute(
+            """SELECT MIN(position), MAX(position) FROM list_store
+               WHERE list_key = ?""",
             (list_key,),
         )
-        existing = cursor.fetchall()
+        head, tail = cursor.fetchone()
+        if head is None:
+            return None
+        return head, tail
 
-        # Delete all items for this list
-        self.conn.execute(
-            "DELETE FROM list_store WHERE list_key = ?",
-            (list_key,),
-        )
+    def _resolve_range(
+        self, conn: sqlite3.Connection, list_key: str, start: int, end: int
+    ) -> tuple[int, int] | None:
+        """Map a Redis-style index range onto list positions.
 
-        # Insert new item at position 0
-        serialized = self._serialize(value)
-        self.conn.execute(
-            """INSERT INTO list_store (list_key, position, value, expires_at)
-               VALUES (?, 0, ?, NULL)""",
-            (list_key, serialized),
-        )
+        Returns:
+            (first, last) positions, or None if the range is empty
+        """
+        bounds = self._list_bounds(conn, list_key)
+        if bounds is None:
+            return None
+
+        head, tail = bounds
+        length = tail - head + 1
+
+        # Handle negative indices
+        if start < 0:
+            start = length + start
+        if end < 0:
+            end = length + end
+
+        # Clamp to valid range
+        start = max(0, start)
+        end = min(length - 1, end)
+
+        if start > end:
+            return None
 
-        # Re-insert existing items with shifted positions
-        for pos, val, exp in existing:
+        return head + start, head + end
+
+    def lpush(
+        self, list_key: str, value: Any, max_length: int | None = None
+    ) -> None:
+        """Prepend a value to a list."""
+        serialized = self._serialize(value)
+        with self.transaction():
             self.conn.execute(
                 """INSERT INTO list_store (list_key, position, value, expires_at)
-                   VALUES (?, ?, ?, ?)""",
-                (list_key, pos + 1, val, exp),
+                   SELECT ?, COALESCE(MIN(position) - 1, 0), ?, NULL
+                   FROM list_store WHERE list_key = ?""",
+                (list_key, serialized, list_key),
             )
+            if max_length is not None:
+                self.ltrim(list_key, 0, max_length - 1)
 
-    def rpush(self, list_key: str, value: Any) -> None:
+    def rpush(
+        self, list_key: str, value: Any, max_length: int | None = None
+    ) -> None:
         """Append a value to a list."""
-        # Get max position
-        cursor = self.conn.execute(
-            "SELECT MAX(position) FROM list_store WHERE list_key = ?",
-            (list_key,),
-        )
-        row = cursor.fetchone()
-        max_pos = row[0] if row[0] is not None else -1
-
-        # Insert at next position
         serialized = self._serialize(value)
-        self.conn.execute(
-            """INSERT INTO list_store (list_key, position, value, expires_at)
-               VALUES (?, ?, ?, NULL)""",
-            (list_key, max_pos + 1, serialized),
-        )
+        with self.transaction():
+            self.conn.execute(
+                """INSERT INTO list_store
+                   (list_key, position, value, expires_at)
+                   SELECT ?, COALESCE(MAX(position) + 1, 0), ?, NULL
+                   FROM list_store WHERE list_key = ?""",
+                (list_key, serialized, list_key),
+            )
+            if max_length is not None:
+                self.ltrim(list_key, -max_length, -1)
 
     def lrange(
         self, list_key: str, start: int = 0, end: int = -1
     ) -> list[Any]:
         """Get a range of elements from a list."""
-        # Get list length
-        length = self.llen(list_key)
-
-        if length == 0:
-            return []
-
-        # Handle negative indices
-        if end < 0:
-            end = length + end
-
-        # Clamp to valid range
-        start = max(0, start)
-        end = min(length - 1, end)
-
-        if start > end:
-            return []
-
-        cursor = self.conn.execute(
-            """SELECT value FROM list_store
-               WHERE list_key = ? AND position >= ? AND position <= ?
-               AND (expires_at IS NULL OR expires_at > ?)
-               ORDER BY position""",
-            (list_key, start, end, self._current_timestamp()),
-        )
+        with self._reading() as conn:
+            positions = self._resolve_range(conn, list_key, start, end)
+            if positions is None:
+                return []
+
+            cursor = conn.execute(
+                """SELECT value FROM list_store
+                   WHERE list_key = ? AND position >= ? AND position <= ?
+                   AND (expires_at IS NULL OR expires_at > ?)
+                   ORDER BY position""",
+                (list_key, *positions, self._current_timestamp()),
+            )
 
-        return [self._deserialize(row[0]) for row in cursor.fetchall()]
+            return [self._deserialize(row[0]) for row in cursor.fetchall()]
 
     def llen(self, list_key: str) -> int:
         """Get the length of a list."""
-        cursor = self.conn.execute(
-            """SELECT COUNT(*) FROM list_store
-               WHERE list_key = ? AND (expires_at IS NULL OR expires_at > ?)""",
-            (list_key, self._current_timestamp()),
-        )
-        return cursor.fetchone()[0]
-
-    def lpop(self, list_key: str) -> Any | None:
-        """Remove and return the first element of a list."""
-        cursor = self.conn.execute(
-            """SELECT value FROM list_store
-               WHERE list_key = ? AND position = 0
-               AND (expires_at IS NULL OR expires_at > ?)""",
-            (list_key, self._current_timestamp()),
-        )
-        row = cursor.fetchone()
+        with self._reading() as conn:
+            cursor = conn.execute(
+                """SELECT COUNT(*) FROM list_store
+                   WHERE list_key = ?
+                   AND (expires_at IS NULL OR expires_at > ?)""",
+                (list_key, self._current_timestamp()),
+            )
+            return cursor.fetchone()[0]
 
-        if row is None:
-            return None
+    def ltrim(self, list_key: str, start: int, end: int) -> None:
+        """Trim a list to the elements between start and end."""
+        with self.transaction():
+            positions = self._resolve_range(self.conn, list_key, start, end)
+            if positions is None:
+                self.conn.execute(
+                    "DELETE FROM list_store WHERE list_key = ?",
+                    (list_key,),
+                )
+                return
 
-        value = self._deserialize(row[0])
+            self.conn.execute(
+                """DELETE FROM list_store
+                   WHERE list_key = ? AND (position < ? OR position > ?)""",
+                (list_key, *positions),
+            )
 
-        # Delete the element
-        self.conn.execute(
-            "DELETE FROM list_store WHERE list_key = ? AND position = 0",
-            (list_key,),
-        )
+    def _pop(self, list_key: str, order: str) -> Any | None:
+        """Remove and return the element at one end of a list."""
+        with self.transaction():
+            cursor = self.conn.execute(
+                f"""SELECT position, value, expires_at FROM list_store
+                    WHERE list_key = ?
+                    ORDER BY position {order} LIMIT 1""",
+                (list_key,),
+            )
+            row = cursor.fetchone()
 
-        # Shift all positions down by 1
-        self.conn.execute(
-            "UPDATE list_store SET position = position - 1 WHERE list_key = ?",
-            (list_key,),
-        )
+            if row is None:
+                return None
 
-        return value
+            position, value, expires_at = row
 
-    def rpop(self, list_key: str) -> Any | None:
-        """Remove and return the last element of a list."""
-        cursor = self.conn.execute(
-            """SELECT position, value FROM list_store
-               WHERE list_key = ? AND (expires_at IS NULL OR expires_at > ?)
-               ORDER BY position DESC LIMIT 1""",
-            (list_key, self._current_timestamp()),
-        )
-        row = cursor.fetchone()
+            # Delete the element
+            self.conn.execute(
+                "DELETE FROM list_store WHERE list_key = ? AND position = ?",
+                (list_key, position),
+            )
 
-        if row is None:
+        if self._is_expired(expires_at):
             return None
 
-        position, value = row
-        value = self._deserialize(value)
+        return self._deserialize(value)
 
-        # Delete the element
-        self.conn.execute(
-            "DELETE FROM list_store WHERE list_key = ? AND position = ?",
-            (list_key, position),
-        )
+    def lpop(self, list_key: str) -> Any | None:
+        """Remove and return the first element of a list."""
+        return self._pop(list_key, "ASC")
 
-        return value
+    def rpop(self, list_key: str) -> Any | None:
+        """Remove and return the last element of a list."""
+        return self._pop(list_key, "DESC")
 
     # === Set Operations ===
 
     def sadd(self, set_key: str, *values: Any) -> int:
         """Add one or more values to a set."""
         added = 0
-        for value in values:
-            serialized = self._serialize(value)
-            try:
-                self.conn.execute(
-                    """INSERT INTO set_store (set_key, value, expires_at)
+        with self.transaction():
+            for value in values:
+                cursor = self.conn.execute(
+                    """INSERT OR IGNORE INTO set_store
+                       (set_key, value, expires_at)
                        VALUES (?, ?, NULL)""",
-                    (set_key, serialized),
+                    (set_key, self._serialize(value)),
                 )
-                added += 1
-            except sqlite3.IntegrityError:
-                # Value already exists in set
-                pass
+                added += cursor.rowcount
         return added
 
     def smembers(self, set_key: str) -> set[Any]:
         """Get all members of a set."""
-        cursor = self.conn.execute(
-            """SELECT value FROM set_store
-               WHERE set_key = ? AND (expires_at IS NULL OR expires_at > ?)""",
-            (set_key, self._current_timestamp()),
-        )
-        return {self._deserialize(row[0]) for row in cursor.fetchall()}
+        with self._reading() as conn:
+            rows = conn.execute(
+                """SELECT value FROM set_store
+                   WHERE set_key = ?
+                   AND (expires_at IS NULL OR expires_at > ?)""",
+                (set_key, self._current_timestamp()),
+            ).fetchall()
+        return {self._deserialize(row[0]) for row in rows}
 
     def sismember(self, set_key: str, value: Any) -> bool:
         """Check if a value is a member of a set."""
         serialized = self._serialize(value)
-        cursor = self.conn.execute(
-            """SELECT expires_at FROM set_store
-               WHERE set_key = ? AND value = ?""",
-            (set_key, serialized),
-        )
-        row = cursor.fetchone()
+        with self._reading() as conn:
+            cursor = conn.execute(
+                """SELECT expires_at FROM set_store
+                   WHERE set_key = ? AND value = ?""",
+                (set_key, serialized),
+            )
+            row = cursor.fetchone()
 
         if row is None:
             return False
 
         expires_at = row[0]
         if self._is_expired(expires_at):
-            self.srem(set_key, value)
+            self._purge_expired(
+                "set_store", "set_key = ? AND value = ?", (set_key, serialized)
+            )
             return False
 
         return True
@@ -453,23 +898,26 @@ class SQLiteBackend(StateBackend):
     def srem(self, set_key: str, *values: Any) -> int:
         """Remove one or more values from a set."""
         removed = 0
-        for value in values:
-            serialized = self._serialize(value)
-            cursor = self.conn.execute(
-                "DELETE FROM set_store WHERE set_key = ? AND value = ?",
-                (set_key, serialized),
-            )
-            removed += cursor.rowcount
+        with self.transaction():
+            for value in values:
+                serialized = self._serialize(value)
+                cursor = self.conn.execute(
+                    "DELETE FROM set_store WHERE set_key = ? AND value = ?",
+                    (set_key, serialized),
+                )
+                removed += cursor.rowcount
         return removed
 
     def scard(self, set_key: str) -> int:
         """Get the number of members in a set."""
-        cursor = self.conn.execute(
-            """SELECT COUNT(*) FROM set_store
-               WHERE set_key = ? AND (expires_at IS NULL OR expires_at > ?)""",
-            (set_key, self._current_timestamp()),
-        )
-        return cursor.fetchone()[0]
+        with self._reading() as conn:
+            cursor = conn.execute(
+                """SELECT COUNT(*) FROM set_store
+                   WHERE set_key = ?
+                   AND (expires_at IS NULL OR expires_at > ?)""",
+                (set_key, self._current_timestamp()),
+            )
+            return cursor.fetchone()[0]
 
     # === TTL/Expiration Operations ===
 
@@ -477,172 +925,319 @@ class SQLiteBackend(StateBackend):
         """Set an expiration time on a key."""
         expires_at = self._current_timestamp() + seconds
 
-        # Try to update in kv_store
-        cursor = self.conn.execute(
-            "UPDATE kv_store SET expires_at = ? WHERE key = ?",
-            (expires_at, key),
-        )
-
-        if cursor.rowcount > 0:
-            return True
-
-        # Try hash_store (set expiration on all fields)
-        cursor = self.conn.execute(
-            "UPDATE hash_store SET expires_at = ? WHERE hash_key = ?",
-            (expires_at, key),
-        )
-
-        if cursor.rowcount > 0:
-            return True
-
-        # Try list_store
-        cursor = self.conn.execute(
-            "UPDATE list_store SET expires_at = ? WHERE list_key = ?",
-            (expires_at, key),
-        )
-
-        if cursor.rowcount > 0:
-            return True
-
-        # Try set_store
-        cursor = self.conn.execute(
-            "UPDATE set_store SET expires_at = ? WHERE set_key = ?",
-            (expires_at, key),
-        )
+        # The first data structure holding the key gets the expiry
+        with self.transaction():
+            for table, column in TYPE_TABLES.values():
+                cursor = self.conn.execute(
+                    f"UPDATE {table} SET expires_at = ? WHERE {column} = ?",
+                    (expires_at, key),
+                )
+                if cursor.rowcount > 0:
+                    return True
 
-        return cursor.rowcount > 0
+        return False
 
     def ttl(self, key: str) -> int | None:
         """Get the remaining time to live for a key."""
-        # Check kv_store
-        cursor = self.conn.execute(
-            "SELECT expires_at FROM kv_store WHERE key = ?",
-            (key,),
-        )
-        row = cursor.fetchone()
-
-        if row is not None:
-            expires_at = row[0]
-            if expires_at is None:
-                return None
-            remaining = expires_at - self._current_timestamp()
-            return max(0, remaining) if remaining > 0 else -2
-
-        # Check hash_store
-        cursor = self.conn.execute(
-            "SELECT expires_at FROM hash_store WHERE hash_key = ? LIMIT 1",
-            (key,),
-        )
-        row = cursor.fetchone()
-
-        if row is not None:
-            expires_at = row[0]
-            if expires_at is None:
-                return None
-            remaining = expires_at - self._current_timestamp()
-            return max(0, remaining) if remaining > 0 else -2
+        with self._reading() as conn:
+            for table, column in TYPE_TABLES.values():
+                row = conn.execute(
+                    f"""SELECT expires_at FROM {table}
+                        WHERE {column} = ? LIMIT 1""",
+                    (key,),
+                ).fetchone()
 
-        # Check list_store
-        cursor = self.conn.execute(
-            "SELECT expires_at FROM list_store WHERE list_key = ? LIMIT 1",
-            (key,),
-        )
-        row = cursor.fetchone()
-
-        if row is not None:
-            expires_at = row[0]
-            if expires_at is None:
-                return None
-            remaining = expires_at - self._current_timestamp()
-            return max(0, remaining) if remaining > 0 else -2
-
-        # Check set_store
-        cursor = self.conn.execute(
-            "SELECT expires_at FROM set_store WHERE set_key = ? LIMIT 1",
-            (key,),
-        )
-        row = cursor.fetchone()
-
-        if row is not None:
-            expires_at = row[0]
-            if expires_at is None:
-                return None
-            remaining = expires_at - self._current_timestamp()
-            return max(0, remaining) if remaining > 0 else -2
+                if row is not None:
+                    return self._remaining(row[0])
 
         return -2  # Key doesn't exist
 
     def persist(self, key: str) -> bool:
         """Remove expiration from a key."""
-        # Try all tables
         updated = False
 
-        cursor = self.conn.execute(
-            "UPDATE kv_store SET expires_at = NULL WHERE key = ? AND expires_at IS NOT NULL",
-            (key,),
-        )
-        updated = updated or cursor.rowcount > 0
+        with self.transaction():
+            for table, column in TYPE_TABLES.values():
+                cursor = self.conn.execute(
+                    f"""UPDATE {table} SET expires_at = NULL
+                        WHERE {column} = ? AND expires_at IS NOT NULL""",
+                    (key,),
+                )
+                updated = updated or cursor.rowcount > 0
 
-        cursor = self.conn.execute(
-            "UPDATE hash_store SET expires_at = NULL WHERE hash_key = ? AND expires_at IS NOT NULL",
-            (key,),
-        )
-        updated = updated or cursor.rowcount > 0
+        return updated
 
-        cursor = self.conn.execute(
-            "UPDATE list_store SET expires_at = NULL WHERE list_key = ? AND expires_at IS NOT NULL",
-            (key,),
-        )
-        updated = updated or cursor.rowcount > 0
+    # === Transactions ===
 
-        cursor = self.conn.execute(
-            "UPDATE set_store SET expires_at = NULL WHERE set_key = ? AND expires_at IS NOT NULL",
-            (key,),
-        )
-        updated = updated or cursor.rowcount > 0
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Run the enclosed operations in a single BEGIN...COMMIT.
 
-        return updated
+        The backend lock is held for the whole block, so other threads
+        sharing this backend wait until it commits.
+        """
+        with self._lock:
+            if self._transaction_depth:
+                # Nested: the outermost transaction commits
+                self._transaction_depth += 1
+                try:
+                    yield
+                finally:
+                    self._transaction_depth -= 1
+                return
+
+            self.conn.execute("BEGIN IMMEDIATE")
+            self._transaction_depth = 1
+            self._local.in_transaction = True
+            try:
+                yield
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+            else:
+                self.conn.execute("COMMIT")
+            finally:
+                self._transaction_depth = 0
+                self._local.in_transaction = False
+
+    # === Change Notifications ===
+    #
+    # Triggers on the data tables append every change to change_log,
+    # so writes made by any connection (or process) are recorded. They
+    # trim the log to its last CHANGE_LOG_SIZE entries. Every backend
+    # with subscriptions registers in change_listeners; the triggers
+    # exist only while someone is registered, so writes pay for them
+    # only while they are needed. A poller thread checks
+    # PRAGMA data_version, which changes when another connection
+    # commits, and reads the new entries only then.
+
+    def _init_change_log(self) -> None:
+        """Register as a listener and create the change log triggers."""
+        with self.transaction():
+            conn = self.conn
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS change_log (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    key TEXT NOT NULL,
+                    event TEXT NOT NULL
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS change_listeners (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    pid INTEGER NOT NULL
+                )
+            """)
+            self._listener_id = conn.execute(
+                "INSERT INTO change_listeners (pid) VALUES (?)",
+                (os.getpid(),),
+            ).lastrowid
+
+            trim = f"""DELETE FROM change_log
+                       WHERE id <= last_insert_rowid() - {CHANGE_LOG_SIZE};"""
+            for table, column in TYPE_TABLES.values():
+                conn.execute(f"""
+                    CREATE TRIGGER IF NOT EXISTS {table}_notify_insert
+                    AFTER INSERT ON {table}
+                    BEGIN
+                        INSERT INTO change_log (key, event)
+                        VALUES (NEW.{column}, 'write');
+                        {trim}
+                    END
+                """)
+                conn.execute(f"""
+                    CREATE TRIGGER IF NOT EXISTS {table}_notify_update
+                    AFTER UPDATE ON {table}
+                    BEGIN
+                        INSERT INTO change_log (key, event)
+                        VALUES (
+                            NEW.{column},
+                            CASE WHEN NEW.value IS OLD.value
+                            THEN 'expire' ELSE 'write' END
+                        );
+                        {trim}
+                    END
+                """)
+                conn.execute(f"""
+                    CREATE TRIGGER IF NOT EXISTS {table}_notify_delete
+                    AFTER DELETE ON {table}
+                    BEGIN
+                        INSERT INTO change_log (key, event)
+                        VALUES (OLD.{column}, 'remove');
+                        {trim}
+                    END
+                """)
+
+    def _release_change_log(self) -> None:
+        """Unregister as a listener, dropping the triggers if last.
+
+        Listeners left behind by processes that died are removed too.
+        """
+        if self._listener_id is None:
+            return
+        with self.transaction():
+            conn = self.conn
+            conn.execute(
+                "DELETE FROM change_listeners WHERE id = ?",
+                (self._listener_id,),
+            )
+            self._listener_id = None
+
+            pids = conn.execute(
+                "SELECT DISTINCT pid FROM change_listeners"
+            ).fetchall()
+            for (pid,) in pids:
+                if pid != os.getpid() and not _process_alive(pid):
+                    conn.execute(
+                        "DELETE FROM change_listeners WHERE pid = ?", (pid,)
+                    )
+            if conn.execute("SELECT 1 FROM change_listeners").fetchone():
+                return
+
+            for table, _ in TYPE_TABLES.values():
+                for suffix in CHANGE_TRIGGERS:
+                    conn.execute(f"DROP TRIGGER IF EXISTS {table}_{suffix}")
+
+    def subscribe(
+        self, pattern: str, callback: ChangeCallback
+    ) -> Subscription:
+        """Call back whenever a key matching a pattern changes.
+
+        Changes are picked up within notify_interval seconds, from this
+        and every other connection to the database. Callbacks run on
+        the backend's poller thread.
+        """
+        with self._poller_lock:
+            if self._poller is None:
+                self._init_change_log()
+
+                conn = self._connect()
+                self._configure(conn)
+                conn.execute("PRAGMA query_only = ON")
+                last_id = conn.execute(
+                    "SELECT COALESCE(MAX(id), 0) FROM change_log"
+                ).fetchone()[0]
+
+                self._poller_stop = threading.Event()
+                self._poller = threading.Thread(
+                    target=self._poll_changes,
+                    args=(conn, last_id, self._poller_stop),
+                    name="state-change-poller",
+                    daemon=True,
+                )
+                self._poller.start()
+
+            return self._subscribers.add(pattern, callback)
+
+    def _poll_changes(
+        self,
+        conn: sqlite3.Connection,
+        last_id: int,
+        stop: threading.Event,
+    ) -> None:
+        """Deliver new change log entries until stopped."""
+        version = None
+        try:
+            while not stop.wait(self.notify_interval):
+                try:
+                    current = conn.execute("PRAGMA data_version").fetchone()[0]
+                    if current == version:
+                        continue
+                    version = current
+                    rows = conn.execute(
+                        """SELECT id, key, event FROM change_log
+                           WHERE id > ? ORDER BY id""",
+                        (last_id,),
+                    ).fetchall()
+                except sqlite3.Error as e:
+                    self._logger.warning(f"Reading state changes failed: {e}")
+                    continue
+
+                if rows:
+                    last_id = rows[-1][0]
+                    self._subscribers.dispatch(
+                        KeyChange(key, event) for _, key, event in rows
+                    )
+        finally:
+            conn.close()
+
+    def _stop_change_poller(self) -> None:
+        """Stop the poller thread once nothing is subscribed."""
+        with self._poller_lock:
+            if self._subscribers or self._poller is None:
+                return
+            poller, self._poller = self._poller, None
+            self._poller_stop.set()
 
-    # === Maintenance Operations ===
+            try:
+                self._release_change_log()
+            except sqlite3.Error as e:
+                self._logger.warning(f"Removing change triggers failed: {e}")
 
-    def cleanup_expired(self) -> int:
-        """Remove all expired keys."""
-        current_time = self._current_timestamp()
-        total_removed = 0
+        # A callback may cancel its own subscription from the poller
+        if poller is not threading.current_thread():
+            poller.join()
 
-        cursor = self.conn.execute(
-            "DELETE FROM kv_store WHERE expires_at IS NOT NULL AND expires_at <= ?",
-            (current_time,),
-        )
-        total_removed += cursor.rowcount
+    # === Maintenance Operations ===
 
-        cursor = self.conn.execute(
-            "DELETE FROM hash_store WHERE expires_at IS NOT NULL AND expires_at <= ?",
-            (current_time,),
-        )
-        total_removed += cursor.rowcount
+    def cleanup_expired(self, limit: int | None = None) -> int:
+        """Remove expired rows in one transaction.
 
-        cursor = self.conn.execute(
-            "DELETE FROM list_store WHERE expires_at IS NOT NULL AND expires_at <= ?",
-            (current_time,),
-        )
-        total_removed += cursor.rowcount
+        Rows are found through the idx_*_expires indexes, so the cost
+        depends on the number of expired rows rather than on the size of
+        the tables.
+        """
+        current_time = self._current_timestamp()
+        total_removed = 0
 
-        cursor = self.conn.execute(
-            "DELETE FROM set_store WHERE expires_at IS NOT NULL AND expires_at <= ?",
-            (current_time,),
-        )
-        total_removed += cursor.rowcount
+        with self.transaction():
+            for table, _ in TYPE_TABLES.values():
+                remaining = -1 if limit is None else limit - total_removed
+                if remaining == 0:
+                    break
+                cursor = self.conn.execute(
+                    f"""DELETE FROM {table} WHERE rowid IN (
+                        SELECT rowid FROM {table}
+                        WHERE expires_at <= ? LIMIT ?
+                    )""",
+                    (current_time, remaining),
+                )
+                total_removed += cursor.rowcount
 
         return total_removed
 
     def clear_all(self) -> None:
         """Clear all data (dangerous!)."""
-        self.conn.execute("DELETE FROM kv_store")
-        self.conn.execute("DELETE FROM hash_store")
-        self.conn.execute("DELETE FROM list_store")
-        self.conn.execute("DELETE FROM set_store")
+        with self.transaction():
+            self.conn.execute("DELETE FROM kv_store")
+            self.conn.execute("DELETE FROM hash_store")
+            self.conn.execute("DELETE FROM list_store")
+            self.conn.execute("DELETE FROM set_store")
+            self.conn.execute("DELETE FROM key_registry")
+
+    def data_version(self) -> int | None:
+        """Get SQLite's data_version, bumped by commits of other connections.
+
+        Read on the writer connection, whose version only changes on
+        commits by others. While a write holds that connection the last
+        known version is returned instead of waiting for it.
+        """
+        if not self._lock.acquire(blocking=False):
+            return self._data_version
+        try:
+            self._data_version = self.conn.execute(
+                "PRAGMA data_version"
+            ).fetchone()[0]
+            return self._data_version
+        finally:
+            self._lock.release()
 
     def close(self) -> None:
-        """Close the backend connection and cleanup resources."""
+        """Close the backend connections and cleanup resources."""
+        self._subscribers.clear()
+        self._stop_change_poller()
+        with self._readers_lock:
+            for reader in self._readers:
+                reader.close()
+            self._readers.clear()
         self.conn.close()
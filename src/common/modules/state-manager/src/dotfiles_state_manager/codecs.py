@@ -0,0 +1,324 @@
+"""Value codecs used by the backends to store values.
+
+A Serializer turns values into what a backend stores. With the default
+JSON codec and no compression values are stored as JSON text, as they
+always have been. Any other setting stores bytes (BLOB in SQLite) made
+of a one byte header followed by the payload::
+
+    header = codec tag << 4 | compression tag
+
+The header makes stored values self-describing, so values written with
+one codec (or compression setting) can still be read after switching to
+another, and JSON text written before codecs existed stays readable.
+"""
+
+from __future__ import annotations
+
+import json
+import zlib
+from abc import ABC, abstractmethod
+from typing import Any, ClassVar
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgpack
+
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+
+class Codec(ABC):
+    """Format used to turn values into bytes.
+
+    Attributes:
+        name: Name used in configuration
+        tag: Identifies the format in stored headers (1-15). Codecs
+            producing the same format share a tag.
+    """
+
+    name: ClassVar[str]
+    tag: ClassVar[int]
+
+    @abstractmethod
+    def dumps(self, value: Any) -> bytes:
+        """Encode a value.
+
+        Args:
+            value: Value to encode
+
+        Returns:
+            Encoded value
+        """
+        pass
+
+    @abstractmethod
+    def loads(self, data: bytes) -> Any:
+        """Decode a value.
+
+        Args:
+            data: Bytes produced by dumps
+
+        Returns:
+            Decoded value
+        """
+        pass
+
+
+class JsonCodec(Codec):
+    """JSON using the standard library."""
+
+    name = "json"
+    tag = 1
+
+    def dumps(self, value: Any) -> bytes:
+        """Encode a value as UTF-8 JSON."""
+        return json.dumps(value).encode()
+
+    def loads(self, data: bytes) -> Any:
+        """Decode UTF-8 JSON."""
+        return json.loads(data)
+
+
+class OrjsonCodec(Codec):
+    """JSON using orjson, several times faster than the standard library.
+
+    Requires orjson package to be installed:
+        uv add dotfiles-state-manager[orjson]
+    """
+
+    name = "orjson"
+    tag = JsonCodec.tag
+
+    def __init__(self) -> None:
+        """Initialize the codec.
+
+        Raises:
+            ImportError: If orjson package is not installed
+        """
+        if not ORJSON_AVAILABLE:
+            raise ImportError(
+                "orjson codec requires orjson package. "
+                "Install with: uv add dotfiles-state-manager[orjson]"
+            )
+
+    def dumps(self, value: Any) -> bytes:
+        """Encode a value as UTF-8 JSON."""
+        return orjson.dumps(value)
+
+    def loads(self, data: bytes) -> Any:
+        """Decode UTF-8 JSON."""
+        return orjson.loads(data)
+
+
+class MsgpackCodec(Codec):
+    """MessagePack, a compact binary format that also stores bytes.
+
+    Requires msgpack package to be installed:
+        uv add dotfiles-state-manager[msgpack]
+    """
+
+    name = "msgpack"
+    tag = 2
+
+    def __init__(self) -> None:
+        """Initialize the codec.
+
+        Raises:
+            ImportError: If msgpack package is not installed
+        """
+        if not MSGPACK_AVAILABLE:
+            raise ImportError(
+                "msgpack codec requires msgpack package. "
+                "Install with: uv add dotfiles-state-manager[msgpack]"
+            )
+
+    def dumps(self, value: Any) -> bytes:
+        """Encode a value as MessagePack."""
+        return msgpack.packb(value, use_bin_type=True)
+
+    def loads(self, data: bytes) -> Any:
+        """Decode MessagePack."""
+        return msgpack.unpackb(data, raw=False, strict_map_key=False)
+
+
+class RawCodec(Codec):
+    """Stores bytes as they are; other values are rejected."""
+
+    name = "raw"
+    tag = 3
+
+    def dumps(self, value: Any) -> bytes:
+        """Return the bytes of a bytes-like value.
+
+        Raises:
+            TypeError: If value is not bytes-like
+        """
+        if not isinstance(value, (bytes, bytearray, memoryview)):
+            raise TypeError(
+                f"raw codec stores bytes only, got {type(value).__name__}"
+            )
+        return bytes(value)
+
+    def loads(self, data: bytes) -> Any:
+        """Return the stored bytes."""
+        return data
+
+
+# Codec classes by configuration name
+CODECS: dict[str, type[Codec]] = {
+    codec.name: codec
+    for codec in (JsonCodec, OrjsonCodec, MsgpackCodec, RawCodec)
+}
+
+# Compression algorithms by configuration name -> header tag
+COMPRESSIONS = {"zlib": 1, "zstd": 2}
+
+
+def get_codec(name: str) -> Codec:
+    """Create a codec from its configuration name.
+
+    Raises:
+        ValueError: If no codec has that name
+        ImportError: If the codec's package is not installed
+    """
+    try:
+        return CODECS[name]()
+    except KeyError:
+        raise ValueError(f"Unsupported codec: {name}") from None
+
+
+class Serializer:
+    """Encodes values for storage with a codec and optional compression.
+
+    Usage:
+        serializer = Serializer(MsgpackCodec(), compression="zlib")
+        stored = serializer.encode({"svg": "<svg>...</svg>"})
+        value = serializer.decode(stored)
+    """
+
+    def __init__(
+        self,
+        codec: Codec | None = None,
+        compression: str | None = None,
+        compress_threshold: int = 1024,
+    ) -> None:
+        """Initialize the serializer.
+
+        Args:
+            codec: Value format (JSON if None)
+            compression: "zlib", "zstd" or None
+            compress_threshold: Payloads of at least this many bytes are
+                compressed (smaller ones rarely shrink)
+
+        Raises:
+            ValueError: If the compression algorithm is unknown
+            ImportError: If zstd is requested but zstandard is missing
+        """
+        if compression is not None and compression not in COMPRESSIONS:
+            raise ValueError(f"Unsupported compression: {compression}")
+        if compression == "zstd" and not ZSTD_AVAILABLE:
+            raise ImportError(
+                "zstd compression requires zstandard package. "
+                "Install with: uv add dotfiles-state-manager[zstd]"
+            )
+
+        self.codec = codec if codec is not None else JsonCodec()
+        self.compression = compression
+        self.compress_threshold = compress_threshold
+        self._decoders: dict[int, Codec] = {self.codec.tag: self.codec}
+
+    @property
+    def binary(self) -> bool:
+        """Whether encoded values are bytes rather than JSON text."""
+        return type(self.codec) is not JsonCodec or bool(self.compression)
+
+    def encode(self, value: Any) -> str | bytes:
+        """Encode a value for storage.
+
+        Args:
+            value: Value to store
+
+        Returns:
+            JSON text for the default JSON codec, header and payload
+            bytes otherwise
+        """
+        if not self.binary:
+            return json.dumps(value)
+
+        payload = self.codec.dumps(value)
+        compression_tag = 0
+        if self.compression and len(payload) >= self.compress_threshold:
+            compressed = self._compress(payload)
+            if len(compressed) < len(payload):
+                payload = compressed
+                compression_tag = COMPRESSIONS[self.compression]
+
+        return bytes((self.codec.tag << 4 | compression_tag,)) + payload
+
+    def decode(self, data: str | bytes) -> Any:
+        """Decode a stored value.
+
+        Args:
+            data: JSON text or bytes produced by encode
+
+        Returns:
+            Decoded value
+
+        Raises:
+            ValueError: If the header names an unknown codec or
+                compression
+        """
+        if isinstance(data, str):
+            return json.loads(data)
+
+        header = data[0]
+        payload = bytes(data[1:])
+        compression_tag = header & 0x0F
+        if compression_tag:
+            payload = self._decompress(compression_tag, payload)
+
+        return self._decoder(header >> 4).loads(payload)
+
+    def _decoder(self, tag: int) -> Codec:
+        """Get a codec able to decode values with the given tag."""
+        codec = self._decoders.get(tag)
+        if codec is None:
+            codec_classes = [c for c in CODECS.values() if c.tag == tag]
+            if not codec_classes:
+                raise ValueError(f"Unknown codec tag in stored value: {tag}")
+            codec = codec_classes[0]()
+            self._decoders[tag] = codec
+        return codec
+
+    def _compress(self, payload: bytes) -> bytes:
+        """Compress a payload with the configured algorithm."""
+        if self.compression == "zstd":
+            return zstandard.ZstdCompressor().compress(payload)
+        return zlib.compress(payload)
+
+    @staticmethod
+    def _decompress(tag: int, payload: bytes) -> bytes:
+        """Decompress a payload compressed with the tagged algorithm."""
+        if tag == COMPRESSIONS["zlib"]:
+            return zlib.decompress(payload)
+        if tag == COMPRESSIONS["zstd"]:
+            if not ZSTD_AVAILABLE:
+                raise ImportError(
+                    "Value is zstd compressed; install zstandard to read it"
+                )
+            return zstandard.ZstdDecompressor().decompress(payload)
+        raise ValueError(f"Unknown compression tag in stored value: {tag}")
@@ -2,9 +2,13 @@
 
 from dotfiles_state_manager.config.config import (
     AppConfig,
+    CacheConfig,
+    CodecConfig,
+    MemoryConfig,
     RedisConfig,
     SQLiteConfig,
     StateManagerConfig,
+    SweeperConfig,
 )
 from dotfiles_state_manager.config.settings import (
     get_default_config,
@@ -16,6 +20,10 @@ __all__ = [
     "StateManagerConfig",
     "SQLiteConfig",
     "RedisConfig",
+    "MemoryConfig",
+    "CacheConfig",
+    "CodecConfig",
+    "SweeperConfig",
     "get_default_config",
     "get_state_manager_config",
 ]
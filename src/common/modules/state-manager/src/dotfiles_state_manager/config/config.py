@@ -17,6 +17,26 @@ class SQLiteConfig(BaseModel):
         default=True,
         description="Enable WAL mode for better concurrency",
     )
+    connection_pool: bool = Field(
+        default=False,
+        description="Give each thread its own read-only connection",
+    )
+    busy_timeout: float = Field(
+        default=5.0,
+        description="Seconds to wait for locks held by other connections",
+    )
+    cache_size_kib: int = Field(
+        default=8192,
+        description="Page cache size per connection in KiB",
+    )
+    mmap_size: int = Field(
+        default=64 * 1024 * 1024,
+        description="Bytes of the database file to memory-map",
+    )
+    notify_interval: float = Field(
+        default=0.1,
+        description="Seconds between checks for changes of subscribed keys",
+    )
     auto_cleanup_enabled: bool = Field(
         default=True,
         description="Enable automatic cleanup of expired keys",
@@ -27,6 +47,19 @@ class SQLiteConfig(BaseModel):
     )
 
 
+class MemoryConfig(BaseModel):
+    """In-memory backend configuration."""
+
+    snapshot_path: Path | None = Field(
+        default=None,
+        description="File to load data from and snapshot it to (None = off)",
+    )
+    snapshot_interval_seconds: float = Field(
+        default=60,
+        description="Seconds between snapshots (0 = only on close)",
+    )
+
+
 class RedisConfig(BaseModel):
     """Redis backend configuration."""
 
@@ -68,10 +101,73 @@ class RedisConfig(BaseModel):
     )
 
 
+class CodecConfig(BaseModel):
+    """Value encoding configuration."""
+
+    format: Literal["json", "orjson", "msgpack", "raw"] = Field(
+        default="json",
+        description="Codec used to encode values",
+    )
+    compression: Literal["zlib", "zstd"] | None = Field(
+        default=None,
+        description="Compression for large values (None = disabled)",
+    )
+    compress_threshold: int = Field(
+        default=1024,
+        description="Minimum encoded size in bytes for compression",
+    )
+
+
+class CacheConfig(BaseModel):
+    """In-process read cache configuration."""
+
+    enabled: bool = Field(
+        default=False,
+        description="Cache reads in memory in front of the backend",
+    )
+    max_bytes: int = Field(
+        default=16 * 1024 * 1024,
+        description="Maximum estimated size of cached values in bytes",
+    )
+    ttl_seconds: float = Field(
+        default=0,
+        description="Maximum age of a cached entry (0 = until invalidated)",
+    )
+    version_check_seconds: float = Field(
+        default=0.05,
+        ge=0,
+        description=(
+            "Minimum interval between checks for writes by other "
+            "processes"
+        ),
+    )
+
+
+class SweeperConfig(BaseModel):
+    """Background expired key sweeper configuration."""
+
+    enabled: bool = Field(
+        default=False,
+        description="Remove expired keys from a background thread",
+    )
+    interval_seconds: float = Field(
+        default=300,
+        description="Seconds between sweeps",
+    )
+    batch_size: int = Field(
+        default=500,
+        description="Rows removed per transaction",
+    )
+    max_rows_per_sweep: int = Field(
+        default=10_000,
+        description="Maximum rows removed by one sweep",
+    )
+
+
 class StateManagerConfig(BaseModel):
     """State manager configuration."""
 
-    backend: Literal["sqlite", "redis"] = Field(
+    backend: Literal["sqlite", "redis", "memory"] = Field(
         default="sqlite",
         description="Backend to use for state persistence",
     )
@@ -87,6 +183,22 @@ class StateManagerConfig(BaseModel):
         default_factory=RedisConfig,
         description="Redis backend configuration",
     )
+    memory: MemoryConfig = Field(
+        default_factory=MemoryConfig,
+        description="In-memory backend configuration",
+    )
+    codec: CodecConfig = Field(
+        default_factory=CodecConfig,
+        description="Value encoding configuration",
+    )
+    cache: CacheConfig = Field(
+        default_factory=CacheConfig,
+        description="In-process read cache configuration",
+    )
+    sweeper: SweeperConfig = Field(
+        default_factory=SweeperConfig,
+        description="Background expired key sweeper configuration",
+    )
 
 
 class AppConfig(BaseModel):
@@ -2,24 +2,94 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+from contextlib import AbstractContextManager
 from typing import Any
 
 from dotfiles_state_manager.backends import (
+    CachedBackend,
+    CacheStats,
+    MemoryBackend,
     RedisBackend,
     SQLiteBackend,
     StateBackend,
 )
+from dotfiles_state_manager.codecs import Serializer, get_codec
 from dotfiles_state_manager.config import (
+    CacheConfig,
     StateManagerConfig,
+    SweeperConfig,
     get_state_manager_config,
 )
+from dotfiles_state_manager.notifications import ChangeCallback, Subscription
+from dotfiles_state_manager.sweeper import ExpirySweeper, SweepStats
+
+
+def create_serializer(config: StateManagerConfig) -> Serializer:
+    """Create the value serializer described by a configuration.
+
+    Raises:
+        ValueError: If the codec or compression is not supported
+    """
+    return Serializer(
+        get_codec(config.codec.format),
+        compression=config.codec.compression,
+        compress_threshold=config.codec.compress_threshold,
+    )
+
+
+def create_backend(config: StateManagerConfig) -> StateBackend:
+    """Create a blocking backend from configuration.
+
+    Args:
+        config: State manager configuration
+
+    Returns:
+        Configured backend instance
+
+    Raises:
+        ValueError: If backend or codec type is not supported
+    """
+    serializer = create_serializer(config)
+
+    if config.backend == "sqlite":
+        return SQLiteBackend(
+            db_path=config.sqlite.db_path,
+            wal_mode=config.sqlite.wal_mode,
+            serializer=serializer,
+            connection_pool=config.sqlite.connection_pool,
+            busy_timeout=config.sqlite.busy_timeout,
+            cache_size_kib=config.sqlite.cache_size_kib,
+            mmap_size=config.sqlite.mmap_size,
+            notify_interval=config.sqlite.notify_interval,
+        )
+    elif config.backend == "redis":
+        return RedisBackend(
+            host=config.redis.host,
+            port=config.redis.port,
+            db=config.redis.db,
+            password=config.redis.password if config.redis.password else None,
+            key_prefix=config.redis.key_prefix,
+            max_connections=config.redis.max_connections,
+            socket_timeout=config.redis.socket_timeout,
+            socket_connect_timeout=config.redis.socket_connect_timeout,
+            serializer=serializer,
+        )
+    elif config.backend == "memory":
+        return MemoryBackend(
+            serializer=serializer,
+            snapshot_path=config.memory.snapshot_path,
+            snapshot_interval=config.memory.snapshot_interval_seconds or None,
+        )
+    else:
+        raise ValueError(f"Unsupported backend: {config.backend}")
 
 
 class StateManager:
     """Main state manager facade.
 
     Provides a unified interface for state persistence that delegates
-    to the configured backend (SQLite or Redis).
+    to the configured backend (SQLite, Redis or memory).
 
     Usage:
         # Use default configuration
@@ -31,18 +101,30 @@ class StateManager:
 
         # Use specific backend directly
         state = StateManager(backend=SQLiteBackend(db_path=Path("custom.db")))
+
+        # Cache reads in memory
+        state = StateManager(cache=CacheConfig(enabled=True))
+
+        # Remove expired keys in the background
+        state = StateManager(sweeper=SweeperConfig(enabled=True))
     """
 
     def __init__(
         self,
         config: StateManagerConfig | None = None,
         backend: StateBackend | None = None,
+        cache: CacheConfig | None = None,
+        sweeper: SweeperConfig | None = None,
     ) -> None:
         """Initialize state manager.
 
         Args:
             config: Configuration for state manager. If None, loads from settings files.
             backend: Specific backend instance to use. If provided, config is ignored.
+            cache: Read cache configuration. If None, uses config.cache
+                (no cache when a backend is given).
+            sweeper: Expired key sweeper configuration. If None, uses
+                config.sweeper (no sweeper when a backend is given).
         """
         if backend is not None:
             self._backend = backend
@@ -50,40 +132,43 @@ class StateManager:
             if config is None:
                 config = get_state_manager_config()
 
-            self._backend = self._create_backend(config)
-
-    def _create_backend(self, config: StateManagerConfig) -> StateBackend:
-        """Create backend from configuration.
-
-        Args:
-            config: State manager configuration
-
-        Returns:
-            Configured backend instance
-
-        Raises:
-            ValueError: If backend type is not supported
-        """
-        if config.backend == "sqlite":
-            return SQLiteBackend(
-                db_path=config.sqlite.db_path,
-                wal_mode=config.sqlite.wal_mode,
+            self._backend = create_backend(config)
+            if cache is None:
+                cache = config.cache
+            if sweeper is None:
+                sweeper = config.sweeper
+
+        if cache is not None and cache.enabled:
+            self._backend = CachedBackend(
+                self._backend,
+                max_bytes=cache.max_bytes,
+                ttl=cache.ttl_seconds or None,
+                version_check_interval=cache.version_check_seconds,
             )
-        elif config.backend == "redis":
-            return RedisBackend(
-                host=config.redis.host,
-                port=config.redis.port,
-                db=config.redis.db,
-                password=config.redis.password
-                if config.redis.password
-                else None,
-                key_prefix=config.redis.key_prefix,
-                max_connections=config.redis.max_connections,
-                socket_timeout=config.redis.socket_timeout,
-                socket_connect_timeout=config.redis.socket_connect_timeout,
+
+        self._sweeper: ExpirySweeper | None = None
+        if sweeper is not None and sweeper.enabled:
+            self._sweeper = ExpirySweeper(
+                self._backend,
+                interval=sweeper.interval_seconds,
+                batch_size=sweeper.batch_size,
+                max_rows=sweeper.max_rows_per_sweep,
             )
-        else:
-            raise ValueError(f"Unsupported backend: {config.backend}")
+            self._sweeper.start()
+
+    @property
+    def cache_stats(self) -> CacheStats | None:
+        """Hit/miss counters of the read cache, or None if disabled."""
+        if isinstance(self._backend, CachedBackend):
+            return self._backend.stats
+        return None
+
+    @property
+    def sweep_stats(self) -> SweepStats | None:
+        """Counters of the expired key sweeper, or None if disabled."""
+        if self._sweeper is not None:
+            return self._sweeper.stats
+        return None
 
     # === Key-Value Operations ===
 
@@ -95,6 +180,14 @@ class StateManager:
         """Retrieve a value for the given key."""
         return self._backend.get(key, default)
 
+    def mset(self, mapping: dict[str, Any]) -> None:
+        """Store several key-value pairs in one operation."""
+        self._backend.mset(mapping)
+
+    def mget(self, keys: list[str], default: Any = None) -> list[Any]:
+        """Retrieve the values of several keys in one operation."""
+        return self._backend.mget(keys, default)
+
     def delete(self, key: str) -> bool:
         """Delete a key."""
         return self._backend.delete(key)
@@ -107,12 +200,25 @@ class StateManager:
         """List all keys, optionally matching a pattern."""
         return self._backend.keys(pattern)
 
+    def scan(
+        self,
+        pattern: str | None = None,
+        type: str | None = None,
+        count: int = 100,
+    ) -> Iterator[str]:
+        """Iterate over keys of any data type, a page at a time."""
+        return self._backend.scan(pattern, type, count)
+
     # === Hash Operations ===
 
     def hset(self, hash_key: str, field: str, value: Any) -> None:
         """Set a field in a hash."""
         self._backend.hset(hash_key, field, value)
 
+    def hmset(self, hash_key: str, mapping: dict[str, Any]) -> None:
+        """Set several fields in a hash in one operation."""
+        self._backend.hmset(hash_key, mapping)
+
     def hget(self, hash_key: str, field: str, default: Any = None) -> Any:
         """Get a field from a hash."""
         return self._backend.hget(hash_key, field, default)
@@ -131,13 +237,17 @@ class StateManager:
 
     # === List Operations ===
 
-    def lpush(self, list_key: str, value: Any) -> None:
-        """Prepend a value to a list."""
-        self._backend.lpush(list_key, value)
+    def lpush(
+        self, list_key: str, value: Any, max_length: int | None = None
+    ) -> None:
+        """Prepend a value to a list, optionally capping its length."""
+        self._backend.lpush(list_key, value, max_length)
 
-    def rpush(self, list_key: str, value: Any) -> None:
-        """Append a value to a list."""
-        self._backend.rpush(list_key, value)
+    def rpush(
+        self, list_key: str, value: Any, max_length: int | None = None
+    ) -> None:
+        """Append a value to a list, optionally capping its length."""
+        self._backend.rpush(list_key, value, max_length)
 
     def lrange(
         self, list_key: str, start: int = 0, end: int = -1
@@ -149,6 +259,10 @@ class StateManager:
         """Get the length of a list."""
         return self._backend.llen(list_key)
 
+    def ltrim(self, list_key: str, start: int, end: int) -> None:
+        """Trim a list to the elements between start and end."""
+        self._backend.ltrim(list_key, start, end)
+
     def lpop(self, list_key: str) -> Any | None:
         """Remove and return the first element of a list."""
         return self._backend.lpop(list_key)
@@ -193,11 +307,40 @@ class StateManager:
         """Remove expiration from a key."""
         return self._backend.persist(key)
 
+    # === Transactions ===
+
+    def transaction(self) -> AbstractContextManager[None]:
+        """Group operations so they are committed together.
+
+        Usage:
+            with state.transaction():
+                state.hset("user:1", "name", "John")
+                state.set("last_user", "user:1")
+        """
+        return self._backend.transaction()
+
+    # === Change Notifications ===
+
+    def subscribe(
+        self, pattern: str, callback: ChangeCallback
+    ) -> Subscription:
+        """Call back whenever a key matching a pattern changes.
+
+        Usage:
+            def on_change(change: KeyChange) -> None:
+                print(change.key, change.event)
+
+            subscription = state.subscribe("wallpaper:*", on_change)
+            ...
+            subscription.cancel()
+        """
+        return self._backend.subscribe(pattern, callback)
+
     # === Maintenance Operations ===
 
-    def cleanup_expired(self) -> int:
-        """Remove all expired keys."""
-        return self._backend.cleanup_expired()
+    def cleanup_expired(self, limit: int | None = None) -> int:
+        """Remove expired keys, at most limit rows if given."""
+        return self._backend.cleanup_expired(limit)
 
     def clear_all(self) -> None:
         """Clear all data (dangerous!)."""
@@ -205,6 +348,8 @@ class StateManager:
 
     def close(self) -> None:
         """Close the backend connection and cleanup resources."""
+        if self._sweeper is not None:
+            self._sweeper.stop()
         self._backend.close()
 
     # === Context Manager Support ===
@@ -0,0 +1,171 @@
+"""Change notifications for state keys."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from fnmatch import fnmatch
+from typing import Any
+
+# Kinds of change reported in KeyChange.event
+CHANGE_EVENTS = ("write", "remove", "expire")
+
+
+@dataclass(frozen=True)
+class KeyChange:
+    """A change made to a key.
+
+    Attributes:
+        key: The key that changed
+        event: "write" (value set or added to), "remove" (value, or part
+            of it such as a hash field, removed or expired) or "expire"
+            (TTL set or removed)
+    """
+
+    key: str
+    event: str
+
+
+ChangeCallback = Callable[[KeyChange], None]
+
+
+class Subscription:
+    """Handle returned by subscribe(); cancel() stops the notifications.
+
+    Usage:
+        with state.subscribe("wallpaper:*", on_change):
+            ...
+
+        subscription = state.subscribe("theme", on_change)
+        subscription.cancel()
+    """
+
+    def __init__(
+        self,
+        registry: SubscriberRegistry,
+        pattern: str,
+        callback: ChangeCallback,
+    ) -> None:
+        """Initialize the subscription.
+
+        Args:
+            registry: Registry the subscription belongs to
+            pattern: Glob-style pattern of the keys to watch
+            callback: Called with a KeyChange for every matching change
+        """
+        self.pattern = pattern
+        self.callback = callback
+        self._registry = registry
+
+    @property
+    def active(self) -> bool:
+        """Whether changes are still delivered to the callback."""
+        return self in self._registry
+
+    def matches(self, key: str) -> bool:
+        """Check if a key is watched by this subscription."""
+        return fnmatch(key, self.pattern)
+
+    def cancel(self) -> None:
+        """Stop delivering changes. Safe to call more than once."""
+        self._registry.remove(self)
+
+    def __enter__(self) -> Subscription:
+        """Enter context manager."""
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Exit context manager, cancelling the subscription."""
+        self.cancel()
+
+
+class SubscriberRegistry:
+    """Subscriptions of a backend, and delivery of changes to them.
+
+    Backends detect changes their own way and hand them to dispatch(),
+    which calls the callbacks of the matching subscriptions. A callback
+    raising an exception is logged and doesn't affect the others.
+    """
+
+    def __init__(self, on_empty: Callable[[], None] | None = None) -> None:
+        """Initialize the registry.
+
+        Args:
+            on_empty: Called when the last subscription is cancelled, so
+                the backend can stop watching for changes
+        """
+        self._on_empty = on_empty
+        self._lock = threading.Lock()
+        self._subscriptions: list[Subscription] = []
+        self._logger = logging.getLogger(__name__)
+
+    def __bool__(self) -> bool:
+        """Whether there is any subscription."""
+        return bool(self._subscriptions)
+
+    def __len__(self) -> int:
+        """Number of subscriptions."""
+        return len(self._subscriptions)
+
+    def __contains__(self, subscription: object) -> bool:
+        """Whether a subscription is active."""
+        return subscription in self._subscriptions
+
+    def add(self, pattern: str, callback: ChangeCallback) -> Subscription:
+        """Register a callback for the keys matching a pattern.
+
+        Args:
+            pattern: Glob-style pattern (e.g., "wallpaper:*")
+            callback: Called with a KeyChange for every matching change
+
+        Returns:
+            The new subscription
+        """
+        subscription = Subscription(self, pattern, callback)
+        with self._lock:
+            self._subscriptions = [*self._subscriptions, subscription]
+        return subscription
+
+    def remove(self, subscription: Subscription) -> None:
+        """Cancel a subscription."""
+        with self._lock:
+            if subscription not in self._subscriptions:
+                return
+            self._subscriptions = [
+                s for s in self._subscriptions if s is not subscription
+            ]
+            emptied = not self._subscriptions
+
+        if emptied and self._on_empty is not None:
+            self._on_empty()
+
+    def clear(self) -> None:
+        """Cancel every subscription without calling on_empty."""
+        with self._lock:
+            self._subscriptions = []
+
+    def dispatch(self, changes: Iterable[KeyChange]) -> None:
+        """Deliver changes to the matching subscriptions.
+
+        Consecutive duplicates (e.g. one change per hash field of the
+        same key) are delivered once.
+        """
+        previous = None
+        for change in changes:
+            if change == previous:
+                continue
+            previous = change
+
+            # The list is replaced, never mutated, so no lock is needed
+            for subscription in self._subscriptions:
+                if not subscription.matches(change.key):
+                    continue
+                try:
+                    subscription.callback(change)
+                except Exception as e:
+                    self._logger.warning(
+                        f"State change callback for '{change.key}' "
+                        f"failed: {e}"
+                    )
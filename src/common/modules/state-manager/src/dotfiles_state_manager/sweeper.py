@@ -0,0 +1,142 @@
+"""Background removal of expired keys."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+
+from dotfiles_state_manager.backends import StateBackend
+
+
+@dataclass
+class SweepStats:
+    """Counters of an ExpirySweeper.
+
+    Attributes:
+        sweeps: Completed sweeps
+        rows_reclaimed: Expired rows removed over all sweeps
+        last_rows: Rows removed by the latest sweep
+        last_duration: Duration of the latest sweep in seconds
+        errors: Sweeps aborted by an exception
+    """
+
+    sweeps: int = 0
+    rows_reclaimed: int = 0
+    last_rows: int = 0
+    last_duration: float = 0.0
+    errors: int = 0
+
+
+class ExpirySweeper:
+    """Periodically removes expired keys from a backend.
+
+    Expired keys are hidden from reads as soon as they expire, but their
+    rows stay in the database until something deletes them. The sweeper
+    does so from a daemon thread, in batches of batch_size rows (each its
+    own short transaction, so other writers are never blocked for long)
+    and at most max_rows per sweep.
+
+    Usage:
+        sweeper = ExpirySweeper(backend, interval=60)
+        sweeper.start()
+        ...
+        sweeper.stop()
+    """
+
+    def __init__(
+        self,
+        backend: StateBackend,
+        interval: float = 300.0,
+        batch_size: int = 500,
+        max_rows: int = 10_000,
+    ) -> None:
+        """Initialize the sweeper.
+
+        Args:
+            backend: Backend to sweep
+            interval: Seconds between sweeps
+            batch_size: Rows removed per transaction
+            max_rows: Rows removed per sweep at most; the rest is left
+                for the next sweep
+        """
+        self.backend = backend
+        self.interval = interval
+        self.batch_size = batch_size
+        self.max_rows = max_rows
+
+        self._logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._stats = SweepStats()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the background thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def stats(self) -> SweepStats:
+        """Snapshot of the sweep counters."""
+        with self._lock:
+            return SweepStats(**vars(self._stats))
+
+    def sweep(self) -> int:
+        """Run one sweep in the calling thread.
+
+        Returns:
+            Number of rows removed
+        """
+        started = time.monotonic()
+        removed = 0
+        try:
+            while removed < self.max_rows:
+                batch = min(self.batch_size, self.max_rows - removed)
+                count = self.backend.cleanup_expired(limit=batch)
+                removed += count
+                if count < batch or self._stop_event.is_set():
+                    break
+        except Exception:
+            with self._lock:
+                self._stats.errors += 1
+                self._stats.rows_reclaimed += removed
+            raise
+
+        with self._lock:
+            self._stats.sweeps += 1
+            self._stats.rows_reclaimed += removed
+            self._stats.last_rows = removed
+            self._stats.last_duration = time.monotonic() - started
+        return removed
+
+    def start(self) -> None:
+        """Start sweeping in a daemon thread."""
+        if self.running:
+            return
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="state-expiry-sweeper", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stop the background thread, finishing the current batch.
+
+        Args:
+            timeout: Seconds to wait for the thread (None = no limit)
+        """
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        """Sweep every interval until stopped."""
+        while not self._stop_event.wait(self.interval):
+            try:
+                self.sweep()
+            except Exception as e:
+                self._logger.warning(f"Expired key sweep failed: {e}")
@@ -0,0 +1,211 @@
+"""Tests for the asyncio state manager."""
+
+import asyncio
+import threading
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from dotfiles_state_manager import (
+    AsyncRedisBackend,
+    AsyncStateManager,
+    CacheConfig,
+    ExecutorBackend,
+    StateManagerConfig,
+)
+from dotfiles_state_manager.backends.async_redis_backend import (
+    REDIS_AVAILABLE,
+)
+
+
+@pytest.fixture
+def async_state(sqlite_backend):
+    """Create an async state manager around a SQLite backend."""
+    return AsyncStateManager(backend=sqlite_backend)
+
+
+class TestAsyncStateManager:
+    """Test awaitable operations on a blocking backend."""
+
+    @pytest.mark.asyncio
+    async def test_operations(self, async_state):
+        """Test operations of every data type."""
+        await async_state.set("key", {"a": 1})
+        await async_state.mset({"b": 2, "c": 3})
+        await async_state.hmset("hash", {"f1": "v1", "f2": "v2"})
+        await async_state.rpush("list", "x", max_length=2)
+        await async_state.rpush("list", "y", max_length=2)
+        await async_state.rpush("list", "z", max_length=2)
+        await async_state.sadd("set", "a", "b")
+
+        assert await async_state.get("key") == {"a": 1}
+        assert await async_state.mget(["b", "c", "d"], 0) == [2, 3, 0]
+        assert await async_state.hgetall("hash") == {"f1": "v1", "f2": "v2"}
+        assert await async_state.lrange("list") == ["y", "z"]
+        assert await async_state.smembers("set") == {"a", "b"}
+        assert await async_state.keys() == ["b", "c", "key"]
+
+    @pytest.mark.asyncio
+    async def test_runs_off_the_event_loop(self, async_state, sqlite_backend):
+        """Test backend calls run on the dedicated thread."""
+        threads = []
+        get = sqlite_backend.get
+
+        def recording_get(key, default=None):
+            threads.append(threading.current_thread())
+            return get(key, default)
+
+        sqlite_backend.get = recording_get
+        await async_state.get("key")
+        await async_state.get("key")
+
+        assert threads[0] is not threading.current_thread()
+        assert threads[0] is threads[1]
+
+    @pytest.mark.asyncio
+    async def test_scan(self, async_state):
+        """Test scan yields keys across pages."""
+        await async_state.mset({f"key:{i}": i for i in range(5)})
+        await async_state.hset("hash", "f", 1)
+
+        keys = [key async for key in async_state.scan("key:*", count=2)]
+
+        assert sorted(keys) == [f"key:{i}" for i in range(5)]
+
+    @pytest.mark.asyncio
+    async def test_transaction_rollback(self, async_state):
+        """Test a failing transaction discards its writes."""
+        await async_state.set("key", "committed")
+
+        with pytest.raises(RuntimeError):
+            async with async_state.transaction():
+                await async_state.set("key", "rolled back")
+                async with async_state.transaction():
+                    await async_state.set("other", 1)
+                raise RuntimeError("boom")
+
+        assert await async_state.get("key") == "committed"
+        assert not await async_state.exists("other")
+
+    @pytest.mark.asyncio
+    async def test_transaction_isolated_from_other_tasks(self, async_state):
+        """Test other tasks' writes wait for the transaction to end."""
+        started = asyncio.Event()
+
+        async def writer():
+            await started.wait()
+            await async_state.set("other", "written")
+
+        async def failing_transaction():
+            async with async_state.transaction():
+                await async_state.set("key", "rolled back")
+                started.set()
+                await asyncio.sleep(0.05)
+                raise RuntimeError("boom")
+
+        results = await asyncio.gather(
+            failing_transaction(), writer(), return_exceptions=True
+        )
+
+        assert isinstance(results[0], RuntimeError)
+        assert await async_state.get("other") == "written"
+        assert await async_state.get("key") is None
+
+    @pytest.mark.asyncio
+    async def test_config(self, tmp_path):
+        """Test the configured SQLite backend and cache are used."""
+        config = StateManagerConfig(cache=CacheConfig(enabled=True))
+        config.sqlite.db_path = tmp_path / "state.db"
+
+        async with AsyncStateManager(config=config) as state:
+            await state.set("key", "value")
+            await state.get("key")
+            await state.get("key")
+
+            assert isinstance(state._backend, ExecutorBackend)
+            assert state.cache_stats.hits == 1
+
+
+@pytest.mark.skipif(not REDIS_AVAILABLE, reason="redis package not installed")
+class TestAsyncRedisBackend:
+    """Test the redis.asyncio backend."""
+
+    @pytest.fixture
+    def client(self):
+        """Create a mock asyncio Redis client."""
+        client = AsyncMock()
+        client.pipeline = MagicMock()
+        return client
+
+    @pytest.fixture
+    def backend(self, client):
+        """Create an asyncio Redis backend talking to a mock client."""
+        with patch(
+            "dotfiles_state_manager.backends.async_redis_backend"
+            ".aioredis.Redis",
+            return_value=client,
+        ):
+            return AsyncRedisBackend(key_prefix="test:")
+
+    @pytest.mark.asyncio
+    async def test_get_and_set(self, backend, client):
+        """Test values are prefixed and serialized."""
+        client.get.return_value = '{"a": 1}'
+
+        await backend.set("key", [1])
+
+        assert await backend.get("key") == {"a": 1}
+        client.set.assert_awaited_once_with("test:key", "[1]")
+        client.get.assert_awaited_once_with("test:key")
+
+    @pytest.mark.asyncio
+    async def test_transaction_pipelines_writes(self, backend, client):
+        """Test writes in a transaction are queued and executed once."""
+        pipeline = client.pipeline.return_value
+        pipeline.execute = AsyncMock()
+
+        await backend.rpush("history", "event", max_length=100)
+
+        pipeline.rpush.assert_called_once_with("test:history", '"event"')
+        pipeline.ltrim.assert_called_once_with("test:history", -100, -1)
+        pipeline.execute.assert_awaited_once()
+        client.rpush.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_transaction_reset_on_error(self, backend, client):
+        """Test a failing transaction discards its pipeline."""
+        pipeline = client.pipeline.return_value
+        pipeline.execute = AsyncMock()
+        pipeline.reset = AsyncMock()
+
+        with pytest.raises(RuntimeError):
+            async with backend.transaction():
+                await backend.set("key", 1)
+                raise RuntimeError("boom")
+
+        pipeline.reset.assert_awaited_once()
+        pipeline.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_scan(self, backend, client):
+        """Test scan strips the prefix."""
+
+        async def scan_iter(**kwargs):
+            for key in ("test:a", "test:b"):
+                yield key
+
+        client.scan_iter = MagicMock(side_effect=scan_iter)
+
+        assert await backend.keys() == ["a", "b"]
+
+    def test_state_manager_uses_asyncio_redis(self):
+        """Test a Redis configuration selects the asyncio backend."""
+        with patch(
+            "dotfiles_state_manager.backends.async_redis_backend"
+            ".aioredis.Redis"
+        ):
+            state = AsyncStateManager(
+                config=StateManagerConfig(backend="redis")
+            )
+
+        assert isinstance(state._backend, AsyncRedisBackend)
@@ -0,0 +1,303 @@
+"""Tests for the in-process read cache."""
+
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from dotfiles_state_manager import (
+    CacheConfig,
+    CachedBackend,
+    JsonCodec,
+    MsgpackCodec,
+    OrjsonCodec,
+    RawCodec,
+    Serializer,
+    SQLiteBackend,
+    StateManager,
+)
+from dotfiles_state_manager.codecs import MSGPACK_AVAILABLE, ORJSON_AVAILABLE
+
+# Values each codec changes on the way through the backend
+CODEC_VALUES = [
+    pytest.param(JsonCodec, {"t": (1, 2), "n": [None, 1.5]}, id="json"),
+    pytest.param(
+        OrjsonCodec,
+        {"t": (1, 2), "n": [None, 1.5]},
+        id="orjson",
+        marks=pytest.mark.skipif(
+            not ORJSON_AVAILABLE, reason="orjson missing"
+        ),
+    ),
+    pytest.param(
+        MsgpackCodec,
+        {1: [1, 2], "t": (b"\x00", (3,))},
+        id="msgpack",
+        marks=pytest.mark.skipif(
+            not MSGPACK_AVAILABLE, reason="msgpack missing"
+        ),
+    ),
+    pytest.param(RawCodec, b"\x00\xff", id="raw"),
+]
+
+
+@pytest.fixture
+def cached_backend(sqlite_backend):
+    """Create a cache in front of a SQLite backend."""
+    return CachedBackend(sqlite_backend)
+
+
+class TestCachedBackendReads:
+    """Test reads are served from memory."""
+
+    def test_get_hit(self, cached_backend, sqlite_backend):
+        """Test a second get doesn't reach the backend."""
+        cached_backend.set("key", {"a": 1})
+
+        assert cached_backend.get("key") == {"a": 1}
+        with patch.object(sqlite_backend, "get") as backend_get:
+            assert cached_backend.get("key") == {"a": 1}
+        backend_get.assert_not_called()
+
+        stats = cached_backend.stats
+        assert (stats.hits, stats.misses) == (1, 1)
+        assert stats.entries == 1
+        assert stats.hit_rate == 0.5
+
+    def test_missing_key_is_cached(self, cached_backend):
+        """Test misses are cached and still return the caller's default."""
+        assert cached_backend.get("missing") is None
+        assert cached_backend.get("missing", "d") == "d"
+        assert cached_backend.stats.hits == 1
+
+    def test_hits_return_copies(self, cached_backend):
+        """Test mutating a returned value doesn't corrupt the cache."""
+        cached_backend.hset("hash", "field", [1])
+
+        cached_backend.hgetall("hash")["field"].append(2)
+        cached_backend.hgetall("hash")["other"] = 3
+
+        assert cached_backend.hgetall("hash") == {"field": [1]}
+
+    def test_mget_fetches_only_uncached(self, cached_backend, sqlite_backend):
+        """Test mget asks the backend for the uncached keys only."""
+        cached_backend.mset({"a": 1, "b": 2})
+        cached_backend.get("a")
+
+        with patch.object(
+            sqlite_backend,
+            "mget_with_ttl",
+            wraps=sqlite_backend.mget_with_ttl,
+        ) as backend_mget:
+            values = cached_backend.mget(["a", "b", "c"], 0)
+
+        assert values == [1, 2, 0]
+        assert backend_mget.call_args.args[0] == ["b", "c"]
+        assert cached_backend.mget(["a", "b", "c"], 0) == [1, 2, 0]
+        assert cached_backend.stats.hits == 4
+
+    @pytest.mark.parametrize(("codec", "value"), CODEC_VALUES)
+    def test_hit_equals_miss(self, temp_db, codec, value):
+        """Test a hit returns exactly what the backend returned."""
+        backend = CachedBackend(
+            SQLiteBackend(db_path=temp_db, serializer=Serializer(codec()))
+        )
+        backend.mset({"key": value, "other": value})
+        backend.hset("hash", "field", value)
+
+        for read in (
+            lambda: backend.get("key"),
+            lambda: backend.mget(["other"])[0],
+            lambda: backend.hget("hash", "field"),
+            lambda: backend.hgetall("hash")["field"],
+        ):
+            miss = read()
+            hit = read()
+            assert hit == miss
+            assert repr(hit) == repr(miss)
+        assert backend.stats.hits == 4
+        backend.close()
+
+    def test_misses_read_ttl_with_value(self, cached_backend, sqlite_backend):
+        """Test misses don't make a separate ttl call."""
+        cached_backend.set("key", 1)
+        cached_backend.hset("hash", "field", 1)
+
+        with patch.object(sqlite_backend, "ttl") as backend_ttl:
+            cached_backend.get("key")
+            cached_backend.mget(["key", "other"])
+            cached_backend.hget("hash", "field")
+            cached_backend.hgetall("hash")
+
+        backend_ttl.assert_not_called()
+
+    def test_hget(self, cached_backend):
+        """Test hash fields are cached separately."""
+        cached_backend.hmset("hash", {"f1": "v1", "f2": "v2"})
+
+        assert cached_backend.hget("hash", "f1") == "v1"
+        assert cached_backend.hget("hash", "f1") == "v1"
+        assert cached_backend.hget("hash", "f3", "d") == "d"
+        assert cached_backend.stats.hits == 1
+
+
+class TestCachedBackendInvalidation:
+    """Test cached entries never go stale."""
+
+    def test_writes_invalidate(self, cached_backend):
+        """Test every write drops the cached entries of its key."""
+        cached_backend.hset("hash", "field", 1)
+        cached_backend.hget("hash", "field")
+        cached_backend.hgetall("hash")
+
+        cached_backend.hset("hash", "field", 2)
+
+        assert cached_backend.hget("hash", "field") == 2
+        assert cached_backend.hgetall("hash") == {"field": 2}
+        assert cached_backend.stats.invalidations == 2
+
+        cached_backend.set("key", 1)
+        cached_backend.get("key")
+        cached_backend.delete("key")
+        assert cached_backend.get("key") is None
+
+    def test_other_connection_write(self, sqlite_backend, temp_db):
+        """Test commits by another connection are detected."""
+        cached_backend = CachedBackend(
+            sqlite_backend, version_check_interval=0
+        )
+        cached_backend.set("key", "old")
+        cached_backend.get("key")
+
+        other = SQLiteBackend(db_path=temp_db)
+        other.set("key", "new")
+        other.close()
+
+        assert cached_backend.get("key") == "new"
+
+    def test_version_checks_are_throttled(self, sqlite_backend):
+        """Test hits check data_version at most once per interval."""
+        backend = CachedBackend(sqlite_backend, version_check_interval=60)
+        backend.get("key")
+
+        with patch.object(sqlite_backend, "data_version") as data_version:
+            for _ in range(10):
+                backend.get("key")
+
+        data_version.assert_not_called()
+
+    def test_version_check_doesnt_wait_for_writer(self, sqlite_backend):
+        """Test data_version returns while another thread writes."""
+        version = sqlite_backend.data_version()
+        locked = threading.Event()
+        release = threading.Event()
+
+        def hold_writer():
+            with sqlite_backend.transaction():
+                locked.set()
+                release.wait(5)
+
+        writer = threading.Thread(target=hold_writer)
+        writer.start()
+        locked.wait(5)
+        try:
+            assert sqlite_backend.data_version() == version
+        finally:
+            release.set()
+            writer.join()
+
+    def test_key_ttl_is_respected(self, cached_backend):
+        """Test entries don't outlive the TTL of their key."""
+        cached_backend.set("short", 1)
+        cached_backend.expire("short", 1)
+        cached_backend.set("long", 1)
+        cached_backend.expire("long", 3600)
+
+        cached_backend.get("short")
+        cached_backend.get("long")
+
+        assert cached_backend.stats.entries == 1
+
+    def test_cache_ttl(self, sqlite_backend):
+        """Test entries expire after the configured maximum age."""
+        backend = CachedBackend(sqlite_backend, ttl=10)
+        backend.set("key", 1)
+        backend.get("key")
+
+        with patch(
+            "dotfiles_state_manager.backends.cached_backend.time.monotonic",
+            return_value=1e12,
+        ):
+            backend.get("key")
+
+        assert backend.stats.misses == 2
+
+    def test_transaction_rollback_clears(self, cached_backend):
+        """Test rolled back writes are not served from memory."""
+        cached_backend.set("key", "committed")
+
+        with pytest.raises(RuntimeError), cached_backend.transaction():
+            cached_backend.set("key", "rolled back")
+            assert cached_backend.get("key") == "rolled back"
+            raise RuntimeError("boom")
+
+        assert cached_backend.get("key") == "committed"
+
+    def test_clear_all(self, cached_backend):
+        """Test clear_all empties the cache."""
+        cached_backend.set("key", 1)
+        cached_backend.get("key")
+
+        cached_backend.clear_all()
+
+        assert cached_backend.get("key") is None
+
+
+class TestCachedBackendEviction:
+    """Test the cache stays within its byte budget."""
+
+    def test_lru_eviction(self, sqlite_backend):
+        """Test the least recently used entries are evicted first."""
+        backend = CachedBackend(sqlite_backend, max_bytes=700)
+        for key in ("a", "b", "c"):
+            backend.set(key, "x" * 10)
+            backend.get(key)
+        backend.get("a")  # Refresh a, making b the oldest
+
+        backend.set("d", "x" * 10)
+        backend.get("d")
+
+        stats = backend.stats
+        assert stats.evictions == 1
+        assert stats.size_bytes <= 700
+        backend.get("a")
+        assert backend.stats.hits == 2
+
+    def test_oversized_values_are_not_cached(self, sqlite_backend):
+        """Test values larger than the budget bypass the cache."""
+        backend = CachedBackend(sqlite_backend, max_bytes=300)
+        backend.set("big", "x" * 1000)
+
+        assert backend.get("big") == "x" * 1000
+        assert backend.stats.entries == 0
+
+
+class TestStateManagerCache:
+    """Test StateManager's cache option."""
+
+    def test_disabled_by_default(self, state_manager):
+        """Test no cache is used unless configured."""
+        assert state_manager.cache_stats is None
+
+    def test_enabled(self, sqlite_backend):
+        """Test the backend is wrapped when the cache is enabled."""
+        state = StateManager(
+            backend=sqlite_backend,
+            cache=CacheConfig(enabled=True, max_bytes=1024),
+        )
+        state.set("key", "value")
+        state.get("key")
+        state.get("key")
+
+        assert state.cache_stats.hits == 1
+        assert state.cache_stats.misses == 1
@@ -0,0 +1,150 @@
+"""Tests for value codecs."""
+
+import pytest
+
+from dotfiles_state_manager import (
+    CodecConfig,
+    JsonCodec,
+    MsgpackCodec,
+    OrjsonCodec,
+    RawCodec,
+    Serializer,
+    SQLiteBackend,
+    StateManager,
+    StateManagerConfig,
+    get_codec,
+)
+from dotfiles_state_manager.codecs import (
+    MSGPACK_AVAILABLE,
+    ORJSON_AVAILABLE,
+    ZSTD_AVAILABLE,
+)
+
+VALUE = {"name": "John", "tags": ["a", "b"], "age": 42, "ok": True}
+
+
+class TestSerializer:
+    """Test encoding and decoding values."""
+
+    def test_default_is_json_text(self):
+        """Test the default serializer keeps storing JSON text."""
+        serializer = Serializer()
+
+        assert not serializer.binary
+        assert serializer.encode(VALUE) == (
+            '{"name": "John", "tags": ["a", "b"], "age": 42, "ok": true}'
+        )
+        assert serializer.decode(serializer.encode(VALUE)) == VALUE
+
+    @pytest.mark.skipif(not MSGPACK_AVAILABLE, reason="msgpack missing")
+    def test_msgpack(self):
+        """Test msgpack values are tagged bytes."""
+        serializer = Serializer(MsgpackCodec())
+        encoded = serializer.encode(VALUE)
+
+        assert isinstance(encoded, bytes)
+        assert encoded[0] == MsgpackCodec.tag << 4
+        assert serializer.decode(encoded) == VALUE
+
+    @pytest.mark.skipif(not ORJSON_AVAILABLE, reason="orjson missing")
+    def test_orjson_reads_json(self):
+        """Test orjson and json share a format."""
+        encoded = Serializer(OrjsonCodec()).encode(VALUE)
+
+        assert Serializer(JsonCodec(), "zlib").decode(encoded) == VALUE
+
+    def test_raw(self):
+        """Test raw bytes round-trip and other values are rejected."""
+        serializer = Serializer(RawCodec())
+
+        assert serializer.decode(serializer.encode(b"\x00\xff")) == b"\x00\xff"
+        with pytest.raises(TypeError, match="bytes only"):
+            serializer.encode("text")
+
+    def test_compression_threshold(self):
+        """Test only values above the threshold are compressed."""
+        serializer = Serializer(compression="zlib", compress_threshold=100)
+
+        small = serializer.encode("x")
+        large = serializer.encode("x" * 1000)
+
+        assert small[0] & 0x0F == 0
+        assert large[0] & 0x0F == 1
+        assert len(large) < 100
+        assert serializer.decode(large) == "x" * 1000
+
+    @pytest.mark.skipif(not ZSTD_AVAILABLE, reason="zstandard missing")
+    def test_zstd(self):
+        """Test zstd compression round-trips."""
+        serializer = Serializer(compression="zstd", compress_threshold=0)
+
+        assert serializer.decode(serializer.encode(VALUE)) == VALUE
+
+    def test_reads_other_codecs(self):
+        """Test values stay readable after switching codec."""
+        stored = [
+            Serializer().encode(VALUE),
+            Serializer(compression="zlib", compress_threshold=0).encode(
+                VALUE
+            ),
+        ]
+
+        reader = Serializer(RawCodec())
+        assert [reader.decode(value) for value in stored] == [VALUE, VALUE]
+
+    def test_unknown_names(self):
+        """Test unknown codec and compression names are rejected."""
+        with pytest.raises(ValueError, match="Unsupported codec"):
+            get_codec("xml")
+        with pytest.raises(ValueError, match="Unsupported compression"):
+            Serializer(compression="lzma")
+
+
+class TestBackendCodecs:
+    """Test backends storing encoded values."""
+
+    def test_sqlite_stores_blobs(self, temp_db):
+        """Test binary encodings are stored as BLOBs and read back."""
+        backend = SQLiteBackend(
+            db_path=temp_db, serializer=Serializer(RawCodec())
+        )
+        svg = b"<svg>" + b"\x00" * 10 + b"</svg>"
+
+        backend.set("svg", svg)
+        backend.hset("hash", "field", b"data")
+        backend.sadd("set", b"member")
+
+        assert backend.get("svg") == svg
+        assert backend.hgetall("hash") == {"field": b"data"}
+        assert backend.sismember("set", b"member")
+        stored_type = backend.conn.execute(
+            "SELECT typeof(value) FROM kv_store WHERE key = 'svg'"
+        ).fetchone()[0]
+        assert stored_type == "blob"
+        backend.close()
+
+    def test_sqlite_mixed_rows(self, temp_db):
+        """Test JSON rows written earlier stay readable."""
+        backend = SQLiteBackend(db_path=temp_db)
+        backend.set("old", VALUE)
+        backend.close()
+
+        backend = SQLiteBackend(
+            db_path=temp_db, serializer=Serializer(compression="zlib")
+        )
+        backend.set("new", "x" * 5000)
+
+        assert backend.mget(["old", "new"]) == [VALUE, "x" * 5000]
+        backend.close()
+
+    def test_state_manager_config(self, tmp_path):
+        """Test the configured codec reaches the backend."""
+        config = StateManagerConfig(
+            codec=CodecConfig(format="raw", compression="zlib")
+        )
+        config.sqlite.db_path = tmp_path / "state.db"
+
+        with StateManager(config=config) as state:
+            state.set("key", b"bytes")
+            assert state.get("key") == b"bytes"
+            assert isinstance(state._backend.serializer.codec, RawCodec)
@@ -0,0 +1,325 @@
+"""Tests for the in-memory backend."""
+
+import json
+import time
+
+import pytest
+
+from dotfiles_state_manager import (
+    MemoryBackend,
+    MemoryConfig,
+    StateManager,
+    StateManagerConfig,
+)
+from dotfiles_state_manager.manager import create_backend
+
+
+@pytest.fixture
+def memory_backend():
+    """Create a memory backend without snapshots."""
+    backend = MemoryBackend()
+    yield backend
+    backend.close()
+
+
+class TestMemoryBackendOperations:
+    """Test the StateBackend operations."""
+
+    def test_key_value(self, memory_backend):
+        """Test set, get, delete and exists."""
+        memory_backend.set("key", {"a": [1, 2]})
+        assert memory_backend.get("key") == {"a": [1, 2]}
+        assert memory_backend.exists("key")
+
+        assert memory_backend.delete("key")
+        assert not memory_backend.delete("key")
+        assert memory_backend.get("key", "default") == "default"
+
+    def test_none_value(self, memory_backend):
+        """Test a stored None is distinct from a missing key."""
+        memory_backend.set("null", None)
+        assert memory_backend.exists("null")
+        assert memory_backend.get("null", "default") is None
+
+    def test_returned_values_are_copies(self, memory_backend):
+        """Test mutating a returned value doesn't change the stored one."""
+        memory_backend.set("key", [1])
+        memory_backend.get("key").append(2)
+        assert memory_backend.get("key") == [1]
+
+    def test_mset_and_mget(self, memory_backend):
+        """Test batch writes and reads."""
+        memory_backend.mset({"a": 1, "b": 2})
+        assert memory_backend.mget(["a", "missing", "b"], 0) == [1, 0, 2]
+
+    def test_hash(self, memory_backend):
+        """Test hash operations."""
+        memory_backend.hset("user", "name", "John")
+        memory_backend.hmset("user", {"email": "john@example.com"})
+
+        assert memory_backend.hget("user", "name") == "John"
+        assert memory_backend.hgetall("user") == {
+            "name": "John",
+            "email": "john@example.com",
+        }
+        assert memory_backend.hexists("user", "email")
+
+        assert memory_backend.hdel("user", "name")
+        assert memory_backend.hdel("user", "email")
+        assert not memory_backend.hdel("user", "email")
+        assert list(memory_backend.scan()) == []
+
+    def test_list(self, memory_backend):
+        """Test list pushes, pops, ranges and trims."""
+        memory_backend.rpush("list", 2)
+        memory_backend.rpush("list", 3)
+        memory_backend.lpush("list", 1)
+
+        assert memory_backend.lrange("list") == [1, 2, 3]
+        assert memory_backend.lrange("list", -2, 10) == [2, 3]
+        assert memory_backend.lrange("list", 2, 1) == []
+        assert memory_backend.llen("list") == 3
+
+        memory_backend.ltrim("list", 1, -1)
+        assert memory_backend.lrange("list") == [2, 3]
+        assert memory_backend.lpop("list") == 2
+        assert memory_backend.rpop("list") == 3
+        assert memory_backend.rpop("list") is None
+
+    def test_capped_push(self, memory_backend):
+        """Test max_length keeps the newest elements."""
+        for value in range(5):
+            memory_backend.rpush("tail", value, max_length=3)
+            memory_backend.lpush("head", value, max_length=3)
+
+        assert memory_backend.lrange("tail") == [2, 3, 4]
+        assert memory_backend.lrange("head") == [4, 3, 2]
+
+    def test_set(self, memory_backend):
+        """Test set operations, including unhashable members."""
+        assert memory_backend.sadd("tags", "a", "b", "a") == 2
+        assert memory_backend.sadd("tags", ["list"]) == 1
+        assert memory_backend.sismember("tags", ["list"])
+        assert memory_backend.scard("tags") == 3
+
+        assert memory_backend.srem("tags", "a", ["list"], "missing") == 2
+        assert memory_backend.smembers("tags") == {"b"}
+
+    def test_scan(self, memory_backend):
+        """Test scan covers every type, sorted, each key once."""
+        memory_backend.set("b", 1)
+        memory_backend.hset("a", "field", 1)
+        memory_backend.rpush("c", 1)
+        memory_backend.sadd("b", 1)
+
+        assert list(memory_backend.scan()) == ["a", "b", "c"]
+        assert list(memory_backend.scan(type="hash")) == ["a"]
+        assert memory_backend.keys() == ["b"]
+        with pytest.raises(ValueError):
+            list(memory_backend.scan(type="zset"))
+
+    def test_scan_allows_writes(self, memory_backend):
+        """Test keys can be deleted while scanning."""
+        memory_backend.mset({f"key{i}": i for i in range(10)})
+        for key in memory_backend.scan():
+            memory_backend.delete(key)
+        assert memory_backend.keys() == []
+
+
+class TestMemoryBackendExpiry:
+    """Test TTL handling."""
+
+    def test_ttl_and_persist(self, memory_backend):
+        """Test expire, ttl and persist."""
+        memory_backend.hset("hash", "field", 1)
+        assert memory_backend.ttl("hash") is None
+        assert memory_backend.ttl("missing") == -2
+
+        assert memory_backend.expire("hash", 100)
+        assert 99 <= memory_backend.ttl("hash") <= 100
+        assert memory_backend.persist("hash")
+        assert not memory_backend.persist("hash")
+        assert not memory_backend.expire("missing", 100)
+
+    def test_set_clears_expiry(self, memory_backend):
+        """Test overwriting a string removes its TTL."""
+        memory_backend.set("key", 1)
+        memory_backend.expire("key", 100)
+        memory_backend.set("key", 2)
+        assert memory_backend.ttl("key") is None
+
+    def test_expired_keys_are_hidden(self, memory_backend):
+        """Test expired keys read as missing."""
+        memory_backend.set("key", 1)
+        memory_backend.sadd("set", 1)
+        memory_backend.expire("key", -1)
+        memory_backend.expire("set", -1)
+
+        assert memory_backend.get("key") is None
+        assert memory_backend.smembers("set") == set()
+        assert list(memory_backend.scan()) == []
+        assert memory_backend.ttl("key") == -2
+
+    def test_cleanup_expired_limit(self, memory_backend):
+        """Test cleanup removes at most limit expired keys."""
+        for i in range(5):
+            memory_backend.set(f"key{i}", i)
+            memory_backend.expire(f"key{i}", -1)
+        memory_backend.set("live", 1)
+
+        assert memory_backend.cleanup_expired(limit=3) == 3
+        assert memory_backend.cleanup_expired() == 2
+        assert memory_backend.keys() == ["live"]
+
+
+class TestMemoryBackendTransactions:
+    """Test transactions."""
+
+    def test_rollback(self, memory_backend):
+        """Test a failing transaction restores every touched key."""
+        memory_backend.set("key", "before")
+        memory_backend.rpush("list", 1)
+        memory_backend.expire("list", 100)
+
+        with pytest.raises(RuntimeError), memory_backend.transaction():
+            memory_backend.set("key", "after")
+            memory_backend.set("new", 1)
+            memory_backend.rpush("list", 2)
+            memory_backend.persist("list")
+            memory_backend.hset("hash", "field", 1)
+            raise RuntimeError
+
+        assert memory_backend.get("key") == "before"
+        assert not memory_backend.exists("new")
+        assert memory_backend.lrange("list") == [1]
+        assert memory_backend.ttl("list") is not None
+        assert memory_backend.hgetall("hash") == {}
+
+    def test_nested_commit(self, memory_backend):
+        """Test nested transactions commit with the outermost one."""
+        with memory_backend.transaction():
+            memory_backend.set("a", 1)
+            with memory_backend.transaction():
+                memory_backend.set("b", 2)
+
+        assert memory_backend.mget(["a", "b"]) == [1, 2]
+
+    def test_clear_all_rollback(self, memory_backend):
+        """Test clear_all inside a failed transaction is undone."""
+        memory_backend.mset({"a": 1, "b": 2})
+
+        with pytest.raises(RuntimeError), memory_backend.transaction():
+            memory_backend.clear_all()
+            raise RuntimeError
+
+        assert memory_backend.keys() == ["a", "b"]
+
+
+class TestMemoryBackendSnapshots:
+    """Test snapshot persistence."""
+
+    def test_save_and_load(self, tmp_path):
+        """Test data survives a close and reopen."""
+        path = tmp_path / "state.json"
+        backend = MemoryBackend(snapshot_path=path)
+        backend.set("key", "value")
+        backend.hmset("hash", {"a": 1})
+        backend.rpush("list", 1)
+        backend.rpush("list", 2)
+        backend.sadd("set", "x")
+        backend.expire("hash", 100)
+        backend.set("gone", 1)
+        backend.expire("gone", -1)
+        backend.close()
+
+        backend = MemoryBackend(snapshot_path=path)
+        assert backend.get("key") == "value"
+        assert backend.hgetall("hash") == {"a": 1}
+        assert 99 <= backend.ttl("hash") <= 100
+        assert backend.lrange("list") == [1, 2]
+        assert backend.smembers("set") == {"x"}
+        assert not backend.exists("gone")
+        backend.close()
+
+    def test_binary_values(self, tmp_path):
+        """Test bytes written by a binary serializer are restored."""
+        from dotfiles_state_manager import RawCodec, Serializer
+
+        path = tmp_path / "state.json"
+        serializer = Serializer(RawCodec())
+        backend = MemoryBackend(serializer=serializer, snapshot_path=path)
+        backend.set("icon", b"\x00\xff")
+        backend.close()
+
+        backend = MemoryBackend(serializer=serializer, snapshot_path=path)
+        assert backend.get("icon") == b"\x00\xff"
+        backend.close()
+
+    def test_save_only_when_changed(self, tmp_path):
+        """Test save skips writing an unchanged snapshot."""
+        backend = MemoryBackend(snapshot_path=tmp_path / "state.json")
+        backend.set("key", 1)
+
+        assert backend.save()
+        assert not backend.save()
+        backend.set("key", 2)
+        assert backend.save()
+        backend.close()
+
+    def test_snapshot_is_json(self, tmp_path):
+        """Test the snapshot file is a versioned JSON document."""
+        path = tmp_path / "state.json"
+        backend = MemoryBackend(snapshot_path=path)
+        backend.set("key", 1)
+        backend.save()
+
+        document = json.loads(path.read_text())
+        assert document["version"] == 1
+        assert "key" in document["keys"]["string"]
+        assert list(tmp_path.iterdir()) == [path]
+        backend.close()
+
+    def test_save_without_path(self, memory_backend):
+        """Test save requires a snapshot path."""
+        with pytest.raises(ValueError):
+            memory_backend.save()
+
+    def test_periodic_snapshots(self, tmp_path):
+        """Test the background thread writes snapshots."""
+        path = tmp_path / "state.json"
+        backend = MemoryBackend(snapshot_path=path, snapshot_interval=0.01)
+        backend.set("key", 1)
+
+        for _ in range(200):
+            if path.exists():
+                break
+            time.sleep(0.01)
+
+        assert path.exists()
+        backend.close()
+
+
+class TestMemoryBackendConfig:
+    """Test selecting the backend through configuration."""
+
+    def test_create_backend(self, tmp_path):
+        """Test backend = "memory" creates a MemoryBackend."""
+        config = StateManagerConfig(
+            backend="memory",
+            memory=MemoryConfig(
+                snapshot_path=tmp_path / "state.json",
+                snapshot_interval_seconds=0,
+            ),
+        )
+        backend = create_backend(config)
+
+        assert isinstance(backend, MemoryBackend)
+        assert backend.snapshot_path == tmp_path / "state.json"
+        assert backend.snapshot_interval is None
+        backend.close()
+
+    def test_state_manager(self):
+        """Test StateManager works on a memory backend."""
+        with StateManager(config=StateManagerConfig(backend="memory")) as sm:
+            sm.set("key", "value")
+            assert sm.get("key") == "value"
@@ -0,0 +1,335 @@
+"""Tests for key change notifications."""
+
+import queue
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from dotfiles_state_manager import (
+    KeyChange,
+    MemoryBackend,
+    SQLiteBackend,
+    StateManager,
+)
+from dotfiles_state_manager.backends.redis_backend import REDIS_AVAILABLE
+from dotfiles_state_manager.notifications import SubscriberRegistry
+
+
+def _collect() -> tuple[list[KeyChange], MagicMock]:
+    """Create a callback appending the changes it receives to a list."""
+    changes: list[KeyChange] = []
+    return changes, MagicMock(side_effect=changes.append)
+
+
+class TestSubscriberRegistry:
+    """Test delivery to subscriptions."""
+
+    def test_dispatch_matches_pattern(self):
+        """Test only subscriptions matching the key are called."""
+        registry = SubscriberRegistry()
+        changes, callback = _collect()
+        registry.add("wallpaper:*", callback)
+
+        registry.dispatch(
+            [KeyChange("wallpaper:current", "write"), KeyChange("x", "write")]
+        )
+
+        assert changes == [KeyChange("wallpaper:current", "write")]
+
+    def test_dispatch_collapses_duplicates(self):
+        """Test consecutive identical changes are delivered once."""
+        registry = SubscriberRegistry()
+        changes, callback = _collect()
+        registry.add("*", callback)
+
+        registry.dispatch([KeyChange("h", "remove")] * 3)
+
+        assert changes == [KeyChange("h", "remove")]
+
+    def test_failing_callback_is_isolated(self):
+        """Test a raising callback doesn't stop delivery to others."""
+        registry = SubscriberRegistry()
+        changes, callback = _collect()
+        registry.add("*", MagicMock(side_effect=RuntimeError))
+        registry.add("*", callback)
+
+        registry.dispatch([KeyChange("key", "write")])
+
+        assert changes == [KeyChange("key", "write")]
+
+    def test_cancel_calls_on_empty(self):
+        """Test cancelling the last subscription calls on_empty once."""
+        on_empty = MagicMock()
+        registry = SubscriberRegistry(on_empty=on_empty)
+        first = registry.add("*", MagicMock())
+        second = registry.add("*", MagicMock())
+
+        first.cancel()
+        on_empty.assert_not_called()
+        with second:
+            assert second.active
+        second.cancel()
+
+        assert not second.active
+        on_empty.assert_called_once()
+
+
+class TestMemoryBackendNotifications:
+    """Test in-process notifications."""
+
+    def test_operations(self):
+        """Test each kind of operation reports its event."""
+        backend = MemoryBackend()
+        changes, callback = _collect()
+        backend.subscribe("*", callback)
+
+        backend.set("key", 1)
+        backend.expire("key", 100)
+        backend.delete("key")
+        backend.rpush("list", 1)
+        backend.lpop("list")
+
+        assert changes == [
+            KeyChange("key", "write"),
+            KeyChange("key", "expire"),
+            KeyChange("key", "remove"),
+            KeyChange("list", "write"),
+            KeyChange("list", "remove"),
+        ]
+        backend.close()
+
+    def test_transaction_delivers_on_commit(self):
+        """Test changes are delivered on commit and dropped on rollback."""
+        backend = MemoryBackend()
+        changes, callback = _collect()
+        backend.subscribe("*", callback)
+
+        with backend.transaction():
+            backend.set("a", 1)
+            assert changes == []
+        assert changes == [KeyChange("a", "write")]
+
+        with pytest.raises(RuntimeError), backend.transaction():
+            backend.set("b", 1)
+            raise RuntimeError
+        assert changes == [KeyChange("a", "write")]
+        backend.close()
+
+    def test_callback_may_write(self):
+        """Test a callback can use the backend (it runs unlocked)."""
+        backend = MemoryBackend()
+
+        def on_change(change):
+            backend.rpush("log", change.key)
+
+        backend.subscribe("theme", on_change)
+        backend.set("theme", "dark")
+
+        assert backend.lrange("log") == ["theme"]
+        backend.close()
+
+
+class TestSQLiteBackendNotifications:
+    """Test change log based notifications."""
+
+    @pytest.fixture
+    def backend(self, temp_db):
+        """Create a SQLite backend polling quickly."""
+        backend = SQLiteBackend(db_path=temp_db, notify_interval=0.01)
+        yield backend
+        backend.close()
+
+    def test_own_writes(self, backend):
+        """Test writes through the same backend are reported."""
+        received = queue.Queue()
+        backend.subscribe("wallpaper:*", received.put)
+
+        backend.hmset("wallpaper:current", {"path": "/a.png", "mode": "fill"})
+        backend.set("other", 1)
+        backend.expire("wallpaper:current", 100)
+
+        assert received.get(timeout=5) == KeyChange(
+            "wallpaper:current", "write"
+        )
+        assert received.get(timeout=5) == KeyChange(
+            "wallpaper:current", "expire"
+        )
+
+    def test_other_process_writes(self, backend, temp_db):
+        """Test writes by another connection to the database are reported."""
+        received = queue.Queue()
+        backend.subscribe("*", received.put)
+
+        other = SQLiteBackend(db_path=temp_db)
+        other.set("theme", "dark")
+        other.delete("theme")
+        other.close()
+
+        assert received.get(timeout=5) == KeyChange("theme", "write")
+        assert received.get(timeout=5) == KeyChange("theme", "remove")
+
+    def test_changes_before_subscribe_are_skipped(self, backend):
+        """Test a new subscription starts at the end of the log."""
+        backend.subscribe("unrelated", MagicMock()).cancel()
+        backend.set("old", 1)
+
+        received = queue.Queue()
+        backend.subscribe("*", received.put)
+        backend.set("new", 1)
+
+        assert received.get(timeout=5) == KeyChange("new", "write")
+
+    def test_poller_stops_with_last_subscription(self, backend):
+        """Test the poller thread ends when nothing is subscribed."""
+        subscription = backend.subscribe("*", MagicMock())
+        poller = backend._poller
+        assert poller.is_alive()
+
+        subscription.cancel()
+
+        assert backend._poller is None
+        assert not poller.is_alive()
+
+    def test_change_log_is_bounded(self, backend, monkeypatch):
+        """Test the triggers trim the change log."""
+        monkeypatch.setattr(
+            "dotfiles_state_manager.backends.sqlite_backend.CHANGE_LOG_SIZE",
+            5,
+        )
+        backend.subscribe("*", MagicMock())
+        backend.mset({f"key{i}": i for i in range(20)})
+
+        count = backend.conn.execute(
+            "SELECT COUNT(*) FROM change_log"
+        ).fetchone()[0]
+        assert count <= 6
+
+    def test_triggers_dropped_after_unsubscribe(self, backend):
+        """Test writes after the last unsubscribe skip the change log."""
+        backend.subscribe("*", MagicMock()).cancel()
+
+        def log_size():
+            return backend.conn.execute(
+                "SELECT COUNT(*) FROM change_log"
+            ).fetchone()[0]
+
+        before = log_size()
+        backend.set("key", 1)
+        backend.hset("hash", "field", 1)
+        backend.delete("key")
+
+        assert log_size() == before
+        triggers = backend.conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'trigger'"
+            " AND name LIKE '%_notify_%'"
+        ).fetchall()
+        assert triggers == []
+
+    def test_triggers_kept_for_other_listeners(self, backend, temp_db):
+        """Test triggers stay while another backend is subscribed."""
+        other = SQLiteBackend(db_path=temp_db, notify_interval=0.01)
+        received = queue.Queue()
+        other.subscribe("*", received.put)
+
+        backend.subscribe("*", MagicMock()).cancel()
+        backend.set("key", 1)
+
+        assert received.get(timeout=5) == KeyChange("key", "write")
+        other.close()
+
+    def test_dead_listeners_are_ignored(self, backend):
+        """Test listeners of processes that died don't keep triggers."""
+        backend.subscribe("*", MagicMock()).cancel()
+        backend.conn.execute(
+            "INSERT INTO change_listeners (pid) VALUES (?)", (2**22 + 1,)
+        )
+
+        backend.subscribe("*", MagicMock()).cancel()
+
+        assert backend.conn.execute(
+            "SELECT COUNT(*) FROM change_listeners"
+        ).fetchone() == (0,)
+
+    def test_state_manager_subscribe(self, backend):
+        """Test StateManager forwards subscriptions to its backend."""
+        received = queue.Queue()
+        state = StateManager(backend=backend)
+
+        with state.subscribe("key", received.put):
+            state.set("key", "value")
+            assert received.get(timeout=5) == KeyChange("key", "write")
+
+
+@pytest.mark.skipif(not REDIS_AVAILABLE, reason="redis package not installed")
+class TestRedisBackendNotifications:
+    """Test keyspace notification based notifications."""
+
+    @pytest.fixture
+    def backend(self, mock_redis_client):
+        """Create a Redis backend talking to a mock client."""
+        from dotfiles_state_manager import RedisBackend
+
+        with patch(
+            "dotfiles_state_manager.backends.redis_backend.redis.Redis",
+            return_value=mock_redis_client,
+        ):
+            backend = RedisBackend(key_prefix="test:", db=2)
+        yield backend
+
+    def test_subscribe_listens_to_keyspace(self, backend, mock_redis_client):
+        """Test subscribe enables notifications and listens once."""
+        mock_redis_client.config_get.return_value = {
+            "notify-keyspace-events": "Ex"
+        }
+        pubsub = mock_redis_client.pubsub.return_value
+
+        backend.subscribe("a", MagicMock())
+        backend.subscribe("b", MagicMock())
+
+        mock_redis_client.config_set.assert_called_once_with(
+            "notify-keyspace-events", "ExKg$lsh"
+        )
+        pubsub.psubscribe.assert_called_once()
+        (channel,) = pubsub.psubscribe.call_args.kwargs
+        assert channel == "__keyspace@2__:test:*"
+        pubsub.run_in_thread.assert_called_once()
+
+    def test_keyspace_events(self, backend, mock_redis_client):
+        """Test keyspace messages become KeyChanges of unprefixed keys."""
+        mock_redis_client.config_get.return_value = {
+            "notify-keyspace-events": "AK"
+        }
+        changes, callback = _collect()
+        backend.subscribe("wallpaper:*", callback)
+
+        for event in ("hset", "hdel", "expire", "expired"):
+            backend._on_keyspace_event(
+                {
+                    "channel": "__keyspace@2__:test:wallpaper:current",
+                    "data": event,
+                }
+            )
+
+        key = "wallpaper:current"
+        assert changes == [
+            KeyChange(key, "write"),
+            KeyChange(key, "remove"),
+            KeyChange(key, "expire"),
+            KeyChange(key, "remove"),
+        ]
+        mock_redis_client.config_set.assert_not_called()
+
+    def test_listener_stops_with_last_subscription(
+        self, backend, mock_redis_client
+    ):
+        """Test the listener thread is stopped when nothing is subscribed."""
+        mock_redis_client.config_get.return_value = {
+            "notify-keyspace-events": "AK"
+        }
+        listener = (
+            mock_redis_client.pubsub.return_value.run_in_thread.return_value
+        )
+
+        backend.subscribe("*", MagicMock()).cancel()
+
+        listener.stop.assert_called_once()
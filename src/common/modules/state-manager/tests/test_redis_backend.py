@@ -0,0 +1,182 @@
+"""Tests for Redis backend batching and transactions."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from dotfiles_state_manager import RedisBackend
+from dotfiles_state_manager.backends.redis_backend import REDIS_AVAILABLE
+
+pytestmark = pytest.mark.skipif(
+    not REDIS_AVAILABLE, reason="redis package not installed"
+)
+
+
+@pytest.fixture
+def redis_backend(mock_redis_client):
+    """Create a Redis backend talking to a mock client."""
+    with patch(
+        "dotfiles_state_manager.backends.redis_backend.redis.Redis",
+        return_value=mock_redis_client,
+    ):
+        backend = RedisBackend(key_prefix="test:")
+    yield backend
+
+
+class TestRedisBackendBatchOperations:
+    """Test batched Redis commands."""
+
+    def test_mset(self, redis_backend, mock_redis_client):
+        """Test mset sends one MSET with prefixed keys."""
+        redis_backend.mset({"a": 1, "b": "x"})
+
+        mock_redis_client.mset.assert_called_once_with(
+            {"test:a": "1", "test:b": '"x"'}
+        )
+
+    def test_mget(self, redis_backend, mock_redis_client):
+        """Test mget sends one MGET and fills in the default."""
+        mock_redis_client.mget.return_value = ["1", None]
+
+        assert redis_backend.mget(["a", "b"], "d") == [1, "d"]
+        mock_redis_client.mget.assert_called_once_with(["test:a", "test:b"])
+
+    def test_get_with_ttl(self, redis_backend, mock_redis_client):
+        """Test the value and TTL are read in one pipelined round trip."""
+        pipeline = mock_redis_client.pipeline.return_value
+        pipeline.execute.return_value = ["1", -1]
+
+        assert redis_backend.get_with_ttl("a") == (1, None)
+        mock_redis_client.pipeline.assert_called_once_with(transaction=False)
+        pipeline.get.assert_called_once_with("test:a")
+        pipeline.ttl.assert_called_once_with("test:a")
+
+        pipeline.execute.return_value = [None, -2]
+        assert redis_backend.get_with_ttl("b", "d") == ("d", -2)
+
+    def test_mget_with_ttl(self, redis_backend, mock_redis_client):
+        """Test mget_with_ttl pipelines one MGET and a TTL per key."""
+        pipeline = mock_redis_client.pipeline.return_value
+        pipeline.execute.return_value = [["1", None], 30, -2]
+
+        assert redis_backend.mget_with_ttl(["a", "b"], "d") == [
+            (1, 30),
+            ("d", -2),
+        ]
+        pipeline.mget.assert_called_once_with(["test:a", "test:b"])
+        assert pipeline.execute.call_count == 1
+
+    def test_hmset(self, redis_backend, mock_redis_client):
+        """Test hmset sends one HSET with a mapping."""
+        redis_backend.hmset("hash", {"f1": "v1", "f2": 2})
+
+        mock_redis_client.hset.assert_called_once_with(
+            "test:hash", mapping={"f1": '"v1"', "f2": "2"}
+        )
+
+    def test_empty_batches_are_noops(self, redis_backend, mock_redis_client):
+        """Test empty mappings don't reach the server."""
+        redis_backend.mset({})
+        redis_backend.hmset("hash", {})
+
+        assert redis_backend.mget([]) == []
+        mock_redis_client.mset.assert_not_called()
+        mock_redis_client.hset.assert_not_called()
+
+
+class TestRedisBackendScan:
+    """Test SCAN-based key iteration."""
+
+    def test_scan(self, redis_backend, mock_redis_client):
+        """Test scan strips the prefix and passes the type filter."""
+        mock_redis_client.scan_iter.return_value = iter(
+            ["test:wallpaper:a", "test:wallpaper:b"]
+        )
+
+        keys = list(redis_backend.scan("wallpaper:*", type="hash", count=50))
+
+        assert keys == ["wallpaper:a", "wallpaper:b"]
+        mock_redis_client.scan_iter.assert_called_once_with(
+            match="test:wallpaper:*", count=50, _type="hash"
+        )
+
+    def test_keys_uses_scan(self, redis_backend, mock_redis_client):
+        """Test keys never issues the blocking KEYS command."""
+        mock_redis_client.scan_iter.return_value = iter(
+            ["test:a", "test:b", "test:a"]
+        )
+
+        assert redis_backend.keys() == ["a", "b"]
+        mock_redis_client.keys.assert_not_called()
+
+
+class TestRedisBackendCappedLists:
+    """Test capped list pushes."""
+
+    def test_capped_rpush(self, redis_backend, mock_redis_client):
+        """Test rpush with max_length trims in the same pipeline."""
+        pipeline = MagicMock()
+        mock_redis_client.pipeline.return_value = pipeline
+
+        redis_backend.rpush("history", "event", max_length=100)
+
+        pipeline.rpush.assert_called_once_with("test:history", '"event"')
+        pipeline.ltrim.assert_called_once_with("test:history", -100, -1)
+        pipeline.execute.assert_called_once()
+
+    def test_uncapped_push_is_direct(self, redis_backend, mock_redis_client):
+        """Test plain pushes don't open a pipeline."""
+        redis_backend.lpush("history", "event")
+
+        mock_redis_client.lpush.assert_called_once()
+        mock_redis_client.pipeline.assert_not_called()
+
+
+class TestRedisBackendTransaction:
+    """Test MULTI/EXEC pipelines."""
+
+    def test_writes_are_queued(self, redis_backend, mock_redis_client):
+        """Test writes in a transaction go through one pipeline."""
+        pipeline = MagicMock()
+        mock_redis_client.pipeline.return_value = pipeline
+
+        with redis_backend.transaction():
+            redis_backend.set("key", "value")
+            redis_backend.hmset("hash", {"field": "value"})
+            redis_backend.rpush("list", 1)
+
+        mock_redis_client.pipeline.assert_called_once_with(transaction=True)
+        pipeline.set.assert_called_once_with("test:key", '"value"')
+        pipeline.hset.assert_called_once()
+        pipeline.rpush.assert_called_once_with("test:list", "1")
+        pipeline.execute.assert_called_once()
+        mock_redis_client.set.assert_not_called()
+
+    def test_error_discards_pipeline(self, redis_backend, mock_redis_client):
+        """Test an exception resets the pipeline instead of executing."""
+        pipeline = MagicMock()
+        mock_redis_client.pipeline.return_value = pipeline
+
+        with pytest.raises(RuntimeError), redis_backend.transaction():
+            redis_backend.set("key", "value")
+            raise RuntimeError("boom")
+
+        pipeline.execute.assert_not_called()
+        pipeline.reset.assert_called_once()
+
+        # Writes after the transaction go straight to the client
+        redis_backend.set("key", "value")
+        mock_redis_client.set.assert_called_once()
+
+    def test_nested_transaction(self, redis_backend, mock_redis_client):
+        """Test nested transactions share the outer pipeline."""
+        pipeline = MagicMock()
+        mock_redis_client.pipeline.return_value = pipeline
+
+        with redis_backend.transaction():
+            with redis_backend.transaction():
+                redis_backend.set("key", "value")
+            pipeline.execute.assert_not_called()
+
+        mock_redis_client.pipeline.assert_called_once()
+        pipeline.execute.assert_called_once()
@@ -1,5 +1,7 @@
 """Tests for SQLite backend edge cases and advanced features."""
 
+import sqlite3
+import threading
 import time
 from pathlib import Path
 
@@ -121,6 +123,85 @@ class TestSQLiteBackendEdgeCases:
         assert "key10" not in keys
 
 
+class TestSQLiteBackendScan:
+    """Tests for scanning keys across data types."""
+
+    def test_scan_all_types(self, sqlite_backend):
+        """Test scan covers strings, hashes, lists and sets."""
+        sqlite_backend.set("wallpaper:a", 1)
+        sqlite_backend.hset("wallpaper:b", "field", 1)
+        sqlite_backend.rpush("wallpaper:c", 1)
+        sqlite_backend.sadd("wallpaper:d", 1)
+        sqlite_backend.hset("other", "field", 1)
+
+        assert list(sqlite_backend.scan("wallpaper:*")) == [
+            "wallpaper:a",
+            "wallpaper:b",
+            "wallpaper:c",
+            "wallpaper:d",
+        ]
+        assert list(sqlite_backend.scan("wallpaper:*", type="hash")) == [
+            "wallpaper:b"
+        ]
+
+    def test_scan_pages(self, sqlite_backend):
+        """Test scan returns every key once across pages."""
+        sqlite_backend.mset({f"key:{i:03d}": i for i in range(25)})
+        for i in range(25):
+            sqlite_backend.hset(f"key:{i:03d}", "field", i)
+
+        keys = list(sqlite_backend.scan("key:*", count=4))
+
+        assert keys == [f"key:{i:03d}" for i in range(25)]
+
+    def test_scan_pattern_after_prefix(self, sqlite_backend):
+        """Test wildcards after the prefix are still applied."""
+        sqlite_backend.hset("user:1:name", "f", 1)
+        sqlite_backend.hset("user:1:email", "f", 1)
+        sqlite_backend.hset("user:2:name", "f", 1)
+
+        assert list(sqlite_backend.scan("user:*:name")) == [
+            "user:1:name",
+            "user:2:name",
+        ]
+        assert list(sqlite_backend.scan("user:?:email")) == ["user:1:email"]
+
+    def test_scan_skips_removed_and_expired(self, sqlite_backend):
+        """Test keys disappear once their data is gone or expired."""
+        sqlite_backend.hset("hash", "a", 1)
+        sqlite_backend.hset("hash", "b", 1)
+        sqlite_backend.rpush("list", 1)
+        sqlite_backend.set("expired", 1)
+        sqlite_backend.conn.execute(
+            "UPDATE kv_store SET expires_at = 1 WHERE key = 'expired'"
+        )
+
+        sqlite_backend.hdel("hash", "a")
+        assert list(sqlite_backend.scan()) == ["hash", "list"]
+
+        sqlite_backend.hdel("hash", "b")
+        sqlite_backend.rpop("list")
+        assert list(sqlite_backend.scan()) == []
+
+    def test_scan_registers_existing_data(self, temp_db):
+        """Test databases created before the key registry are indexed."""
+        backend = SQLiteBackend(db_path=temp_db)
+        backend.hset("legacy", "field", 1)
+        backend.conn.execute("DROP TABLE key_registry")
+        backend.close()
+
+        backend = SQLiteBackend(db_path=temp_db)
+        try:
+            assert list(backend.scan()) == ["legacy"]
+        finally:
+            backend.close()
+
+    def test_scan_rejects_unknown_type(self, sqlite_backend):
+        """Test scan validates the type filter."""
+        with pytest.raises(ValueError, match="Unsupported key type"):
+            list(sqlite_backend.scan(type="zset"))
+
+
 class TestSQLiteBackendHashEdgeCases:
     """Tests for SQLite backend hash edge cases."""
 
@@ -209,6 +290,72 @@ class TestSQLiteBackendListEdgeCases:
         result = sqlite_backend.lrange("list", 0, -1)
         assert result == [{"key": "value"}, [1, 2, 3]]
 
+    def test_mixed_pushes_and_pops(self, sqlite_backend):
+        """Test both ends of a list behave like a deque."""
+        sqlite_backend.rpush("list", "b")
+        sqlite_backend.lpush("list", "a")
+        sqlite_backend.rpush("list", "c")
+        sqlite_backend.lpush("list", "z")
+
+        assert sqlite_backend.lrange("list", 0, -1) == ["z", "a", "b", "c"]
+        assert sqlite_backend.lrange("list", 1, 2) == ["a", "b"]
+        assert sqlite_backend.lrange("list", -2, -1) == ["b", "c"]
+        assert sqlite_backend.lpop("list") == "z"
+        assert sqlite_backend.rpop("list") == "c"
+        assert sqlite_backend.lrange("list", 0, -1) == ["a", "b"]
+        assert sqlite_backend.llen("list") == 2
+
+    def test_lpush_does_not_renumber(self, sqlite_backend):
+        """Test pushes and pops leave the other elements' rows alone."""
+        for i in range(10):
+            sqlite_backend.rpush("list", i)
+
+        def positions():
+            return sqlite_backend.conn.execute(
+                "SELECT position, value FROM list_store ORDER BY position"
+            ).fetchall()
+
+        before = positions()
+        sqlite_backend.lpush("list", -1)
+        sqlite_backend.rpush("list", 10)
+
+        assert positions() == [(-1, "-1"), *before, (10, "10")]
+
+        sqlite_backend.lpop("list")
+        sqlite_backend.rpop("list")
+        assert positions() == before
+
+    def test_ltrim(self, sqlite_backend):
+        """Test ltrim keeps only the requested range."""
+        for value in "abcdef":
+            sqlite_backend.rpush("list", value)
+
+        sqlite_backend.ltrim("list", 1, -2)
+        assert sqlite_backend.lrange("list", 0, -1) == list("bcde")
+
+        sqlite_backend.ltrim("list", 5, 10)
+        assert sqlite_backend.llen("list") == 0
+
+    def test_capped_push(self, sqlite_backend):
+        """Test max_length keeps the newest elements."""
+        for i in range(5):
+            sqlite_backend.rpush("tail", i, max_length=3)
+            sqlite_backend.lpush("head", i, max_length=3)
+
+        assert sqlite_backend.lrange("tail", 0, -1) == [2, 3, 4]
+        assert sqlite_backend.lrange("head", 0, -1) == [4, 3, 2]
+
+    def test_reads_legacy_positions(self, sqlite_backend):
+        """Test lists written with 0-based positions stay readable."""
+        for position, value in enumerate("abc"):
+            sqlite_backend.conn.execute(
+                "INSERT INTO list_store VALUES ('list', ?, ?, NULL)",
+                (position, f'"{value}"'),
+            )
+
+        sqlite_backend.lpush("list", "z")
+        assert sqlite_backend.lrange("list", 0, -1) == ["z", "a", "b", "c"]
+
 
 class TestSQLiteBackendSetEdgeCases:
     """Tests for SQLite backend set edge cases."""
@@ -279,6 +426,26 @@ class TestSQLiteBackendTTLEdgeCases:
         sqlite_backend.set("key", "value")
         assert sqlite_backend.ttl("key") is None
 
+    def test_reads_with_ttl(self, sqlite_backend):
+        """Test values are read together with their key's TTL."""
+        sqlite_backend.set("key", "value")
+        sqlite_backend.hset("hash", "field", 1)
+        sqlite_backend.expire("hash", 3600)
+
+        assert sqlite_backend.get_with_ttl("key") == ("value", None)
+        assert sqlite_backend.get_with_ttl("missing", 0) == (0, -2)
+        assert sqlite_backend.mget_with_ttl(["key", "missing"]) == [
+            ("value", None),
+            (None, -2),
+        ]
+        value, ttl = sqlite_backend.hget_with_ttl("hash", "field")
+        assert value == 1
+        assert 3590 < ttl <= 3600
+        fields, ttl = sqlite_backend.hgetall_with_ttl("hash")
+        assert fields == {"field": 1}
+        assert 3590 < ttl <= 3600
+        assert sqlite_backend.hgetall_with_ttl("missing") == ({}, -2)
+
     def test_persist_nonexistent_key_returns_false(self, sqlite_backend):
         """Test persist on nonexistent key returns False."""
         assert not sqlite_backend.persist("nonexistent")
@@ -354,6 +521,28 @@ class TestSQLiteBackendMaintenance:
         assert not sqlite_backend.exists("key2")
         assert sqlite_backend.exists("key3")
 
+    def test_cleanup_expired_limit(self, sqlite_backend):
+        """Test cleanup_expired removes at most limit rows per call."""
+        sqlite_backend.hmset("hash", {f"f{i}": i for i in range(5)})
+        sqlite_backend.expire("hash", -10)
+        sqlite_backend.set("key", "value")
+        sqlite_backend.expire("key", -10)
+
+        assert sqlite_backend.cleanup_expired(limit=4) == 4
+        assert sqlite_backend.cleanup_expired(limit=4) == 2
+        assert sqlite_backend.cleanup_expired(limit=4) == 0
+        assert sqlite_backend.keys() == []
+
+    def test_cleanup_expired_uses_index(self, sqlite_backend):
+        """Test expired rows are found through the expires_at index."""
+        plan = sqlite_backend.conn.execute(
+            """EXPLAIN QUERY PLAN SELECT rowid FROM hash_store
+               WHERE expires_at <= ? LIMIT ?""",
+            (0, 10),
+        ).fetchall()
+
+        assert "idx_hash_expires" in str(plan)
+
     def test_close_closes_connection(self, temp_db):
         """Test close closes the database connection."""
         backend = SQLiteBackend(db_path=temp_db)
@@ -363,3 +552,198 @@ class TestSQLiteBackendMaintenance:
         # Connection should be closed
         with pytest.raises(Exception):
             backend.conn.execute("SELECT 1")
+
+
+class TestSQLiteBackendBatchOperations:
+    """Test batched writes and transactions."""
+
+    def test_mset_and_mget(self, sqlite_backend):
+        """Test mset stores all pairs and mget returns them in order."""
+        sqlite_backend.mset({"a": 1, "b": {"nested": True}})
+
+        assert sqlite_backend.mget(["b", "missing", "a"], "x") == [
+            {"nested": True},
+            "x",
+            1,
+        ]
+
+    def test_mget_skips_expired(self, sqlite_backend):
+        """Test mget treats expired keys as missing."""
+        sqlite_backend.set("key", "value")
+        sqlite_backend.conn.execute(
+            "UPDATE kv_store SET expires_at = 1 WHERE key = 'key'"
+        )
+
+        assert sqlite_backend.mget(["key"]) == [None]
+
+    def test_mget_many_keys(self, sqlite_backend):
+        """Test mget batches lookups beyond the parameter limit."""
+        sqlite_backend.mset({f"key{i}": i for i in range(2000)})
+
+        keys = [f"key{i}" for i in range(2000)]
+        assert sqlite_backend.mget(keys) == list(range(2000))
+
+    def test_hmset(self, sqlite_backend):
+        """Test hmset sets and overwrites fields."""
+        sqlite_backend.hset("hash", "a", "old")
+        sqlite_backend.hmset("hash", {"a": "new", "b": [1, 2]})
+
+        assert sqlite_backend.hgetall("hash") == {"a": "new", "b": [1, 2]}
+
+    def test_batch_writes_use_one_transaction(self, sqlite_backend):
+        """Test hmset commits once instead of once per field."""
+        statements = []
+        sqlite_backend.conn.set_trace_callback(statements.append)
+
+        sqlite_backend.hmset("hash", {f"f{i}": i for i in range(6)})
+
+        assert statements.count("BEGIN IMMEDIATE") == 1
+        assert statements.count("COMMIT") == 1
+
+    def test_transaction_commits(self, sqlite_backend):
+        """Test operations in a transaction are committed together."""
+        with sqlite_backend.transaction():
+            sqlite_backend.set("key", "value")
+            sqlite_backend.hmset("hash", {"field": "value"})
+            assert sqlite_backend.conn.in_transaction
+
+        assert not sqlite_backend.conn.in_transaction
+        assert sqlite_backend.get("key") == "value"
+        assert sqlite_backend.hget("hash", "field") == "value"
+
+    def test_transaction_rolls_back_on_error(self, sqlite_backend):
+        """Test an exception discards every write in the transaction."""
+        sqlite_backend.set("key", "before")
+
+        with pytest.raises(RuntimeError), sqlite_backend.transaction():
+            sqlite_backend.set("key", "after")
+            sqlite_backend.rpush("list", "item")
+            raise RuntimeError("boom")
+
+        assert sqlite_backend.get("key") == "before"
+        assert sqlite_backend.llen("list") == 0
+
+    def test_nested_transaction(self, sqlite_backend):
+        """Test only the outermost transaction commits."""
+        with sqlite_backend.transaction():
+            with sqlite_backend.transaction():
+                sqlite_backend.set("key", "value")
+            assert sqlite_backend.conn.in_transaction
+
+        assert not sqlite_backend.conn.in_transaction
+        assert sqlite_backend.get("key") == "value"
+
+
+class TestSQLiteBackendConnectionPool:
+    """Tests for per-thread reader connections."""
+
+    @pytest.fixture
+    def pooled_backend(self, temp_db):
+        """Create a backend with a connection pool."""
+        backend = SQLiteBackend(db_path=temp_db, connection_pool=True)
+        yield backend
+        backend.close()
+
+    def test_pragmas(self, pooled_backend):
+        """Test tuned pragmas are applied to every connection."""
+        reader = pooled_backend._reader()
+
+        for conn in (pooled_backend.conn, reader):
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+            assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+            assert conn.execute("PRAGMA cache_size").fetchone()[0] == -8192
+        assert reader.execute("PRAGMA query_only").fetchone()[0] == 1
+
+    def test_threads_get_own_readers(self, pooled_backend):
+        """Test each thread reads through its own connection."""
+        pooled_backend.set("key", "value")
+        readers = {}
+
+        def read(name):
+            assert pooled_backend.get("key") == "value"
+            readers[name] = pooled_backend._reader()
+
+        threads = [
+            threading.Thread(target=read, args=(i,)) for i in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len({id(conn) for conn in readers.values()}) == 4
+        assert pooled_backend.conn not in readers.values()
+
+    def test_readers_closed_when_threads_exit(self, pooled_backend):
+        """Test short-lived threads don't leave reader connections."""
+        pooled_backend.set("key", "value")
+        readers = []
+
+        def read():
+            assert pooled_backend.get("key") == "value"
+            readers.append(pooled_backend._reader())
+
+        for _ in range(50):
+            threads = [threading.Thread(target=read) for _ in range(6)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert len(readers) == 300
+        assert len(pooled_backend._readers) == 0
+        with pytest.raises(sqlite3.ProgrammingError):
+            readers[0].execute("SELECT 1")
+
+    def test_reads_see_committed_writes(self, pooled_backend):
+        """Test readers see writes made through the writer."""
+        assert pooled_backend.get("key") is None
+
+        pooled_backend.hset("hash", "field", 1)
+        pooled_backend.set("key", "value")
+
+        assert pooled_backend.get("key") == "value"
+        assert pooled_backend.hgetall("hash") == {"field": 1}
+
+    def test_reads_in_transaction(self, pooled_backend):
+        """Test a transaction reads its own uncommitted writes."""
+        with pooled_backend.transaction():
+            pooled_backend.set("key", "value")
+            assert pooled_backend.get("key") == "value"
+
+    def test_concurrent_reads_and_writes(self, pooled_backend):
+        """Test readers and a writer can run side by side."""
+        errors = []
+
+        def write():
+            for i in range(200):
+                pooled_backend.set("counter", i)
+
+        def read():
+            try:
+                for _ in range(200):
+                    value = pooled_backend.get("counter")
+                    assert value is None or 0 <= value < 200
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=write)] + [
+            threading.Thread(target=read) for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert pooled_backend.get("counter") == 199
+
+    def test_expired_read_keeps_new_value(self, pooled_backend):
+        """Test lazy expiry doesn't delete a value written after it."""
+        pooled_backend.set("key", "old")
+        pooled_backend.expire("key", -10)
+        pooled_backend.set("key", "new")
+
+        pooled_backend._purge_expired("kv_store", "key = ?", ("key",))
+
+        assert pooled_backend.get("key") == "new"
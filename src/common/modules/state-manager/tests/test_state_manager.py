@@ -1,5 +1,7 @@
 """Tests for StateManager wrapper class."""
 
+import pytest
+
 from dotfiles_state_manager import StateManager
 
 
@@ -83,6 +85,38 @@ class TestStateManagerKeyValueOperations:
         assert "user:2" in user_keys
 
 
+class TestStateManagerBatchOperations:
+    """Tests for StateManager batched operations."""
+
+    def test_mset_and_mget(self, state_manager):
+        """Test mset and mget operations."""
+        state_manager.mset({"key1": "value1", "key2": 2})
+        assert state_manager.mget(["key1", "key2", "key3"]) == [
+            "value1",
+            2,
+            None,
+        ]
+
+    def test_hmset(self, state_manager):
+        """Test hmset operation."""
+        state_manager.hmset("hash", {"field1": "value1", "field2": "value2"})
+        assert state_manager.hgetall("hash") == {
+            "field1": "value1",
+            "field2": "value2",
+        }
+
+    def test_transaction(self, state_manager):
+        """Test transaction groups writes and rolls back on error."""
+        with state_manager.transaction():
+            state_manager.set("key", "value")
+
+        with pytest.raises(ValueError), state_manager.transaction():
+            state_manager.set("key", "changed")
+            raise ValueError("abort")
+
+        assert state_manager.get("key") == "value"
+
+
 class TestStateManagerHashOperations:
     """Tests for StateManager hash operations."""
 
@@ -0,0 +1,101 @@
+"""Tests for the background expired key sweeper."""
+
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from dotfiles_state_manager import (
+    ExpirySweeper,
+    StateManager,
+    SweeperConfig,
+)
+
+
+def _add_expired(backend, count: int) -> None:
+    """Add count expired hash rows."""
+    backend.hmset("expired", {f"field{i}": i for i in range(count)})
+    backend.expire("expired", -10)
+
+
+class TestExpirySweeper:
+    """Test sweeping expired rows."""
+
+    def test_sweep_in_batches(self, sqlite_backend):
+        """Test a sweep removes expired rows a batch at a time."""
+        _add_expired(sqlite_backend, 25)
+        sqlite_backend.set("live", "value")
+        calls = []
+        cleanup = sqlite_backend.cleanup_expired
+
+        def counting_cleanup(limit=None):
+            calls.append(limit)
+            return cleanup(limit)
+
+        sqlite_backend.cleanup_expired = counting_cleanup
+        sweeper = ExpirySweeper(sqlite_backend, batch_size=10)
+
+        assert sweeper.sweep() == 25
+        assert calls == [10, 10, 10]
+        assert sqlite_backend.keys() == ["live"]
+
+        stats = sweeper.stats
+        assert stats.sweeps == 1
+        assert stats.rows_reclaimed == 25
+        assert stats.last_rows == 25
+
+    def test_row_budget(self, sqlite_backend):
+        """Test a sweep stops at max_rows, leaving the rest for later."""
+        _add_expired(sqlite_backend, 25)
+        sweeper = ExpirySweeper(sqlite_backend, batch_size=10, max_rows=15)
+
+        assert sweeper.sweep() == 15
+        assert sweeper.sweep() == 10
+        assert sweeper.stats.rows_reclaimed == 25
+
+    def test_errors_are_counted(self):
+        """Test a failing sweep is counted and re-raised."""
+        backend = MagicMock()
+        backend.cleanup_expired.side_effect = RuntimeError("locked")
+        sweeper = ExpirySweeper(backend)
+
+        with pytest.raises(RuntimeError):
+            sweeper.sweep()
+        assert sweeper.stats.errors == 1
+
+    def test_background_thread(self, sqlite_backend):
+        """Test the thread sweeps periodically until stopped."""
+        _add_expired(sqlite_backend, 3)
+        sweeper = ExpirySweeper(sqlite_backend, interval=0.01)
+
+        sweeper.start()
+        deadline = time.monotonic() + 5
+        while sweeper.stats.rows_reclaimed < 3:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+        sweeper.stop()
+
+        assert not sweeper.running
+        assert sqlite_backend.keys() == []
+
+
+class TestStateManagerSweeper:
+    """Test StateManager's sweeper option."""
+
+    def test_disabled_by_default(self, state_manager):
+        """Test no sweeper runs unless configured."""
+        assert state_manager.sweep_stats is None
+
+    def test_enabled(self, sqlite_backend):
+        """Test the sweeper runs with the manager and stops on close."""
+        state = StateManager(
+            backend=sqlite_backend,
+            sweeper=SweeperConfig(enabled=True, interval_seconds=3600),
+        )
+        sweeper = state._sweeper
+
+        assert sweeper.running
+        assert state.sweep_stats.sweeps == 0
+
+        state.close()
+        assert not sweeper.running
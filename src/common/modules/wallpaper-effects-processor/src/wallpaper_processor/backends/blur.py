@@ -1,14 +1,11 @@
 """Blur effect implementations (ImageMagick and PIL)."""
 
 import shutil
-import subprocess
-import tempfile
-from pathlib import Path
 
 from PIL import Image, ImageFilter
 
 from wallpaper_processor.core.base import WallpaperEffect
-from wallpaper_processor.core.exceptions import ProcessingError
+from wallpaper_processor.core.imagemagick import run_imagemagick
 from wallpaper_processor.core.registry import register_effect
 from wallpaper_processor.core.types import BlurParams, EffectParams
 
@@ -51,55 +48,10 @@ class ImageMagickBlur(WallpaperEffect):
         if not isinstance(params, BlurParams):
             raise TypeError(f"Expected BlurParams, got {type(params)}")
 
-        # Create temporary files
-        with (
-            tempfile.NamedTemporaryFile(
-                suffix=".png", delete=False
-            ) as input_tmp,
-            tempfile.NamedTemporaryFile(
-                suffix=".png", delete=False
-            ) as output_tmp,
-        ):
-            input_path = Path(input_tmp.name)
-            output_path = Path(output_tmp.name)
-
-        try:
-            # Save input image
-            image.save(input_path)
-
-            # Build ImageMagick command
-            # -blur radiusxsigma
-            blur_arg = f"{params.radius}x{params.sigma}"
-            cmd = [
-                "convert",
-                str(input_path),
-                "-blur",
-                blur_arg,
-                str(output_path),
-            ]
-
-            # Run ImageMagick
-            result = subprocess.run(
-                cmd, capture_output=True, text=True, check=False
-            )
-
-            if result.returncode != 0:
-                raise ProcessingError(
-                    f"ImageMagick blur failed: {result.stderr}"
-                )
-
-            # Load result
-            blurred_image = Image.open(output_path)
-            # Copy to ensure we can delete temp file
-            result_image = blurred_image.copy()
-            blurred_image.close()
-
-            return result_image
-
-        finally:
-            # Clean up temp files
-            input_path.unlink(missing_ok=True)
-            output_path.unlink(missing_ok=True)
+        # Build ImageMagick operations
+        # -blur radiusxsigma
+        blur_arg = f"{params.radius}x{params.sigma}"
+        return run_imagemagick(image, ["-blur", blur_arg], "blur")
 
 
 @register_effect("blur")
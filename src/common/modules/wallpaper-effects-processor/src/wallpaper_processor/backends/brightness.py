@@ -1,14 +1,13 @@
 """Brightness effect implementations (ImageMagick and PIL)."""
 
 import shutil
-import subprocess
-import tempfile
-from pathlib import Path
 
 from PIL import Image, ImageEnhance
 
+from wallpaper_processor.core import color_matrix
 from wallpaper_processor.core.base import WallpaperEffect
-from wallpaper_processor.core.exceptions import ProcessingError
+from wallpaper_processor.core.color_matrix import ColorMatrix
+from wallpaper_processor.core.imagemagick import run_imagemagick
 from wallpaper_processor.core.registry import register_effect
 from wallpaper_processor.core.types import BrightnessParams, EffectParams
 
@@ -51,54 +50,14 @@ class ImageMagickBrightness(WallpaperEffect):
         if not isinstance(params, BrightnessParams):
             raise TypeError(f"Expected BrightnessParams, got {type(params)}")
 
-        # Create temporary files
-        with (
-            tempfile.NamedTemporaryFile(
-                suffix=".png", delete=False
-            ) as input_tmp,
-            tempfile.NamedTemporaryFile(
-                suffix=".png", delete=False
-            ) as output_tmp,
-        ):
-            input_path = Path(input_tmp.name)
-            output_path = Path(output_tmp.name)
-
-        try:
-            # Save input image
-            image.save(input_path)
-
-            # Convert adjustment percentage to ImageMagick brightness value
-            # ImageMagick -brightness-contrast: brightness is -100 to 100
-            brightness_value = str(params.adjustment)
-            cmd = [
-                "convert",
-                str(input_path),
-                "-brightness-contrast",
-                f"{brightness_value}x0",
-                str(output_path),
-            ]
-
-            # Run ImageMagick
-            result = subprocess.run(
-                cmd, capture_output=True, text=True, check=False
-            )
-
-            if result.returncode != 0:
-                raise ProcessingError(
-                    f"ImageMagick brightness failed: {result.stderr}"
-                )
-
-            # Load result
-            adjusted_image = Image.open(output_path)
-            result_image = adjusted_image.copy()
-            adjusted_image.close()
-
-            return result_image
-
-        finally:
-            # Clean up temp files
-            input_path.unlink(missing_ok=True)
-            output_path.unlink(missing_ok=True)
+        # Convert adjustment percentage to ImageMagick brightness value
+        # ImageMagick -brightness-contrast: brightness is -100 to 100
+        brightness_value = str(params.adjustment)
+        return run_imagemagick(
+            image,
+            ["-brightness-contrast", f"{brightness_value}x0"],
+            "brightness",
+        )
 
 
 @register_effect("brightness")
@@ -123,6 +82,12 @@ class PILBrightness(WallpaperEffect):
         """Get default parameters."""
         return BrightnessParams()
 
+    def get_color_matrix(self, params: EffectParams) -> ColorMatrix | None:
+        """Get brightness adjustment as a color matrix."""
+        if not isinstance(params, BrightnessParams):
+            return None
+        return color_matrix.scale(1.0 + (params.adjustment / 100.0))
+
     def apply(self, image: Image.Image, params: EffectParams) -> Image.Image:
         """Apply brightness adjustment using PIL.
 
@@ -1,18 +1,33 @@
 """Color overlay effect implementations (ImageMagick and PIL)."""
 
 import shutil
-import subprocess
-import tempfile
-from pathlib import Path
 
 from PIL import Image
 
+from wallpaper_processor.core import color_matrix
 from wallpaper_processor.core.base import WallpaperEffect
-from wallpaper_processor.core.exceptions import ProcessingError
+from wallpaper_processor.core.color_matrix import ColorMatrix
+from wallpaper_processor.core.imagemagick import run_imagemagick
 from wallpaper_processor.core.registry import register_effect
 from wallpaper_processor.core.types import ColorOverlayParams, EffectParams
 
 
+def _parse_hex_color(color: str) -> tuple[int, int, int]:
+    """Convert a hex color code to an RGB tuple.
+
+    Args:
+        color: Hex color code (e.g., #ff00ff)
+
+    Returns:
+        (r, g, b) tuple
+    """
+    color_hex = color.lstrip("#")
+    r = int(color_hex[0:2], 16)
+    g = int(color_hex[2:4], 16)
+    b = int(color_hex[4:6], 16)
+    return r, g, b
+
+
 @register_effect("color_overlay")
 class ImageMagickColorOverlay(WallpaperEffect):
     """Color overlay effect using ImageMagick."""
@@ -51,66 +66,26 @@ class ImageMagickColorOverlay(WallpaperEffect):
         if not isinstance(params, ColorOverlayParams):
             raise TypeError(f"Expected ColorOverlayParams, got {type(params)}")
 
-        # Create temporary files
-        with (
-            tempfile.NamedTemporaryFile(
-                suffix=".png", delete=False
-            ) as input_tmp,
-            tempfile.NamedTemporaryFile(
-                suffix=".png", delete=False
-            ) as output_tmp,
-        ):
-            input_path = Path(input_tmp.name)
-            output_path = Path(output_tmp.name)
-
-        try:
-            # Save input image
-            image.save(input_path)
-
-            # Convert opacity to percentage for ImageMagick
-            opacity_percent = int(params.opacity * 100)
-
-            # ImageMagick command to overlay color
-            cmd = [
-                "convert",
-                str(input_path),
-                "(",
-                "-clone",
-                "0",
-                "-fill",
-                params.color,
-                "-colorize",
-                "100",
-                ")",
-                "-compose",
-                "blend",
-                "-define",
-                f"compose:args={opacity_percent}",
-                "-composite",
-                str(output_path),
-            ]
-
-            # Run ImageMagick
-            result = subprocess.run(
-                cmd, capture_output=True, text=True, check=False
-            )
-
-            if result.returncode != 0:
-                raise ProcessingError(
-                    f"ImageMagick color overlay failed: {result.stderr}"
-                )
-
-            # Load result
-            overlaid_image = Image.open(output_path)
-            result_image = overlaid_image.copy()
-            overlaid_image.close()
-
-            return result_image
-
-        finally:
-            # Clean up temp files
-            input_path.unlink(missing_ok=True)
-            output_path.unlink(missing_ok=True)
+        # Convert opacity to percentage for ImageMagick
+        opacity_percent = int(params.opacity * 100)
+
+        # ImageMagick operations to overlay color
+        operations = [
+            "(",
+            "-clone",
+            "0",
+            "-fill",
+            params.color,
+            "-colorize",
+            "100",
+            ")",
+            "-compose",
+            "blend",
+            "-define",
+            f"compose:args={opacity_percent}",
+            "-composite",
+        ]
+        return run_imagemagick(image, operations, "color overlay")
 
 
 @register_effect("color_overlay")
@@ -135,6 +110,13 @@ class PILColorOverlay(WallpaperEffect):
         """Get default parameters."""
         return ColorOverlayParams()
 
+    def get_color_matrix(self, params: EffectParams) -> ColorMatrix | None:
+        """Get color overlay as a color matrix."""
+        if not isinstance(params, ColorOverlayParams):
+            return None
+        color = _parse_hex_color(params.color)
+        return color_matrix.blend(color, params.opacity)
+
     def apply(self, image: Image.Image, params: EffectParams) -> Image.Image:
         """Apply color overlay using PIL.
 
@@ -148,14 +130,8 @@ class PILColorOverlay(WallpaperEffect):
         if not isinstance(params, ColorOverlayParams):
             raise TypeError(f"Expected ColorOverlayParams, got {type(params)}")
 
-        # Convert hex color to RGB
-        color_hex = params.color.lstrip("#")
-        r = int(color_hex[0:2], 16)
-        g = int(color_hex[2:4], 16)
-        b = int(color_hex[4:6], 16)
-
         # Create color overlay
-        overlay = Image.new("RGB", image.size, (r, g, b))
+        overlay = Image.new("RGB", image.size, _parse_hex_color(params.color))
 
         # Blend with original image
         # PIL blend: result = image1 * (1 - alpha) + image2 * alpha
@@ -1,14 +1,13 @@
 """Grayscale effect implementations (ImageMagick and PIL)."""
 
 import shutil
-import subprocess
-import tempfile
-from pathlib import Path
 
 from PIL import Image, ImageOps
 
+from wallpaper_processor.core import color_matrix
 from wallpaper_processor.core.base import WallpaperEffect
-from wallpaper_processor.core.exceptions import ProcessingError
+from wallpaper_processor.core.color_matrix import ColorMatrix
+from wallpaper_processor.core.imagemagick import run_imagemagick
 from wallpaper_processor.core.registry import register_effect
 from wallpaper_processor.core.types import EffectParams, GrayscaleParams
 
@@ -51,75 +50,26 @@ class ImageMagickGrayscale(WallpaperEffect):
         if not isinstance(params, GrayscaleParams):
             raise TypeError(f"Expected GrayscaleParams, got {type(params)}")
 
-        # Create temporary files
-        with (
-            tempfile.NamedTemporaryFile(
-                suffix=".png", delete=False
-            ) as input_tmp,
-            tempfile.NamedTemporaryFile(
-                suffix=".png", delete=False
-            ) as output_tmp,
-        ):
-            input_path = Path(input_tmp.name)
-            output_path = Path(output_tmp.name)
-
-        try:
-            # Save input image
-            image.save(input_path)
-
-            # Build ImageMagick command based on method
-            if params.method == "average":
-                cmd = [
-                    "convert",
-                    str(input_path),
-                    "-grayscale",
-                    "Average",
-                    str(output_path),
-                ]
-            elif params.method == "luminosity":
-                cmd = [
-                    "convert",
-                    str(input_path),
-                    "-grayscale",
-                    "Rec709Luminance",
-                    str(output_path),
-                ]
-            else:  # mean
-                cmd = [
-                    "convert",
-                    str(input_path),
-                    "-set",
-                    "colorspace",
-                    "Gray",
-                    "-separate",
-                    "-evaluate-sequence",
-                    "Mean",
-                    str(output_path),
-                ]
-
-            # Run ImageMagick
-            result = subprocess.run(
-                cmd, capture_output=True, text=True, check=False
-            )
-
-            if result.returncode != 0:
-                raise ProcessingError(
-                    f"ImageMagick grayscale failed: {result.stderr}"
-                )
-
-            # Load result
-            grayscale_image = Image.open(output_path)
-            # Convert to RGB mode to maintain consistency with PIL backend
-            # and avoid colorspace issues when saving/displaying
-            result_image = grayscale_image.convert("RGB")
-            grayscale_image.close()
-
-            return result_image
-
-        finally:
-            # Clean up temp files
-            input_path.unlink(missing_ok=True)
-            output_path.unlink(missing_ok=True)
+        # Build ImageMagick operations based on method
+        if params.method == "average":
+            operations = ["-grayscale", "Average"]
+        elif params.method == "luminosity":
+            operations = ["-grayscale", "Rec709Luminance"]
+        else:  # mean
+            operations = [
+                "-set",
+                "colorspace",
+                "Gray",
+                "-separate",
+                "-evaluate-sequence",
+                "Mean",
+            ]
+
+        # Read back as RGB to maintain consistency with PIL backend
+        # and avoid colorspace issues when saving/displaying
+        return run_imagemagick(
+            image, operations, "grayscale", output_mode="RGB"
+        )
 
 
 @register_effect("grayscale")
@@ -144,6 +94,12 @@ class PILGrayscale(WallpaperEffect):
         """Get default parameters."""
         return GrayscaleParams()
 
+    def get_color_matrix(self, params: EffectParams) -> ColorMatrix | None:
+        """Get grayscale conversion as a color matrix."""
+        if not isinstance(params, GrayscaleParams):
+            return None
+        return color_matrix.saturate(0.0)
+
     def apply(self, image: Image.Image, params: EffectParams) -> Image.Image:
         """Apply grayscale conversion using PIL.
 
@@ -1,14 +1,13 @@
 """Negate (color inversion) effect implementations (ImageMagick and PIL)."""
 
 import shutil
-import subprocess
-import tempfile
-from pathlib import Path
 
 from PIL import Image, ImageOps
 
+from wallpaper_processor.core import color_matrix
 from wallpaper_processor.core.base import WallpaperEffect
-from wallpaper_processor.core.exceptions import ProcessingError
+from wallpaper_processor.core.color_matrix import ColorMatrix
+from wallpaper_processor.core.imagemagick import run_imagemagick
 from wallpaper_processor.core.registry import register_effect
 from wallpaper_processor.core.types import EffectParams, NegateParams
 
@@ -51,55 +50,11 @@ class ImageMagickNegate(WallpaperEffect):
         if not isinstance(params, NegateParams):
             raise TypeError(f"Expected NegateParams, got {type(params)}")
 
-        # Create temporary files
-        with (
-            tempfile.NamedTemporaryFile(
-                suffix=".png", delete=False
-            ) as input_tmp,
-            tempfile.NamedTemporaryFile(
-                suffix=".png", delete=False
-            ) as output_tmp,
-        ):
-            input_path = Path(input_tmp.name)
-            output_path = Path(output_tmp.name)
-
-        try:
-            # Save input image
-            image.save(input_path)
-
-            # Build ImageMagick command
-            # -channel RGB -negate +channel inverts RGB channels only
-            cmd = [
-                "convert",
-                str(input_path),
-                "-channel",
-                "RGB",
-                "-negate",
-                "+channel",
-                str(output_path),
-            ]
-
-            # Run ImageMagick
-            result = subprocess.run(
-                cmd, capture_output=True, text=True, check=False
-            )
-
-            if result.returncode != 0:
-                raise ProcessingError(
-                    f"ImageMagick negate failed: {result.stderr}"
-                )
-
-            # Load result
-            negated_image = Image.open(output_path)
-            result_image = negated_image.copy()
-            negated_image.close()
-
-            return result_image
-
-        finally:
-            # Clean up temp files
-            input_path.unlink(missing_ok=True)
-            output_path.unlink(missing_ok=True)
+        # Build ImageMagick operations
+        # -channel RGB -negate +channel inverts RGB channels only
+        return run_imagemagick(
+            image, ["-channel", "RGB", "-negate", "+channel"], "negate"
+        )
 
 
 @register_effect("negate")
@@ -124,6 +79,12 @@ class PILNegate(WallpaperEffect):
         """Get default parameters."""
         return NegateParams()
 
+    def get_color_matrix(self, params: EffectParams) -> ColorMatrix | None:
+        """Get color inversion as a color matrix."""
+        if not isinstance(params, NegateParams):
+            return None
+        return color_matrix.invert()
+
     def apply(self, image: Image.Image, params: EffectParams) -> Image.Image:
         """Apply color inversion using PIL.
 
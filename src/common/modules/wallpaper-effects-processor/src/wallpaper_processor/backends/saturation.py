@@ -1,14 +1,13 @@
 """Saturation effect implementations (ImageMagick and PIL)."""
 
 import shutil
-import subprocess
-import tempfile
-from pathlib import Path
 
 from PIL import Image, ImageEnhance
 
+from wallpaper_processor.core import color_matrix
 from wallpaper_processor.core.base import WallpaperEffect
-from wallpaper_processor.core.exceptions import ProcessingError
+from wallpaper_processor.core.color_matrix import ColorMatrix
+from wallpaper_processor.core.imagemagick import run_imagemagick
 from wallpaper_processor.core.registry import register_effect
 from wallpaper_processor.core.types import EffectParams, SaturationParams
 
@@ -51,54 +50,12 @@ class ImageMagickSaturation(WallpaperEffect):
         if not isinstance(params, SaturationParams):
             raise TypeError(f"Expected SaturationParams, got {type(params)}")
 
-        # Create temporary files
-        with (
-            tempfile.NamedTemporaryFile(
-                suffix=".png", delete=False
-            ) as input_tmp,
-            tempfile.NamedTemporaryFile(
-                suffix=".png", delete=False
-            ) as output_tmp,
-        ):
-            input_path = Path(input_tmp.name)
-            output_path = Path(output_tmp.name)
-
-        try:
-            # Save input image
-            image.save(input_path)
-
-            # Convert adjustment percentage to ImageMagick modulate value
-            # modulate saturation: 0 = grayscale, 100 = original, 200 = double
-            saturation_value = 100 + params.adjustment
-            cmd = [
-                "convert",
-                str(input_path),
-                "-modulate",
-                f"100,{saturation_value},100",
-                str(output_path),
-            ]
-
-            # Run ImageMagick
-            result = subprocess.run(
-                cmd, capture_output=True, text=True, check=False
-            )
-
-            if result.returncode != 0:
-                raise ProcessingError(
-                    f"ImageMagick saturation failed: {result.stderr}"
-                )
-
-            # Load result
-            adjusted_image = Image.open(output_path)
-            result_image = adjusted_image.copy()
-            adjusted_image.close()
-
-            return result_image
-
-        finally:
-            # Clean up temp files
-            input_path.unlink(missing_ok=True)
-            output_path.unlink(missing_ok=True)
+        # Convert adjustment percentage to ImageMagick modulate value
+        # modulate saturation: 0 = grayscale, 100 = original, 200 = double
+        saturation_value = 100 + params.adjustment
+        return run_imagemagick(
+            image, ["-modulate", f"100,{saturation_value},100"], "saturation"
+        )
 
 
 @register_effect("saturation")
@@ -123,6 +80,12 @@ class PILSaturation(WallpaperEffect):
         """Get default parameters."""
         return SaturationParams()
 
+    def get_color_matrix(self, params: EffectParams) -> ColorMatrix | None:
+        """Get saturation adjustment as a color matrix."""
+        if not isinstance(params, SaturationParams):
+            return None
+        return color_matrix.saturate(1.0 + (params.adjustment / 100.0))
+
     def apply(self, image: Image.Image, params: EffectParams) -> Image.Image:
         """Apply saturation adjustment using PIL.
 
@@ -1,17 +1,55 @@
 """Vignette effect implementations (ImageMagick and PIL)."""
 
 import shutil
-import subprocess
-import tempfile
-from pathlib import Path
+from functools import lru_cache
 
-from PIL import Image, ImageDraw
+import numpy as np
+from PIL import Image
 
 from wallpaper_processor.core.base import WallpaperEffect
-from wallpaper_processor.core.exceptions import ProcessingError
+from wallpaper_processor.core.imagemagick import run_imagemagick
 from wallpaper_processor.core.registry import register_effect
 from wallpaper_processor.core.types import EffectParams, VignetteParams
 
+# Number of radial masks kept in memory (a 4K mask is ~8 MB)
+_MASK_CACHE_SIZE = 4
+
+
+@lru_cache(maxsize=_MASK_CACHE_SIZE)
+def _radial_mask(
+    width: int, height: int, strength: int, falloff: float
+) -> Image.Image:
+    """Build a radial vignette mask.
+
+    The mask is computed as a broadcasted distance field instead of a
+    per-pixel loop. Results are cached, so callers must not modify the
+    returned image.
+
+    Args:
+        width: Mask width in pixels
+        height: Mask height in pixels
+        strength: Vignette strength percentage (0-100)
+        falloff: Exponent applied to the normalized distance
+
+    Returns:
+        Grayscale ("L") mask, 255 at the center fading towards the edges
+    """
+    center_x, center_y = width // 2, height // 2
+    max_radius = ((width / 2) ** 2 + (height / 2) ** 2) ** 0.5
+
+    xs = np.arange(width, dtype=np.float32) - center_x
+    ys = np.arange(height, dtype=np.float32) - center_y
+    normalized = np.hypot(xs[np.newaxis, :], ys[:, np.newaxis])
+    normalized /= max_radius
+
+    if falloff != 1.0:
+        np.power(normalized, falloff, out=normalized)
+
+    values = 255 * (1 - normalized * (strength / 100.0))
+    np.clip(values, 0, 255, out=values)
+
+    return Image.fromarray(values.astype(np.uint8))
+
 
 @register_effect("vignette")
 class ImageMagickVignette(WallpaperEffect):
@@ -51,55 +89,11 @@ class ImageMagickVignette(WallpaperEffect):
         if not isinstance(params, VignetteParams):
             raise TypeError(f"Expected VignetteParams, got {type(params)}")
 
-        # Create temporary files
-        with (
-            tempfile.NamedTemporaryFile(
-                suffix=".png", delete=False
-            ) as input_tmp,
-            tempfile.NamedTemporaryFile(
-                suffix=".png", delete=False
-            ) as output_tmp,
-        ):
-            input_path = Path(input_tmp.name)
-            output_path = Path(output_tmp.name)
-
-        try:
-            # Save input image
-            image.save(input_path)
-
-            # ImageMagick vignette: -vignette {radius}x{sigma}+{x}+{y}
-            # We use strength to control the effect
-            # Higher strength = darker vignette
-            vignette_arg = f"0x{params.strength}"
-            cmd = [
-                "convert",
-                str(input_path),
-                "-vignette",
-                vignette_arg,
-                str(output_path),
-            ]
-
-            # Run ImageMagick
-            result = subprocess.run(
-                cmd, capture_output=True, text=True, check=False
-            )
-
-            if result.returncode != 0:
-                raise ProcessingError(
-                    f"ImageMagick vignette failed: {result.stderr}"
-                )
-
-            # Load result
-            vignetted_image = Image.open(output_path)
-            result_image = vignetted_image.copy()
-            vignetted_image.close()
-
-            return result_image
-
-        finally:
-            # Clean up temp files
-            input_path.unlink(missing_ok=True)
-            output_path.unlink(missing_ok=True)
+        # ImageMagick vignette: -vignette {radius}x{sigma}+{x}+{y}
+        # We use strength to control the effect
+        # Higher strength = darker vignette
+        vignette_arg = f"0x{params.strength}"
+        return run_imagemagick(image, ["-vignette", vignette_arg], "vignette")
 
 
 @register_effect("vignette")
@@ -137,35 +131,11 @@ class PILVignette(WallpaperEffect):
         if not isinstance(params, VignetteParams):
             raise TypeError(f"Expected VignetteParams, got {type(params)}")
 
-        # Create a radial gradient mask
         width, height = image.size
-        mask = Image.new("L", (width, height), 0)
-        _ = ImageDraw.Draw(mask)  # Unused but kept for potential future use
-
-        # Calculate center and radius
-        center_x, center_y = width // 2, height // 2
-        max_radius = ((width / 2) ** 2 + (height / 2) ** 2) ** 0.5
-
-        # Draw radial gradient
-        # Strength controls how dark the vignette is
-        strength_factor = params.strength / 100.0
-
-        for y in range(height):
-            for x in range(width):
-                # Calculate distance from center
-                distance = ((x - center_x) ** 2 + (y - center_y) ** 2) ** 0.5
-                # Normalize distance
-                normalized = distance / max_radius
-                # Apply strength
-                value = int(255 * (1 - normalized * strength_factor))
-                value = max(0, min(255, value))
-                mask.putpixel((x, y), value)
-
-        # Apply mask to darken edges
-        result = image.copy()
-        result.putalpha(mask)
-        # Composite with black background
+        mask = _radial_mask(width, height, params.strength, params.falloff)
+
+        # Composite with black background to darken edges
         background = Image.new("RGB", image.size, (0, 0, 0))
-        background.paste(result, mask=mask)
+        background.paste(image, mask=mask)
 
         return background
@@ -7,6 +7,7 @@ DEFAULT_PROCESSING_MODE = ProcessingMode.MEMORY
 DEFAULT_OUTPUT_FORMAT = OutputFormat.PNG
 DEFAULT_QUALITY = 95
 DEFAULT_WRITE_METADATA = False
+DEFAULT_FUSE_POINT_EFFECTS = True
 
 # Backend defaults
 DEFAULT_PREFER_IMAGEMAGICK = True
@@ -23,6 +24,7 @@ DEFAULT_BRIGHTNESS_ADJUSTMENT = -20
 DEFAULT_SATURATION_ADJUSTMENT = 0
 
 DEFAULT_VIGNETTE_STRENGTH = 20
+DEFAULT_VIGNETTE_FALLOFF = 1.0
 
 DEFAULT_COLOR_OVERLAY_COLOR = "#000000"
 DEFAULT_COLOR_OVERLAY_OPACITY = 0.3
@@ -4,6 +4,7 @@ from abc import ABC, abstractmethod
 from pathlib import Path
 
 from PIL import Image
+from wallpaper_processor.core.color_matrix import ColorMatrix
 from wallpaper_processor.core.exceptions import EffectNotAvailableError
 from wallpaper_processor.core.types import EffectParams
 
@@ -97,6 +98,24 @@ class WallpaperEffect(ABC):
         """
         pass
 
+    def get_color_matrix(
+        self,
+        params: EffectParams,  # noqa: ARG002
+    ) -> ColorMatrix | None:
+        """Get the effect as a 3x4 color matrix, if it is one.
+
+        Point-wise effects that are affine color transforms override this
+        so EffectPipeline can fuse consecutive ones into a single pass.
+        The matrix must reproduce ``apply`` on RGB images.
+
+        Args:
+            params: Effect parameters
+
+        Returns:
+            Color matrix, or None if the effect cannot be expressed as one
+        """
+        return None
+
     def ensure_available(self) -> None:
         """Ensure effect is available, raise if not.
 
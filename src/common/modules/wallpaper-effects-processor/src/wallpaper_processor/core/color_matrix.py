@@ -0,0 +1,148 @@
+"""3x4 color matrices for fusing point-wise effects.
+
+A color matrix is a 12-tuple in the layout accepted by
+``PIL.Image.convert("RGB", matrix)``::
+
+    (rr, rg, rb, r_offset,
+     gr, gg, gb, g_offset,
+     br, bg, bb, b_offset)
+
+Effects that are affine per-pixel color transforms expose one through
+``WallpaperEffect.get_color_matrix``; consecutive matrices are composed
+so the whole run is applied in a single pass.
+"""
+
+from itertools import product
+
+ColorMatrix = tuple[float, ...]
+
+# fmt: off
+IDENTITY: ColorMatrix = (
+    1.0, 0.0, 0.0, 0.0,
+    0.0, 1.0, 0.0, 0.0,
+    0.0, 0.0, 1.0, 0.0,
+)
+# fmt: on
+
+# ITU-R 601-2 luma weights, as used by PIL's convert("L")
+LUMA_WEIGHTS = (0.299, 0.587, 0.114)
+
+
+def scale(factor: float) -> ColorMatrix:
+    """Build a matrix multiplying every channel by factor.
+
+    Args:
+        factor: Channel multiplier
+
+    Returns:
+        Color matrix
+    """
+    # fmt: off
+    return (
+        factor, 0.0, 0.0, 0.0,
+        0.0, factor, 0.0, 0.0,
+        0.0, 0.0, factor, 0.0,
+    )
+    # fmt: on
+
+
+def saturate(factor: float) -> ColorMatrix:
+    """Build a matrix interpolating between luma and the original color.
+
+    Args:
+        factor: 0.0 = grayscale, 1.0 = original, >1.0 = more saturated
+
+    Returns:
+        Color matrix
+    """
+    rows: list[float] = []
+    for channel in range(3):
+        for source in range(3):
+            identity = 1.0 if channel == source else 0.0
+            rows.append(
+                (1 - factor) * LUMA_WEIGHTS[source] + factor * identity
+            )
+        rows.append(0.0)
+    return tuple(rows)
+
+
+def invert() -> ColorMatrix:
+    """Build a matrix inverting every channel.
+
+    Returns:
+        Color matrix
+    """
+    # fmt: off
+    return (
+        -1.0, 0.0, 0.0, 255.0,
+        0.0, -1.0, 0.0, 255.0,
+        0.0, 0.0, -1.0, 255.0,
+    )
+    # fmt: on
+
+
+def blend(color: tuple[int, int, int], opacity: float) -> ColorMatrix:
+    """Build a matrix blending every pixel towards a solid color.
+
+    Args:
+        color: Overlay color as (r, g, b)
+        opacity: Overlay opacity (0.0 to 1.0)
+
+    Returns:
+        Color matrix
+    """
+    keep = 1.0 - opacity
+    r, g, b = color
+    # fmt: off
+    return (
+        keep, 0.0, 0.0, r * opacity,
+        0.0, keep, 0.0, g * opacity,
+        0.0, 0.0, keep, b * opacity,
+    )
+    # fmt: on
+
+
+def compose(first: ColorMatrix, second: ColorMatrix) -> ColorMatrix:
+    """Compose two matrices so that ``second`` is applied after ``first``.
+
+    Args:
+        first: Matrix applied first
+        second: Matrix applied second
+
+    Returns:
+        Combined color matrix
+    """
+    result: list[float] = []
+    for row in range(3):
+        a = second[row * 4 : row * 4 + 4]
+        for col in range(4):
+            value = sum(a[k] * first[k * 4 + col] for k in range(3))
+            if col == 3:
+                value += a[3]
+            result.append(value)
+    return tuple(result)
+
+
+def maps_into_range(matrix: ColorMatrix) -> bool:
+    """Check whether a matrix keeps every 8-bit color within 0-255.
+
+    Intermediate results of a fused run are never clipped, so a matrix
+    may only be followed by another one when this holds. Being affine,
+    the extremes are reached at the corners of the RGB cube.
+
+    Args:
+        matrix: Color matrix
+
+    Returns:
+        True if no channel can leave the 0-255 range
+    """
+    for corner in product((0.0, 255.0), repeat=3):
+        for row in range(3):
+            coeffs = matrix[row * 4 : row * 4 + 4]
+            value = (
+                sum(c * v for c, v in zip(coeffs[:3], corner, strict=True))
+                + coeffs[3]
+            )
+            if value < -0.5 or value > 255.5:
+                return False
+    return True
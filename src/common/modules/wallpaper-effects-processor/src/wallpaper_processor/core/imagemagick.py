@@ -0,0 +1,104 @@
+"""Shared ImageMagick execution layer.
+
+Images are streamed to ImageMagick as raw pixel buffers over
+stdin/stdout (``convert rgb:- ... rgb:-``), so effects never encode,
+write or decode intermediate PNG files.
+"""
+
+import subprocess
+
+from PIL import Image
+
+from wallpaper_processor.config.defaults import DEFAULT_IMAGEMAGICK_BINARY
+from wallpaper_processor.core.exceptions import ProcessingError
+
+# PIL mode -> ImageMagick raw stream format
+_RAW_FORMATS = {
+    "RGB": "rgb",
+    "RGBA": "rgba",
+}
+
+
+def _prepare_image(image: Image.Image) -> Image.Image:
+    """Convert image to a mode that can be streamed as raw pixels.
+
+    Args:
+        image: PIL Image object
+
+    Returns:
+        Image in RGB or RGBA mode
+    """
+    if image.mode in _RAW_FORMATS:
+        return image
+
+    has_alpha = image.mode in ("LA", "PA") or (
+        image.mode == "P" and "transparency" in image.info
+    )
+    return image.convert("RGBA" if has_alpha else "RGB")
+
+
+def run_imagemagick(
+    image: Image.Image,
+    operations: list[str],
+    effect_name: str,
+    output_mode: str | None = None,
+    binary: str = DEFAULT_IMAGEMAGICK_BINARY,
+) -> Image.Image:
+    """Run ImageMagick operations on an image via raw pixel pipes.
+
+    Args:
+        image: PIL Image object
+        operations: ImageMagick operators placed between the input and
+            output streams (e.g. ``["-blur", "0x8"]``)
+        effect_name: Effect name used in error messages
+        output_mode: PIL mode to read back ("RGB" or "RGBA"). Defaults
+            to the mode the image was streamed in.
+        binary: ImageMagick binary to execute
+
+    Returns:
+        Processed PIL Image object (same size as the input)
+
+    Raises:
+        ProcessingError: If ImageMagick fails or returns a truncated
+            buffer
+    """
+    source = _prepare_image(image)
+    output_mode = output_mode or source.mode
+    if output_mode not in _RAW_FORMATS:
+        raise ValueError(f"Unsupported output mode: {output_mode}")
+
+    width, height = source.size
+    cmd = [
+        binary,
+        "-size",
+        f"{width}x{height}",
+        "-depth",
+        "8",
+        f"{_RAW_FORMATS[source.mode]}:-",
+        *operations,
+        "-depth",
+        "8",
+        f"{_RAW_FORMATS[output_mode]}:-",
+    ]
+
+    try:
+        result = subprocess.run(
+            cmd, input=source.tobytes(), capture_output=True, check=False
+        )
+    except OSError as e:
+        raise ProcessingError(f"ImageMagick {effect_name} failed: {e}") from e
+
+    if result.returncode != 0:
+        stderr = result.stderr.decode(errors="replace")
+        raise ProcessingError(f"ImageMagick {effect_name} failed: {stderr}")
+
+    expected = width * height * len(output_mode)
+    if len(result.stdout) != expected:
+        raise ProcessingError(
+            f"ImageMagick {effect_name} failed: expected {expected} bytes, "
+            f"got {len(result.stdout)}"
+        )
+
+    return Image.frombuffer(
+        output_mode, (width, height), result.stdout, "raw", output_mode, 0, 1
+    )
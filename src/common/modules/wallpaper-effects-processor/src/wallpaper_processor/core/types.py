@@ -10,10 +10,12 @@ from wallpaper_processor.config.defaults import (
     DEFAULT_BRIGHTNESS_ADJUSTMENT,
     DEFAULT_COLOR_OVERLAY_COLOR,
     DEFAULT_COLOR_OVERLAY_OPACITY,
+    DEFAULT_FUSE_POINT_EFFECTS,
     DEFAULT_OUTPUT_FORMAT,
     DEFAULT_PROCESSING_MODE,
     DEFAULT_QUALITY,
     DEFAULT_SATURATION_ADJUSTMENT,
+    DEFAULT_VIGNETTE_FALLOFF,
     DEFAULT_VIGNETTE_STRENGTH,
     DEFAULT_WRITE_METADATA,
 )
@@ -71,6 +73,12 @@ class VignetteParams(EffectParams):
         default=DEFAULT_VIGNETTE_STRENGTH,
         description="Vignette strength percentage",
     )
+    falloff: float = Field(
+        gt=0.0,
+        le=10.0,
+        default=DEFAULT_VIGNETTE_FALLOFF,
+        description="Falloff curve exponent (1.0 = linear, >1 = softer)",
+    )
 
 
 class ColorOverlayParams(EffectParams):
@@ -128,6 +136,10 @@ class ProcessorConfig(BaseModel):
         description="Quality for lossy formats",
     )
     write_metadata: bool = DEFAULT_WRITE_METADATA
+    fuse_point_effects: bool = Field(
+        default=DEFAULT_FUSE_POINT_EFFECTS,
+        description="Apply runs of point-wise effects in a single pass",
+    )
 
 
 class EffectMetadata(BaseModel):
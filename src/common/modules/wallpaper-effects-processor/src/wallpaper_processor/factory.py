@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+import os
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+from PIL import Image
+
 # Import backends module to trigger effect registration
 from wallpaper_processor import backends  # noqa: F401
 from wallpaper_processor.config import AppConfig
@@ -193,20 +198,20 @@ class EffectFactory:
         available = {}
 
         for effect_name in effects:
-            backends = []
+            effect_backends = []
 
             # Check ImageMagick
             im_effect = EffectFactory._create_imagemagick(effect_name)
             if im_effect is not None and im_effect.is_available():
-                backends.append("imagemagick")
+                effect_backends.append("imagemagick")
 
             # Check PIL
             pil_effect = EffectFactory._create_pil(effect_name)
             if pil_effect is not None and pil_effect.is_available():
-                backends.append("pil")
+                effect_backends.append("pil")
 
-            if backends:
-                available[effect_name] = backends
+            if effect_backends:
+                available[effect_name] = effect_backends
 
         return available
 
@@ -253,40 +258,120 @@ class EffectFactory:
         if settings is None:
             settings = AppConfig()
 
-        if config is None:
-            config = ProcessorConfig()
-
         # Get image name without extension
         image_name = input_path.stem
 
-        # Create output subdirectory
-        variant_dir = output_dir / image_name
-        variant_dir.mkdir(parents=True, exist_ok=True)
-
         # Get all available effects
-        effects = EffectFactory.list_available_effects()
+        effects = EffectFactory.list_available_effects(settings)
+
+        return EffectFactory.generate_variants(
+            input_path,
+            output_dir / image_name,
+            list(effects),
+            settings,
+            config,
+        )
 
-        # Generate variant for each effect
-        results = {}
-        for effect_name in effects:
-            # Create effect with default parameters
-            effect = EffectFactory.create(effect_name, settings)
-            params = EffectFactory._create_params(effect_name, {})
+    @staticmethod
+    def generate_variants(
+        input_path: Path,
+        output_dir: Path,
+        effect_names: list[str],
+        settings: AppConfig | None = None,
+        config: ProcessorConfig | None = None,
+        max_workers: int | None = None,
+        progress_callback: (
+            Callable[[str, Path | None, Exception | None], None] | None
+        ) = None,
+    ) -> dict[str, Path]:
+        """Generate one variant per effect from a single decode of the input.
+
+        The input image is decoded once and shared (read-only) by every
+        effect, which run in parallel threads. Each variant uses the
+        effect's default parameters and is written to
+        ``output_dir/<effect_name>.<format>``.
+
+        Args:
+            input_path: Path to input image
+            output_dir: Directory to write variants to (created if missing)
+            effect_names: Effects to generate variants for
+            settings: Application configuration (uses defaults if None)
+            config: Processing configuration (uses defaults if None)
+            max_workers: Number of worker threads (defaults to CPU count)
+            progress_callback: Optional callback(effect_name, output_path,
+                error) invoked as each variant finishes. output_path is
+                None and error is set if the effect failed.
 
-            # Create pipeline with single effect
-            pipeline = EffectPipeline([(effect, params)], config)
+        Returns:
+            Dict mapping effect names to output paths. Effects that failed
+            are omitted.
 
-            # Determine output extension
-            output_ext = config.output_format.value
-            if output_ext == "jpg":
-                output_ext = "jpeg"
+        Raises:
+            FileNotFoundError: If input file doesn't exist
+            ValueError: If an effect name is unknown
+        """
+        if not input_path.exists():
+            raise FileNotFoundError(f"Input file not found: {input_path}")
 
-            # Generate output path
-            output_path = variant_dir / f"{effect_name}.{output_ext}"
+        if settings is None:
+            settings = AppConfig()
+
+        if config is None:
+            config = ProcessorConfig()
+
+        output_dir.mkdir(parents=True, exist_ok=True)
 
-            # Apply effect
-            pipeline.apply(input_path, output_path)
+        # Determine output extension
+        output_ext = config.output_format.value
+        if output_ext == "jpg":
+            output_ext = "jpeg"
 
-            results[effect_name] = output_path
+        # Build one single-effect pipeline per variant
+        pipelines: dict[str, tuple[EffectPipeline, Path]] = {}
+        for effect_name in effect_names:
+            effect = EffectFactory.create(effect_name, settings)
+            params = EffectFactory.create_params(effect_name, {})
+            pipelines[effect_name] = (
+                EffectPipeline([(effect, params)], config),
+                output_dir / f"{effect_name}.{output_ext}",
+            )
 
-        return results
+        if not pipelines:
+            return {}
+
+        # Decode once; effects never modify their input image
+        source = Image.open(input_path)
+        source.load()
+
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        max_workers = max(1, min(max_workers, len(pipelines)))
+
+        results: dict[str, Path] = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(
+                    pipeline.apply, input_path, output_path, source
+                ): effect_name
+                for effect_name, (pipeline, output_path) in pipelines.items()
+            }
+
+            for future in as_completed(futures):
+                effect_name = futures[future]
+                error: Exception | None = None
+                variant_path: Path | None = None
+                try:
+                    variant_path = future.result()
+                except Exception as e:
+                    # One failing effect must not abort the other variants
+                    error = e
+                else:
+                    results[effect_name] = variant_path
+
+                if progress_callback:
+                    progress_callback(effect_name, variant_path, error)
+
+        # Keep the requested order
+        return {
+            name: results[name] for name in effect_names if name in results
+        }
@@ -6,6 +6,11 @@ from pathlib import Path
 from PIL import Image
 from wallpaper_processor.config.enums import ProcessingMode
 from wallpaper_processor.core.base import WallpaperEffect
+from wallpaper_processor.core.color_matrix import (
+    ColorMatrix,
+    compose,
+    maps_into_range,
+)
 from wallpaper_processor.core.exceptions import ProcessingError
 from wallpaper_processor.core.types import (
     EffectMetadata,
@@ -33,12 +38,20 @@ class EffectPipeline:
         self.config = config or ProcessorConfig()
         self.metadata: ProcessingMetadata | None = None
 
-    def apply(self, input_path: Path, output_path: Path) -> Path:
+    def apply(
+        self,
+        input_path: Path,
+        output_path: Path,
+        source: Image.Image | None = None,
+    ) -> Path:
         """Apply all effects in sequence.
 
         Args:
             input_path: Input image path
             output_path: Output image path
+            source: Already decoded input image. In memory mode it is used
+                instead of re-opening input_path, so several pipelines can
+                share one decode. It is never modified.
 
         Returns:
             Path to output file
@@ -56,7 +69,7 @@ class EffectPipeline:
 
         # Choose processing mode
         if self.config.processing_mode == ProcessingMode.MEMORY:
-            result_path = self._apply_memory(input_path, output_path)
+            result_path = self._apply_memory(input_path, output_path, source)
         else:
             result_path = self._apply_file(input_path, output_path)
 
@@ -85,28 +98,44 @@ class EffectPipeline:
 
         return result_path
 
-    def _apply_memory(self, input_path: Path, output_path: Path) -> Path:
+    def _apply_memory(
+        self,
+        input_path: Path,
+        output_path: Path,
+        source: Image.Image | None = None,
+    ) -> Path:
         """Apply effects in memory (fast).
 
         Args:
             input_path: Input image path
             output_path: Output image path
+            source: Already decoded input image (opened from input_path
+                if None)
 
         Returns:
             Path to output file
         """
-        image = Image.open(input_path)
+        image = source if source is not None else Image.open(input_path)
+
+        # Apply each effect (or fused run of point-wise effects) in sequence
+        index = 0
+        while index < len(self.effects):
+            effect, params = self.effects[index]
+            run_length, matrix = self._find_fusable_run(index, image)
 
-        # Apply each effect in sequence
-        for effect, params in self.effects:
             try:
-                image = effect.apply(image, params)
+                if matrix is not None:
+                    image = image.convert("RGB", matrix)
+                else:
+                    image = effect.apply(image, params)
             except Exception as e:
-                msg = (
-                    f"Failed to apply {effect.effect_name} "
-                    f"({effect.backend_name}): {e}"
+                names = ", ".join(
+                    f"{fused.effect_name} ({fused.backend_name})"
+                    for fused, _ in self.effects[index : index + run_length]
                 )
-                raise ProcessingError(msg) from e
+                raise ProcessingError(f"Failed to apply {names}: {e}") from e
+
+            index += run_length
 
         # Save with configured format and quality
         save_kwargs = {}
@@ -116,6 +145,45 @@ class EffectPipeline:
         image.save(output_path, **save_kwargs)
         return output_path
 
+    def _find_fusable_run(
+        self, start: int, image: Image.Image
+    ) -> tuple[int, ColorMatrix | None]:
+        """Find a run of point-wise effects that can be applied in one pass.
+
+        Consecutive effects exposing a color matrix are composed for as
+        long as every intermediate result stays within 0-255 (the fused
+        pass only clips once, at the end). Only RGB images are fused.
+
+        Args:
+            start: Index of the first effect of the run
+            image: Image the run will be applied to
+
+        Returns:
+            Tuple of (number of effects consumed, fused matrix). The matrix
+            is None when the effect at ``start`` must be applied on its own.
+        """
+        if not self.config.fuse_point_effects or image.mode != "RGB":
+            return 1, None
+
+        effect, params = self.effects[start]
+        fused = effect.get_color_matrix(params)
+        if fused is None:
+            return 1, None
+
+        end = start + 1
+        while end < len(self.effects) and maps_into_range(fused):
+            effect, params = self.effects[end]
+            matrix = effect.get_color_matrix(params)
+            if matrix is None:
+                break
+            fused = compose(fused, matrix)
+            end += 1
+
+        # A lone effect is applied directly to keep its exact output
+        if end - start == 1:
+            return 1, None
+        return end - start, fused
+
     def _apply_file(self, input_path: Path, output_path: Path) -> Path:
         """Apply effects file-by-file (memory efficient).
 
@@ -0,0 +1,69 @@
+"""Tests for color matrix helpers."""
+
+import pytest
+from PIL import Image, ImageEnhance
+
+from wallpaper_processor.core import color_matrix
+
+
+def _apply(matrix, pixel):
+    """Apply a color matrix to a single pixel."""
+    return Image.new("RGB", (1, 1), pixel).convert("RGB", matrix).getpixel(
+        (0, 0)
+    )
+
+
+class TestColorMatrix:
+    """Tests for color matrix construction and composition."""
+
+    def test_identity(self):
+        """Test identity matrix leaves pixels unchanged."""
+        assert _apply(color_matrix.IDENTITY, (12, 34, 56)) == (12, 34, 56)
+
+    def test_scale(self):
+        """Test scale matches PIL brightness enhancement."""
+        image = Image.new("RGB", (1, 1), (200, 100, 50))
+        expected = ImageEnhance.Brightness(image).enhance(0.5).getpixel((0, 0))
+        assert _apply(color_matrix.scale(0.5), (200, 100, 50)) == expected
+
+    def test_saturate_zero_is_grayscale(self):
+        """Test zero saturation produces equal channels."""
+        r, g, b = _apply(color_matrix.saturate(0.0), (200, 100, 50))
+        assert r == g == b
+
+    def test_invert(self):
+        """Test invert matrix."""
+        assert _apply(color_matrix.invert(), (0, 128, 255)) == (255, 127, 0)
+
+    def test_blend(self):
+        """Test blend towards a solid color."""
+        matrix = color_matrix.blend((255, 0, 0), 0.5)
+        assert _apply(matrix, (0, 0, 0)) == (128, 0, 0)
+
+    def test_compose_order(self):
+        """Test second matrix is applied after the first."""
+        matrix = color_matrix.compose(
+            color_matrix.invert(), color_matrix.scale(0.5)
+        )
+        assert _apply(matrix, (0, 0, 0)) == (128, 128, 128)
+
+    def test_compose_with_identity(self):
+        """Test composing with identity is a no-op."""
+        matrix = color_matrix.saturate(0.3)
+        composed = color_matrix.compose(matrix, color_matrix.IDENTITY)
+        assert composed == pytest.approx(matrix)
+
+    @pytest.mark.parametrize(
+        ("matrix", "expected"),
+        [
+            (color_matrix.IDENTITY, True),
+            (color_matrix.invert(), True),
+            (color_matrix.scale(0.8), True),
+            (color_matrix.scale(1.5), False),
+            (color_matrix.saturate(2.0), False),
+            (color_matrix.blend((255, 255, 255), 0.4), True),
+        ],
+    )
+    def test_maps_into_range(self, matrix, expected):
+        """Test range check for intermediate results."""
+        assert color_matrix.maps_into_range(matrix) is expected
@@ -252,6 +252,52 @@ class TestPILVignette:
         assert isinstance(params, VignetteParams)
         assert params.strength == 20
 
+    def test_apply_darkens_edges(self):
+        """Test that corners are darker than the center."""
+        from wallpaper_processor.backends import PILVignette
+        from wallpaper_processor.core.types import VignetteParams
+
+        image = Image.new("RGB", (64, 48), color=(200, 200, 200))
+        result = PILVignette().apply(image, VignetteParams(strength=80))
+
+        assert result.getpixel((32, 24)) == (200, 200, 200)
+        assert result.getpixel((0, 0))[0] < 100
+
+    def test_mask_matches_reference(self):
+        """Test vectorized mask against the per-pixel formula."""
+        from wallpaper_processor.backends.vignette import _radial_mask
+
+        width, height, strength = 31, 17, 40
+        mask = _radial_mask(width, height, strength, 1.0)
+
+        center_x, center_y = width // 2, height // 2
+        max_radius = ((width / 2) ** 2 + (height / 2) ** 2) ** 0.5
+        for y in range(height):
+            for x in range(width):
+                distance = ((x - center_x) ** 2 + (y - center_y) ** 2) ** 0.5
+                value = int(255 * (1 - distance / max_radius * strength / 100))
+                assert mask.getpixel((x, y)) == max(0, min(255, value))
+
+    def test_mask_is_cached(self):
+        """Test masks are reused for the same size and parameters."""
+        from wallpaper_processor.backends.vignette import _radial_mask
+
+        first = _radial_mask(40, 30, 20, 1.0)
+        assert _radial_mask(40, 30, 20, 1.0) is first
+        assert _radial_mask(40, 30, 20, 2.0) is not first
+
+    def test_falloff_softens_vignette(self):
+        """Test higher falloff keeps mid-range pixels brighter."""
+        from wallpaper_processor.backends import PILVignette
+        from wallpaper_processor.core.types import VignetteParams
+
+        image = Image.new("RGB", (100, 100), color=(255, 255, 255))
+        effect = PILVignette()
+        linear = effect.apply(image, VignetteParams(strength=50))
+        soft = effect.apply(image, VignetteParams(strength=50, falloff=3.0))
+
+        assert soft.getpixel((25, 50)) > linear.getpixel((25, 50))
+
 
 class TestPILColorOverlay:
     """Tests for PIL color overlay effect."""
@@ -173,3 +173,89 @@ class TestEffectFactory:
         assert len(dark_blur.effects) == 2
         assert len(aesthetic.effects) == 3
         assert len(lockscreen.effects) == 3
+
+
+class TestGenerateVariants:
+    """Tests for batch variant generation."""
+
+    @pytest.fixture
+    def pil_config(self, mock_app_config):
+        """Configuration that always uses PIL backends."""
+        return mock_app_config
+
+    def test_generate_variants(self, test_image_file, tmp_path, pil_config):
+        """Test one output is written per requested effect."""
+        output_dir = tmp_path / "variants"
+
+        results = EffectFactory.generate_variants(
+            test_image_file,
+            output_dir,
+            ["negate", "blur", "grayscale"],
+            pil_config,
+        )
+
+        assert list(results) == ["negate", "blur", "grayscale"]
+        for effect_name, path in results.items():
+            assert path == output_dir / f"{effect_name}.png"
+            assert path.exists()
+
+    def test_generate_variants_decodes_once(
+        self, test_image_file, tmp_path, pil_config
+    ):
+        """Test the input image is opened a single time."""
+        from unittest.mock import patch
+
+        from PIL import Image
+
+        with patch(
+            "wallpaper_processor.factory.Image.open", wraps=Image.open
+        ) as mock_open:
+            EffectFactory.generate_variants(
+                test_image_file,
+                tmp_path / "variants",
+                ["negate", "blur", "brightness", "vignette"],
+                pil_config,
+            )
+
+        assert mock_open.call_count == 1
+
+    def test_generate_variants_reports_failures(
+        self, test_image_file, tmp_path, pil_config
+    ):
+        """Test a failing effect is reported and omitted."""
+        from unittest.mock import patch
+
+        from wallpaper_processor.backends import PILBlur
+
+        calls = []
+        with patch.object(PILBlur, "apply", side_effect=RuntimeError("boom")):
+            results = EffectFactory.generate_variants(
+                test_image_file,
+                tmp_path / "variants",
+                ["blur", "negate"],
+                pil_config,
+                progress_callback=lambda *args: calls.append(args),
+            )
+
+        assert list(results) == ["negate"]
+        errors = {name: error for name, _, error in calls}
+        assert errors["negate"] is None
+        assert "boom" in str(errors["blur"])
+
+    def test_generate_variants_missing_input(self, tmp_path, pil_config):
+        """Test missing input raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            EffectFactory.generate_variants(
+                tmp_path / "missing.png", tmp_path, ["blur"], pil_config
+            )
+
+    def test_generate_all_variants(
+        self, test_image_file, tmp_path, pil_config
+    ):
+        """Test all variants go into a subdirectory named after the image."""
+        results = EffectFactory.generate_all_variants(
+            test_image_file, tmp_path, pil_config
+        )
+
+        assert "negate" in results
+        assert results["negate"].parent == tmp_path / test_image_file.stem
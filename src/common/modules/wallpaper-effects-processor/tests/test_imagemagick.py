@@ -0,0 +1,132 @@
+"""Tests for the shared ImageMagick execution layer."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+from PIL import Image
+
+from wallpaper_processor.backends import ImageMagickBlur, ImageMagickGrayscale
+from wallpaper_processor.core.exceptions import ProcessingError
+from wallpaper_processor.core.imagemagick import run_imagemagick
+from wallpaper_processor.core.types import BlurParams, GrayscaleParams
+
+
+def _echo(cmd, input, **kwargs):
+    """Fake ImageMagick that returns the input pixels unchanged."""
+    return Mock(returncode=0, stdout=input, stderr=b"")
+
+
+class TestRunImageMagick:
+    """Tests for run_imagemagick."""
+
+    def test_streams_raw_rgb(self, test_image):
+        """Test image is piped as raw RGB over stdin/stdout."""
+        with patch(
+            "wallpaper_processor.core.imagemagick.subprocess.run",
+            side_effect=_echo,
+        ) as mock_run:
+            result = run_imagemagick(test_image, ["-negate"], "negate")
+
+        cmd = mock_run.call_args.args[0]
+        assert cmd == [
+            "convert",
+            "-size",
+            "100x100",
+            "-depth",
+            "8",
+            "rgb:-",
+            "-negate",
+            "-depth",
+            "8",
+            "rgb:-",
+        ]
+        assert mock_run.call_args.kwargs["input"] == test_image.tobytes()
+        assert result.mode == "RGB"
+        assert result.tobytes() == test_image.tobytes()
+
+    def test_streams_raw_rgba(self):
+        """Test alpha channel is preserved."""
+        image = Image.new("RGBA", (8, 4), color=(10, 20, 30, 40))
+        with patch(
+            "wallpaper_processor.core.imagemagick.subprocess.run",
+            side_effect=_echo,
+        ) as mock_run:
+            result = run_imagemagick(image, [], "test")
+
+        cmd = mock_run.call_args.args[0]
+        assert cmd[5] == "rgba:-"
+        assert cmd[-1] == "rgba:-"
+        assert result.getpixel((0, 0)) == (10, 20, 30, 40)
+
+    def test_converts_unsupported_modes(self):
+        """Test grayscale input is converted to RGB before streaming."""
+        image = Image.new("L", (4, 4), color=100)
+        with patch(
+            "wallpaper_processor.core.imagemagick.subprocess.run",
+            side_effect=_echo,
+        ):
+            result = run_imagemagick(image, [], "test")
+
+        assert result.mode == "RGB"
+        assert result.getpixel((0, 0)) == (100, 100, 100)
+
+    def test_output_mode(self):
+        """Test reading back a different raw format."""
+        image = Image.new("RGBA", (2, 2))
+        with patch(
+            "wallpaper_processor.core.imagemagick.subprocess.run",
+            return_value=Mock(returncode=0, stdout=b"\x00" * 12, stderr=b""),
+        ) as mock_run:
+            result = run_imagemagick(image, [], "test", output_mode="RGB")
+
+        assert mock_run.call_args.args[0][-1] == "rgb:-"
+        assert result.mode == "RGB"
+
+    def test_failure_raises_processing_error(self, test_image):
+        """Test non-zero exit status raises ProcessingError."""
+        with (
+            patch(
+                "wallpaper_processor.core.imagemagick.subprocess.run",
+                return_value=Mock(returncode=1, stdout=b"", stderr=b"boom"),
+            ),
+            pytest.raises(ProcessingError, match="ImageMagick blur failed"),
+        ):
+            run_imagemagick(test_image, [], "blur")
+
+    def test_truncated_output_raises(self, test_image):
+        """Test short output buffer raises ProcessingError."""
+        with (
+            patch(
+                "wallpaper_processor.core.imagemagick.subprocess.run",
+                return_value=Mock(returncode=0, stdout=b"\x00", stderr=b""),
+            ),
+            pytest.raises(ProcessingError, match="expected 30000 bytes"),
+        ):
+            run_imagemagick(test_image, [], "blur")
+
+
+class TestImageMagickBackends:
+    """Tests for ImageMagick backends using the pipe layer."""
+
+    def test_blur_operations(self, test_image):
+        """Test blur passes its operator to ImageMagick."""
+        with patch(
+            "wallpaper_processor.core.imagemagick.subprocess.run",
+            side_effect=_echo,
+        ) as mock_run:
+            result = ImageMagickBlur().apply(test_image, BlurParams(sigma=5))
+
+        assert "-blur" in mock_run.call_args.args[0]
+        assert "0x5.0" in mock_run.call_args.args[0]
+        assert result.size == test_image.size
+
+    def test_grayscale_reads_back_rgb(self):
+        """Test grayscale always returns an RGB image."""
+        image = Image.new("RGBA", (4, 4))
+        with patch(
+            "wallpaper_processor.core.imagemagick.subprocess.run",
+            return_value=Mock(returncode=0, stdout=b"\x00" * 48, stderr=b""),
+        ):
+            result = ImageMagickGrayscale().apply(image, GrayscaleParams())
+
+        assert result.mode == "RGB"
@@ -293,3 +293,93 @@ class TestEffectPipeline:
         assert result == output_path
         assert output_path.exists()
         assert pipeline.config is not None
+
+
+class TestEffectPipelineFusion:
+    """Tests for fusing point-wise effects into a single pass."""
+
+    @pytest.fixture
+    def gradient_file(self, tmp_path):
+        """Create a colorful test image file."""
+        image_path = tmp_path / "gradient.png"
+        image = Image.new("RGB", (64, 64))
+        pixels = image.load()
+        for y in range(64):
+            for x in range(64):
+                pixels[x, y] = (x * 4, y * 4, 255 - x * 2)
+        image.save(image_path)
+        return image_path
+
+    @staticmethod
+    def _point_effects():
+        from wallpaper_processor.backends import (
+            PILColorOverlay,
+            PILNegate,
+            PILSaturation,
+        )
+        from wallpaper_processor.core.types import (
+            ColorOverlayParams,
+            NegateParams,
+            SaturationParams,
+        )
+
+        return [
+            (PILSaturation(), SaturationParams(adjustment=-40)),
+            (PILBrightness(), BrightnessParams(adjustment=-20)),
+            (PILNegate(), NegateParams()),
+            (PILColorOverlay(), ColorOverlayParams(color="#ff00ff")),
+        ]
+
+    def test_fused_matches_sequential(self, gradient_file, tmp_path):
+        """Test fused output matches applying effects one by one."""
+        fused_path = tmp_path / "fused.png"
+        plain_path = tmp_path / "plain.png"
+
+        EffectPipeline(self._point_effects()).apply(gradient_file, fused_path)
+        EffectPipeline(
+            self._point_effects(),
+            ProcessorConfig(fuse_point_effects=False),
+        ).apply(gradient_file, plain_path)
+
+        fused = Image.open(fused_path).tobytes()
+        plain = Image.open(plain_path).tobytes()
+        assert max(abs(a - b) for a, b in zip(fused, plain, strict=True)) <= 3
+
+    def test_run_is_fused(self, gradient_file):
+        """Test consecutive point-wise effects are consumed as one run."""
+        pipeline = EffectPipeline(self._point_effects())
+        image = Image.open(gradient_file)
+
+        run_length, matrix = pipeline._find_fusable_run(0, image)
+
+        assert run_length == 4
+        assert matrix is not None
+
+    def test_run_stops_at_non_point_effect(self, gradient_file):
+        """Test fusion stops at effects without a color matrix."""
+        effects = self._point_effects()
+        effects.insert(2, (PILBlur(), BlurParams(sigma=2)))
+        pipeline = EffectPipeline(effects)
+        image = Image.open(gradient_file)
+
+        assert pipeline._find_fusable_run(0, image)[0] == 2
+        assert pipeline._find_fusable_run(2, image) == (1, None)
+
+    def test_run_stops_after_clipping_effect(self, gradient_file):
+        """Test effects that may clip are only fused as the last step."""
+        pipeline = EffectPipeline(
+            [
+                (PILBrightness(), BrightnessParams(adjustment=50)),
+                (PILBrightness(), BrightnessParams(adjustment=-50)),
+            ]
+        )
+        image = Image.open(gradient_file)
+
+        assert pipeline._find_fusable_run(0, image) == (1, None)
+
+    def test_non_rgb_images_not_fused(self, tmp_path):
+        """Test images that are not RGB use the regular path."""
+        pipeline = EffectPipeline(self._point_effects())
+        image = Image.new("RGBA", (4, 4))
+
+        assert pipeline._find_fusable_run(0, image) == (1, None)
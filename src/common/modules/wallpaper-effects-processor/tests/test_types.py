@@ -155,6 +155,16 @@ class TestVignetteParams:
         with pytest.raises(ValidationError):
             VignetteParams(strength=101)
 
+    def test_falloff_default(self):
+        """Test falloff defaults to a linear curve."""
+        params = VignetteParams()
+        assert params.falloff == 1.0
+
+    def test_falloff_validation(self):
+        """Test falloff must be positive."""
+        with pytest.raises(ValidationError):
+            VignetteParams(falloff=0)
+
 
 class TestColorOverlayParams:
     """Tests for ColorOverlayParams."""
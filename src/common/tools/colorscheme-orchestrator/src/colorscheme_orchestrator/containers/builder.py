@@ -2,10 +2,29 @@
 
 from pathlib import Path
 
-from dotfiles_container_manager import BuildContext, ContainerEngine
+from dotfiles_container_manager import (
+    BUILD_DIGEST_LABEL,
+    BuildContext,
+    ContainerEngine,
+    ImageNotFoundError,
+    build_context_digest,
+)
 
 from colorscheme_orchestrator.containers.registry import BackendRegistry
 from colorscheme_orchestrator.exceptions import ImageBuildError
+from colorscheme_orchestrator.logging import get_logger
+
+logger = get_logger("builder")
+
+# Excluded when streaming the generator module into the build context
+BUILD_CONTEXT_IGNORE = [
+    "__pycache__",
+    "*.pyc",
+    ".venv",
+    ".pytest_cache",
+    ".mypy_cache",
+    ".ruff_cache",
+]
 
 
 class ContainerBuilder:
@@ -28,38 +47,6 @@ class ContainerBuilder:
         self.registry = registry
         self.colorscheme_generator_path = colorscheme_generator_path
 
-    def _add_directory_to_context(
-        self,
-        files: dict[str, bytes],
-        directory: Path,
-        prefix: str = "",
-    ) -> None:
-        """Recursively add directory contents to build context.
-
-        Args:
-            files: Files dictionary to add to
-            directory: Directory to add
-            prefix: Prefix for file paths in context
-        """
-        for item in directory.rglob("*"):
-            if item.is_file():
-                # Skip __pycache__ and .pyc files
-                if "__pycache__" in item.parts or item.suffix == ".pyc":
-                    continue
-
-                # Get relative path from directory
-                rel_path = item.relative_to(directory)
-
-                # Create path in context
-                if prefix:
-                    context_path = f"{prefix}/{rel_path}"
-                else:
-                    context_path = str(rel_path)
-
-                # Read file content
-                with item.open("rb") as f:
-                    files[context_path] = f.read()
-
     def image_exists(self, image_name: str, image_tag: str = "latest") -> bool:
         """Check if container image exists.
 
@@ -77,6 +64,86 @@ class ContainerBuilder:
         except Exception:
             return False
 
+    def image_digest(
+        self, image_name: str, image_tag: str = "latest"
+    ) -> str | None:
+        """Get the build context digest an image was built from.
+
+        Args:
+            image_name: Image name
+            image_tag: Image tag
+
+        Returns:
+            str | None: Digest label, or None if the image doesn't exist
+                or predates digest labels
+        """
+        try:
+            info = self.engine.images.inspect(f"{image_name}:{image_tag}")
+        except ImageNotFoundError:
+            return None
+        return info.labels.get(BUILD_DIGEST_LABEL)
+
+    def create_build_context(
+        self, backend: str, no_cache: bool = False
+    ) -> BuildContext:
+        """Create the build context for a backend image.
+
+        The context is labelled with its content digest so later builds
+        can tell whether the existing image is still current.
+
+        Args:
+            backend: Backend name
+            no_cache: Build without using cache
+
+        Returns:
+            BuildContext: Build context
+
+        Raises:
+            ImageBuildError: If the Dockerfile or the colorscheme-generator
+                module is missing
+        """
+        metadata = self.registry.get(backend)
+
+        # Read Dockerfile
+        if not metadata.dockerfile_path.exists():
+            raise ImageBuildError(
+                backend=backend,
+                message=f"Dockerfile not found: {metadata.dockerfile_path}",
+            )
+
+        with metadata.dockerfile_path.open() as f:
+            dockerfile_content = f.read()
+
+        # Create build context with files
+        files = {}
+
+        # Add entrypoint script
+        if metadata.entrypoint_path.exists():
+            with metadata.entrypoint_path.open("rb") as f:
+                files["entrypoint.py"] = f.read()
+
+        # Add colorscheme-generator module files
+        # The directory is streamed into the context at build time
+        if not self.colorscheme_generator_path.exists():
+            raise ImageBuildError(
+                backend=backend,
+                message=(
+                    "colorscheme-generator module not found: "
+                    f"{self.colorscheme_generator_path}"
+                ),
+            )
+        paths = {"colorscheme-generator": self.colorscheme_generator_path}
+
+        context = BuildContext(
+            dockerfile=dockerfile_content,
+            files=files,
+            paths=paths,
+            ignore=BUILD_CONTEXT_IGNORE,
+            no_cache=no_cache,
+        )
+        context.labels[BUILD_DIGEST_LABEL] = build_context_digest(context)
+        return context
+
     def build_backend_image(
         self,
         backend: str,
@@ -85,93 +152,56 @@ class ContainerBuilder:
     ) -> str:
         """Build container image for a backend.
 
+        The build is skipped when an image built from an identical
+        context (same Dockerfile, entrypoint and module sources) already
+        exists, and triggered whenever any of them changed.
+
         Args:
             backend: Backend name
-            rebuild: Force rebuild even if image exists
+            rebuild: Force rebuild even if the image is up to date
             no_cache: Build without using cache
 
         Returns:
-            str: Image ID
+            str: Image ID, or the image name if the build was skipped
 
         Raises:
             ImageBuildError: If build fails
         """
         # Get backend metadata
         metadata = self.registry.get(backend)
+        image_name = f"{metadata.image_name}:{metadata.image_tag}"
 
-        # Check if image exists (unless rebuild requested)
-        if not rebuild and self.image_exists(
-            metadata.image_name, metadata.image_tag
-        ):
-            print(
-                f"✓ Image {metadata.image_name}:{metadata.image_tag} "
-                "already exists"
+        try:
+            context = self.create_build_context(backend, no_cache)
+            digest = context.labels[BUILD_DIGEST_LABEL]
+
+            # Skip the build if the image matches the context
+            current = self.image_digest(
+                metadata.image_name, metadata.image_tag
             )
-            return f"{metadata.image_name}:{metadata.image_tag}"
+            if not rebuild and current == digest:
+                logger.debug(f"Image {image_name} is up to date")
+                return image_name
 
-        print(f"→ Building image for backend '{backend}'...")
-        print(f"  Dockerfile: {metadata.dockerfile_path}")
-        print(f"  Dependencies: {', '.join(metadata.dependencies)}")
+            if current is not None and not rebuild:
+                print(f"→ Image {image_name} is out of date")
 
-        try:
-            # Read Dockerfile
-            if not metadata.dockerfile_path.exists():
-                raise ImageBuildError(
-                    backend=backend,
-                    message=(
-                        f"Dockerfile not found: {metadata.dockerfile_path}"
-                    ),
-                )
-
-            with metadata.dockerfile_path.open() as f:
-                dockerfile_content = f.read()
-
-            # Create build context with files
-            files = {}
-
-            # Add entrypoint script
-            if metadata.entrypoint_path.exists():
-                with metadata.entrypoint_path.open("rb") as f:
-                    files["entrypoint.py"] = f.read()
-
-            # Add colorscheme-generator module files
-            # We need to recursively add all files from the module
-            if self.colorscheme_generator_path.exists():
-                print("  Adding colorscheme-generator module...")
-                self._add_directory_to_context(
-                    files,
-                    self.colorscheme_generator_path,
-                    "colorscheme-generator",
-                )
-            else:
-                raise ImageBuildError(
-                    backend=backend,
-                    message=(
-                        "colorscheme-generator module not found: "
-                        f"{self.colorscheme_generator_path}"
-                    ),
-                )
-
-            # Create BuildContext
-            context = BuildContext(
-                dockerfile=dockerfile_content,
-                files=files,
-                no_cache=no_cache,
-            )
+            print(f"→ Building image for backend '{backend}'...")
+            print(f"  Dockerfile: {metadata.dockerfile_path}")
+            print(f"  Dependencies: {', '.join(metadata.dependencies)}")
+            print(f"  Context digest: {digest[:19]}")
 
             # Build image
             print("  Building container image...")
-            image_name = f"{metadata.image_name}:{metadata.image_tag}"
             image_id = self.engine.images.build(context, image_name)
 
-            print(
-                f"✓ Image built successfully: "
-                f"{metadata.image_name}:{metadata.image_tag}"
-            )
+            print(f"✓ Image built successfully: {image_name}")
             print(f"  Image ID: {image_id[:12]}")
 
             return image_id
 
+        except ImageBuildError:
+            raise
         except Exception as e:
             raise ImageBuildError(
                 backend=backend,
@@ -186,7 +216,7 @@ class ContainerBuilder:
         """Build images for all backends.
 
         Args:
-            rebuild: Force rebuild even if images exist
+            rebuild: Force rebuild even if images are up to date
             no_cache: Build without using cache
 
         Returns:
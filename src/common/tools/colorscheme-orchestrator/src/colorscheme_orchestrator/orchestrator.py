@@ -170,13 +170,9 @@ class ColorSchemeOrchestrator:
         if progress_callback:
             progress_callback(0.0)
 
-        # Step 1: Ensure backend image exists (0-30%)
-        metadata = self.registry.get(backend)
-        if rebuild or not self.builder.image_exists(
-            metadata.image_name, metadata.image_tag
-        ):
-            print(f"\n→ Building container image for '{backend}'...")
-            self.builder.build_backend_image(backend, rebuild=rebuild)
+        # Step 1: Ensure backend image is current (0-30%)
+        # Rebuilds only if the image's context digest is stale
+        self.builder.build_backend_image(backend, rebuild=rebuild)
 
         if progress_callback:
             progress_callback(30.0)
@@ -1,37 +1,139 @@
 #!/usr/bin/env python3
 """Container entrypoint for wallpaper processing."""
 
+import io
 import json
 import os
 import sys
+import threading
+import time
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add app to path
 sys.path.insert(0, "/app")
 
 from wallpaper_processor import (
+    AppConfig,
     EffectFactory,
     EffectPipeline,
     ProcessorConfig,
     get_default_config,
 )
 
+# Worker mode job directory layout (see ContainerRunner.start_worker)
+JOB_FILE = "job.json"
+CLAIMED_FILE = "job.running"
+RESULT_FILE = "result.json"
+SHUTDOWN_FILE = "shutdown"
 
-def main() -> int:
-    """Main entrypoint."""
+
+class ThreadLocalStream(io.TextIOBase):
+    """Stream that routes writes to a per-thread buffer when one is set.
+
+    Lets worker threads capture the output of their own job while other
+    jobs run concurrently.
+    """
+
+    def __init__(self, fallback: io.TextIOBase):
+        self._fallback = fallback
+        self._local = threading.local()
+
+    def capture(self, buffer: io.StringIO | None) -> None:
+        """Set (or clear) the capture buffer of the current thread."""
+        self._local.buffer = buffer
+
+    def write(self, text: str) -> int:
+        buffer = getattr(self._local, "buffer", None)
+        if buffer is None:
+            return self._fallback.write(text)
+        return buffer.write(text)
+
+    def flush(self) -> None:
+        self._fallback.flush()
+
+
+def run_variants(
+    spec: Mapping[str, str],
+    image_path: Path,
+    config: AppConfig,
+    proc_config: ProcessorConfig,
+) -> int:
+    """Generate one variant per effect from a single decode of the input.
+
+    Reads EFFECTS (comma separated, all effects if empty), OUTPUT_DIR and
+    MAX_WORKERS from the job spec and writes a JSON manifest of the
+    generated variants and failures to MANIFEST_PATH.
+    """
+    output_dir = Path(spec.get("OUTPUT_DIR", "/output"))
+    manifest_path = Path(
+        spec.get("MANIFEST_PATH", str(output_dir / "variants.json"))
+    )
+    effects_str = spec.get("EFFECTS", "")
+    max_workers_str = spec.get("MAX_WORKERS", "")
+
+    if effects_str:
+        effects = [name.strip() for name in effects_str.split(",")]
+    else:
+        effects = EffectFactory.get_all_effect_names()
+
+    print(f"Generating variants: {', '.join(effects)}")
+
+    errors: dict[str, str] = {}
+
+    def report(
+        effect_name: str, output_path: Path | None, error: Exception | None
+    ) -> None:
+        if error is None:
+            print(f"✓ {effect_name} -> {output_path}")
+        else:
+            errors[effect_name] = str(error)
+            print(f"✗ {effect_name}: {error}", file=sys.stderr)
+
+    results = EffectFactory.generate_variants(
+        image_path,
+        output_dir,
+        effects,
+        config,
+        proc_config,
+        max_workers=int(max_workers_str) if max_workers_str else None,
+        progress_callback=report,
+    )
+
+    manifest = {
+        "variants": {name: path.name for name, path in results.items()},
+        "errors": errors,
+    }
+    manifest_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+
+    print(f"✓ Generated {len(results)}/{len(effects)} variants")
+    return 0 if results or not effects else 1
+
+
+def run_job(spec: Mapping[str, str], config: AppConfig) -> int:
+    """Run a single processing job.
+
+    Args:
+        spec: Job settings, using the same keys as the container
+            environment (IMAGE_PATH, OUTPUT_PATH, PRESET, EFFECTS, ...)
+        config: Loaded processor configuration
+
+    Returns:
+        Exit code (0 on success)
+    """
     try:
-        # Get environment variables
-        image_path = Path(os.environ.get("IMAGE_PATH", "/input/image"))
-        output_path = Path(os.environ.get("OUTPUT_PATH", "/output/output.png"))
-        preset = os.environ.get("PRESET", "")
-        effects_str = os.environ.get("EFFECTS", "")
-        effect_params_str = os.environ.get("EFFECT_PARAMS", "{}")
-        processing_mode = os.environ.get("PROCESSING_MODE", "memory")
-        output_format = os.environ.get("OUTPUT_FORMAT", "png")
-        quality = int(os.environ.get("QUALITY", "95"))
-        write_metadata = (
-            os.environ.get("WRITE_METADATA", "false").lower() == "true"
-        )
+        # Get job settings
+        mode = spec.get("MODE", "pipeline")
+        image_path = Path(spec.get("IMAGE_PATH", "/input/image"))
+        output_path = Path(spec.get("OUTPUT_PATH", "/output/output.png"))
+        preset = spec.get("PRESET", "")
+        effects_str = spec.get("EFFECTS", "")
+        effect_params_str = spec.get("EFFECT_PARAMS", "{}")
+        processing_mode = spec.get("PROCESSING_MODE", "memory")
+        output_format = spec.get("OUTPUT_FORMAT", "png")
+        quality = int(spec.get("QUALITY", "95"))
+        write_metadata = spec.get("WRITE_METADATA", "false").lower() == "true"
 
         # Validate input
         if not image_path.exists():
@@ -40,9 +142,6 @@ def main() -> int:
             )
             return 1
 
-        # Load configuration
-        config = get_default_config()
-
         # Create processor config
         proc_config = ProcessorConfig(
             processing_mode=processing_mode,
@@ -51,6 +150,9 @@ def main() -> int:
             write_metadata=write_metadata,
         )
 
+        if mode == "variants":
+            return run_variants(spec, image_path, config, proc_config)
+
         # Create pipeline
         if preset:
             # Use preset
@@ -102,5 +204,79 @@ def main() -> int:
         return 1
 
 
+def run_worker(jobs_dir: Path, config: AppConfig) -> int:
+    """Serve jobs from a mounted job directory until asked to stop.
+
+    Each job is a subdirectory holding a job.json spec (written last by
+    the host). The worker claims it by renaming it to job.running, runs
+    it, and writes result.json with the exit code and captured output.
+    Creating a ``shutdown`` file in jobs_dir stops the worker.
+    """
+    poll_interval = float(os.environ.get("WORKER_POLL_INTERVAL", "0.05"))
+    concurrency = int(os.environ.get("WORKER_CONCURRENCY", "0")) or (
+        os.cpu_count() or 1
+    )
+
+    stdout = ThreadLocalStream(sys.stdout)
+    stderr = ThreadLocalStream(sys.stderr)
+    sys.stdout, sys.stderr = stdout, stderr
+
+    def execute(job_dir: Path) -> None:
+        buffer = io.StringIO()
+        stdout.capture(buffer)
+        stderr.capture(buffer)
+        try:
+            spec = json.loads(
+                (job_dir / CLAIMED_FILE).read_text(encoding="utf-8")
+            )
+            exit_code = run_job(spec, config)
+        except Exception as e:
+            print(f"Error: {e}", file=sys.stderr)
+            exit_code = 1
+        finally:
+            stdout.capture(None)
+            stderr.capture(None)
+
+        result = {"exit_code": exit_code, "output": buffer.getvalue()}
+        tmp_path = job_dir / f"{RESULT_FILE}.tmp"
+        tmp_path.write_text(json.dumps(result), encoding="utf-8")
+        tmp_path.replace(job_dir / RESULT_FILE)
+
+    print(f"Worker ready: {jobs_dir} ({concurrency} threads)")
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        while not (jobs_dir / SHUTDOWN_FILE).exists():
+            claimed = False
+            for job_file in sorted(jobs_dir.glob(f"*/{JOB_FILE}")):
+                try:
+                    job_file.rename(job_file.with_name(CLAIMED_FILE))
+                except OSError:
+                    continue
+                executor.submit(execute, job_file.parent)
+                claimed = True
+
+            if not claimed:
+                time.sleep(poll_interval)
+
+    print("Worker stopped")
+    return 0
+
+
+def main() -> int:
+    """Main entrypoint."""
+    try:
+        # Load configuration once
+        config = get_default_config()
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    if os.environ.get("MODE") == "worker":
+        jobs_dir = Path(os.environ.get("JOBS_DIR", "/jobs"))
+        return run_worker(jobs_dir, config)
+
+    return run_job(os.environ, config)
+
+
 if __name__ == "__main__":
     sys.exit(main())
@@ -301,7 +301,7 @@ def build(
         None, "--runtime", help="Container runtime"
     ),
     force: bool = typer.Option(
-        False, "--force", help="Force rebuild even if image exists"
+        False, "--force", help="Force rebuild even if image is up to date"
     ),
 ) -> None:
     """Build container image."""
@@ -315,17 +315,14 @@ def build(
     orchestrator = WallpaperOrchestrator(config)
 
     try:
-        # Check if image already exists
-        if not force and orchestrator.registry.image_exists():
+        console.print("[yellow]Checking container image...[/yellow]")
+        if orchestrator.ensure_image(force_rebuild=force):
+            console.print("[green]✓ Build complete[/green]")
+        else:
             image_name = orchestrator.registry.get_image_name()
             console.print(
-                f"[green]✓ Image {image_name} already exists[/green]"
+                f"[green]✓ Image {image_name} is up to date[/green]"
             )
-            return
-
-        console.print("[yellow]Building container image...[/yellow]")
-        orchestrator.ensure_image(force_rebuild=force)
-        console.print("[green]✓ Build complete[/green]")
     except Exception as e:
         console.print(f"[red]Error: {e}[/red]")
         sys.exit(1)
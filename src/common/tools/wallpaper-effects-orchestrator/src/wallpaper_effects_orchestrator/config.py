@@ -30,6 +30,13 @@ class ContainerConfig(BaseModel):
     build_pull: bool = Field(
         default=True, description="Pull base image during build"
     )
+    use_worker: bool = Field(
+        default=False,
+        description="Keep one warm worker container up for batch jobs",
+    )
+    worker_job_timeout: float = Field(
+        default=600.0, gt=0, description="Seconds to wait for a worker job"
+    )
 
 
 class ProcessingConfig(BaseModel):
@@ -5,10 +5,25 @@ from __future__ import annotations
 from collections.abc import Callable
 from pathlib import Path
 
-from dotfiles_container_manager import BuildContext, ImageManager
+from dotfiles_container_manager import (
+    BUILD_DIGEST_LABEL,
+    BuildContext,
+    ImageManager,
+    build_context_digest,
+)
 
 from wallpaper_effects_orchestrator.config import AppConfig
 
+# Excluded when streaming module directories into the build context
+BUILD_CONTEXT_IGNORE = [
+    "__pycache__",
+    "*.pyc",
+    ".venv",
+    ".pytest_cache",
+    ".mypy_cache",
+    ".ruff_cache",
+]
+
 
 class ContainerBuilder:
     """Builds wallpaper-effects-processor container images."""
@@ -23,10 +38,42 @@ class ContainerBuilder:
         self.image_manager = image_manager
         self.config = config
 
+    def create_build_context(
+        self,
+        dockerfile_content: str,
+        files: dict[str, bytes],
+        paths: dict[str, Path] | None = None,
+    ) -> BuildContext:
+        """Create a build context labelled with its content digest.
+
+        Args:
+            dockerfile_content: Dockerfile content as string
+            files: Additional files to include in build context
+            paths: Host directories streamed into the build context
+                (context path -> host path)
+
+        Returns:
+            Build context; its ``BUILD_DIGEST_LABEL`` label identifies
+            the sources the image is built from
+        """
+        build_context = BuildContext(
+            dockerfile=dockerfile_content,
+            files=files,
+            paths=dict(paths or {}),
+            ignore=BUILD_CONTEXT_IGNORE,
+            no_cache=self.config.container.build_no_cache,
+            pull=self.config.container.build_pull,
+        )
+        build_context.labels[BUILD_DIGEST_LABEL] = build_context_digest(
+            build_context
+        )
+        return build_context
+
     def build(
         self,
         dockerfile_content: str,
         files: dict[str, bytes],
+        paths: dict[str, Path] | None = None,
         _progress_callback: Callable | None = None,
     ) -> str:
         """Build container image.
@@ -34,6 +81,8 @@ class ContainerBuilder:
         Args:
             dockerfile_content: Dockerfile content as string
             files: Additional files to include in build context
+            paths: Host directories streamed into the build context
+                (context path -> host path)
             _progress_callback: Optional callback for build progress
                 (reserved for future use)
 
@@ -43,60 +92,42 @@ class ContainerBuilder:
         Raises:
             ImageBuildError: If build fails
         """
-        # Create build context
-        build_context = BuildContext(
-            dockerfile=dockerfile_content,
-            files=files,
-            no_cache=self.config.container.build_no_cache,
-            pull=self.config.container.build_pull,
+        build_context = self.create_build_context(
+            dockerfile_content, files, paths
         )
+        return self.build_from_context(build_context)
 
-        # Build image
-        image_name = f"{self.config.container.image_name}:{self.config.container.image_tag}"
-        image_id = self.image_manager.build(build_context, image_name)
-
-        return image_id
-
-    def _add_directory_to_context(
-        self, files: dict[str, bytes], directory: Path, prefix: str = ""
-    ) -> None:
-        """Recursively add directory contents to build context.
+    def build_from_context(self, build_context: BuildContext) -> str:
+        """Build container image from a prepared build context.
 
         Args:
-            files: Files dictionary to add to
-            directory: Directory to add
-            prefix: Prefix for file paths in context
-        """
-        for item in directory.rglob("*"):
-            if item.is_file():
-                # Skip __pycache__ and .pyc files
-                if "__pycache__" in item.parts or item.suffix == ".pyc":
-                    continue
-
-                # Get relative path from directory
-                rel_path = item.relative_to(directory)
+            build_context: Context from create_build_context
 
-                # Create path in context
-                if prefix:
-                    context_path = f"{prefix}/{rel_path}"
-                else:
-                    context_path = str(rel_path)
+        Returns:
+            Image ID
 
-                # Read file content
-                with item.open("rb") as f:
-                    files[context_path] = f.read()
+        Raises:
+            ImageBuildError: If build fails
+        """
+        container = self.config.container
+        image_name = f"{container.image_name}:{container.image_tag}"
+        return self.image_manager.build(build_context, image_name)
 
     def prepare_build_context(
         self, dockerfile_path: Path, entrypoint_path: Path
-    ) -> tuple[str, dict[str, bytes]]:
+    ) -> tuple[str, dict[str, bytes], dict[str, Path]]:
         """Prepare build context with all necessary files.
 
+        Module sources are returned as directories rather than read into
+        memory; they are streamed into the build context by the image
+        manager.
+
         Args:
             dockerfile_path: Path to Dockerfile
             entrypoint_path: Path to entrypoint script
 
         Returns:
-            Tuple of (dockerfile_content, files_dict)
+            Tuple of (dockerfile_content, files_dict, paths_dict)
         """
         # Read Dockerfile
         with dockerfile_path.open() as f:
@@ -133,16 +164,13 @@ class ContainerBuilder:
             / "src"
             / "wallpaper_processor"
         )
+        paths: dict[str, Path] = {}
         if processor_src.exists():
-            self._add_directory_to_context(
-                files, processor_src, "wallpaper_processor"
-            )
+            paths["wallpaper_processor"] = processor_src
 
         # Add logging module
         logging_src = modules_dir / "logging" / "src" / "dotfiles_logging"
         if logging_src.exists():
-            self._add_directory_to_context(
-                files, logging_src, "dotfiles_logging"
-            )
+            paths["dotfiles_logging"] = logging_src
 
-        return dockerfile_content, files
+        return dockerfile_content, files, paths
@@ -3,6 +3,7 @@
 import contextlib
 
 from dotfiles_container_manager import (
+    BUILD_DIGEST_LABEL,
     ContainerEngineFactory,
     ContainerRuntime,
     ImageInfo,
@@ -58,6 +59,18 @@ class ContainerRegistry:
         except ImageNotFoundError:
             return None
 
+    def get_image_digest(self) -> str | None:
+        """Get the build context digest the image was built from.
+
+        Returns:
+            Digest label, or None if the image doesn't exist or was
+            built without one
+        """
+        info = self.get_image_info()
+        if info is None:
+            return None
+        return info.labels.get(BUILD_DIGEST_LABEL)
+
     def remove_image(self, force: bool = False) -> None:
         """Remove image.
 
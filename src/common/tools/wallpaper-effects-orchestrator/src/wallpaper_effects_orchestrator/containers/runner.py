@@ -2,16 +2,33 @@
 
 import contextlib
 import json
+import os
+import shutil
+import tempfile
+import threading
 import time
+import uuid
+from collections.abc import Iterator
 from pathlib import Path
 
 from dotfiles_container_manager import (
     ContainerManager,
+    ContainerRuntimeError,
     RunConfig,
     VolumeMount,
 )
 from wallpaper_effects_orchestrator.config import ContainerConfig, ProcessingConfig
 
+# Manifest written by the container in variants mode
+VARIANTS_MANIFEST = "variants.json"
+
+# Worker mode job directory layout (mirrors container/entrypoint.py)
+WORKER_JOBS_MOUNT = "/jobs"
+WORKER_JOB_FILE = "job.json"
+WORKER_RESULT_FILE = "result.json"
+WORKER_SHUTDOWN_FILE = "shutdown"
+WORKER_POLL_INTERVAL = 0.05
+
 
 class ContainerRunner:
     """Runs wallpaper processing in containers."""
@@ -32,6 +49,113 @@ class ContainerRunner:
         self.container_manager = container_manager
         self.config = config
         self.processing_config = processing_config
+        self._worker_id: str | None = None
+        self._worker_jobs_dir: Path | None = None
+        self._worker_exit_code: int | None = None
+        self._worker_stopped = threading.Event()
+
+    @property
+    def worker_running(self) -> bool:
+        """Whether a warm worker container is serving jobs."""
+        return self._worker_id is not None
+
+    def start_worker(self, jobs_dir: Path | None = None) -> None:
+        """Start a long-running worker container.
+
+        While the worker is up, run_effects, run_preset and run_variants
+        hand their job to it through a mounted job directory instead of
+        starting a new container, so the effects library stays loaded.
+
+        Args:
+            jobs_dir: Host directory shared with the worker (a temporary
+                directory is created if None)
+        """
+        if self._worker_id is not None:
+            return
+
+        if jobs_dir is None:
+            jobs_dir = Path(tempfile.mkdtemp(prefix="wallpaper-effects-"))
+        else:
+            jobs_dir.mkdir(parents=True, exist_ok=True)
+        (jobs_dir / WORKER_SHUTDOWN_FILE).unlink(missing_ok=True)
+
+        run_config = RunConfig(
+            image=f"{self.config.image_name}:{self.config.image_tag}",
+            volumes=[
+                VolumeMount(
+                    source=str(jobs_dir.absolute()),
+                    target=WORKER_JOBS_MOUNT,
+                    read_only=False,
+                )
+            ],
+            environment={"MODE": "worker", "JOBS_DIR": WORKER_JOBS_MOUNT},
+            detach=True,
+            remove=False,
+        )
+
+        self._worker_id = self.container_manager.run(run_config)
+        self._worker_jobs_dir = jobs_dir
+        self._worker_exit_code = None
+        self._worker_stopped.clear()
+
+        # Get notified as soon as the worker exits instead of polling it
+        threading.Thread(
+            target=self._watch_worker, args=(self._worker_id,), daemon=True
+        ).start()
+
+    def _watch_worker(self, worker_id: str) -> None:
+        """Record the exit code of the worker container once it stops.
+
+        Args:
+            worker_id: Worker container ID
+        """
+        try:
+            self._worker_exit_code = self.container_manager.wait(worker_id)
+        except Exception:
+            self._worker_exit_code = None
+        finally:
+            self._worker_stopped.set()
+
+    def stop_worker(self, timeout: float = 10.0) -> None:
+        """Stop the worker container and clean up its job directory.
+
+        Args:
+            timeout: Seconds to wait for a graceful shutdown
+        """
+        if self._worker_id is None or self._worker_jobs_dir is None:
+            return
+
+        worker_id, jobs_dir = self._worker_id, self._worker_jobs_dir
+        self._worker_id = None
+        self._worker_jobs_dir = None
+
+        try:
+            (jobs_dir / WORKER_SHUTDOWN_FILE).touch()
+            self._worker_stopped.wait(timeout)
+        finally:
+            with contextlib.suppress(Exception):
+                self.container_manager.remove(worker_id, force=True)
+            shutil.rmtree(jobs_dir, ignore_errors=True)
+
+    @contextlib.contextmanager
+    def worker(self, jobs_dir: Path | None = None) -> Iterator[None]:
+        """Keep a warm worker container up for the duration of a block.
+
+        Args:
+            jobs_dir: Host directory shared with the worker
+
+        Yields:
+            None
+        """
+        if self.worker_running:
+            yield
+            return
+
+        self.start_worker(jobs_dir)
+        try:
+            yield
+        finally:
+            self.stop_worker()
 
     def run_effects(
         self,
@@ -82,39 +206,7 @@ class ContainerRunner:
             ).lower(),
         }
 
-        # Create run config
-        run_config = RunConfig(
-            image=f"{self.config.image_name}:{self.config.image_tag}",
-            volumes=volumes,
-            environment=environment,
-            detach=True,  # Run in background
-            remove=False,  # Don't auto-remove so we can get logs
-        )
-
-        # Run container
-        container_id = self.container_manager.run(run_config)
-
-        try:
-            # Wait for container to finish
-            while True:
-                info = self.container_manager.inspect(container_id)
-                # Check if container is no longer running
-                if info.state in ("exited", "dead", "stopped"):
-                    break
-                time.sleep(0.5)
-
-            # Get final exit code
-            exit_code = info.exit_code if info.exit_code is not None else 0
-
-            # Get logs
-            logs = self.container_manager.logs(container_id)
-        finally:
-            # Clean up container (ignore cleanup errors)
-            with contextlib.suppress(Exception):
-                self.container_manager.remove(container_id, force=True)
-
-        # Parse logs (stdout/stderr combined in logs)
-        return exit_code, logs, ""
+        return self._run_container(volumes, environment)
 
     def run_preset(
         self,
@@ -159,6 +251,81 @@ class ContainerRunner:
             ).lower(),
         }
 
+        return self._run_container(volumes, environment)
+
+    def run_variants(
+        self,
+        input_path: Path,
+        output_dir: Path,
+        effects: list[str],
+        output_format: str = "png",
+        max_workers: int | None = None,
+    ) -> tuple[int, str, str]:
+        """Generate one variant per effect in a single container run.
+
+        The container decodes the input once and applies every effect
+        from the shared image in parallel threads. It writes
+        ``<effect>.<format>`` files plus a ``variants.json`` manifest
+        into output_dir.
+
+        Args:
+            input_path: Input image path
+            output_dir: Directory to write variants to
+            effects: List of effect names (all effects if empty)
+            output_format: Variant file format (PNG for consistency)
+            max_workers: Number of worker threads in the container
+
+        Returns:
+            Tuple of (exit_code, stdout, stderr)
+        """
+        # Prepare volume mounts
+        volumes = [
+            VolumeMount(
+                source=str(input_path.absolute()),
+                target="/input/image",
+                read_only=True,
+            ),
+            VolumeMount(
+                source=str(output_dir.absolute()),
+                target="/output",
+                read_only=False,
+            ),
+        ]
+
+        # Prepare environment variables
+        environment = {
+            "MODE": "variants",
+            "IMAGE_PATH": "/input/image",
+            "OUTPUT_DIR": "/output",
+            "MANIFEST_PATH": f"/output/{VARIANTS_MANIFEST}",
+            "EFFECTS": ",".join(effects),
+            "PROCESSING_MODE": self.processing_config.mode,
+            "OUTPUT_FORMAT": output_format,
+            "QUALITY": str(self.processing_config.quality),
+            "WRITE_METADATA": str(
+                self.processing_config.write_metadata
+            ).lower(),
+        }
+        if max_workers:
+            environment["MAX_WORKERS"] = str(max_workers)
+
+        return self._run_container(volumes, environment)
+
+    def _run_container(
+        self, volumes: list[VolumeMount], environment: dict[str, str]
+    ) -> tuple[int, str, str]:
+        """Run the processor image to completion and collect its logs.
+
+        Args:
+            volumes: Volume mounts
+            environment: Environment variables
+
+        Returns:
+            Tuple of (exit_code, stdout, stderr)
+        """
+        if self._worker_id is not None:
+            return self._run_worker_job(volumes, environment)
+
         # Create run config
         run_config = RunConfig(
             image=f"{self.config.image_name}:{self.config.image_tag}",
@@ -172,16 +339,8 @@ class ContainerRunner:
         container_id = self.container_manager.run(run_config)
 
         try:
-            # Wait for container to finish
-            while True:
-                info = self.container_manager.inspect(container_id)
-                # Check if container is no longer running
-                if info.state in ("exited", "dead", "stopped"):
-                    break
-                time.sleep(0.5)
-
-            # Get final exit code
-            exit_code = info.exit_code if info.exit_code is not None else 0
+            # Block until the container exits
+            exit_code = self.container_manager.wait(container_id)
 
             # Get logs
             logs = self.container_manager.logs(container_id)
@@ -190,4 +349,106 @@ class ContainerRunner:
             with contextlib.suppress(Exception):
                 self.container_manager.remove(container_id, force=True)
 
+        # Parse logs (stdout/stderr combined in logs)
         return exit_code, logs, ""
+
+    def _run_worker_job(
+        self, volumes: list[VolumeMount], environment: dict[str, str]
+    ) -> tuple[int, str, str]:
+        """Hand a job to the warm worker and wait for its result.
+
+        The worker only sees the job directory, so each volume is staged
+        inside a per-job subdirectory: input files are hard-linked (or
+        copied), writable directories start empty and their contents are
+        moved to the real destination once the job finishes. Container
+        paths in the environment are rewritten to the staged locations.
+
+        Args:
+            volumes: Volume mounts the job would use as a one-off container
+            environment: Environment variables of the job
+
+        Returns:
+            Tuple of (exit_code, stdout, stderr)
+
+        Raises:
+            ContainerRuntimeError: If the worker dies or the job times out
+        """
+        assert self._worker_id is not None
+        assert self._worker_jobs_dir is not None
+
+        job_id = uuid.uuid4().hex
+        job_dir = self._worker_jobs_dir / job_id
+        job_dir.mkdir()
+
+        try:
+            spec = dict(environment)
+            outputs: list[tuple[Path, Path]] = []
+            for index, volume in enumerate(volumes):
+                staged = job_dir / f"volume{index}"
+                source = Path(volume.source)
+                if source.is_dir():
+                    if volume.read_only:
+                        shutil.copytree(source, staged)
+                    else:
+                        staged.mkdir()
+                        outputs.append((staged, source))
+                else:
+                    try:
+                        os.link(source, staged)
+                    except OSError:
+                        shutil.copyfile(source, staged)
+
+                # Point container paths at the staged copy
+                mapped = f"{WORKER_JOBS_MOUNT}/{job_id}/{staged.name}"
+                for key, value in spec.items():
+                    if value == volume.target or value.startswith(
+                        f"{volume.target}/"
+                    ):
+                        spec[key] = mapped + value[len(volume.target) :]
+
+            # Write the spec last, atomically, so the worker never sees
+            # a partial job
+            tmp_path = job_dir / f"{WORKER_JOB_FILE}.tmp"
+            tmp_path.write_text(json.dumps(spec), encoding="utf-8")
+            tmp_path.replace(job_dir / WORKER_JOB_FILE)
+
+            result = self._wait_for_worker_result(job_dir)
+
+            for staged, destination in outputs:
+                destination.mkdir(parents=True, exist_ok=True)
+                for item in staged.iterdir():
+                    item.replace(destination / item.name)
+        finally:
+            shutil.rmtree(job_dir, ignore_errors=True)
+
+        return int(result.get("exit_code", 1)), result.get("output", ""), ""
+
+    def _wait_for_worker_result(self, job_dir: Path) -> dict:
+        """Wait for the worker to write a job's result file.
+
+        Args:
+            job_dir: Job directory on the host
+
+        Returns:
+            Parsed result (exit_code, output)
+
+        Raises:
+            ContainerRuntimeError: If the worker dies or the job times out
+        """
+        result_path = job_dir / WORKER_RESULT_FILE
+        deadline = time.monotonic() + self.config.worker_job_timeout
+
+        while not result_path.exists():
+            if self._worker_stopped.is_set():
+                raise ContainerRuntimeError(
+                    f"Worker container exited "
+                    f"(exit code {self._worker_exit_code})"
+                )
+            if time.monotonic() > deadline:
+                raise ContainerRuntimeError(
+                    f"Worker job timed out after "
+                    f"{self.config.worker_job_timeout}s"
+                )
+            time.sleep(WORKER_POLL_INTERVAL)
+
+        return json.loads(result_path.read_text(encoding="utf-8"))
@@ -1,8 +1,14 @@
 """Orchestrator for wallpaper processing."""
 
+import contextlib
+import json
 from pathlib import Path
 
-from dotfiles_container_manager import ContainerEngineFactory, ContainerRuntime
+from dotfiles_container_manager import (
+    BUILD_DIGEST_LABEL,
+    ContainerEngineFactory,
+    ContainerRuntime,
+)
 
 from wallpaper_effects_orchestrator.config import AppConfig
 from wallpaper_effects_orchestrator.containers import (
@@ -10,6 +16,7 @@ from wallpaper_effects_orchestrator.containers import (
     ContainerRegistry,
     ContainerRunner,
 )
+from wallpaper_effects_orchestrator.containers.runner import VARIANTS_MANIFEST
 
 
 class WallpaperOrchestrator:
@@ -34,17 +41,28 @@ class WallpaperOrchestrator:
             self.engine.containers, config.container, config.processing
         )
 
-    def ensure_image(self, force_rebuild: bool = False) -> None:
-        """Ensure container image exists.
+        # Set once the image is known to match the current sources
+        self._image_verified = False
+
+    def ensure_image(self, force_rebuild: bool = False) -> bool:
+        """Ensure the container image exists and is up to date.
+
+        The build context (Dockerfile, entrypoint and module sources) is
+        digested and compared with the digest label of the existing
+        image, so the image is rebuilt exactly when its sources changed.
+        The check runs once per orchestrator.
 
         Args:
-            force_rebuild: Force rebuild even if image exists
+            force_rebuild: Force rebuild even if the image is up to date
+
+        Returns:
+            True if the image was (re)built
 
         Raises:
             ImageBuildError: If build fails
         """
-        if not force_rebuild and self.registry.image_exists():
-            return
+        if self._image_verified and not force_rebuild:
+            return False
 
         # Get container files
         container_dir = Path(__file__).parent.parent.parent / "container"
@@ -52,12 +70,21 @@ class WallpaperOrchestrator:
         entrypoint_path = container_dir / "entrypoint.py"
 
         # Prepare build context
-        dockerfile_content, files = self.builder.prepare_build_context(
+        dockerfile_content, files, paths = self.builder.prepare_build_context(
             dockerfile_path, entrypoint_path
         )
+        context = self.builder.create_build_context(
+            dockerfile_content, files, paths
+        )
+
+        # Build unless the image was built from identical sources
+        digest = context.labels[BUILD_DIGEST_LABEL]
+        built = force_rebuild or self.registry.get_image_digest() != digest
+        if built:
+            self.builder.build_from_context(context)
 
-        # Build
-        self.builder.build(dockerfile_content, files)
+        self._image_verified = True
+        return built
 
     def process_image(
         self,
@@ -156,12 +183,53 @@ class WallpaperOrchestrator:
         successful = 0
         failed = 0
 
-        if parallel > 1:
-            # Parallel processing
-            from concurrent.futures import ThreadPoolExecutor, as_completed
+        # Keep one warm container serving every image when enabled
+        worker = (
+            self.runner.worker()
+            if self.config.container.use_worker
+            else contextlib.nullcontext()
+        )
 
-            with ThreadPoolExecutor(max_workers=parallel) as executor:
-                futures = {}
+        with worker:
+            if parallel > 1:
+                # Parallel processing
+                from concurrent.futures import ThreadPoolExecutor, as_completed
+
+                with ThreadPoolExecutor(max_workers=parallel) as executor:
+                    futures = {}
+                    for input_file in input_files:
+                        output_file = output_dir / input_file.name
+
+                        # Skip if exists
+                        if skip_existing and output_file.exists():
+                            continue
+
+                        future = executor.submit(
+                            self.process_image,
+                            input_file,
+                            output_file,
+                            preset,
+                            effects,
+                            effect_params,
+                        )
+                        futures[future] = input_file
+
+                    for future in as_completed(futures):
+                        input_file = futures[future]
+                        try:
+                            if future.result():
+                                successful += 1
+                                print(f"✓ {input_file.name}")
+                            else:
+                                failed += 1
+                                print(f"✗ {input_file.name}")
+                        except Exception as e:
+                            failed += 1
+                            print(f"✗ {input_file.name}: {e}")
+                            if not continue_on_error:
+                                break
+            else:
+                # Sequential processing
                 for input_file in input_files:
                     output_file = output_dir / input_file.name
 
@@ -169,20 +237,14 @@ class WallpaperOrchestrator:
                     if skip_existing and output_file.exists():
                         continue
 
-                    future = executor.submit(
-                        self.process_image,
-                        input_file,
-                        output_file,
-                        preset,
-                        effects,
-                        effect_params,
-                    )
-                    futures[future] = input_file
-
-                for future in as_completed(futures):
-                    input_file = futures[future]
                     try:
-                        if future.result():
+                        if self.process_image(
+                            input_file,
+                            output_file,
+                            preset,
+                            effects,
+                            effect_params,
+                        ):
                             successful += 1
                             print(f"✓ {input_file.name}")
                         else:
@@ -193,29 +255,6 @@ class WallpaperOrchestrator:
                         print(f"✗ {input_file.name}: {e}")
                         if not continue_on_error:
                             break
-        else:
-            # Sequential processing
-            for input_file in input_files:
-                output_file = output_dir / input_file.name
-
-                # Skip if exists
-                if skip_existing and output_file.exists():
-                    continue
-
-                try:
-                    if self.process_image(
-                        input_file, output_file, preset, effects, effect_params
-                    ):
-                        successful += 1
-                        print(f"✓ {input_file.name}")
-                    else:
-                        failed += 1
-                        print(f"✗ {input_file.name}")
-                except Exception as e:
-                    failed += 1
-                    print(f"✗ {input_file.name}: {e}")
-                    if not continue_on_error:
-                        break
 
         return successful, failed
 
@@ -226,7 +265,8 @@ class WallpaperOrchestrator:
 
         Creates a subdirectory named after the input image (without
         extension) and generates one variant for each available effect
-        with default parameters.
+        with default parameters. All variants are produced by a single
+        container run that decodes the input once.
 
         Args:
             input_path: Path to input image
@@ -269,33 +309,38 @@ class WallpaperOrchestrator:
         from wallpaper_processor.factory import EffectFactory
 
         effects = EffectFactory.get_all_effect_names()
-        total_effects = len(effects)
 
         # Report initial progress
         if progress_callback:
             progress_callback(0.0)
 
-        # Generate variant for each effect
-        results = {}
-        for i, effect_name in enumerate(effects):
-            # Determine output extension (use PNG for consistency)
-            output_path = variant_dir / f"{effect_name}.png"
-
-            # Process with single effect and default parameters
-            success = self.process_image(
-                input_path=input_path,
-                output_path=output_path,
-                effects=[effect_name],
-                effect_params={},
-            )
+        # Generate every variant in one container run (single decode)
+        exit_code, stdout, stderr = self.runner.run_variants(
+            input_path, variant_dir, effects
+        )
 
-            if success:
-                results[effect_name] = output_path
+        manifest_path = variant_dir / VARIANTS_MANIFEST
+        try:
+            manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            manifest = {"variants": {}, "errors": {}}
+        finally:
+            manifest_path.unlink(missing_ok=True)
 
-            # Report progress after completing this effect
-            if progress_callback:
-                progress = ((i + 1) / total_effects) * 100
-                progress_callback(progress)
+        if exit_code != 0:
+            print(f"Variant generation failed: {stderr or stdout}")
+
+        for effect_name, error in manifest.get("errors", {}).items():
+            print(f"Failed to generate {effect_name}: {error}")
+
+        results = {
+            effect_name: variant_dir / file_name
+            for effect_name, file_name in manifest.get("variants", {}).items()
+        }
+
+        # Report completion
+        if progress_callback:
+            progress_callback(100.0)
 
         return results
 
@@ -0,0 +1,183 @@
+"""Tests for container runner."""
+
+import json
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from dotfiles_container_manager import ContainerRuntimeError
+
+from wallpaper_effects_orchestrator.config import (
+    ContainerConfig,
+    ProcessingConfig,
+)
+from wallpaper_effects_orchestrator.containers import ContainerRunner
+from wallpaper_effects_orchestrator.containers.runner import (
+    WORKER_JOB_FILE,
+    WORKER_RESULT_FILE,
+    WORKER_SHUTDOWN_FILE,
+)
+
+
+class TestContainerRunner:
+    """Tests for ContainerRunner."""
+
+    def _runner(self) -> tuple[ContainerRunner, MagicMock]:
+        manager = MagicMock()
+        manager.run.return_value = "abc123"
+        manager.wait.return_value = 0
+        manager.logs.return_value = "done"
+        runner = ContainerRunner(
+            manager, ContainerConfig(), ProcessingConfig()
+        )
+        return runner, manager
+
+    def test_run_variants(self, tmp_path):
+        """Test all variants are requested in a single container run."""
+        runner, manager = self._runner()
+
+        exit_code, stdout, _ = runner.run_variants(
+            Path("/tmp/image.png"), tmp_path, ["blur", "negate"]
+        )
+
+        assert exit_code == 0
+        assert stdout == "done"
+        manager.run.assert_called_once()
+        run_config = manager.run.call_args.args[0]
+        assert run_config.environment["MODE"] == "variants"
+        assert run_config.environment["EFFECTS"] == "blur,negate"
+        assert run_config.environment["OUTPUT_FORMAT"] == "png"
+        assert run_config.volumes[1].source == str(tmp_path.absolute())
+        manager.remove.assert_called_once_with("abc123", force=True)
+
+    def test_run_effects_returns_exit_code(self, tmp_path):
+        """Test non-zero container exit codes are returned."""
+        runner, manager = self._runner()
+        manager.wait.return_value = 2
+
+        exit_code, _, _ = runner.run_effects(
+            Path("/tmp/image.png"), tmp_path / "out.png", ["blur"], {}
+        )
+
+        assert exit_code == 2
+        manager.wait.assert_called_once_with("abc123")
+        manager.remove.assert_called_once()
+
+
+class TestContainerRunnerWorker:
+    """Tests for the warm worker mode of ContainerRunner."""
+
+    def _runner(self) -> tuple[ContainerRunner, MagicMock]:
+        manager = MagicMock()
+        manager.run.return_value = "worker123"
+        runner = ContainerRunner(
+            manager, ContainerConfig(), ProcessingConfig()
+        )
+
+        def wait(container_id, timeout=None):
+            # The worker exits once asked to shut down
+            while runner._worker_jobs_dir is not None and not (
+                runner._worker_jobs_dir / WORKER_SHUTDOWN_FILE
+            ).exists():
+                time.sleep(0.01)
+            return 0
+
+        manager.wait.side_effect = wait
+        return runner, manager
+
+    def _serve(self, jobs_dir: Path, exit_code: int = 0) -> threading.Thread:
+        """Fake worker: answer one job, writing an output file."""
+
+        def serve() -> None:
+            deadline = time.monotonic() + 5
+            while time.monotonic() < deadline:
+                for job_file in jobs_dir.glob(f"*/{WORKER_JOB_FILE}"):
+                    spec = json.loads(job_file.read_text())
+                    job_dir = job_file.parent
+                    # Resolve the container path inside the job dir
+                    output = Path(
+                        spec["OUTPUT_PATH"].replace("/jobs", str(jobs_dir))
+                    )
+                    output.write_text("pixels")
+                    result = {
+                        "exit_code": exit_code,
+                        "output": json.dumps(spec),
+                    }
+                    (job_dir / WORKER_RESULT_FILE).write_text(
+                        json.dumps(result)
+                    )
+                    return
+                time.sleep(0.01)
+
+        thread = threading.Thread(target=serve)
+        thread.start()
+        return thread
+
+    def test_start_worker(self, tmp_path):
+        """Test worker container mounts the job directory."""
+        runner, manager = self._runner()
+
+        runner.start_worker(tmp_path)
+
+        assert runner.worker_running
+        run_config = manager.run.call_args.args[0]
+        assert run_config.environment["MODE"] == "worker"
+        assert run_config.volumes[0].source == str(tmp_path.absolute())
+        assert run_config.volumes[0].target == "/jobs"
+
+        runner.stop_worker()
+
+    def test_job_runs_in_worker(self, tmp_path):
+        """Test jobs are handed to the worker instead of a new container."""
+        runner, manager = self._runner()
+        jobs_dir = tmp_path / "jobs"
+        input_path = tmp_path / "image.png"
+        input_path.write_bytes(b"png")
+        output_path = tmp_path / "out" / "result.png"
+        output_path.parent.mkdir()
+
+        runner.start_worker(jobs_dir)
+        thread = self._serve(jobs_dir)
+        exit_code, stdout, _ = runner.run_effects(
+            input_path, output_path, ["blur"], {}
+        )
+        thread.join()
+
+        assert exit_code == 0
+        spec = json.loads(stdout)
+        assert spec["IMAGE_PATH"].startswith("/jobs/")
+        assert spec["IMAGE_PATH"].endswith("/volume0")
+        assert spec["OUTPUT_PATH"].endswith("/volume1/result.png")
+        assert output_path.read_text() == "pixels"
+        assert list(jobs_dir.iterdir()) == []
+        manager.run.assert_called_once()
+        manager.wait.assert_called_once_with("worker123")
+
+        runner.stop_worker()
+
+    def test_stop_worker(self, tmp_path):
+        """Test stopping the worker removes it and its job directory."""
+        runner, manager = self._runner()
+
+        with runner.worker():
+            jobs_dir = runner._worker_jobs_dir
+            assert jobs_dir is not None and jobs_dir.exists()
+
+        assert not runner.worker_running
+        assert not jobs_dir.exists()
+        manager.remove.assert_called_once_with("worker123", force=True)
+
+    def test_dead_worker_raises(self, tmp_path):
+        """Test a job fails fast when the worker container has died."""
+        runner, manager = self._runner()
+        manager.wait.side_effect = None
+        manager.wait.return_value = 137
+        runner.config.worker_job_timeout = 5.0
+        input_path = tmp_path / "image.png"
+        input_path.write_bytes(b"png")
+
+        runner.start_worker(tmp_path / "jobs")
+        with pytest.raises(ContainerRuntimeError, match="exit code 137"):
+            runner.run_effects(input_path, tmp_path / "out.png", ["blur"], {})
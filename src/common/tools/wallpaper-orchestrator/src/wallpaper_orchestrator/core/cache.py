@@ -7,6 +7,13 @@ from pathlib import Path
 
 from dotfiles_state_manager import StateManager
 
+# Hash mapping resolved wallpaper paths to their stat fingerprint and
+# content hash. Deliberately outside the "wallpaper:*" key namespace.
+FINGERPRINT_INDEX_KEY = "fingerprints:wallpaper"
+
+# Read size used when hashing wallpaper content
+HASH_CHUNK_SIZE = 1024 * 1024
+
 
 class WallpaperCacheManager:
     """Manages caching of wallpaper effects and colorschemes.
@@ -22,7 +29,9 @@ class WallpaperCacheManager:
     - Metadata: Tracked in SQLite via state-manager
 
     Cache Key: SHA256 hash of wallpaper file content (detects changes,
-    survives moves)
+    survives moves). Hashes are memoized in a fingerprint index keyed by
+    path, inode, size and mtime, so a file is only re-read after it
+    changed.
     """
 
     def __init__(
@@ -48,6 +57,9 @@ class WallpaperCacheManager:
         self.colorscheme_cache_dir = colorscheme_cache_dir
         self.colorscheme_active_dir = colorscheme_active_dir
 
+        # In-process memo of the fingerprint index (path -> entry)
+        self._fingerprints: dict[str, dict] = {}
+
     def __deepcopy__(self, memo):
         """Return self for deep copy (cache manager should not be copied)."""
         return self
@@ -59,9 +71,47 @@ class WallpaperCacheManager:
         - Detects content changes
         - Survives file moves/renames
         - Prevents duplicate processing of same image
+
+        The hash is looked up by stat fingerprint (inode, size, mtime)
+        first, in memory and then in the persisted fingerprint index;
+        the file is only read and hashed when the fingerprint changed.
         """
-        hash_obj = hashlib.sha256(wallpaper_path.read_bytes())
-        return f"wallpaper:{hash_obj.hexdigest()}"
+        path = str(wallpaper_path.resolve())
+        stat = wallpaper_path.stat()
+        fingerprint = {
+            "inode": stat.st_ino,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+        }
+
+        entry = self._fingerprints.get(path)
+        if entry is None:
+            entry = self.state.hget(FINGERPRINT_INDEX_KEY, path)
+
+        if not self._fingerprint_matches(entry, fingerprint):
+            entry = {**fingerprint, "digest": self._hash_file(wallpaper_path)}
+            self.state.hset(FINGERPRINT_INDEX_KEY, path, entry)
+
+        self._fingerprints[path] = entry
+        return f"wallpaper:{entry['digest']}"
+
+    @staticmethod
+    def _fingerprint_matches(entry: dict | None, fingerprint: dict) -> bool:
+        """Check whether a fingerprint index entry is still valid."""
+        if not isinstance(entry, dict) or "digest" not in entry:
+            return False
+        return all(
+            entry.get(name) == value for name, value in fingerprint.items()
+        )
+
+    @staticmethod
+    def _hash_file(wallpaper_path: Path) -> str:
+        """Hash file content in chunks (never loads the whole file)."""
+        hash_obj = hashlib.sha256()
+        with wallpaper_path.open("rb") as f:
+            while chunk := f.read(HASH_CHUNK_SIZE):
+                hash_obj.update(chunk)
+        return hash_obj.hexdigest()
 
     def _get_wallpaper_subdir(self, wallpaper_path: Path) -> str:
         """Get subdirectory name for wallpaper (uses stem)."""
@@ -139,12 +189,17 @@ class WallpaperCacheManager:
         """
         key = self._get_cache_key(wallpaper_path)
 
-        self.state.hset(key, "wallpaper_path", str(wallpaper_path))
-        self.state.hset(key, "wallpaper_stem", wallpaper_path.stem)
-        self.state.hset(key, "effects_dir", str(effects_dir))
-        self.state.hset(key, "effects_cached", "true")
-        self.state.hset(key, "effects_count", str(len(effect_variants)))
-        self.state.hset(key, "effects_cached_at", datetime.now().isoformat())
+        self.state.hmset(
+            key,
+            {
+                "wallpaper_path": str(wallpaper_path),
+                "wallpaper_stem": wallpaper_path.stem,
+                "effects_dir": str(effects_dir),
+                "effects_cached": "true",
+                "effects_count": str(len(effect_variants)),
+                "effects_cached_at": datetime.now().isoformat(),
+            },
+        )
 
     # === COLORSCHEME CACHING ===
 
@@ -293,15 +348,16 @@ class WallpaperCacheManager:
         )
 
         # Update metadata
-        self.state.hset(key, "wallpaper_path", str(wallpaper_path))
-        self.state.hset(key, "wallpaper_stem", wallpaper_path.stem)
-        self.state.hset(key, "colorscheme_cache_dir", str(cache_dir))
-        self.state.hset(key, "colorscheme_cached", "true")
-        self.state.hset(
-            key, "colorscheme_formats", ",".join(colorscheme_files.keys())
-        )
-        self.state.hset(
-            key, "colorscheme_cached_at", datetime.now().isoformat()
+        self.state.hmset(
+            key,
+            {
+                "wallpaper_path": str(wallpaper_path),
+                "wallpaper_stem": wallpaper_path.stem,
+                "colorscheme_cache_dir": str(cache_dir),
+                "colorscheme_cached": "true",
+                "colorscheme_formats": ",".join(colorscheme_files.keys()),
+                "colorscheme_cached_at": datetime.now().isoformat(),
+            },
         )
 
     # === CACHE MANAGEMENT ===
@@ -335,6 +391,10 @@ class WallpaperCacheManager:
         key = self._get_cache_key(wallpaper_path)
         self.state.delete(key)
 
+        path = str(wallpaper_path.resolve())
+        self._fingerprints.pop(path, None)
+        self.state.hdel(FINGERPRINT_INDEX_KEY, path)
+
     def get_cache_info(self, wallpaper_path: Path) -> dict:
         """Get cache metadata for a wallpaper.
 
@@ -364,10 +424,9 @@ class WallpaperCacheManager:
                 ...
             ]
         """
-        all_keys = self.state.keys("wallpaper:*")
         wallpapers = []
 
-        for key in all_keys:
+        for key in self.state.scan("wallpaper:*", type="hash"):
             metadata = self.state.hgetall(key)
             if not metadata:
                 continue
@@ -106,9 +106,11 @@ class WallpaperOrchestrator:
 
         from wallpaper_orchestrator.core.cache import WallpaperCacheManager
 
-        # Create state manager with SQLite backend
+        # Create state manager with SQLite backend; pipeline steps read
+        # the cache from several threads
         backend = SQLiteBackend(
-            db_path=self.config.cache.state_manager.db_path
+            db_path=self.config.cache.state_manager.db_path,
+            connection_pool=True,
         )
         state_manager = StateManager(backend=backend)
 
@@ -1,7 +1,12 @@
 """Dependency injection container for dotfiles manager."""
 
 from dependency_injector import containers, providers
-from dotfiles_state_manager import SQLiteBackend, StateManager
+from dotfiles_state_manager import (
+    CacheConfig,
+    Serializer,
+    SQLiteBackend,
+    StateManager,
+)
 from icon_generator import IconRegistry, IconService  # noqa: F401
 from wallpaper_orchestrator import WallpaperOrchestrator, load_settings
 
@@ -37,11 +42,16 @@ class Container(containers.DeclarativeContainer):
     system_state_backend = providers.Singleton(
         SQLiteBackend,
         db_path=config.provided.manager.state_db_path,
+        # Rendered SVGs are large and compress well
+        serializer=providers.Factory(Serializer, compression="zlib"),
     )
 
+    # Repositories re-read the same keys on every event; the cache
+    # notices writes made by other processes through data_version
     system_state = providers.Singleton(
         StateManager,
         backend=system_state_backend,
+        cache=CacheConfig(enabled=True),
     )
 
     # Wallpaper orchestrator (with its own cache)